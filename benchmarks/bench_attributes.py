@@ -0,0 +1,66 @@
+# bench_attributes.py
+
+#   Measures attribute get/set throughput of the structures with component
+#   swizzling (Vector2, Vector3, Vector4, Color and Rectangle): plain fields,
+#   swizzles, derived Rectangle components and read-only repeated swizzles.
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_attributes.py [--number N] [--repeat R]
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import raylibpy as rl
+
+
+NAMESPACE = {
+    'v2': rl.Vector2(1.0, 2.0),
+    'v3': rl.Vector3(1.0, 2.0, 3.0),
+    'v4': rl.Vector4(1.0, 2.0, 3.0, 4.0),
+    'color': rl.Color(255, 128, 64, 255),
+    'rec': rl.Rectangle(10.0, 20.0, 100.0, 50.0),
+}
+
+STATEMENTS = (
+    ('Vector2', 'v2.x'),
+    ('Vector2', 'v2.x = 3.0'),
+    ('Vector2', 'v2.yx'),
+    ('Vector2', 'v2.xy = (3.0, 4.0)'),
+    ('Vector2', 'v2.xxyy'),
+    ('Vector3', 'v3.z'),
+    ('Vector3', 'v3.z = 3.0'),
+    ('Vector3', 'v3.xy'),
+    ('Vector3', 'v3.xyz = (3.0, 4.0, 5.0)'),
+    ('Vector4', 'v4.w'),
+    ('Vector4', 'v4.wzyx'),
+    ('Color', 'color.r'),
+    ('Color', 'color.a = 200'),
+    ('Color', 'color.bgra'),
+    ('Color', 'color.rgb = (1, 2, 3)'),
+    ('Rectangle', 'rec.width'),
+    ('Rectangle', 'rec.x = 5.0'),
+    ('Rectangle', 'rec.c'),
+    ('Rectangle', 'rec.cm = (50.0, 50.0)'),
+    ('Rectangle', 'rec.xywh'),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures raylibpy struct attribute get/set throughput')
+    parser.add_argument('--number', type=int, default=100000, help='executions per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per statement (best is kept)')
+    args = parser.parse_args()
+
+    print("{:<10} {:<28} {:>10} {:>14}".format('struct', 'statement', 'ns/op', 'Mops/s'))
+    for struct, statement in STATEMENTS:
+        best = min(timeit.repeat(statement, globals=NAMESPACE, number=args.number, repeat=args.repeat)) / args.number
+        print("{:<10} {:<28} {:>10.0f} {:>14.2f}".format(struct, statement, best * 1e9, 1e-6 / best))
+
+
+if __name__ == '__main__':
+    main()
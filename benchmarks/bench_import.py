@@ -0,0 +1,70 @@
+# bench_import.py
+
+#   Measures how long `import raylibpy` takes in a fresh interpreter, comparing
+#   lazy symbol binding (the default) against eager binding
+#   (RAYLIBPY_EAGER_BINDING=1).
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_import.py [--runs N]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+_SNIPPET = (
+    "import time, sys, io\n"
+    "_stdout = sys.stdout\n"
+    "sys.stdout = io.StringIO()\n"
+    "t0 = time.perf_counter()\n"
+    "import raylibpy\n"
+    "t1 = time.perf_counter()\n"
+    "sys.stdout = _stdout\n"
+    "print(t1 - t0)\n"
+)
+
+
+def _src_dir():
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def measure_import(runs, eager):
+    # type: (int, bool) -> list[float]
+    """Returns the import times (in seconds) of `runs` fresh interpreters"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (_src_dir(), env.get('PYTHONPATH')) if p)
+    env['RAYLIBPY_EAGER_BINDING'] = '1' if eager else '0'
+
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', _SNIPPET], env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr else 'import failed')
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the import time of raylibpy')
+    parser.add_argument('--runs', type=int, default=15, help='number of interpreters to spawn per mode')
+    args = parser.parse_args()
+
+    results = {}
+    for label, eager in (('lazy', False), ('eager', True)):
+        try:
+            timings = measure_import(args.runs, eager)
+        except RuntimeError as e:
+            print("{:>6}: failed ({})".format(label, e))
+            continue
+        results[label] = statistics.median(timings)
+        print("{:>6}: median {:8.2f} ms  min {:8.2f} ms".format(label, results[label] * 1000, min(timings) * 1000))
+
+    if 'lazy' in results and 'eager' in results:
+        print("saved: {:8.2f} ms per import".format((results['eager'] - results['lazy']) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# bench_raymath_batch.py
+
+#   Measures the throughput of matrix_multiply, vector3_transform and
+#   quaternion_slerp called once per item through the FFI against their NumPy
+#   batch variants (matrix_multiply_batch, ...), for several batch sizes.
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_raymath_batch.py [--sizes 100 1000 10000] [--repeat R]
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import numpy as np
+import raylibpy as rl
+
+
+def make_data(count):
+    """Returns random matrices, vectors, unit quaternions and amounts, as arrays and as structs"""
+    rng = np.random.default_rng(0)
+    arrays = {
+        'left': rng.standard_normal((count, 16)).astype(np.float32),
+        'right': rng.standard_normal((count, 16)).astype(np.float32),
+        'vectors': rng.standard_normal((count, 3)).astype(np.float32),
+        'q1': rng.standard_normal((count, 4)).astype(np.float32),
+        'q2': rng.standard_normal((count, 4)).astype(np.float32),
+        'amounts': rng.random(count).astype(np.float32),
+    }
+    arrays['q1'] /= np.linalg.norm(arrays['q1'], axis=1, keepdims=True)
+    arrays['q2'] /= np.linalg.norm(arrays['q2'], axis=1, keepdims=True)
+    structs = {
+        'left': [rl.Matrix.from_buffer_copy(row) for row in arrays['left']],
+        'right': [rl.Matrix.from_buffer_copy(row) for row in arrays['right']],
+        'vectors': [rl.Vector3.from_buffer_copy(row) for row in arrays['vectors']],
+        'q1': [rl.Quaternion.from_buffer_copy(row) for row in arrays['q1']],
+        'q2': [rl.Quaternion.from_buffer_copy(row) for row in arrays['q2']],
+        'amounts': [float(a) for a in arrays['amounts']],
+    }
+    return arrays, structs
+
+
+def cases(arrays, structs):
+    """Returns (name, per-item callable, batch callable) triples"""
+    a, s = arrays, structs
+    return (
+        ('matrix_multiply',
+         lambda: [rl.matrix_multiply(l, r) for l, r in zip(s['left'], s['right'])],
+         lambda: rl.matrix_multiply_batch(a['left'], a['right'])),
+        ('vector3_transform',
+         lambda: [rl.vector3_transform(v, m) for v, m in zip(s['vectors'], s['left'])],
+         lambda: rl.vector3_transform_batch(a['vectors'], a['left'])),
+        ('quaternion_slerp',
+         lambda: [rl.quaternion_slerp(q1, q2, t) for q1, q2, t in zip(s['q1'], s['q2'], s['amounts'])],
+         lambda: rl.quaternion_slerp_batch(a['q1'], a['q2'], a['amounts'])),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures raymath per-item vs NumPy batch throughput')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help='batch sizes')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per case (best is kept)')
+    args = parser.parse_args()
+
+    print("{:<18} {:>7} {:>16} {:>16} {:>9}".format('function', 'N', 'per item (M/s)', 'batch (M/s)', 'speedup'))
+    for count in args.sizes:
+        arrays, structs = make_data(count)
+        for name, per_item, batch in cases(arrays, structs):
+            per_item()  # binds the C function outside of the measurement
+            scalar = min(timeit.repeat(per_item, number=1, repeat=args.repeat))
+            vector = min(timeit.repeat(batch, number=1, repeat=args.repeat))
+            print("{:<18} {:>7} {:>16.3f} {:>16.3f} {:>8.1f}x".format(
+                name, count, count / scalar * 1e-6, count / vector * 1e-6, scalar / vector))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# bench_sprite_batch.py
+
+#   Measures sprites per second drawn with one draw_texture_pro call per sprite
+#   against SpriteBatch, in a hidden window, for several sprite counts. The
+#   NumPy vertex generation of SpriteBatch is measured on its own too, and is
+#   the only part measured when no window can be created (headless machines).
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_sprite_batch.py [--sizes 1000 10000 50000] [--frames F]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import numpy as np
+import raylibpy as rl
+
+
+def make_sprites(count, width, height):
+    """Returns random sources, dests, origins, rotations and tints for `count` sprites"""
+    rng = np.random.default_rng(0)
+    sources = np.zeros((count, 4), dtype=np.float32)
+    sources[:, 2:] = 16
+    dests = np.empty((count, 4), dtype=np.float32)
+    dests[:, 0] = rng.uniform(0, width, count)
+    dests[:, 1] = rng.uniform(0, height, count)
+    dests[:, 2:] = 16
+    origins = np.full((count, 2), 8, dtype=np.float32)
+    rotations = rng.uniform(0, 360, count).astype(np.float32)
+    tints = rng.integers(0, 256, (count, 4), dtype=np.uint8)
+    tints[:, 3] = 255
+    return sources, dests, origins, rotations, tints
+
+
+def bench_vertices(sizes, frames):
+    print("{:<22} {:>7} {:>16}".format('vertex generation', 'N', 'sprites/s (M)'))
+    for count in sizes:
+        sources, dests, origins, rotations, _ = make_sprites(count, 800, 450)
+        start = time.perf_counter()
+        for _ in range(frames):
+            rl.sprite_vertices(16, 16, sources, dests, origins, rotations)
+        elapsed = time.perf_counter() - start
+        print("{:<22} {:>7} {:>16.3f}".format('sprite_vertices', count, count * frames / elapsed * 1e-6))
+
+
+def bench_drawing(sizes, frames):
+    image = rl.gen_image_checked(16, 16, 4, 4, rl.WHITE, rl.GRAY)
+    texture = rl.load_texture_from_image(image)
+    rl.unload_image(image)
+    batch = rl.SpriteBatch(texture)
+
+    def per_call(sources, dests, origins, rotations, tints):
+        structs = [(rl.Rectangle(*s), rl.Rectangle(*d), rl.Vector2(*o), float(r), rl.Color(*t))
+                   for s, d, o, r, t in zip(sources.tolist(), dests.tolist(), origins.tolist(), rotations.tolist(), tints.tolist())]
+
+        def draw():
+            for source, dest, origin, rotation, tint in structs:
+                rl.draw_texture_pro(texture, source, dest, origin, rotation, tint)
+        return draw
+
+    def batched(sources, dests, origins, rotations, tints):
+        return lambda: batch.draw(sources, dests, origins, rotations, tints)
+
+    print("{:<22} {:>7} {:>16} {:>9}".format('drawing', 'N', 'sprites/s (M)', 'speedup'))
+    for count in sizes:
+        sprites = make_sprites(count, rl.get_screen_width(), rl.get_screen_height())
+        timings = []
+        for name, factory in (('draw_texture_pro', per_call), ('SpriteBatch.draw', batched)):
+            draw = factory(*sprites)
+            start = time.perf_counter()
+            for _ in range(frames):
+                rl.begin_drawing()
+                rl.clear_background(rl.BLACK)
+                draw()
+                rl.end_drawing()
+            timings.append(time.perf_counter() - start)
+            print("{:<22} {:>7} {:>16.3f} {:>8.1f}x".format(
+                name, count, count * frames / timings[-1] * 1e-6, timings[0] / timings[-1]))
+
+    batch.unload()
+    rl.unload_texture(texture)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures per-call vs SpriteBatch sprite throughput')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000], help='sprites per frame')
+    parser.add_argument('--frames', type=int, default=30, help='frames drawn per measurement')
+    args = parser.parse_args()
+
+    bench_vertices(args.sizes, args.frames)
+
+    # raylib exits the process when it fails to create the window
+    if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        print("no display available, drawing not measured")
+        return
+    rl.set_trace_log_level(rl.LOG_WARNING)
+    rl.set_config_flags(rl.FLAG_WINDOW_HIDDEN)
+    rl.init_window(800, 450, 'bench_sprite_batch')
+    if not rl.is_window_ready():
+        print("no window could be created, drawing not measured")
+        return
+    try:
+        bench_drawing(args.sizes, args.frames)
+    finally:
+        rl.close_window()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# bench_submodules.py
+
+#   Measures import time and peak resident memory of fresh interpreters that use
+#   raylibpy partially (no function submodule, only the image functions) or
+#   completely (`from raylibpy import *`, which imports every submodule).
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_submodules.py [--runs N]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+_SNIPPET = (
+    "import time, sys, io, resource\n"
+    "_stdout = sys.stdout\n"
+    "sys.stdout = io.StringIO()\n"
+    "t0 = time.perf_counter()\n"
+    "{}\n"
+    "t1 = time.perf_counter()\n"
+    "sys.stdout = _stdout\n"
+    "print(t1 - t0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+SCENARIOS = (
+    ('structs only', "from raylibpy import Image, Wave"),
+    ('textures', "from raylibpy import Image, gen_image_color, image_resize"),
+    ('everything', "from raylibpy import *"),
+)
+
+
+def _src_dir():
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def measure(statement, runs):
+    # type: (str, int) -> tuple[list[float], list[int]]
+    """Returns the import times (seconds) and peak RSS (KiB) of `runs` fresh interpreters"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (_src_dir(), env.get('PYTHONPATH')) if p)
+
+    timings, rss = [], []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', _SNIPPET.format(statement)], env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr else 'import failed')
+        seconds, kib = out.stdout.strip().splitlines()[-1].split()
+        timings.append(float(seconds))
+        rss.append(int(kib))
+    return timings, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures import time and memory of partial raylibpy users')
+    parser.add_argument('--runs', type=int, default=15, help='number of interpreters to spawn per scenario')
+    args = parser.parse_args()
+
+    for label, statement in SCENARIOS:
+        try:
+            timings, rss = measure(statement, args.runs)
+        except RuntimeError as e:
+            print("{:>12}: failed ({})".format(label, e))
+            continue
+        print("{:>12}: median {:8.2f} ms  peak RSS {:8.1f} MiB".format(label, statistics.median(timings) * 1000, statistics.median(rss) / 1024))
+
+
+if __name__ == '__main__':
+    main()
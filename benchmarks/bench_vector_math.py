@@ -0,0 +1,68 @@
+# bench_vector_math.py
+
+#   Measures the per-operation latency of Vector2/Vector3/Quaternion arithmetic
+#   with the 'raymath' backend (C functions through ctypes) and the 'python'
+#   backend (raylibpy.pymath), both through the raymath functions and through
+#   the operators of the vector classes.
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_vector_math.py [--number N] [--repeat R]
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import raylibpy as rl
+
+
+a = rl.Vector2(1.25, -3.5)
+b = rl.Vector2(0.75, 2.0)
+u = rl.Vector3(1.25, -3.5, 0.5)
+v = rl.Vector3(0.75, 2.0, -4.0)
+q = rl.Quaternion(0.1, 0.2, 0.3, 0.9)
+
+OPERATIONS = (
+    ('vector2_add(a, b)', lambda: rl.vector2_add(a, b)),
+    ('vector2_scale(a, 2.5)', lambda: rl.vector2_scale(a, 2.5)),
+    ('vector2_divide(a, b)', lambda: rl.vector2_divide(a, b)),
+    ('a + b', lambda: a + b),
+    ('a - b', lambda: a - b),
+    ('a * 2.5', lambda: a * 2.5),
+    ('a / b', lambda: a / b),
+    ('-a', lambda: -a),
+    ('vector3_add(u, v)', lambda: rl.vector3_add(u, v)),
+    ('u * v', lambda: u * v),
+    ('quaternion_scale(q, 2.5)', lambda: rl.quaternion_scale(q, 2.5)),
+)
+
+
+def measure(function, number, repeat):
+    # type: (callable, int, int) -> float
+    """Returns the best time per call, in seconds"""
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures raylibpy vector math latency per backend')
+    parser.add_argument('--number', type=int, default=20000, help='calls per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per operation (best is kept)')
+    args = parser.parse_args()
+
+    print("{:<28} {:>12} {:>12} {:>8}".format('operation', 'raymath', 'python', 'speedup'))
+    for label, function in OPERATIONS:
+        timings = {}
+        for backend in ('raymath', 'python'):
+            rl.set_math_backend(backend)
+            function()  # binds the C function outside of the measurement
+            timings[backend] = measure(function, args.number, args.repeat)
+        print("{:<28} {:>9.0f} ns {:>9.0f} ns {:>7.2f}x".format(
+            label, timings['raymath'] * 1e9, timings['python'] * 1e9, timings['raymath'] / timings['python']))
+    rl.set_math_backend('raymath')
+
+
+if __name__ == '__main__':
+    main()
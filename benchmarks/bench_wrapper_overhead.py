@@ -0,0 +1,64 @@
+# bench_wrapper_overhead.py
+
+#   Measures the overhead of the public wrappers (argument coercion with _vec2,
+#   _color, _rect, _float, _int) over calling the raylib C functions directly
+#   through ctypes, with arguments given as structs and as tuples. Only functions
+#   that work without a window are measured.
+#
+#   How to use:
+#
+#   $ python benchmarks/bench_wrapper_overhead.py [--number N] [--repeat R]
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import raylibpy as rl
+
+
+V2 = rl.Vector2(1.0, 2.0)
+V3 = rl.Vector3(1.0, 2.0, 3.0)
+REC = rl.Rectangle(0.0, 0.0, 10.0, 10.0)
+COLOR = rl.Color(200, 100, 50, 255)
+
+# (C function, wrapper, arguments as structs, arguments as tuples or None if only structs are accepted)
+CASES = (
+    ('ColorToInt', rl.color_to_int, (COLOR,), ((200, 100, 50, 255),)),
+    ('Fade', rl.fade, (COLOR, 0.5), ((200, 100, 50, 255), 0.5)),
+    ('ColorAlphaBlend', rl.color_alpha_blend, (COLOR, COLOR, COLOR), ((200, 100, 50, 255),) * 3),
+    ('GetColor', rl.get_color, (0xFF0000FF,), (0xFF0000FF,)),
+    ('CheckCollisionRecs', rl.check_collision_recs, (REC, REC), ((0, 0, 10, 10), (5, 5, 10, 10))),
+    ('CheckCollisionPointCircle', rl.check_collision_point_circle, (V2, V2, 5.0), ((1.0, 2.0), (3.0, 4.0), 5.0)),
+    ('Vector2Add', rl.vector2_add, (V2, V2), None),
+    ('Vector3CrossProduct', rl.vector3_cross_product, (V3, V3), None),
+)
+
+
+def best(func, args, number, repeat):
+    """Returns the best time of one call of func(*args), in seconds"""
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures raylibpy wrapper overhead over direct C calls')
+    parser.add_argument('--number', type=int, default=100000, help='calls per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per case (best is kept)')
+    args = parser.parse_args()
+
+    print("{:<26} {:>10} {:>14} {:>14} {:>14}".format('function', 'C (ns)', 'structs (ns)', 'tuples (ns)', 'overhead (ns)'))
+    for c_name, wrapper, struct_args, tuple_args in CASES:
+        wrapper(*struct_args)  # binds the C function
+        direct = rl._symbol_table[c_name]
+        c_time = best(direct, struct_args, args.number, args.repeat)
+        struct_time = best(wrapper, struct_args, args.number, args.repeat)
+        tuple_time = best(wrapper, tuple_args, args.number, args.repeat) if tuple_args else None
+        print("{:<26} {:>10.0f} {:>14.0f} {:>14} {:>14.0f}".format(
+            c_name, c_time * 1e9, struct_time * 1e9, '-' if tuple_time is None else round(tuple_time * 1e9),
+            (struct_time - c_time) * 1e9))
+
+
+if __name__ == '__main__':
+    main()
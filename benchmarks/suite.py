@@ -0,0 +1,350 @@
+# suite.py
+
+#   Headless benchmark suite of the binding layer: raymath wrappers and vector
+#   operators, struct construction and coercion, swizzles, Image generation and
+#   processing, Mesh generation, text utilities and Wave operations.
+#
+#   Each group runs in its own interpreter, so a group crashing in the native
+#   library (or missing symbols of an older raylib) is reported without losing
+#   the others. Mesh.gen_* upload the generated mesh to the GPU, so that group
+#   opens a hidden window and is skipped when no display is available.
+#
+#   Results are written as JSON with sorted keys, one value per line, so two runs
+#   can be diffed directly or compared with --compare, which flags the cases that
+#   got slower than --threshold and exits with status 1 if there are any.
+#
+#   How to use:
+#
+#   $ python benchmarks/suite.py [--groups raymath structs ...] [--output results.json] [--quick]
+#   $ python benchmarks/suite.py --compare before.json [after.json] [--threshold 0.1]
+
+import argparse
+import ctypes
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+import wave
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+
+# region GROUPS
+
+def raymath_cases(rl):
+    v2a, v2b = rl.Vector2(1.0, 2.0), rl.Vector2(3.0, 4.0)
+    v3a, v3b = rl.Vector3(1.0, 2.0, 3.0), rl.Vector3(4.0, 5.0, 6.0)
+    mat = rl.matrix_rotate_xyz(v3a)
+    q1, q2 = rl.quaternion_from_euler(0.1, 0.2, 0.3), rl.quaternion_from_euler(1.0, 0.5, 0.2)
+    return (
+        ('vector2_add', lambda: rl.vector2_add(v2a, v2b)),
+        ('vector2_operator_add', lambda: v2a + v2b),
+        ('vector2_operator_add_tuple', lambda: v2a + (3.0, 4.0)),
+        ('vector3_cross_product', lambda: rl.vector3_cross_product(v3a, v3b)),
+        ('vector3_normalize', lambda: rl.vector3_normalize(v3a)),
+        ('vector3_transform', lambda: rl.vector3_transform(v3a, mat)),
+        ('matrix_multiply', lambda: rl.matrix_multiply(mat, mat)),
+        ('matrix_rotate_xyz', lambda: rl.matrix_rotate_xyz(v3a)),
+        ('quaternion_slerp', lambda: rl.quaternion_slerp(q1, q2, 0.5)),
+    )
+
+
+def structs_cases(rl):
+    return (
+        ('vector2', lambda: rl.Vector2(1.0, 2.0)),
+        ('vector3', lambda: rl.Vector3(1.0, 2.0, 3.0)),
+        ('color', lambda: rl.Color(1, 2, 3, 4)),
+        ('rectangle', lambda: rl.Rectangle(1.0, 2.0, 3.0, 4.0)),
+        ('matrix', lambda: rl.Matrix()),
+        ('camera3d', lambda: rl.Camera3D(rl.Vector3(0, 10, 10), rl.Vector3(0, 0, 0), rl.Vector3(0, 1, 0), 45.0, 0)),
+        ('coerce_vector2_tuple', lambda: rl._vec2((1.0, 2.0))),
+        ('coerce_color_tuple', lambda: rl._color((1, 2, 3, 4))),
+        ('coerce_color_list', lambda: rl._color([1, 2, 3, 4])),
+        ('coerce_rectangle_tuple', lambda: rl._rect((1.0, 2.0, 3.0, 4.0))),
+        ('vector2_array_1000', lambda: rl.Vector2Array([(1.0, 2.0)] * 1000)),
+    )
+
+
+def swizzles_cases(rl):
+    v2, v3 = rl.Vector2(1.0, 2.0), rl.Vector3(1.0, 2.0, 3.0)
+    color, rec = rl.Color(1, 2, 3, 4), rl.Rectangle(1.0, 2.0, 3.0, 4.0)
+
+    def set_x():
+        v2.x = 3.0
+
+    def set_xyz():
+        v3.xyz = (3.0, 4.0, 5.0)
+
+    def set_center():
+        rec.cm = (5.0, 5.0)
+
+    return (
+        ('vector2_x', lambda: v2.x),
+        ('vector2_set_x', set_x),
+        ('vector2_yx', lambda: v2.yx),
+        ('vector2_xxyy', lambda: v2.xxyy),
+        ('vector3_xy', lambda: v3.xy),
+        ('vector3_set_xyz', set_xyz),
+        ('color_r', lambda: color.r),
+        ('color_bgra', lambda: color.bgra),
+        ('rectangle_c', lambda: rec.c),
+        ('rectangle_set_cm', set_center),
+    )
+
+
+def image_cases(rl):
+    source = rl.gen_image_checked(256, 256, 8, 8, rl.WHITE, rl.BLACK)
+
+    def on_copy(operation):
+        def run():
+            image = rl.image_copy(source)
+            operation(image)
+            rl.unload_image(image)
+        return run
+
+    def generate(function, *args):
+        return lambda: rl.unload_image(function(*args))
+
+    return (
+        ('gen_image_color_256', generate(rl.gen_image_color, 256, 256, rl.RED)),
+        ('gen_image_checked_256', generate(rl.gen_image_checked, 256, 256, 8, 8, rl.WHITE, rl.BLACK)),
+        ('gen_image_white_noise_256', generate(rl.gen_image_white_noise, 256, 256, 0.5)),
+        ('gen_image_perlin_noise_256', generate(rl.gen_image_perlin_noise, 256, 256, 0, 0, 4.0)),
+        ('image_copy_256', on_copy(lambda image: None)),
+        ('image_resize_256_to_128', on_copy(lambda image: rl.image_resize(image, 128, 128))),
+        ('image_resize_nn_256_to_512', on_copy(lambda image: rl.image_resize_nn(image, 512, 512))),
+        ('image_blur_gaussian_256', on_copy(lambda image: rl.image_blur_gaussian(image, 2))),
+        ('image_flip_vertical_256', on_copy(rl.image_flip_vertical)),
+        ('image_color_grayscale_256', on_copy(rl.image_color_grayscale)),
+    )
+
+
+def mesh_cases(rl):
+    def generate(function, *args):
+        return lambda: rl.unload_mesh(function(*args))
+
+    return (
+        ('gen_cube', generate(rl.Mesh.gen_cube, 1.0, 1.0, 1.0)),
+        ('gen_plane_32', generate(rl.Mesh.gen_plane, 10.0, 10.0, 32, 32)),
+        ('gen_sphere_32', generate(rl.Mesh.gen_sphere, 1.0, 32, 32)),
+        ('gen_cylinder_32', generate(rl.Mesh.gen_cylinder, 1.0, 2.0, 32)),
+        ('gen_torus_32', generate(rl.Mesh.gen_torus, 1.0, 0.5, 32, 32)),
+        ('gen_knot_32', generate(rl.Mesh.gen_knot, 1.0, 0.5, 32, 32)),
+    )
+
+
+def text_cases(rl):
+    text = 'The quick brown fox jumps over the lazy dog ' * 4
+    size = ctypes.c_int()
+    return (
+        ('text_length', lambda: rl.text_length(text)),
+        ('text_is_equal', lambda: rl.text_is_equal(text, text)),
+        ('text_subtext', lambda: rl.text_subtext(text, 10, 20)),
+        ('text_find_index', lambda: rl.text_find_index(text, 'lazy')),
+        ('text_to_upper', lambda: rl.text_to_upper(text)),
+        ('text_to_integer', lambda: rl.text_to_integer('123456')),
+        ('text_split', lambda: rl.text_split(text, ord(' '), ctypes.byref(size))),
+        ('get_codepoint', lambda: rl.get_codepoint('été', ctypes.byref(size))),
+        ('codepoint_to_utf8', lambda: rl.codepoint_to_utf8(0x20AC, ctypes.byref(size))),
+    )
+
+
+def wave_cases(rl):
+    # One second of 16 bit stereo noise, in memory allocated by raylib so that unload_wave can free it
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(44100)
+        writer.writeframes(os.urandom(44100 * 4))
+    frames = buffer.getvalue()[44:]
+    data = rl.mem_alloc(len(frames))
+    ctypes.memmove(data, frames, len(frames))
+    source = rl.Wave(44100, 44100, 16, 2, data)
+
+    def on_copy(operation):
+        def run():
+            copy = rl.wave_copy(source)
+            operation(copy)
+            rl.unload_wave(copy)
+        return run
+
+    return (
+        ('wave_copy_1s', on_copy(lambda copy: None)),
+        ('wave_crop_1s', on_copy(lambda copy: rl.wave_crop(copy, 1000, 20000))),
+        ('wave_format_1s_to_22050_mono', on_copy(lambda copy: rl.wave_format(copy, 22050, 16, 1))),
+        ('wave_format_1s_to_float', on_copy(lambda copy: rl.wave_format(copy, 44100, 32, 2))),
+        ('load_wave_samples_1s', lambda: rl.unload_wave_samples(rl.load_wave_samples(source))),
+    )
+
+
+# (cases factory, needs a window)
+GROUPS = {
+    'raymath': (raymath_cases, False),
+    'structs': (structs_cases, False),
+    'swizzles': (swizzles_cases, False),
+    'image': (image_cases, False),
+    'mesh': (mesh_cases, True),
+    'text': (text_cases, False),
+    'wave': (wave_cases, False),
+}
+
+# endregion (groups)
+
+
+# region RUNNING
+
+def measure(function, repeat, min_time):
+    """Returns the best and median times of one call of `function` in ns, and the calls per run"""
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    times = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return {'best_ns': round(min(times), 1), 'median_ns': round(statistics.median(times), 1), 'number': number}
+
+
+def run_group(name, repeat, min_time):
+    """Runs the cases of a group in this process, returns (status, results)"""
+    import raylibpy as rl
+
+    factory, needs_window = GROUPS[name]
+    rl.set_trace_log_level(rl.LOG_WARNING)
+    if needs_window:
+        # raylib exits the process when it fails to create the window
+        if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+            return 'skipped: needs a window (no display available)', {}
+        rl.set_config_flags(rl.FLAG_WINDOW_HIDDEN)
+        rl.init_window(64, 64, 'suite')
+
+    try:
+        cases = factory(rl)
+    except AttributeError as error:     # missing symbol in the loaded raylib
+        return 'skipped: {}'.format(error), {}
+
+    results = {}
+    for case, function in cases:
+        try:
+            function()
+        except AttributeError as error:
+            results[case] = {'skipped': str(error)}
+            continue
+        except Exception as error:
+            results[case] = {'error': '{}: {}'.format(type(error).__name__, error)}
+            continue
+        results[case] = measure(function, repeat, min_time)
+
+    if needs_window:
+        rl.close_window()
+    return 'ok', results
+
+
+def run_suite(groups, repeat, min_time):
+    """Runs each group in a child interpreter, returns the report"""
+    report = {'environment': environment(), 'groups': {}, 'results': {}}
+    for name in groups:
+        print("running {}...".format(name), file=sys.stderr)
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'group.json')
+            process = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--run-group', name, '--group-output', output,
+                 '--repeat', str(repeat), '--min-time', str(min_time)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            if process.returncode != 0 or not os.path.exists(output):
+                report['groups'][name] = 'failed: exit code {}'.format(process.returncode)
+                print(process.stderr.decode('utf-8', 'replace')[-2000:], file=sys.stderr)
+                continue
+            with open(output) as file:
+                status, results = json.load(file)
+        report['groups'][name] = status
+        for case, result in results.items():
+            report['results']['{}.{}'.format(name, case)] = result
+    return report
+
+
+def environment():
+    """Returns the environment the results depend on"""
+    import raylibpy as rl
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL).stdout.decode().strip()
+    except OSError:
+        commit = ''
+    return {
+        'commit': commit,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'raylib_library': os.path.basename(getattr(rl.rlapi, '_name', '') or ''),
+    }
+
+
+def compare(base, new, threshold):
+    """Prints the cases of two reports side by side, returns the number of regressions"""
+    regressions = 0
+    print("{:<44} {:>14} {:>14} {:>9}".format('case', 'base (ns)', 'new (ns)', 'change'))
+    for case in sorted(set(base['results']) | set(new['results'])):
+        old, current = base['results'].get(case, {}), new['results'].get(case, {})
+        if 'best_ns' not in old or 'best_ns' not in current:
+            print("{:<44} {:>14} {:>14}".format(case, old.get('best_ns', '-'), current.get('best_ns', '-')))
+            continue
+        change = current['best_ns'] / old['best_ns'] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print("{:<44} {:>14.1f} {:>14.1f} {:>+8.1%}{}".format(case, old['best_ns'], current['best_ns'], change, flag))
+    for name, status in sorted(new['groups'].items()):
+        if status != 'ok':
+            print("group {}: {}".format(name, status))
+    return regressions
+
+# endregion (running)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless benchmark suite of the raylibpy binding layer')
+    parser.add_argument('--groups', nargs='+', choices=sorted(GROUPS), default=list(GROUPS), help='groups to run')
+    parser.add_argument('--output', help='file to write the JSON results to (default: stdout)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per case (best and median are kept)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per run')
+    parser.add_argument('--quick', action='store_true', help='shorter runs (--repeat 3 --min-time 0.05)')
+    parser.add_argument('--compare', nargs='+', metavar='JSON', help='compare a base report with another one or a new run')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative slowdown reported as a regression')
+    parser.add_argument('--run-group', help=argparse.SUPPRESS)
+    parser.add_argument('--group-output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.05
+
+    if args.run_group:
+        with open(args.group_output, 'w') as file:
+            json.dump(run_group(args.run_group, args.repeat, args.min_time), file)
+        return
+
+    if args.compare:
+        with open(args.compare[0]) as file:
+            base = json.load(file)
+        if len(args.compare) > 1:
+            with open(args.compare[1]) as file:
+                report = json.load(file)
+        else:
+            report = run_suite(args.groups, args.repeat, args.min_time)
+        sys.exit(1 if compare(base, report, args.threshold) else 0)
+
+    report = run_suite(args.groups, args.repeat, args.min_time)
+    text = json.dumps(report, indent=1, sort_keys=True) + '\n'
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == '__main__':
+    main()
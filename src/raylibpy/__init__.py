@@ -63,12 +63,17 @@
 
 import sys
 import re
+import importlib
 import os
-import platform
 import ctypes
 import json
+import logging
 import struct
 
+from array import array
+from collections import OrderedDict
+from itertools import chain, permutations
+from operator import attrgetter
 from typing import Generic, TypeVar
 from enum import IntEnum
 from contextlib import contextmanager
@@ -80,7 +85,7 @@ from ctypes import (
     c_ubyte, c_ushort, c_uint, c_ulong, c_ulonglong,
     c_float, c_double, c_longdouble,
     c_void_p, c_size_t,
-    Array, Structure, POINTER, CFUNCTYPE, byref, cast, pointer, POINTER
+    Array, Structure, POINTER, CFUNCTYPE, byref, cast, pointer, POINTER, sizeof, _Pointer
 )
 
 from . import easings
@@ -93,12 +98,33 @@ from . import easings
 __all__ = [
 
     # utilities
+    'bind_all_symbols',
     'byte_array',
     'clear_format_string_cache',
+    'clear_text_measure_cache',
+    'disable_profiler',
+    'disable_resource_tracking',
     'double_array',
+    'draw_profiler_overlay',
+    'enable_profiler',
+    'enable_resource_tracking',
     'float_array',
+    'format_resource_report',
+    'get_live_resources',
+    'get_math_backend',
+    'get_profiler_frame_count',
+    'get_profiler_stats',
+    'get_resource_report',
+    'get_text_measure_stats',
     'int_array',
+    'is_profiler_enabled',
+    'is_resource_tracking_enabled',
     'pop_out_param',
+    'release_finalized_resources',
+    'reset_profiler',
+    'reset_text_measure_stats',
+    'set_math_backend',
+    'set_text_measure_cache_size',
     'short_array',
     'string_array',
     'ubyte_array',
@@ -186,7 +212,9 @@ __all__ = [
     'Texture',
     'Transform',
     'Vector2',
+    'Vector2Array',
     'Vector3',
+    'Vector3Array',
     'Vector4',
     'VrDeviceInfo',
     'VrStereoConfig',
@@ -197,6 +225,19 @@ __all__ = [
     'rlRenderBatch',
     'rlVertexBuffer',
 
+    # helpers
+    'AssetLoader',
+    'AssetPack',
+    'AssetPackBuilder',
+    'AudioProcessor',
+    'ImageCache',
+    'MusicStreamer',
+    'ResourceCache',
+    'SoundMixer',
+    'SpriteBatch',
+    'StreamingAudioSource',
+    'StreamingTexture',
+
     # enums
     'BlendMode',
     'CameraMode',
@@ -842,6 +883,7 @@ __all__ = [
     'draw_circle_sector',
     'draw_circle_sector_lines',
     'draw_circle_v',
+    'draw_circles',
     'draw_cube',
     'draw_cube_v',
     'draw_cube_wires',
@@ -860,6 +902,7 @@ __all__ = [
     'draw_line_ex',
     'draw_line_strip',
     'draw_line_v',
+    'draw_lines',
     'draw_mesh',
     'draw_mesh_instanced',
     'draw_model',
@@ -885,6 +928,7 @@ __all__ = [
     'draw_rectangle_rounded',
     'draw_rectangle_rounded_lines',
     'draw_rectangle_v',
+    'draw_rectangles',
     'draw_ring',
     'draw_ring_lines',
     'draw_sphere',
@@ -1198,6 +1242,7 @@ __all__ = [
     'matrix_invert',
     'matrix_look_at',
     'matrix_multiply',
+    'matrix_multiply_batch',
     'matrix_ortho',
     'matrix_perspective',
     'matrix_rotate',
@@ -1246,6 +1291,7 @@ __all__ = [
     'quaternion_normalize',
     'quaternion_scale',
     'quaternion_slerp',
+    'quaternion_slerp_batch',
     'quaternion_subtract',
     'quaternion_subtract_value',
     'quaternion_to_axis_angle',
@@ -1461,6 +1507,7 @@ __all__ = [
     'set_window_state',
     'set_window_title',
     'show_cursor',
+    'sprite_vertices',
     'start_automation_event_recording',
     'stop_audio_stream',
     'stop_automation_event_recording',
@@ -1586,6 +1633,7 @@ __all__ = [
     'vector3_subtract_value',
     'vector3_to_float_v',
     'vector3_transform',
+    'vector3_transform_batch',
     'vector3_unproject',
     'vector3_zero',
     'wait_time',
@@ -1682,9 +1730,35 @@ if sys.platform == 'win32':
 
 # endregion (cdllex)
 
+# Diagnostics of the library loading; set RAYLIBPY_VERBOSE=1 to print them to stderr
+_logger = logging.getLogger('raylibpy')
+
+if os.environ.get('RAYLIBPY_VERBOSE', '0') not in ('', '0'):
+    _logger.addHandler(logging.StreamHandler())
+    _logger.setLevel(logging.DEBUG)
+
 _dotraylib_used = False
 _dotraylib_loadinfo = []
 
+# Parsed .raylib files, keyed by (path, modification time)
+_dotraylib_cache = {}
+
+# Resolved library paths, keyed by (library name, .raylib path, .raylib modification time)
+_library_path_cache = {}
+
+
+def _dotraylib_key():
+    """Returns the (path, modification time) of the .raylib file in the current working directory
+
+    The modification time is None when there is no such file.
+    """
+    _dotraylib = os.path.join(os.getcwd(), '.raylib')
+    try:
+        return _dotraylib, os.stat(_dotraylib).st_mtime_ns
+    except OSError:
+        return _dotraylib, None
+
+
 def _check_dotraylib(lib, platform, bitness, default=None):
     """Checks for the .raylib file in the current working directory
 
@@ -1710,28 +1784,61 @@ def _check_dotraylib(lib, platform, bitness, default=None):
     ```
     """
 
-    global _dotraylib_loadinfo, _dotraylib_used
-    _dotraylib = os.path.join(os.getcwd(), '.raylib')
+    global _dotraylib_used
+    key = _dotraylib_key()
 
-    if os.path.exists(_dotraylib) and os.path.isfile(_dotraylib):
-        _dotraylib_used = True
+    if key[1] is None:
+        _dotraylib_loadinfo.append("INFO: .raylib file not available")
+        return default
+
+    _dotraylib_used = True
+    _dotraylib_config = _dotraylib_cache.get(key)
 
-        with open(_dotraylib, 'r', encoding='utf8') as fp:
+    if _dotraylib_config is None:
+        with open(key[0], 'r', encoding='utf8') as fp:
             try:
                 _dotraylib_config = json.load(fp)
-                _libpath = _dotraylib_config.get(lib, {}).get(platform, {}).get(bitness, default)
                 _dotraylib_loadinfo.append("INFO: .raylib loaded successfully")
-                return _libpath
-
             except json.JSONDecodeError:
+                _dotraylib_config = {}
                 _dotraylib_loadinfo.append("ERROR: Could not decode .raylib file")
-    else:
-        _dotraylib_loadinfo.append("INFO: .raylib file not available")
-    return default
+        _dotraylib_cache[key] = _dotraylib_config
+
+    return _dotraylib_config.get(lib, {}).get(platform, {}).get(bitness, default)
+
+
+def _log_library_info(lib_name, is_extension, abspath):
+    """Logs the library resolution details (only when debug logging is enabled)"""
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return
+
+    _load_info = "\n            ".join(_dotraylib_loadinfo) if _dotraylib_loadinfo else "does not apply"
+
+    _logger.debug(
+        """Library loading info (%s):
+        platform: %s
+        current working dir: %s
+        .raylib used: %s
+        .raylib status: %s
+        absolute path: %s
+        is extension: %s
+        path exists: %s
+        path leads to a file: %s""",
+        lib_name,
+        sys.platform,
+        os.getcwd(),
+        'yes' if _dotraylib_used else 'no',
+        _load_info,
+        abspath,
+        'yes' if is_extension else 'no',
+        'yes' if os.path.exists(abspath) else 'no',
+        'yes' if os.path.isfile(abspath) else 'no'
+    )
 
 
 def _load_library(lib_name, is_extension, basedir, **bin_fnames):
-    global _dotraylib_loadinfo, _dotraylib_used
+    """Loads and returns the shared library `lib_name`, raising OSError on failure"""
+    global _dotraylib_used
 
     _lib_fname = {
         'win32': bin_fnames.get('win32', 'no_file_specified.dll'),
@@ -1739,83 +1846,49 @@ def _load_library(lib_name, is_extension, basedir, **bin_fnames):
         'darwin': bin_fnames.get('darwin', 'no_file_specified.dylib')
     }
 
-    _dotraylib_used = False
     _lib_platform = sys.platform
+    _cache_key = (lib_name,) + _dotraylib_key()
+    _lib_fname_abspath = _library_path_cache.get(_cache_key)
+    _dotraylib_loadinfo.clear()
 
-    if _lib_platform == 'win32':
-        _bitness = platform.architecture()[0]
-    elif _lib_platform == 'darwin':
-        _bitness = '64bit'
-    else:
-        _bitness = '64bit' if sys.maxsize > 2 ** 32 else '32bit'
-
-    if is_extension:
-        _lib_default = None
-    else:
-        _lib_default = os.path.join(*(d.format(os.path.dirname(__file__)) for d in basedir), _bitness, _lib_fname[_lib_platform])
+    if _lib_fname_abspath is None:
+        _dotraylib_used = False
 
-    _lib_default = _check_dotraylib(lib_name, _lib_platform, _bitness, _lib_default)
+        # the bitness of the running interpreter, which is what the binary must match
+        if _lib_platform == 'darwin':
+            _bitness = '64bit'
+        else:
+            _bitness = '64bit' if sys.maxsize > 2 ** 32 else '32bit'
 
-    if not _lib_default:
         if is_extension:
-            _dotraylib_loadinfo.append("ERROR: Platform ({}), bitness ({}) or valid filename not specified in .raylib file for {} extension".format(lib_name, _lib_platform, _bitness))
+            _lib_default = None
         else:
-            _dotraylib_loadinfo.append("ERROR: Platform ({}), bitness ({}) or valid filename not specified in .raylib file for {}".format(lib_name, _lib_platform, _bitness))
-
-        _lib_fname_abspath = ''
-        _ok = False
-    else:
-        _lib_fname_abspath = os.path.normcase(os.path.normpath(_lib_default))
-        _ok = True
+            _lib_default = os.path.join(*(d.format(os.path.dirname(__file__)) for d in basedir), _bitness, _lib_fname[_lib_platform])
 
-    _cwd_info = os.getcwd()
-    _load_info = "\n            ".join(_dotraylib_loadinfo) if _dotraylib_loadinfo else "does not apply"
-
-    print(
-        """Library loading info:
-        platform: {}
-        bitness: {}
-        current working dir: {}
-        .raylib used: {}
-        .raylib status: {}
-        absolute path: {}
-        is extension: {}
-        path exists: {}
-        path leads to a file: {}
-        """.format(
-            _lib_platform,
-            _bitness,
-            _cwd_info,
-            'yes' if _dotraylib_used else 'no',
-            _load_info,
-            _lib_fname_abspath,
-            'yes' if is_extension else 'no',
-            'yes' if os.path.exists(_lib_fname_abspath) else 'no',
-            'yes' if os.path.isfile(_lib_fname_abspath) else 'no'
-        )
-    )
+        _lib_default = _check_dotraylib(lib_name, _lib_platform, _bitness, _lib_default)
 
-    if not _ok:
-        print("Failed to load Shared library", lib_name)
-        sys.exit(1)
+        if not _lib_default:
+            if is_extension:
+                _dotraylib_loadinfo.append("ERROR: Platform ({}), bitness ({}) or valid filename not specified in .raylib file for {} extension".format(_lib_platform, _bitness, lib_name))
+            else:
+                _dotraylib_loadinfo.append("ERROR: Platform ({}), bitness ({}) or valid filename not specified in .raylib file for {}".format(_lib_platform, _bitness, lib_name))
+            _log_library_info(lib_name, is_extension, '')
+            raise OSError("Failed to load shared library {}: {}".format(lib_name, _dotraylib_loadinfo[-1]))
 
-    lib_ = None
-    if _lib_platform == 'win32':
+        _lib_fname_abspath = os.path.normcase(os.path.normpath(_lib_default))
+        _library_path_cache[_cache_key] = _lib_fname_abspath
+        _log_library_info(lib_name, is_extension, _lib_fname_abspath)
 
-        try:
+    try:
+        if _lib_platform == 'win32':
             lib_ = CDLLEx(_lib_fname_abspath, LOAD_WITH_ALTERED_SEARCH_PATH)
-        except OSError as e:
-            print("Unable to load {}: {}".format(_lib_fname[_lib_platform], e.args))
-            lib_ = None
-    else:
-        lib_ = CDLL(_lib_fname_abspath)
-
-    if lib_ is None:
-        print("Failed to load Shared library", lib_name)
-        sys.exit(1)
-    else:
-        print("Shared library loaded succesfully", lib_)
+        else:
+            lib_ = CDLL(_lib_fname_abspath)
+    except OSError as e:
+        _library_path_cache.pop(_cache_key, None)
+        raise OSError("Failed to load shared library {} from '{}': {}".format(lib_name, _lib_fname_abspath, e)) from e
 
+    _logger.debug("Shared library loaded successfully: %s", lib_)
     return lib_
 
 
@@ -1823,14 +1896,28 @@ rlapi = _load_library('raylib', False, ['{}/bin'], win32='raylib.dll', linux='li
 
 # endregion (library loading)
 
-print('\nraylib-py v{RAYLIB_VERSION} is initializing.\n')
-
 # region GLOBALS
 
 # Used to store temporarily out param argument passed to functions
 # so that the values can be retrieved following the call
 _in_out = []
 
+# Binding table: maps C function names to lazy placeholders or bound functions
+_symbol_table = {}
+
+# Namespaces whose `_FunctionName` placeholders are replaced once bound
+_symbol_namespaces = [globals()]
+
+# Python implementations replacing C functions: C function name -> function (see set_math_backend)
+_symbol_overrides = {}
+
+# Interposition: C function name -> [(owner, factory)], innermost first; each factory(name, function)
+# returns a wrapper of the function below it (see _interpose)
+_interposers = {}
+
+# Name of the implementation of the component-wise vector operations (see set_math_backend)
+_math_backend = 'raymath'
+
 # TypeVar for generic Array class
 _T = TypeVar('_T')
 
@@ -1859,18 +1946,19 @@ FMT_SPEC_TABLE = {
 
 _fmt_cache = {}
 
-# Vector component swizzling helppers
-RE_VEC2_GET_SWZL = re.compile(r'[xy]{,4}')
-RE_VEC3_GET_SWZL = re.compile(r'[xyz]{,4}')
-RE_VEC4_GET_SWZL = re.compile(r'[xyzw]{,4}')
-RE_RGBA_GET_SWZL = re.compile(r'[rgba]{1,4}')
-RE_RECT_GET_SWZL = re.compile(r'(width|height|[xywhcmrb]{,4})')
-
-RE_VEC2_SET_SWZL = re.compile(r'[xy]{,2}')
-RE_VEC3_SET_SWZL = re.compile(r'[xyz]{,3}')
-RE_VEC4_SET_SWZL = re.compile(r'[xyzw]{,4}')
-RE_RGBA_SET_SWZL = re.compile(r'[rgba]{1,4}')
-RE_RECT_SET_SWZL = re.compile(r'(width|height|[xywhcmrb]{,4})')
+# Text measure cache: font texture id (None for measure_text's default font) -> OrderedDict of
+# (text, font size[, spacing]) -> measure, least recently used first (see set_text_measure_cache_size)
+_text_measures = {}
+_text_measure_limit = 1024      # entries per font, 0 disables the cache
+_text_measure_stats = [0, 0]    # hits, misses
+_text_line_spacing = 2          # raylib's textLineSpacing: measures are cleared when it changes
+
+# Default size of new audio streams set by the application, 0 for raylib's (raylib has no getter)
+_audio_stream_buffer_size = 0
+
+# LoadFileDataCallback set by the application, and the one installed over it while asset packs are mounted
+_load_file_data_callbacks = {'application': None, 'override': None}
+
 # endregion (globals)
 
 # region UTILS
@@ -1942,50 +2030,246 @@ def _str_out(value):
     return value.decode('utf-8', 'ignore') if isinstance(value, bytes) else value
 
 
-def _float(value):
-    return float(value)
+def _numpy():
+    """Imports NumPy, an optional dependency only needed by the array interop features"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("this feature requires NumPy, install it with `pip install numpy`") from None
+    return numpy
+
+
+# Argument coercion, run by every wrapper: the common case (argument already of the
+# expected type) must stay a single check, and conversions write the fields with
+# struct.pack_into instead of going through the component descriptors.
+
+_bool = bool
+_float = float
+_struct_new = Structure.__new__
+
+_pack_2f = struct.Struct('2f').pack_into
+_pack_3f = struct.Struct('3f').pack_into
+_pack_4f = struct.Struct('4f').pack_into
+_pack_4B = struct.Struct('4B').pack_into
+
+# Colors converted from tuples, mostly constants like (255, 0, 0, 255) written in draw calls
+_color_cache = {}
+_COLOR_CACHE_SIZE = 256
 
 
 def _int(value, ranged=None):
+    value = int(value)
     if ranged:
-        return max(ranged[0], min(int(value), ranged[1]))
-    return int(value)
+        low, high = ranged
+        return low if value < low else high if value > high else value
+    return value
+
+
+def _byte(value):
+    value = int(value)
+    return 0 if value < 0 else 255 if value > 255 else value
 
 
 def _vec2(seq):
     if isinstance(seq, Vector2):
         return seq
     x, y = seq
-    return Vector2(_float(x), _float(y))
+    vector = _struct_new(Vector2)
+    try:
+        _pack_2f(vector, 0, x, y)
+    except (OverflowError, struct.error):
+        return Vector2(float(x), float(y))
+    return vector
 
 
 def _vec3(seq):
     if isinstance(seq, Vector3):
         return seq
     x, y, z = seq
-    return Vector3(float(x), float(y), float(z))
+    vector = _struct_new(Vector3)
+    try:
+        _pack_3f(vector, 0, x, y, z)
+    except (OverflowError, struct.error):
+        return Vector3(float(x), float(y), float(z))
+    return vector
 
 
 def _vec4(seq):
     if isinstance(seq, Vector4):
         return seq
     x, y, z, w = seq
-    return Vector4(float(x), float(y), float(z), float(w))
+    vector = _struct_new(Vector4)
+    try:
+        _pack_4f(vector, 0, x, y, z, w)
+    except (OverflowError, struct.error):
+        return Vector4(float(x), float(y), float(z), float(w))
+    return vector
+
+
+def _vec2_operand(other):
+    # operators use the first two items of longer sequences too (a Vector3, (x, y, z)...)
+    if isinstance(other, Vector2):
+        return other
+    return _vec2((other[0], other[1]))
+
+
+def _vec3_operand(other):
+    if isinstance(other, Vector3):
+        return other
+    return _vec3((other[0], other[1], other[2]))
+
+
+def _vec2_array(seq):
+    if isinstance(seq, (BaseArray, _Pointer, Vector2Array)):
+        return seq
+    return Vector2Array(seq)
+
+
+def _vec3_array(seq):
+    if isinstance(seq, (BaseArray, _Pointer, Vector3Array)):
+        return seq
+    return Vector3Array(seq)
+
+
+class _Swizzle(object):
+    """Descriptor reading and writing several components of a struct at once (e.g. `v.xy = v.yx`)"""
+
+    __slots__ = ('read', 'writers', 'result_type')
+
+    def __init__(self, read, writers, result_type):
+        self.read = read
+        self.writers = writers
+        self.result_type = result_type
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.result_type(*self.read(instance))
+
+    def __set__(self, instance, value):
+        writers = self.writers
+        if writers is None:
+            raise AttributeError("swizzle with repeated components is read-only")
+        if len(writers) == 1:
+            writers[0](instance, value)
+        else:
+            for i, write in enumerate(writers):
+                write(instance, value[i])
+
+
+def _components(*values):
+    return values
+
+
+def _make_swizzle(cls, name, writable):
+    components = cls._swizzle_components
+    if all(isinstance(components[ch], str) for ch in name):
+        fields = [components[ch] for ch in name]
+        read = attrgetter(*fields) if len(fields) > 1 else (lambda obj, get=attrgetter(fields[0]): (get(obj),))
+    else:
+        getters = [attrgetter(components[ch]) if isinstance(components[ch], str) else components[ch][0] for ch in name]
+        read = lambda obj: [get(obj) for get in getters]
+    writers = None
+    if writable:
+        writers = tuple(
+            cls.__dict__[components[ch]].__set__ if isinstance(components[ch], str) else components[ch][1]
+            for ch in name)
+    return _Swizzle(read, writers, cls._swizzle_results[len(name)])
+
+
+def _define_swizzles(cls, components, results, exclusive=()):
+    """Installs a descriptor on `cls` for every swizzle made of distinct components
+
+    `components` maps a letter either to a field name, read and written directly,
+    or to a (getter, setter) pair; `exclusive` lists letters writing the same
+    field, which can't be combined. Swizzles repeating a component (e.g. `xxy`)
+    are read-only and created on first access by `_lazy_swizzle`.
+    """
+    cls._swizzle_components = components
+    cls._swizzle_results = results
+    for size in range(1, 5):
+        if size not in results:
+            continue
+        for letters in permutations(components, size):
+            if any(len(group.intersection(letters)) > 1 for group in exclusive):
+                continue
+            name = ''.join(letters)
+            if components[name[0]] == name:
+                continue    # plain fields keep their ctypes descriptor
+            elif size == 1 and not isinstance(components[name], str):
+                setattr(cls, name, property(*components[name]))
+            else:
+                setattr(cls, name, _make_swizzle(cls, name, True))
+
+
+def _lazy_swizzle(cls, name):
+    components = getattr(cls, '_swizzle_components', ())
+    if not 0 < len(name) <= 4 or len(name) not in cls._swizzle_results or any(ch not in components for ch in name):
+        raise AttributeError("{} object does not have attribute '{}'.".format(cls.__name__, name))
+    swizzle = _make_swizzle(cls, name, False)
+    setattr(cls, name, swizzle)
+    return swizzle
+
+
+def _buffer_in(source):
+    """Returns `source` in a form accepted by a `void *` parameter, sharing its memory when possible
+
+    Pointers, ctypes arrays, bytes and ints pass through; C-contiguous writable
+    buffers (NumPy arrays, bytearray, memoryview, mmap...) are wrapped without a
+    copy, read-only NumPy arrays by address; other read-only buffers are copied.
+    """
+    if source is None or isinstance(source, (int, bytes, c_void_p, BaseArray, _Pointer)):
+        return source
+    view = memoryview(source)
+    if not view.c_contiguous:
+        raise ValueError("buffer must be C-contiguous")
+    if not view.readonly:
+        return (c_char * view.nbytes).from_buffer(view)
+    interface = getattr(source, '__array_interface__', None)
+    if interface is not None:
+        return interface['data'][0]
+    return view.tobytes()
+
+
+def _ubyte_buffer_in(source):
+    """Returns `source` (see _buffer_in()) as an `unsigned char *`, sharing its memory when possible"""
+    source = _buffer_in(source)
+    if source is None or isinstance(source, UCharPtr):
+        return source
+    return cast(source, UCharPtr)
 
 
 def _rect(seq):
     if isinstance(seq, Rectangle):
         return seq
     x, y, w, h = seq
-    return Rectangle(float(x), float(y), float(w), float(h))
+    rec = _struct_new(Rectangle)
+    try:
+        _pack_4f(rec, 0, x, y, w, h)
+    except (OverflowError, struct.error):
+        return Rectangle(float(x), float(y), float(w), float(h))
+    return rec
 
 
 def _color(seq):
     if isinstance(seq, Color):
         return seq
-    r, g, b, q = seq
-    rng = 0, 255
-    return Color(_int(r, rng), _int(g, rng), _int(b, rng), _int(q, rng))
+    cached = type(seq) is tuple
+    if cached:
+        color = _color_cache.get(seq)
+        if color is not None:
+            return color
+    r, g, b, a = seq
+    color = _struct_new(Color)
+    try:
+        _pack_4B(color, 0, r, g, b, a)
+    except struct.error:    # out of range or not integers
+        _pack_4B(color, 0, _byte(r), _byte(g), _byte(b), _byte(a))
+    if cached:
+        if len(_color_cache) >= _COLOR_CACHE_SIZE:
+            _color_cache.clear()
+        _color_cache[seq] = color
+    return color
 
 
 def _array_in(sequence, type_ctype=None):
@@ -2007,11 +2291,205 @@ def _push_in_out(ctype_pointer_type):
     _in_out.append(ctype_pointer_type)
 
 
-def _wrap(api, res_type, *arg_types):
-    """Configure the paramters and return types for the wrapped C function and returns it"""
-    api.argtypes = arg_types
-    api.restype = res_type
-    return api
+class _LazySymbol(object):
+    """Placeholder for a C function that is resolved and configured on its first call"""
+
+    __slots__ = ('name', 'res_type', 'arg_types')
+
+    def __init__(self, name, res_type, arg_types):
+        self.name = name
+        self.res_type = res_type
+        self.arg_types = arg_types
+
+    def __repr__(self):
+        return "<unbound symbol '{}'>".format(self.name)
+
+    def __call__(self, *args):
+        return self.bind()(*args)
+
+    def bind(self):
+        """Resolves the C function, configures it and replaces this placeholder by it"""
+        api = getattr(rlapi, self.name)
+        api.argtypes = self.arg_types
+        api.restype = self.res_type
+        alias = '_' + self.name
+        for namespace in _symbol_namespaces:
+            if namespace.get(alias) is self:
+                namespace[alias] = api
+        _symbol_table[self.name] = api
+        return api
+
+
+def _wrap(name, res_type, *arg_types):
+    """Registers the C function `name` in the binding table and returns its lazy placeholder
+
+    The symbol is only looked up in the shared library (and its parameter and
+    return types configured) the first time it is called.
+    """
+    symbol = _LazySymbol(name, res_type, arg_types)
+    _symbol_table[name] = symbol
+    return symbol
+
+
+def _bound_on_call(symbol):
+    """Returns a callable calling the lazy placeholder `symbol`, bound on its first call"""
+    target = [symbol]
+
+    def call(*args):
+        if isinstance(target[0], _LazySymbol):
+            target[0] = target[0].bind()
+        return target[0](*args)
+    return call
+
+
+def _install_symbol(name):
+    """Puts the C function `name` (or its override) wrapped by its interposers in every namespace using it"""
+    function = _symbol_overrides.get(name) or _symbol_table[name]
+    interposers = _interposers.get(name)
+    if interposers:
+        if isinstance(function, _LazySymbol):
+            function = _bound_on_call(function)
+        for _, factory in interposers:
+            function = factory(name, function)
+    alias = '_' + name
+    for namespace in _symbol_namespaces:
+        if alias in namespace:
+            namespace[alias] = function
+
+
+def _interpose(name, owner, factory):
+    """Wraps the C function `name` with factory(name, function) in every namespace, until _withdraw()
+
+    Interposers (the profiler, the resource tracker...) stack up: each wraps the
+    ones added before it, and any of them can be withdrawn without disturbing the
+    others, whose wrappers are rebuilt over what remains.
+    """
+    _interposers.setdefault(name, []).append((owner, factory))
+    _install_symbol(name)
+
+
+def _withdraw(name, owner):
+    """Removes the wrapper of `owner` from the C function `name`"""
+    interposers = [entry for entry in _interposers.get(name, ()) if entry[0] != owner]
+    if interposers:
+        _interposers[name] = interposers
+    else:
+        _interposers.pop(name, None)
+    _install_symbol(name)
+
+
+def _text_measure_lookup(font_id, key):
+    """Returns the measure cached under `key` for the font `font_id`, None if not cached"""
+    if not _text_measure_limit:
+        return None
+    cache = _text_measures.get(font_id)
+    value = cache.get(key) if cache is not None else None
+    if value is None:
+        _text_measure_stats[1] += 1
+    else:
+        cache.move_to_end(key)
+        _text_measure_stats[0] += 1
+    return value
+
+
+def _text_measure_store(font_id, key, value):
+    """Caches `value` under `key` for the font `font_id`, dropping its least recently used measure if full"""
+    if _text_measure_limit:
+        cache = _text_measures.get(font_id)
+        if cache is None:
+            cache = _text_measures[font_id] = OrderedDict()
+        cache[key] = value
+        if len(cache) > _text_measure_limit:
+            cache.popitem(last=False)
+    return value
+
+
+def _measure_text(text, font_size):
+    """MeasureText, cached once the default font is loaded (by init_window)"""
+    key = (text, font_size)
+    width = _text_measure_lookup(None, key)
+    if width is None:
+        width = _MeasureText(_str_in(text), _int(font_size))
+        if _GetFontDefault().texture.id:
+            _text_measure_store(None, key, width)
+    return width
+
+
+def _measure_text_ex(font, text, font_size, spacing):
+    """MeasureTextEx, cached for the fonts having a texture"""
+    font_id = font.texture.id
+    if not font_id:
+        return _MeasureTextEx(font, _str_in(text), _float(font_size), _float(spacing))
+    key = (text, font_size, spacing)
+    size = _text_measure_lookup(font_id, key)
+    if size is None:
+        vector = _MeasureTextEx(font, _str_in(text), _float(font_size), _float(spacing))
+        _text_measure_store(font_id, key, (vector.x, vector.y))
+        return vector
+    return Vector2(*size)
+
+
+def _set_text_line_spacing(spacing):
+    """SetTextLineSpacing, clearing the cached measures if the spacing changes"""
+    global _text_line_spacing
+
+    spacing = _int(spacing)
+    if spacing != _text_line_spacing:
+        _text_measures.clear()
+        _text_line_spacing = spacing
+    _SetTextLineSpacing(spacing)
+
+
+def _forget_text_measures(font):
+    """Forgets the measures cached for `font`, whose texture id may be reused once it is unloaded"""
+    _text_measures.pop(font.texture.id, None)
+
+
+def _unload_font(font):
+    """UnloadFont, forgetting the measures cached for the font"""
+    _forget_text_measures(font)
+    _UnloadFont(font)
+
+
+def _set_audio_stream_buffer_size_default(size):
+    """SetAudioStreamBufferSizeDefault, remembering the size to restore after _audio_stream_buffer_size_override"""
+    global _audio_stream_buffer_size
+
+    _audio_stream_buffer_size = _int(size)
+    _SetAudioStreamBufferSizeDefault(_audio_stream_buffer_size)
+
+
+def _set_load_file_data_callback(callback):
+    """SetLoadFileDataCallback, keeping the callback alive and under the override of mounted asset packs"""
+    if callback is not None and not isinstance(callback, LoadFileDataCallback):
+        callback = LoadFileDataCallback(callback)
+    _load_file_data_callbacks['application'] = callback
+    if _load_file_data_callbacks['override'] is None:
+        _SetLoadFileDataCallback(callback or LoadFileDataCallback())
+
+
+def _override_load_file_data_callback(callback):
+    """Installs `callback` over the application's LoadFileDataCallback, None to restore the latter"""
+    _load_file_data_callbacks['override'] = callback
+    _SetLoadFileDataCallback(callback or _load_file_data_callbacks['application'] or LoadFileDataCallback())
+
+
+def _load_music_stream_from_memory(file_type, data, data_size):
+    """LoadMusicStreamFromMemory, keeping `data` alive with the music: the stream decodes from it while it plays"""
+    buffer = _buffer_in(data)   # may be a copy (read-only buffers) or an address (read-only NumPy arrays)
+    music = _LoadMusicStreamFromMemory(_str_in(file_type), _ubyte_buffer_in(buffer), _int(data_size))
+    music._data = (data, buffer)
+    return music
+
+
+@contextmanager
+def _audio_stream_buffer_size_override(size):
+    """Sets the default size of the audio streams created within the block, then restores the application's"""
+    _SetAudioStreamBufferSizeDefault(_int(size))
+    try:
+        yield
+    finally:
+        _SetAudioStreamBufferSizeDefault(_audio_stream_buffer_size)
 
 # endregion (internal)
 
@@ -2023,12 +2501,92 @@ class Array(Generic[_T]):
     pass
 
 
+def bind_all_symbols():
+    """Resolves all C functions at once instead of on their first call (eager binding)
+
+    Useful before entering latency-sensitive loops; setting the environment variable
+    RAYLIBPY_EAGER_BINDING=1 does the same at import time.
+    """
+    for symbol in tuple(_symbol_table.values()):
+        if isinstance(symbol, _LazySymbol):
+            symbol.bind()
+
+
+def set_math_backend(name):
+    # type: (str) -> None
+    """Selects who computes the component-wise vector and quaternion operations
+
+    'raymath' (the default) calls the C functions; 'python' computes add, subtract,
+    scale, multiply, divide, negate and invert in Python (see raylibpy.pymath),
+    which saves the FFI round trip and gives bit-identical float32 results.
+    RAYLIBPY_MATH_BACKEND=python selects it at import time.
+    """
+    global _math_backend
+
+    if name not in ('raymath', 'python'):
+        raise ValueError("unknown math backend '{}', expected 'raymath' or 'python'".format(name))
+
+    from . import pymath
+
+    for c_name, function in pymath.OVERRIDES.items():
+        if name == 'python':
+            _symbol_overrides[c_name] = function
+        else:
+            _symbol_overrides.pop(c_name, None)
+        _install_symbol(c_name)     # under the profiler's wrappers, if enabled
+    _math_backend = name
+
+
+def get_math_backend():
+    # type: () -> str
+    """Returns the name of the current math backend, 'raymath' or 'python'"""
+    return _math_backend
+
+
 def clear_format_string_cache():
     global _fmt_cache
 
     _fmt_cache.clear()
 
 
+def set_text_measure_cache_size(max_entries):
+    # type: (int) -> None
+    """Sets how many measures of measure_text() and measure_text_ex() are cached per font (1024 by default)
+
+    The least recently used are dropped first; 0 disables the cache.
+    """
+    global _text_measure_limit
+
+    _text_measure_limit = max(int(max_entries), 0)
+    for cache in _text_measures.values():
+        while len(cache) > _text_measure_limit:
+            cache.popitem(last=False)
+
+
+def clear_text_measure_cache():
+    # type: () -> None
+    """Forgets all the cached text measures"""
+    _text_measures.clear()
+
+
+def get_text_measure_stats():
+    # type: () -> dict[str, int | float]
+    """Returns {'hits': int, 'misses': int, 'hit_rate': float, 'entries': int} for the text measure cache"""
+    hits, misses = _text_measure_stats
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / float(hits + misses) if hits + misses else 0.0,
+        'entries': sum(len(cache) for cache in _text_measures.values()),
+    }
+
+
+def reset_text_measure_stats():
+    # type: () -> None
+    """Resets the hit and miss counts of the text measure cache"""
+    _text_measure_stats[:] = [0, 0]
+
+
 def pop_out_param(default=None):
     """Pops and returns the out param argument passed to the last call, or the default value otherwise"""
     global _in_out
@@ -2180,7 +2738,7 @@ Long = c_long
 UChar = c_ubyte
 
 # Type wrapper for `unsigned char *`
-UCharPtr = c_ubyte
+UCharPtr = POINTER(c_ubyte)
 
 # Type wrapper for `unsigned int`
 UInt = c_uint
@@ -4042,6 +4600,8 @@ RL_CULL_FACE_BACK = rlCullMode.RL_CULL_FACE_BACK
 class Vector2(Structure):
     """Vector2, 2 components"""
 
+    __slots__ = ()
+
     @classmethod
     def array_of(cls, sequence):
         """Creates and returns an array of Vector2 elements"""
@@ -4055,10 +4615,10 @@ class Vector2(Structure):
     def __init__(self, x=None, y=None):
         # type: (Vector2, float, float) -> None
         """Initializes this Vector2"""
-        super(Vector2, self).__init__(
-            x or 0.0,
-            y or 0.0
-        )
+        try:
+            _pack_2f(self, 0, x or 0.0, y or 0.0)
+        except (OverflowError, struct.error):
+            super(Vector2, self).__init__(x or 0.0, y or 0.0)
 
     def __str__(self):
         return "({}, {})".format(self.x, self.y)
@@ -4084,35 +4644,35 @@ class Vector2(Structure):
     def __add__(self, other):
         if isinstance(other, (int, float)):
             return _Vector2AddValue(self, float(other))
-        return _Vector2Add(self, Vector2(other[0], other[1]))
+        return _Vector2Add(self, _vec2_operand(other))
     
     def __radd__(self, other):
         if isinstance(other, (int, float)):
             return _Vector2AddValue(self, float(other))
-        return _Vector2Add(self, Vector2(other[0], other[1]))
+        return _Vector2Add(self, _vec2_operand(other))
     
     def __iadd__(self, other):
         if isinstance(other, (int, float)):
             self.xy = _Vector2AddValue(self, float(other))
         else:
-            self.xy = _Vector2Add(self, Vector2(other[0], other[1]))
+            self.xy = _Vector2Add(self, _vec2_operand(other))
         return self
     
     def __sub__(self, other):
         if isinstance(other, (int, float)):
             return _Vector2SubtractValue(self, float(other))
-        return _Vector2Subtract(self, Vector2(other[0], other[1]))
+        return _Vector2Subtract(self, _vec2_operand(other))
     
     def __rsub__(self, other):
         if isinstance(other, (int, float)):
             return Vector2(other - self.x, other - self.y)
-        return _Vector2Subtract(Vector2(other[0], other[1]), self)
+        return _Vector2Subtract(_vec2_operand(other), self)
     
     def __isub__(self, other):
         if isinstance(other, (int, float)):
             self.xy = _Vector2SubtractValue(self, float(other))
         else:
-            self.xy = _Vector2Subtract(self, Vector2(other[0], other[1]))
+            self.xy = _Vector2Subtract(self, _vec2_operand(other))
         return self
     
     def __mul__(self, other):
@@ -4120,12 +4680,12 @@ class Vector2(Structure):
             return _Vector2Scale(self, float(other))
         elif isinstance(other, Matrix):
             return _Vector2Transform(self, other)
-        return _Vector2Multiply(self, Vector2(other[0], other[1]))
+        return _Vector2Multiply(self, _vec2_operand(other))
     
     def __rmul__(self, other):
         if isinstance(other, (int, float)):
             return _Vector2Scale(self, float(other))
-        return _Vector2Multiply(self, Vector2(other[0], other[1]))
+        return _Vector2Multiply(self, _vec2_operand(other))
     
     def __imul__(self, other):
         if isinstance(other, (int, float)):
@@ -4133,24 +4693,24 @@ class Vector2(Structure):
         elif isinstance(other, Matrix):
             self.xy = _Vector2Transform(self, other)
         else:
-            self.xy = _Vector2Multiply(self, Vector2(other[0], other[1]))
+            self.xy = _Vector2Multiply(self, _vec2_operand(other))
         return self
     
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
             return _Vector2Divide(self, Vector2(other, other))
-        return _Vector2Divide(self, Vector2(other[0], other[1]))
+        return _Vector2Divide(self, _vec2_operand(other))
     
     def __rtruediv__(self, other):
         if isinstance(other, (int, float)):
             return Vector2(other / self.x, other / self.y)
-        return _Vector2Divide(Vector2(other[0], other[1]), self)
+        return _Vector2Divide(_vec2_operand(other), self)
     
     def __itruediv__(self, other):
         if isinstance(other, (int, float)):
             self.xy = _Vector2Divide(self, Vector2(other, other))
         else:
-            self.xy = _Vector2Divide(self, Vector2(other[0], other[1]))
+            self.xy = _Vector2Divide(self, _vec2_operand(other))
         return self
 
     def __len__(self):
@@ -4159,23 +4719,11 @@ class Vector2(Structure):
     def __getitem__(self, key):
         return (self.x, self.y).__getitem__(key)
     
+    def __reduce__(self):
+        return type(self), tuple(self)
+
     def __getattr__(self, attr):
-        m = RE_VEC2_GET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Vector2 object does not have attribute '{}'.".format(attr))
-        cls = {1: float, 2: Vector2, 3: Vector3, 4: Vector4}.get(len(attr))
-        v = self.todict()
-        return cls(*(v[ch] for ch in attr))
-    
-    def __setattr__(self, attr, value):
-        m = RE_VEC2_SET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Vector2 object does not have attribute '{}'.".format(attr))
-        if len(attr) == 1:
-            super(Vector2, self).__setattr__(attr, float(value))
-        else:
-            for i, ch in enumerate(attr):
-                super(Vector2, self).__setattr__(ch, float(value[i]))
+        return _lazy_swizzle(type(self), attr).__get__(self)
 
     @property
     def byref(self):
@@ -4262,6 +4810,8 @@ Vector2Ptr = POINTER(Vector2)
 class Vector3(Structure):
     """Vector3, 3 components"""
 
+    __slots__ = ()
+
     @classmethod
     def array_of(cls, sequence):
         """Creates and returns an array of Vector3 elements"""
@@ -4275,11 +4825,10 @@ class Vector3(Structure):
     def __init__(self, x=None, y=None, z=None):
         # type: (Vector3, float, float, float) -> None
         """Initializes this Vector3"""
-        super(Vector3, self).__init__(
-            x or 0.0,
-            y or 0.0,
-            z or 0.0
-        )
+        try:
+            _pack_3f(self, 0, x or 0.0, y or 0.0, z or 0.0)
+        except (OverflowError, struct.error):
+            super(Vector3, self).__init__(x or 0.0, y or 0.0, z or 0.0)
 
     def __str__(self):
         return "({}, {}, {})".format(self.x, self.y, self.z)
@@ -4305,35 +4854,35 @@ class Vector3(Structure):
     def __add__(self, other):
         if isinstance(other, (int, float)):
             return _Vector3AddValue(self, float(other))
-        return _Vector3Add(self, Vector3(other[0], other[1], other[2]))
+        return _Vector3Add(self, _vec3_operand(other))
     
     def __radd__(self, other):
         if isinstance(other, (int, float)):
             return _Vector3AddValue(self, float(other))
-        return _Vector3Add(self, Vector3(other[0], other[1], other[2]))
+        return _Vector3Add(self, _vec3_operand(other))
     
     def __iadd__(self, other):
         if isinstance(other, (int, float)):
-            self.xy = _Vector3AddValue(self, float(other))
+            self.xyz = _Vector3AddValue(self, float(other))
         else:
-            self.xy = _Vector3Add(self, Vector3(other[0], other[1], other[2]))
+            self.xyz = _Vector3Add(self, _vec3_operand(other))
         return self
     
     def __sub__(self, other):
         if isinstance(other, (int, float)):
             return _Vector3SubtractValue(self, float(other))
-        return _Vector3Subtract(self, Vector3(other[0], other[1], other[2]))
+        return _Vector3Subtract(self, _vec3_operand(other))
     
     def __rsub__(self, other):
         if isinstance(other, (int, float)):
             return Vector3(other - self.x, other - self.y, other - self.z)
-        return _Vector3Subtract(Vector3(other[0], other[1], other[2]), self)
+        return _Vector3Subtract(_vec3_operand(other), self)
     
     def __isub__(self, other):
         if isinstance(other, (int, float)):
-            self.xy = _Vector3SubtractValue(self, float(other))
+            self.xyz = _Vector3SubtractValue(self, float(other))
         else:
-            self.xy = _Vector3Subtract(self, Vector3(other[0], other[1], other[2]))
+            self.xyz = _Vector3Subtract(self, _vec3_operand(other))
         return self
     
     def __mul__(self, other):
@@ -4341,37 +4890,37 @@ class Vector3(Structure):
             return _Vector3Scale(self, float(other))
         elif isinstance(other, Matrix):
             return _Vector3Transform(self, other)
-        return _Vector3Multiply(self, Vector3(other[0], other[1], other[2]))
+        return _Vector3Multiply(self, _vec3_operand(other))
     
     def __rmul__(self, other):
         if isinstance(other, (int, float)):
             return _Vector3Scale(self, float(other))
-        return _Vector3Multiply(self, Vector3(other[0], other[1], other[2]))
+        return _Vector3Multiply(self, _vec3_operand(other))
     
     def __imul__(self, other):
         if isinstance(other, (int, float)):
-            self.xy = _Vector3Scale(self, float(other))
+            self.xyz = _Vector3Scale(self, float(other))
         elif isinstance(other, Matrix):
-            self.xy = _Vector3Transform(self, other)
+            self.xyz = _Vector3Transform(self, other)
         else:
-            self.xy = _Vector3Multiply(self, Vector3(other[0], other[1], other[2]))
+            self.xyz = _Vector3Multiply(self, _vec3_operand(other))
         return self
     
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
-            return _Vector3Divide(self, Vector3(other, other))
-        return _Vector3Divide(self, Vector3(other[0], other[1]))
+            return _Vector3Divide(self, Vector3(other, other, other))
+        return _Vector3Divide(self, _vec3_operand(other))
     
     def __rtruediv__(self, other):
         if isinstance(other, (int, float)):
             return Vector3(other / self.x, other / self.y, other / self.z)
-        return _Vector3Divide(Vector3(other[0], other[1], other[2]), self)
+        return _Vector3Divide(_vec3_operand(other), self)
     
     def __itruediv__(self, other):
         if isinstance(other, (int, float)):
-            self.xy = _Vector3Divide(self, Vector3(other, other))
+            self.xyz = _Vector3Divide(self, Vector3(other, other, other))
         else:
-            self.xy = _Vector3Divide(self, Vector3(other[0], other[1], other[2]))
+            self.xyz = _Vector3Divide(self, _vec3_operand(other))
         return self
 
     def __len__(self):
@@ -4380,23 +4929,11 @@ class Vector3(Structure):
     def __getitem__(self, key):
         return (self.x, self.y, self.z).__getitem__(key)
     
+    def __reduce__(self):
+        return type(self), tuple(self)
+
     def __getattr__(self, attr):
-        m = RE_VEC3_GET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Vector3 object does not have attribute '{}'.".format(attr))
-        cls = {1: float, 2: Vector2, 3: Vector3, 4: Vector4}.get(len(attr))
-        v = self.todict()
-        return cls(*(v[ch] for ch in attr))
-    
-    def __setattr__(self, attr, value):
-        m = RE_VEC3_SET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Vector3 object does not have attribute '{}'.".format(attr))
-        if len(attr) == 1:
-            super(Vector3, self).__setattr__(attr, float(value))
-        else:
-            for i, ch in enumerate(attr):
-                super(Vector3, self).__setattr__(ch, float(value[i]))
+        return _lazy_swizzle(type(self), attr).__get__(self)
 
     @property
     def byref(self):
@@ -4522,9 +5059,116 @@ class Vector3(Structure):
 Vector3Ptr = POINTER(Vector3)
 
 
+class _VectorArray(object):
+    """Contiguous float32 array of vectors, shared with C and NumPy without copies"""
+
+    __slots__ = ('_data', '_ptr')
+
+    _item_type = Structure
+    _ptr_type = c_void_p
+
+    def __init__(self, source=0):
+        # type: (int | Sequence | _VectorArray) -> None
+        """Initializes this array with `source` zeroed elements or a copy of the `source` vectors
+
+        `source` may be a sequence of vectors/tuples, another array of the same
+        type or a NumPy array of shape (n, components) or of n * components
+        values, which is copied at once.
+        """
+        item_type = self._item_type
+        width = len(item_type._fields_)
+        if isinstance(source, int):
+            data = (item_type * source)()
+        elif isinstance(source, type(self)):
+            data = (item_type * len(source)).from_buffer_copy(source._data)
+        elif hasattr(source, '__array_interface__'):
+            values = _numpy().ascontiguousarray(source, dtype='float32')
+            if not (values.ndim == 2 and values.shape[1] == width or values.ndim == 1 and values.size % width == 0):
+                raise ValueError("expected an array of shape (n, {0}) or of n * {0} values, got {1}".format(width, values.shape))
+            data = (item_type * (values.size // width)).from_buffer_copy(values)
+        else:
+            source = source if isinstance(source, (list, tuple)) else list(source)
+            values = array('f', chain.from_iterable(source))
+            if len(values) != len(source) * width:
+                raise ValueError("every element must have {} components".format(width))
+            data = (item_type * len(source)).from_buffer_copy(values)
+        self._data = data
+        self._ptr = cast(data, self._ptr_type)
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Creates an array sharing the memory of `buffer`, a writable C-contiguous float32 buffer"""
+        view = memoryview(buffer)
+        if view.format.lstrip('@=<') != 'f' or view.itemsize != 4:
+            raise ValueError("expected a float32 buffer, got format {!r}".format(view.format))
+        count, rest = divmod(view.nbytes, sizeof(cls._item_type))
+        if rest:
+            raise ValueError("buffer size is not a multiple of {}".format(sizeof(cls._item_type)))
+        self = cls.__new__(cls)
+        self._data = (cls._item_type * count).from_buffer(buffer)
+        self._ptr = cast(self._data, cls._ptr_type)
+        return self
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            self._data[key] = [self._item_type(*v) for v in value]
+        else:
+            self._data[key] = self._item_type(*value)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, [tuple(v) for v in self._data])
+
+    @property
+    def _as_parameter_(self):
+        return self._ptr
+
+    @property
+    def ptr(self):
+        """Gets a pointer to the first element, valid while this array is alive"""
+        return self._ptr
+
+    @property
+    def nbytes(self):
+        return sizeof(self._data)
+
+    def numpy(self):
+        """Returns a NumPy array of shape (len, components) sharing this array's memory"""
+        width = len(self._item_type._fields_)
+        return _numpy().frombuffer(self._data, dtype='float32').reshape(len(self._data), width)
+
+
+class Vector2Array(_VectorArray):
+    """Contiguous array of Vector2, usable as Vector2Ptr and as a (n, 2) float32 NumPy view"""
+
+    __slots__ = ()
+
+    _item_type = Vector2
+    _ptr_type = Vector2Ptr
+
+
+class Vector3Array(_VectorArray):
+    """Contiguous array of Vector3, usable as Vector3Ptr and as a (n, 3) float32 NumPy view"""
+
+    __slots__ = ()
+
+    _item_type = Vector3
+    _ptr_type = Vector3Ptr
+
+
 class Vector4(Structure):
     """Vector4, 4 components"""
 
+    __slots__ = ()
+
     @classmethod
     def array_of(cls, sequence):
         """Creates and returns an array of Vector4 elements"""
@@ -4533,12 +5177,10 @@ class Vector4(Structure):
     def __init__(self, x=None, y=None, z=None, w=None):
         # type: (Vector4, float, float, float, float) -> None
         """Initializes this Vector4"""
-        super(Vector4, self).__init__(
-            x or 0.0,
-            y or 0.0,
-            z or 0.0,
-            w or 0.0
-        )
+        try:
+            _pack_4f(self, 0, x or 0.0, y or 0.0, z or 0.0, w or 0.0)
+        except (OverflowError, struct.error):
+            super(Vector4, self).__init__(x or 0.0, y or 0.0, z or 0.0, w or 0.0)
 
     def __str__(self):
         return "({}, {}, {}, {})".format(self.x, self.y, self.z, self.w)
@@ -4567,23 +5209,11 @@ class Vector4(Structure):
     def __getitem__(self, key):
         return (self.x, self.y, self.z, self.w).__getitem__(key)
     
+    def __reduce__(self):
+        return type(self), tuple(self)
+
     def __getattr__(self, attr):
-        m = RE_VEC4_GET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Vector4 object does not have attribute '{}'.".format(attr))
-        cls = {1: float, 2: Vector2, 3: Vector3, 4: Vector4}.get(len(attr))
-        v = self.todict()
-        return cls(*(v[ch] for ch in attr))
-    
-    def __setattr__(self, attr, value):
-        m = RE_VEC4_SET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Vector4 object does not have attribute '{}'.".format(attr))
-        if len(attr) == 1:
-            super(Vector4, self).__setattr__(attr, float(value))
-        else:
-            for i, ch in enumerate(attr):
-                super(Vector4, self).__setattr__(ch, float(value[i]))
+        return _lazy_swizzle(type(self), attr).__get__(self)
 
     @property
     def byref(self):
@@ -4736,6 +5366,8 @@ MatrixPtr = POINTER(Matrix)
 class Color(Structure):
     """Color, 4 components, R8G8B8A8 (32bit)"""
 
+    __slots__ = ()
+
     @classmethod
     def array_of(cls, sequence):
         """Creates and returns an array of Color elements"""
@@ -4762,12 +5394,10 @@ class Color(Structure):
     def __init__(self, r=None, g=None, b=None, a=None):
         # type: (Color, int, int, int, int) -> None
         """Initializes this Color"""
-        super(Color, self).__init__(
-            r or 0,
-            g or 0,
-            b or 0,
-            a or 0
-        )
+        try:
+            _pack_4B(self, 0, r or 0, g or 0, b or 0, a or 0)
+        except (OverflowError, struct.error):
+            super(Color, self).__init__(r or 0, g or 0, b or 0, a or 0)
 
     def __str__(self):
         return "({: 3}, {: 3}, {: 3}, {: 3})".format(self.r, self.g, self.b, self.a)
@@ -4781,23 +5411,11 @@ class Color(Structure):
     def __getitem__(self, key):
         return (self.r, self.g, self.b, self.a).__getitem__(key)
     
+    def __reduce__(self):
+        return type(self), tuple(self)
+
     def __getattr__(self, attr):
-        m = RE_RGBA_GET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Color object does not have attribute '{}'.".format(attr))
-        cls = {1: int, 4: Color}.get(len(attr))
-        v = self.todict()
-        return cls(*(v[ch] for ch in attr))
-    
-    def __setattr__(self, attr, value):
-        m = RE_RGBA_SET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Color object does not have attribute '{}'.".format(attr))
-        if len(attr) == 1:
-            super(Color, self).__setattr__(attr, int(value))
-        else:
-            for i, ch in enumerate(attr):
-                super(Color, self).__setattr__(ch, int(value[i]))
+        return _lazy_swizzle(type(self), attr).__get__(self)
 
     @property
     def byref(self):
@@ -4867,6 +5485,8 @@ ColorPtr = POINTER(Color)
 class Rectangle(Structure):
     """Rectangle, 4 components"""
 
+    __slots__ = ()
+
     @classmethod
     def array_of(cls, sequence):
         """Creates and returns an array of Rectangle elements"""
@@ -4875,12 +5495,10 @@ class Rectangle(Structure):
     def __init__(self, x=None, y=None, width=None, height=None):
         # type: (Rectangle, float, float, float, float) -> None
         """Initializes this Rectangle"""
-        super(Rectangle, self).__init__(
-            x or 0.0,
-            y or 0.0,
-            width or 0.0,
-            height or 0.0
-        )
+        try:
+            _pack_4f(self, 0, x or 0.0, y or 0.0, width or 0.0, height or 0.0)
+        except (OverflowError, struct.error):
+            super(Rectangle, self).__init__(x or 0.0, y or 0.0, width or 0.0, height or 0.0)
 
     def __str__(self):
         return "({}, {}, {}, {})".format(self.x, self.y, self.width, self.height)
@@ -4894,51 +5512,11 @@ class Rectangle(Structure):
     def __getitem__(self, key):
         return (self.x, self.y, self.width, self.height).__getitem__(key)
     
+    def __reduce__(self):
+        return type(self), tuple(self)
+
     def __getattr__(self, attr):
-        m = RE_RECT_GET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Rectangle object does not have attribute '{}'.".format(attr))
-        cls = {1: float, 2: Vector2, 3: Vector3, 4: Rectangle}.get(len(attr))
-        v = self.todict()
-        return cls(*(v[ch] for ch in attr))
-    
-    def __setattr__(self, attr, value):
-        m = RE_RECT_SET_SWZL.fullmatch(attr)
-        if not m:
-            raise AttributeError("Rectangle object does not have attribute '{}'.".format(attr))
-        w = self.width
-        h = self.height
-        if attr in ('width', 'height') or len(attr) == 1:
-            if attr == 'c':
-                super(Rectangle, self).__setattr__('x', float(value - w * 0.5))
-            elif attr == 'r':
-                super(Rectangle, self).__setattr__('x', float(value - w))
-            elif attr == 'm':
-                super(Rectangle, self).__setattr__('y', float(value - h * 0.5))
-            elif attr == 'b':
-                super(Rectangle, self).__setattr__('y', float(value - h))
-            elif attr == 'w':
-                super(Rectangle, self).__setattr__('width', value)
-            elif attr == 'h':
-                super(Rectangle, self).__setattr__('height', value)
-            else:
-                super(Rectangle, self).__setattr__(attr, float(value))
-        else:
-            for i, ch in enumerate(attr):
-                if ch in ('x', 'y'):
-                    super(Rectangle, self).__setattr__(ch, float(value[i]))
-                elif ch == 'c':
-                    super(Rectangle, self).__setattr__('x', float(value[i] - w * 0.5))
-                elif ch == 'r':
-                    super(Rectangle, self).__setattr__('x', float(value[i] - w))
-                elif ch == 'm':
-                    super(Rectangle, self).__setattr__('y', float(value[i] - h * 0.5))
-                elif ch == 'b':
-                    super(Rectangle, self).__setattr__('y', float(value[i] - h))
-                elif ch == 'w':
-                    super(Rectangle, self).__setattr__('width', value[i])
-                elif ch == 'h':
-                    super(Rectangle, self).__setattr__('height', value[i])
+        return _lazy_swizzle(type(self), attr).__get__(self)
 
     @property
     def byref(self):
@@ -4965,6 +5543,24 @@ RectanglePtr = POINTER(Rectangle)
 RectanglePtrPtr = POINTER(RectanglePtr)
 
 
+# Pixel layout of the uncompressed formats: (NumPy dtype name, channels), see Image.numpy()
+_PIXEL_LAYOUTS = {
+    PIXELFORMAT_UNCOMPRESSED_GRAYSCALE: ('uint8', 1),
+    PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA: ('uint8', 2),
+    PIXELFORMAT_UNCOMPRESSED_R5G6B5: ('uint16', 1),
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8: ('uint8', 3),
+    PIXELFORMAT_UNCOMPRESSED_R5G5B5A1: ('uint16', 1),
+    PIXELFORMAT_UNCOMPRESSED_R4G4B4A4: ('uint16', 1),
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8A8: ('uint8', 4),
+    PIXELFORMAT_UNCOMPRESSED_R32: ('float32', 1),
+    PIXELFORMAT_UNCOMPRESSED_R32G32B32: ('float32', 3),
+    PIXELFORMAT_UNCOMPRESSED_R32G32B32A32: ('float32', 4),
+    PIXELFORMAT_UNCOMPRESSED_R16: ('float16', 1),
+    PIXELFORMAT_UNCOMPRESSED_R16G16B16: ('float16', 3),
+    PIXELFORMAT_UNCOMPRESSED_R16G16B16A16: ('float16', 4),
+}
+
+
 class Image(Structure):
     """Image, pixel data stored in CPU memory (RAM)"""
 
@@ -4999,9 +5595,9 @@ class Image(Structure):
 
     @classmethod
     def load_from_memory(cls, file_type, file_data, data_size):
-        # type: (Image, bytes | str | None, int, int) -> Image
+        # type: (Image, bytes | str | None, Buffer, int) -> Image
         """Load image from memory buffer, fileType refers to extension: i.e. '.png'"""
-        return _LoadImageFromMemory(_str_in(file_type), _int(file_data, (0, 255)), _int(data_size))
+        return _LoadImageFromMemory(_str_in(file_type), _ubyte_buffer_in(file_data), _int(data_size))
 
     @classmethod
     def load_from_texture(cls, texture):
@@ -5087,6 +5683,33 @@ class Image(Structure):
         """Create an image from text (custom sprite font)"""
         return _ImageTextEx(font, _str_in(text), _float(font_size), _float(spacing), _color(tint))
 
+    @classmethod
+    def from_array(cls, array, format_=None):
+        # type: (Image, numpy.ndarray, int | None) -> Image
+        """Create an image from a (height, width[, channels]) NumPy array
+
+        The pixel format is deduced from the dtype and the channel count (uint8,
+        float16 or float32 with 1 to 4 channels) unless `format_` is given, which
+        is required for the packed 16 bit formats. The pixels are copied once into
+        memory allocated by raylib, so the image is released with unload().
+        """
+        np = _numpy()
+        array = np.ascontiguousarray(array)
+        height, width = array.shape[:2]
+        channels = array.shape[2] if array.ndim == 3 else 1
+        if format_ is None:
+            layouts = {layout: fmt for fmt, layout in _PIXEL_LAYOUTS.items() if layout[0] != 'uint16'}
+            format_ = layouts.get((array.dtype.name, channels))
+            if format_ is None:
+                raise ValueError("no pixel format for {} arrays with {} channel(s)".format(array.dtype.name, channels))
+        elif _PIXEL_LAYOUTS.get(format_) != (array.dtype.name, channels):
+            raise ValueError("array does not match the layout of {!r}".format(PixelFormat(format_)))
+        data = _MemAlloc(array.nbytes)
+        if not data:
+            raise MemoryError("could not allocate {} bytes for the image".format(array.nbytes))
+        ctypes.memmove(data, array.ctypes.data, array.nbytes)
+        return cls(data, width, height, 1, format_)
+
     def __init__(self, data=None, width=None, height=None, mipmaps=None, format_=None):
         # type: (Image, bytes | str | None, int, int, int, int) -> None
         """Initializes this Image"""
@@ -5359,6 +5982,34 @@ class Image(Structure):
         """Get image pixel color at (x, y) position"""
         return _GetImageColor(self, _int(x), _int(y))
 
+    def pixel_buffer(self):
+        # type: (Image) -> Array[UChar]
+        """Get the pixel data (first mipmap level) as a ubyte array sharing the image memory
+
+        The array supports the buffer protocol (memoryview, bytes(), NumPy) and is
+        only valid until the image is unloaded or reallocated by an image function.
+        """
+        if not self.data:
+            raise ValueError("image has no pixel data")
+        size = _GetPixelDataSize(self.width, self.height, self.format)
+        return (UChar * size).from_address(self.data)
+
+    def numpy(self):
+        # type: (Image) -> numpy.ndarray
+        """Get the pixels as a NumPy array sharing the image memory, shaped (height, width[, channels])
+
+        The dtype follows the pixel format (uint8, packed uint16, float16 or float32);
+        compressed formats give the raw bytes. Same lifetime rules as pixel_buffer().
+        """
+        np = _numpy()
+        buffer = self.pixel_buffer()
+        layout = _PIXEL_LAYOUTS.get(self.format)
+        if layout is None:
+            return np.frombuffer(buffer, dtype=np.uint8)
+        dtype, channels = layout
+        shape = (self.height, self.width) if channels == 1 else (self.height, self.width, channels)
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
     @staticmethod
     def unload_colors(colors):
         # type: (ColorPtr) -> None
@@ -5479,14 +6130,14 @@ class Texture(Structure):
         _DrawTextureNPatch(self, n_patch_info, _rect(dest), _vec2(origin), _float(rotation), _color(tint))
 
     def update(self, pixels):
-        # type: (Texture2D, bytes | str | None) -> None
+        # type: (Texture2D, bytes | Buffer | VoidPtr) -> None
         """Update GPU texture with new data"""
-        _UpdateTexture(self, pixels)
+        _UpdateTexture(self, _buffer_in(pixels))
 
     def update_rec(self, rec, pixels):
-        # type: (Texture2D, Rectangle, bytes | str | None) -> None
+        # type: (Texture2D, Rectangle, bytes | Buffer | VoidPtr) -> None
         """Update GPU texture rectangle with new data"""
-        _UpdateTextureRec(self, _rect(rec), pixels)
+        _UpdateTextureRec(self, _rect(rec), _buffer_in(pixels))
 
 
 # Texture2D, same as Texture
@@ -5629,10 +6280,10 @@ class Font(Structure):
 
     @classmethod
     def load_from_memory(cls, file_type, file_data, data_size, font_size, codepoints, codepoint_count):
-        # type: (Font, bytes | str | None, int, int, int, list[int] | str, int) -> Font
+        # type: (Font, bytes | str | None, Buffer, int, int, list[int] | str, int) -> Font
         """Load font from memory buffer, fileType refers to extension: i.e. '.ttf'"""
         codepoints = int_array(codepoints)
-        return _LoadFontFromMemory(_str_in(file_type), _int(file_data, (0, 255)), _int(data_size), _int(font_size), codepoints, _int(codepoint_count))
+        return _LoadFontFromMemory(_str_in(file_type), _ubyte_buffer_in(file_data), _int(data_size), _int(font_size), codepoints, _int(codepoint_count))
 
     @classmethod
     def get_default(cls):
@@ -5671,7 +6322,7 @@ class Font(Structure):
     def unload(self):
         # type: (Font) -> None
         """Unload font from GPU memory (VRAM)"""
-        _UnloadFont(self)
+        _unload_font(self)
 
     def draw_text_ex(self, text, position, font_size, spacing, tint):
         # type: (Font, bytes | str | None, Vector2, float, float, Color) -> None
@@ -5695,8 +6346,8 @@ class Font(Structure):
 
     def measure_text_ex(self, text, font_size, spacing):
         # type: (Font, bytes | str | None, float, float) -> Vector2
-        """Measure string size for Font"""
-        return _MeasureTextEx(self, _str_in(text), _float(font_size), _float(spacing))
+        """Measure string size for Font (cached, see set_text_measure_cache_size)"""
+        return _measure_text_ex(self, text, font_size, spacing)
 
     def get_glyph_index(self, codepoint):
         # type: (Font, int) -> int
@@ -5715,10 +6366,10 @@ class Font(Structure):
 
     @staticmethod
     def load_data(file_data, data_size, font_size, codepoints, codepoint_count, type_):
-        # type: (int, int, int, list[int] | str, int, int) -> Array[GlyphInfo]
+        # type: (Buffer, int, int, list[int] | str, int, int) -> Array[GlyphInfo]
         """Load font data for further use"""
         codepoints = int_array(codepoints)
-        result = _LoadFontData(_int(file_data, (0, 255)), _int(data_size), _int(font_size), byref(codepoints), _int(codepoint_count), _int(type_))
+        result = _LoadFontData(_ubyte_buffer_in(file_data), _int(data_size), _int(font_size), byref(codepoints), _int(codepoint_count), _int(type_))
         result = cast(result, POINTER(GlyphInfo * codepoints.value))[0]
         _clear_in_out()
         _push_in_out(codepoints.value)
@@ -6444,6 +7095,36 @@ class BoundingBox(Structure):
         return byref(self)
 
 
+# Wave sample size in bits -> NumPy dtype of the samples
+_SAMPLE_DTYPES = {8: 'uint8', 16: 'int16', 32: 'float32'}
+
+
+def _samples_to_float(samples):
+    """Returns integer (full range, unsigned ones centered) or float samples as float32 values in [-1.0, 1.0]"""
+    np = _numpy()
+    if samples.dtype.kind in 'iu':
+        info = np.iinfo(samples.dtype)
+        half = (int(info.max) - int(info.min) + 1) // 2
+        values = samples.astype(np.float64 if info.bits > 16 else np.float32)
+        if info.kind == 'u':
+            values -= half
+        return (values / half).astype(np.float32, copy=False)
+    if samples.dtype.kind != 'f':
+        raise TypeError("expected integer or float samples, got {}".format(samples.dtype))
+    return samples.astype(np.float32, copy=False)
+
+
+def _float_to_samples(values, out):
+    """Writes float32 values in [-1.0, 1.0] into the `out` samples, clipping to their range"""
+    np = _numpy()
+    if out.dtype == np.uint8:
+        out[...] = np.clip(values * 128.0 + 128.0, 0, 255)
+    elif out.dtype == np.int16:
+        out[...] = np.clip(values * 32768.0, -32768, 32767)
+    else:
+        out[...] = values
+
+
 class Wave(Structure):
     """Wave, audio wave data"""
 
@@ -6460,9 +7141,29 @@ class Wave(Structure):
 
     @classmethod
     def load_from_memory(cls, file_type, file_data, data_size):
-        # type: (Wave, bytes | str | None, int, int) -> Wave
+        # type: (Wave, bytes | str | None, Buffer, int) -> Wave
         """Load wave from memory buffer, fileType refers to extension: i.e. '.wav'"""
-        return _LoadWaveFromMemory(_str_in(file_type), _int(file_data, (0, 255)), _int(data_size))
+        return _LoadWaveFromMemory(_str_in(file_type), _ubyte_buffer_in(file_data), _int(data_size))
+
+    @classmethod
+    def from_array(cls, array, sample_rate):
+        # type: (Wave, numpy.ndarray, int) -> Wave
+        """Create a wave from a (frames, channels) or (frames,) NumPy array of uint8, int16 or float32 samples
+
+        The samples are copied once into memory allocated by raylib, so the wave is
+        released with unload().
+        """
+        np = _numpy()
+        array = np.ascontiguousarray(array)
+        sample_sizes = {dtype: size for size, dtype in _SAMPLE_DTYPES.items()}
+        if array.dtype.name not in sample_sizes or array.ndim not in (1, 2):
+            raise ValueError("expected a 1 or 2 dimensional uint8, int16 or float32 array, got {} {}".format(array.ndim, array.dtype))
+        data = _MemAlloc(array.nbytes)
+        if not data:
+            raise MemoryError("could not allocate {} bytes for the wave".format(array.nbytes))
+        ctypes.memmove(data, array.ctypes.data, array.nbytes)
+        channels = array.shape[1] if array.ndim == 2 else 1
+        return cls(array.shape[0], sample_rate, sample_sizes[array.dtype.name], channels, data)
 
     def __init__(self, frame_count=None, sample_rate=None, sample_size=None, channels=None, data=None):
         # type: (Wave, int, int, int, int, bytes | str | None) -> None
@@ -6506,11 +7207,122 @@ class Wave(Structure):
         """Convert wave data to desired format"""
         _WaveFormat(self, _int(sample_rate), _int(sample_size), _int(channels))
 
-    def format(self):
+    def load_samples(self):
         # type: (Wave) -> FloatPtr
         """Load samples data from wave as a 32bit float data array"""
         return _LoadWaveSamples(self)
 
+    def sample_buffer(self):
+        # type: (Wave) -> Array[UChar]
+        """Get the sample data as a ubyte array sharing the wave memory
+
+        The array supports the buffer protocol (memoryview, bytes(), NumPy) and is
+        only valid until the wave is unloaded or reallocated by a wave function.
+        """
+        if not self.data:
+            raise ValueError("wave has no sample data")
+        return (UChar * (self.frame_count * self.channels * (self.sample_size // 8))).from_address(self.data)
+
+    def numpy(self):
+        # type: (Wave) -> numpy.ndarray
+        """Get the samples as a (frame_count, channels) NumPy array sharing the wave memory
+
+        The dtype follows sample_size: uint8, int16 or float32. Same lifetime rules
+        as sample_buffer().
+        """
+        np = _numpy()
+        dtype = _SAMPLE_DTYPES.get(self.sample_size)
+        if dtype is None:
+            raise ValueError("unsupported sample size: {}".format(self.sample_size))
+        if not self.data:
+            return np.empty((0, self.channels), dtype=dtype)   # empty or failed to load
+        return np.frombuffer(self.sample_buffer(), dtype=dtype).reshape(self.frame_count, self.channels)
+
+    def apply_gain(self, gain):
+        # type: (Wave, float) -> None
+        """Multiplies the samples by `gain` in place, clipping integer samples"""
+        samples = self.numpy()
+        if samples.dtype.kind == 'f':
+            samples *= gain
+        else:
+            _float_to_samples(_samples_to_float(samples) * gain, samples)
+
+    def mix(self, other, gain=1.0, offset=0):
+        # type: (Wave, Wave | numpy.ndarray, float, int) -> int
+        """Adds the samples of `other` times `gain` in place, starting at frame `offset`
+
+        `other` is a Wave with the same sample rate or a (frames, channels) array of
+        samples (floats in [-1.0, 1.0]); mono is mixed into every channel. Samples
+        past the end of this wave are ignored. Returns the number of frames mixed.
+        """
+        np = _numpy()
+        offset = int(offset)
+        if offset < 0:
+            raise ValueError("offset must be a frame index >= 0, got {}".format(offset))
+        if isinstance(other, Wave):
+            if other.sample_rate != self.sample_rate:
+                raise ValueError("sample rates differ ({} and {}), resample() first".format(self.sample_rate, other.sample_rate))
+            other = other.numpy()
+        other = _samples_to_float(np.asarray(other))
+        if other.ndim == 1:
+            other = other[:, None]
+        if other.shape[1] not in (1, self.channels):
+            raise ValueError("cannot mix {} channels into {}".format(other.shape[1], self.channels))
+        samples = self.numpy()[offset:]
+        count = min(len(samples), len(other))
+        target = samples[:count]
+        _float_to_samples(_samples_to_float(target) + other[:count] * np.float32(gain), target)
+        return count
+
+    def resample(self, sample_rate):
+        # type: (Wave, int) -> None
+        """Converts the wave to `sample_rate` with linear interpolation, reallocating its data
+
+        Faster than format() for batch processing, and of lower quality.
+        """
+        np = _numpy()
+        if sample_rate == self.sample_rate:
+            return
+        count = int(self.frame_count * sample_rate // self.sample_rate)
+        if not count:
+            # nothing to interpolate nor to allocate: an empty wave at the new rate
+            if self.data:
+                _MemFree(self.data)
+            self.data = None
+            self.frame_count = 0
+            self.sample_rate = sample_rate
+            return
+        samples = self.numpy()
+        positions = np.arange(count, dtype=np.float64) * (self.sample_rate / float(sample_rate))
+        index = np.minimum(positions.astype(np.intp), self.frame_count - 1)
+        following = np.minimum(index + 1, self.frame_count - 1)
+        fraction = (positions - index).astype(np.float32)[:, None]
+        values = _samples_to_float(samples)
+        resampled = values[index] * (1 - fraction) + values[following] * fraction
+
+        data = _MemAlloc(count * self.channels * samples.itemsize)
+        if not data:
+            raise MemoryError("could not allocate the resampled wave")
+        _MemFree(self.data)
+        self.data = data
+        self.frame_count = count
+        self.sample_rate = sample_rate
+        _float_to_samples(resampled, self.numpy())
+
+    def crop_frames(self, init_frame, final_frame):
+        # type: (Wave, int, int) -> None
+        """Crops the wave to the frames [init_frame, final_frame) in place
+
+        Unlike crop(), the frames are moved within the current allocation instead of
+        being copied to a new one.
+        """
+        init_frame, final_frame = int(init_frame), int(final_frame)
+        if not 0 <= init_frame < final_frame <= self.frame_count:
+            raise ValueError("invalid frame range [{}, {}) for {} frames".format(init_frame, final_frame, self.frame_count))
+        frame_size = self.channels * (self.sample_size // 8)
+        ctypes.memmove(self.data, self.data + init_frame * frame_size, (final_frame - init_frame) * frame_size)
+        self.frame_count = final_frame - init_frame
+
     def export(self, file_name):
         # type: (Wave, bytes | str | None) -> bool
         """Export wave data to file, returns true on success"""
@@ -6526,10 +7338,11 @@ class Wave(Structure):
         """Unload wave data"""
         _UnloadWave(self)
 
-    def unload_samples(self):
+    @staticmethod
+    def unload_samples(samples):
         # type: (FloatPtr) -> None
         """Unload samples data loaded with LoadWaveSamples()"""
-        _UnloadWaveSamples(self)
+        _UnloadWaveSamples(samples)
 
 # Pointer types for Wave
 WavePtr = POINTER(Wave)
@@ -6634,7 +7447,7 @@ class AudioStream(Structure):
     def set_buffer_size_default(self):
         # type: (int) -> None
         """Default size for new audio streams"""
-        _SetAudioStreamBufferSizeDefault(_int(self))
+        _set_audio_stream_buffer_size_default(self)
 
     def set_callback(self, callback):
         # type: (AudioStream, AudioCallback) -> None
@@ -6642,7 +7455,7 @@ class AudioStream(Structure):
         _SetAudioStreamCallback(self, callback)
 
     def attach_processor(self, processor):
-        # type: (AudioStream, AudioCallback) -> None
+        # type: (AudioStream, AudioCallback | AudioProcessor) -> None
         """Attach audio stream processor to stream, receives the samples as <float>s"""
         _AttachAudioStreamProcessor(self, processor)
 
@@ -6774,9 +7587,9 @@ class Music(Structure):
 
     @classmethod
     def load_from_memory(cls, file_type, data, data_size):
-        # type: (Music, bytes | str | None, int, int) -> Music
-        """Load music stream from data"""
-        return _LoadMusicStreamFromMemory(_str_in(file_type), _int(data, (0, 255)), _int(data_size))
+        # type: (Music, bytes | str | None, Buffer, int) -> Music
+        """Load music stream from data, which must stay unchanged while the music is loaded"""
+        return _load_music_stream_from_memory(file_type, data, data_size)
 
     def __init__(self, stream=None, frame_count=None, looping=None, ctx_type=None, ctx_data=None):
         # type: (Music, AudioStream, int, bool, int, bytes | str | None) -> None
@@ -7241,8 +8054,8 @@ rlRenderBatchPtr = POINTER(rlRenderBatch)
 TraceLogCallback = CFUNCTYPE(Int, CharPtr)
 
 
-# FileIO: Load binary data
-LoadFileDataCallback = CFUNCTYPE(CharPtr, IntPtr)
+# FileIO: Load binary data, returns data allocated with MemAlloc() (freed by raylib) and sets *dataSize
+LoadFileDataCallback = CFUNCTYPE(VoidPtr, CharPtr, IntPtr)
 
 
 # FileIO: Save binary data
@@ -7257,7 +8070,7 @@ LoadFileTextCallback = CFUNCTYPE(CharPtr)
 SaveFileTextCallback = CFUNCTYPE(CharPtr, CharPtr)
 
 
-AudioCallback = CFUNCTYPE(VoidPtr, UInt)
+AudioCallback = CFUNCTYPE(None, VoidPtr, UInt)
 
 # endregion (callbacks)
 
@@ -7323,6 +8136,62 @@ Rectangle._fields_ = [
 ]
 
 
+def _packed(struct_type, fmt, convert=float):
+    """Returns a fast constructor of `struct_type` from its component values
+
+    Values that cannot be packed as they are go through `convert` and the regular constructor.
+    """
+    new, pack_into = struct_type.__new__, struct.Struct(fmt).pack_into
+
+    def make(*values):
+        instance = new(struct_type)
+        try:
+            pack_into(instance, 0, *values)
+        except (OverflowError, struct.error):
+            return struct_type(*map(convert, values))
+        return instance
+    return make
+
+
+def _color_channel(name):
+    field = Color.__dict__[name]
+    return field.__get__, lambda color, value: field.__set__(color, int(value))
+
+
+def _rect_getter(field, size_field, factor):
+    get, get_size = attrgetter(field), attrgetter(size_field)
+    return lambda rec: get(rec) + get_size(rec) * factor
+
+
+def _rect_setter(field, size_field, factor):
+    get_size = attrgetter(size_field)
+    return lambda rec, value: setattr(rec, field, value - get_size(rec) * factor)
+
+
+_new_vector2 = _packed(Vector2, '2f')
+_new_vector3 = _packed(Vector3, '3f')
+_new_vector4 = _packed(Vector4, '4f')
+_new_rectangle = _packed(Rectangle, '4f')
+_new_color = _packed(Color, '4B', int)
+
+_vector_results = {1: float, 2: _new_vector2, 3: _new_vector3, 4: _new_vector4}
+
+_define_swizzles(Vector2, {'x': 'x', 'y': 'y'}, _vector_results)
+_define_swizzles(Vector3, {'x': 'x', 'y': 'y', 'z': 'z'}, _vector_results)
+_define_swizzles(Vector4, {'x': 'x', 'y': 'y', 'z': 'z', 'w': 'w'}, _vector_results)
+_define_swizzles(Color, {ch: _color_channel(ch) for ch in 'rgba'}, {1: int, 2: _components, 3: _components, 4: _new_color})
+_define_swizzles(Rectangle, {
+    'x': 'x',
+    'y': 'y',
+    'w': 'width',
+    'h': 'height',
+    'c': (_rect_getter('x', 'width', 0.5), _rect_setter('x', 'width', 0.5)),
+    'm': (_rect_getter('y', 'height', 0.5), _rect_setter('y', 'height', 0.5)),
+    'r': (_rect_getter('x', 'width', 1.0), _rect_setter('x', 'width', 1.0)),
+    'b': (_rect_getter('y', 'height', 1.0), _rect_setter('y', 'height', 1.0)),
+}, {**_vector_results, 4: _new_rectangle}, exclusive=({'x', 'c', 'r'}, {'y', 'm', 'b'}))
+
+
 Image._fields_ = [
     ('data', c_void_p),
     ('width', c_int),
@@ -7568,558 +8437,558 @@ AutomationEventList._fields_ = [
 ]
 
 
-_InitWindow = _wrap(rlapi.InitWindow, None, Int, Int, CharPtr)
-_CloseWindow = _wrap(rlapi.CloseWindow, None)
-_WindowShouldClose = _wrap(rlapi.WindowShouldClose, Bool)
-_IsWindowReady = _wrap(rlapi.IsWindowReady, Bool)
-_IsWindowFullscreen = _wrap(rlapi.IsWindowFullscreen, Bool)
-_IsWindowHidden = _wrap(rlapi.IsWindowHidden, Bool)
-_IsWindowMinimized = _wrap(rlapi.IsWindowMinimized, Bool)
-_IsWindowMaximized = _wrap(rlapi.IsWindowMaximized, Bool)
-_IsWindowFocused = _wrap(rlapi.IsWindowFocused, Bool)
-_IsWindowResized = _wrap(rlapi.IsWindowResized, Bool)
-_IsWindowState = _wrap(rlapi.IsWindowState, Bool, UInt)
-_SetWindowState = _wrap(rlapi.SetWindowState, None, UInt)
-_ClearWindowState = _wrap(rlapi.ClearWindowState, None, UInt)
-_ToggleFullscreen = _wrap(rlapi.ToggleFullscreen, None)
-_ToggleBorderlessWindowed = _wrap(rlapi.ToggleBorderlessWindowed, None)
-_MaximizeWindow = _wrap(rlapi.MaximizeWindow, None)
-_MinimizeWindow = _wrap(rlapi.MinimizeWindow, None)
-_RestoreWindow = _wrap(rlapi.RestoreWindow, None)
-_SetWindowIcon = _wrap(rlapi.SetWindowIcon, None, Image)
-_SetWindowIcons = _wrap(rlapi.SetWindowIcons, None, ImagePtr, Int)
-_SetWindowTitle = _wrap(rlapi.SetWindowTitle, None, CharPtr)
-_SetWindowPosition = _wrap(rlapi.SetWindowPosition, None, Int, Int)
-_SetWindowMonitor = _wrap(rlapi.SetWindowMonitor, None, Int)
-_SetWindowMinSize = _wrap(rlapi.SetWindowMinSize, None, Int, Int)
-_SetWindowMaxSize = _wrap(rlapi.SetWindowMaxSize, None, Int, Int)
-_SetWindowSize = _wrap(rlapi.SetWindowSize, None, Int, Int)
-_SetWindowOpacity = _wrap(rlapi.SetWindowOpacity, None, Float)
-_SetWindowFocused = _wrap(rlapi.SetWindowFocused, None)
-_GetWindowHandle = _wrap(rlapi.GetWindowHandle, VoidPtr)
-_GetScreenWidth = _wrap(rlapi.GetScreenWidth, Int)
-_GetScreenHeight = _wrap(rlapi.GetScreenHeight, Int)
-_GetRenderWidth = _wrap(rlapi.GetRenderWidth, Int)
-_GetRenderHeight = _wrap(rlapi.GetRenderHeight, Int)
-_GetMonitorCount = _wrap(rlapi.GetMonitorCount, Int)
-_GetCurrentMonitor = _wrap(rlapi.GetCurrentMonitor, Int)
-_GetMonitorPosition = _wrap(rlapi.GetMonitorPosition, Vector2, Int)
-_GetMonitorWidth = _wrap(rlapi.GetMonitorWidth, Int, Int)
-_GetMonitorHeight = _wrap(rlapi.GetMonitorHeight, Int, Int)
-_GetMonitorPhysicalWidth = _wrap(rlapi.GetMonitorPhysicalWidth, Int, Int)
-_GetMonitorPhysicalHeight = _wrap(rlapi.GetMonitorPhysicalHeight, Int, Int)
-_GetMonitorRefreshRate = _wrap(rlapi.GetMonitorRefreshRate, Int, Int)
-_GetWindowPosition = _wrap(rlapi.GetWindowPosition, Vector2)
-_GetWindowScaleDPI = _wrap(rlapi.GetWindowScaleDPI, Vector2)
-_GetMonitorName = _wrap(rlapi.GetMonitorName, CharPtr, Int)
-_SetClipboardText = _wrap(rlapi.SetClipboardText, None, CharPtr)
-_GetClipboardText = _wrap(rlapi.GetClipboardText, CharPtr)
-_EnableEventWaiting = _wrap(rlapi.EnableEventWaiting, None)
-_DisableEventWaiting = _wrap(rlapi.DisableEventWaiting, None)
-_ShowCursor = _wrap(rlapi.ShowCursor, None)
-_HideCursor = _wrap(rlapi.HideCursor, None)
-_IsCursorHidden = _wrap(rlapi.IsCursorHidden, Bool)
-_EnableCursor = _wrap(rlapi.EnableCursor, None)
-_DisableCursor = _wrap(rlapi.DisableCursor, None)
-_IsCursorOnScreen = _wrap(rlapi.IsCursorOnScreen, Bool)
-_ClearBackground = _wrap(rlapi.ClearBackground, None, Color)
-_BeginDrawing = _wrap(rlapi.BeginDrawing, None)
-_EndDrawing = _wrap(rlapi.EndDrawing, None)
-_BeginMode2D = _wrap(rlapi.BeginMode2D, None, Camera2D)
-_EndMode2D = _wrap(rlapi.EndMode2D, None)
-_BeginMode3D = _wrap(rlapi.BeginMode3D, None, Camera3D)
-_EndMode3D = _wrap(rlapi.EndMode3D, None)
-_BeginTextureMode = _wrap(rlapi.BeginTextureMode, None, RenderTexture2D)
-_EndTextureMode = _wrap(rlapi.EndTextureMode, None)
-_BeginShaderMode = _wrap(rlapi.BeginShaderMode, None, Shader)
-_EndShaderMode = _wrap(rlapi.EndShaderMode, None)
-_BeginBlendMode = _wrap(rlapi.BeginBlendMode, None, Int)
-_EndBlendMode = _wrap(rlapi.EndBlendMode, None)
-_BeginScissorMode = _wrap(rlapi.BeginScissorMode, None, Int, Int, Int, Int)
-_EndScissorMode = _wrap(rlapi.EndScissorMode, None)
-_BeginVrStereoMode = _wrap(rlapi.BeginVrStereoMode, None, VrStereoConfig)
-_EndVrStereoMode = _wrap(rlapi.EndVrStereoMode, None)
-_LoadVrStereoConfig = _wrap(rlapi.LoadVrStereoConfig, VrStereoConfig, VrDeviceInfo)
-_UnloadVrStereoConfig = _wrap(rlapi.UnloadVrStereoConfig, None, VrStereoConfig)
-_LoadShader = _wrap(rlapi.LoadShader, Shader, CharPtr, CharPtr)
-_LoadShaderFromMemory = _wrap(rlapi.LoadShaderFromMemory, Shader, CharPtr, CharPtr)
-_IsShaderReady = _wrap(rlapi.IsShaderReady, Bool, Shader)
-_GetShaderLocation = _wrap(rlapi.GetShaderLocation, Int, Shader, CharPtr)
-_GetShaderLocationAttrib = _wrap(rlapi.GetShaderLocationAttrib, Int, Shader, CharPtr)
-_SetShaderValue = _wrap(rlapi.SetShaderValue, None, Shader, Int, VoidPtr, Int)
-_SetShaderValueV = _wrap(rlapi.SetShaderValueV, None, Shader, Int, VoidPtr, Int, Int)
-_SetShaderValueMatrix = _wrap(rlapi.SetShaderValueMatrix, None, Shader, Int, Matrix)
-_SetShaderValueTexture = _wrap(rlapi.SetShaderValueTexture, None, Shader, Int, Texture2D)
-_UnloadShader = _wrap(rlapi.UnloadShader, None, Shader)
-_GetMouseRay = _wrap(rlapi.GetMouseRay, Ray, Vector2, Camera)
-_GetCameraMatrix = _wrap(rlapi.GetCameraMatrix, Matrix, Camera)
-_GetCameraMatrix2D = _wrap(rlapi.GetCameraMatrix2D, Matrix, Camera2D)
-_GetWorldToScreen = _wrap(rlapi.GetWorldToScreen, Vector2, Vector3, Camera)
-_GetScreenToWorld2D = _wrap(rlapi.GetScreenToWorld2D, Vector2, Vector2, Camera2D)
-_GetWorldToScreenEx = _wrap(rlapi.GetWorldToScreenEx, Vector2, Vector3, Camera, Int, Int)
-_GetWorldToScreen2D = _wrap(rlapi.GetWorldToScreen2D, Vector2, Vector2, Camera2D)
-_SetTargetFPS = _wrap(rlapi.SetTargetFPS, None, Int)
-_GetFrameTime = _wrap(rlapi.GetFrameTime, Float)
-_GetTime = _wrap(rlapi.GetTime, Double)
-_GetFPS = _wrap(rlapi.GetFPS, Int)
-_SwapScreenBuffer = _wrap(rlapi.SwapScreenBuffer, None)
-_PollInputEvents = _wrap(rlapi.PollInputEvents, None)
-_WaitTime = _wrap(rlapi.WaitTime, None, Double)
-_SetRandomSeed = _wrap(rlapi.SetRandomSeed, None, UInt)
-_GetRandomValue = _wrap(rlapi.GetRandomValue, Int, Int, Int)
-_LoadRandomSequence = _wrap(rlapi.LoadRandomSequence, IntPtr, UInt, Int, Int)
-_UnloadRandomSequence = _wrap(rlapi.UnloadRandomSequence, None, IntPtr)
-_TakeScreenshot = _wrap(rlapi.TakeScreenshot, None, CharPtr)
-_SetConfigFlags = _wrap(rlapi.SetConfigFlags, None, UInt)
-_OpenURL = _wrap(rlapi.OpenURL, None, CharPtr)
-_TraceLog = _wrap(rlapi.TraceLog, None, Int, CharPtr)
-_SetTraceLogLevel = _wrap(rlapi.SetTraceLogLevel, None, Int)
-_MemAlloc = _wrap(rlapi.MemAlloc, VoidPtr, UInt)
-_MemRealloc = _wrap(rlapi.MemRealloc, VoidPtr, VoidPtr, UInt)
-_MemFree = _wrap(rlapi.MemFree, None, VoidPtr)
-_SetTraceLogCallback = _wrap(rlapi.SetTraceLogCallback, None, TraceLogCallback)
-_SetLoadFileDataCallback = _wrap(rlapi.SetLoadFileDataCallback, None, LoadFileDataCallback)
-_SetSaveFileDataCallback = _wrap(rlapi.SetSaveFileDataCallback, None, SaveFileDataCallback)
-_SetLoadFileTextCallback = _wrap(rlapi.SetLoadFileTextCallback, None, LoadFileTextCallback)
-_SetSaveFileTextCallback = _wrap(rlapi.SetSaveFileTextCallback, None, SaveFileTextCallback)
-_LoadFileData = _wrap(rlapi.LoadFileData, UCharPtr, CharPtr, IntPtr)
-_UnloadFileData = _wrap(rlapi.UnloadFileData, None, UCharPtr)
-_SaveFileData = _wrap(rlapi.SaveFileData, Bool, CharPtr, VoidPtr, Int)
-_ExportDataAsCode = _wrap(rlapi.ExportDataAsCode, Bool, UCharPtr, Int, CharPtr)
-_LoadFileText = _wrap(rlapi.LoadFileText, CharPtr, CharPtr)
-_UnloadFileText = _wrap(rlapi.UnloadFileText, None, CharPtr)
-_SaveFileText = _wrap(rlapi.SaveFileText, Bool, CharPtr, CharPtr)
-_FileExists = _wrap(rlapi.FileExists, Bool, CharPtr)
-_DirectoryExists = _wrap(rlapi.DirectoryExists, Bool, CharPtr)
-_IsFileExtension = _wrap(rlapi.IsFileExtension, Bool, CharPtr, CharPtr)
-_GetFileLength = _wrap(rlapi.GetFileLength, Int, CharPtr)
-_GetFileExtension = _wrap(rlapi.GetFileExtension, CharPtr, CharPtr)
-_GetFileName = _wrap(rlapi.GetFileName, CharPtr, CharPtr)
-_GetFileNameWithoutExt = _wrap(rlapi.GetFileNameWithoutExt, CharPtr, CharPtr)
-_GetDirectoryPath = _wrap(rlapi.GetDirectoryPath, CharPtr, CharPtr)
-_GetPrevDirectoryPath = _wrap(rlapi.GetPrevDirectoryPath, CharPtr, CharPtr)
-_GetWorkingDirectory = _wrap(rlapi.GetWorkingDirectory, CharPtr)
-_GetApplicationDirectory = _wrap(rlapi.GetApplicationDirectory, CharPtr)
-_ChangeDirectory = _wrap(rlapi.ChangeDirectory, Bool, CharPtr)
-_IsPathFile = _wrap(rlapi.IsPathFile, Bool, CharPtr)
-_LoadDirectoryFiles = _wrap(rlapi.LoadDirectoryFiles, FilePathList, CharPtr)
-_LoadDirectoryFilesEx = _wrap(rlapi.LoadDirectoryFilesEx, FilePathList, CharPtr, CharPtr, Bool)
-_UnloadDirectoryFiles = _wrap(rlapi.UnloadDirectoryFiles, None, FilePathList)
-_IsFileDropped = _wrap(rlapi.IsFileDropped, Bool)
-_LoadDroppedFiles = _wrap(rlapi.LoadDroppedFiles, FilePathList)
-_UnloadDroppedFiles = _wrap(rlapi.UnloadDroppedFiles, None, FilePathList)
-_GetFileModTime = _wrap(rlapi.GetFileModTime, Long, CharPtr)
-_CompressData = _wrap(rlapi.CompressData, UCharPtr, UCharPtr, Int, IntPtr)
-_DecompressData = _wrap(rlapi.DecompressData, UCharPtr, UCharPtr, Int, IntPtr)
-_EncodeDataBase64 = _wrap(rlapi.EncodeDataBase64, CharPtr, UCharPtr, Int, IntPtr)
-_DecodeDataBase64 = _wrap(rlapi.DecodeDataBase64, UCharPtr, UCharPtr, IntPtr)
-_LoadAutomationEventList = _wrap(rlapi.LoadAutomationEventList, AutomationEventList, CharPtr)
-_UnloadAutomationEventList = _wrap(rlapi.UnloadAutomationEventList, None, AutomationEventListPtr)
-_ExportAutomationEventList = _wrap(rlapi.ExportAutomationEventList, Bool, AutomationEventList, CharPtr)
-_SetAutomationEventList = _wrap(rlapi.SetAutomationEventList, None, AutomationEventListPtr)
-_SetAutomationEventBaseFrame = _wrap(rlapi.SetAutomationEventBaseFrame, None, Int)
-_StartAutomationEventRecording = _wrap(rlapi.StartAutomationEventRecording, None)
-_StopAutomationEventRecording = _wrap(rlapi.StopAutomationEventRecording, None)
-_PlayAutomationEvent = _wrap(rlapi.PlayAutomationEvent, None, AutomationEvent)
-_IsKeyPressed = _wrap(rlapi.IsKeyPressed, Bool, Int)
-_IsKeyPressedRepeat = _wrap(rlapi.IsKeyPressedRepeat, Bool, Int)
-_IsKeyDown = _wrap(rlapi.IsKeyDown, Bool, Int)
-_IsKeyReleased = _wrap(rlapi.IsKeyReleased, Bool, Int)
-_IsKeyUp = _wrap(rlapi.IsKeyUp, Bool, Int)
-_GetKeyPressed = _wrap(rlapi.GetKeyPressed, Int)
-_GetCharPressed = _wrap(rlapi.GetCharPressed, Int)
-_SetExitKey = _wrap(rlapi.SetExitKey, None, Int)
-_IsGamepadAvailable = _wrap(rlapi.IsGamepadAvailable, Bool, Int)
-_GetGamepadName = _wrap(rlapi.GetGamepadName, CharPtr, Int)
-_IsGamepadButtonPressed = _wrap(rlapi.IsGamepadButtonPressed, Bool, Int, Int)
-_IsGamepadButtonDown = _wrap(rlapi.IsGamepadButtonDown, Bool, Int, Int)
-_IsGamepadButtonReleased = _wrap(rlapi.IsGamepadButtonReleased, Bool, Int, Int)
-_IsGamepadButtonUp = _wrap(rlapi.IsGamepadButtonUp, Bool, Int, Int)
-_GetGamepadButtonPressed = _wrap(rlapi.GetGamepadButtonPressed, Int)
-_GetGamepadAxisCount = _wrap(rlapi.GetGamepadAxisCount, Int, Int)
-_GetGamepadAxisMovement = _wrap(rlapi.GetGamepadAxisMovement, Float, Int, Int)
-_SetGamepadMappings = _wrap(rlapi.SetGamepadMappings, Int, CharPtr)
-_IsMouseButtonPressed = _wrap(rlapi.IsMouseButtonPressed, Bool, Int)
-_IsMouseButtonDown = _wrap(rlapi.IsMouseButtonDown, Bool, Int)
-_IsMouseButtonReleased = _wrap(rlapi.IsMouseButtonReleased, Bool, Int)
-_IsMouseButtonUp = _wrap(rlapi.IsMouseButtonUp, Bool, Int)
-_GetMouseX = _wrap(rlapi.GetMouseX, Int)
-_GetMouseY = _wrap(rlapi.GetMouseY, Int)
-_GetMousePosition = _wrap(rlapi.GetMousePosition, Vector2)
-_GetMouseDelta = _wrap(rlapi.GetMouseDelta, Vector2)
-_SetMousePosition = _wrap(rlapi.SetMousePosition, None, Int, Int)
-_SetMouseOffset = _wrap(rlapi.SetMouseOffset, None, Int, Int)
-_SetMouseScale = _wrap(rlapi.SetMouseScale, None, Float, Float)
-_GetMouseWheelMove = _wrap(rlapi.GetMouseWheelMove, Float)
-_GetMouseWheelMoveV = _wrap(rlapi.GetMouseWheelMoveV, Vector2)
-_SetMouseCursor = _wrap(rlapi.SetMouseCursor, None, Int)
-_GetTouchX = _wrap(rlapi.GetTouchX, Int)
-_GetTouchY = _wrap(rlapi.GetTouchY, Int)
-_GetTouchPosition = _wrap(rlapi.GetTouchPosition, Vector2, Int)
-_GetTouchPointId = _wrap(rlapi.GetTouchPointId, Int, Int)
-_GetTouchPointCount = _wrap(rlapi.GetTouchPointCount, Int)
-_SetGesturesEnabled = _wrap(rlapi.SetGesturesEnabled, None, UInt)
-_IsGestureDetected = _wrap(rlapi.IsGestureDetected, Bool, UInt)
-_GetGestureDetected = _wrap(rlapi.GetGestureDetected, Int)
-_GetGestureHoldDuration = _wrap(rlapi.GetGestureHoldDuration, Float)
-_GetGestureDragVector = _wrap(rlapi.GetGestureDragVector, Vector2)
-_GetGestureDragAngle = _wrap(rlapi.GetGestureDragAngle, Float)
-_GetGesturePinchVector = _wrap(rlapi.GetGesturePinchVector, Vector2)
-_GetGesturePinchAngle = _wrap(rlapi.GetGesturePinchAngle, Float)
-_UpdateCamera = _wrap(rlapi.UpdateCamera, None, CameraPtr, Int)
-_UpdateCameraPro = _wrap(rlapi.UpdateCameraPro, None, CameraPtr, Vector3, Vector3, Float)
-_SetShapesTexture = _wrap(rlapi.SetShapesTexture, None, Texture2D, Rectangle)
-_DrawPixel = _wrap(rlapi.DrawPixel, None, Int, Int, Color)
-_DrawPixelV = _wrap(rlapi.DrawPixelV, None, Vector2, Color)
-_DrawLine = _wrap(rlapi.DrawLine, None, Int, Int, Int, Int, Color)
-_DrawLineV = _wrap(rlapi.DrawLineV, None, Vector2, Vector2, Color)
-_DrawLineEx = _wrap(rlapi.DrawLineEx, None, Vector2, Vector2, Float, Color)
-_DrawLineStrip = _wrap(rlapi.DrawLineStrip, None, Vector2Ptr, Int, Color)
-_DrawLineBezier = _wrap(rlapi.DrawLineBezier, None, Vector2, Vector2, Float, Color)
-_DrawCircle = _wrap(rlapi.DrawCircle, None, Int, Int, Float, Color)
-_DrawCircleSector = _wrap(rlapi.DrawCircleSector, None, Vector2, Float, Float, Float, Int, Color)
-_DrawCircleSectorLines = _wrap(rlapi.DrawCircleSectorLines, None, Vector2, Float, Float, Float, Int, Color)
-_DrawCircleGradient = _wrap(rlapi.DrawCircleGradient, None, Int, Int, Float, Color, Color)
-_DrawCircleV = _wrap(rlapi.DrawCircleV, None, Vector2, Float, Color)
-_DrawCircleLines = _wrap(rlapi.DrawCircleLines, None, Int, Int, Float, Color)
-_DrawCircleLinesV = _wrap(rlapi.DrawCircleLinesV, None, Vector2, Float, Color)
-_DrawEllipse = _wrap(rlapi.DrawEllipse, None, Int, Int, Float, Float, Color)
-_DrawEllipseLines = _wrap(rlapi.DrawEllipseLines, None, Int, Int, Float, Float, Color)
-_DrawRing = _wrap(rlapi.DrawRing, None, Vector2, Float, Float, Float, Float, Int, Color)
-_DrawRingLines = _wrap(rlapi.DrawRingLines, None, Vector2, Float, Float, Float, Float, Int, Color)
-_DrawRectangle = _wrap(rlapi.DrawRectangle, None, Int, Int, Int, Int, Color)
-_DrawRectangleV = _wrap(rlapi.DrawRectangleV, None, Vector2, Vector2, Color)
-_DrawRectangleRec = _wrap(rlapi.DrawRectangleRec, None, Rectangle, Color)
-_DrawRectanglePro = _wrap(rlapi.DrawRectanglePro, None, Rectangle, Vector2, Float, Color)
-_DrawRectangleGradientV = _wrap(rlapi.DrawRectangleGradientV, None, Int, Int, Int, Int, Color, Color)
-_DrawRectangleGradientH = _wrap(rlapi.DrawRectangleGradientH, None, Int, Int, Int, Int, Color, Color)
-_DrawRectangleGradientEx = _wrap(rlapi.DrawRectangleGradientEx, None, Rectangle, Color, Color, Color, Color)
-_DrawRectangleLines = _wrap(rlapi.DrawRectangleLines, None, Int, Int, Int, Int, Color)
-_DrawRectangleLinesEx = _wrap(rlapi.DrawRectangleLinesEx, None, Rectangle, Float, Color)
-_DrawRectangleRounded = _wrap(rlapi.DrawRectangleRounded, None, Rectangle, Float, Int, Color)
-_DrawRectangleRoundedLines = _wrap(rlapi.DrawRectangleRoundedLines, None, Rectangle, Float, Int, Float, Color)
-_DrawTriangle = _wrap(rlapi.DrawTriangle, None, Vector2, Vector2, Vector2, Color)
-_DrawTriangleLines = _wrap(rlapi.DrawTriangleLines, None, Vector2, Vector2, Vector2, Color)
-_DrawTriangleFan = _wrap(rlapi.DrawTriangleFan, None, Vector2Ptr, Int, Color)
-_DrawTriangleStrip = _wrap(rlapi.DrawTriangleStrip, None, Vector2Ptr, Int, Color)
-_DrawPoly = _wrap(rlapi.DrawPoly, None, Vector2, Int, Float, Float, Color)
-_DrawPolyLines = _wrap(rlapi.DrawPolyLines, None, Vector2, Int, Float, Float, Color)
-_DrawPolyLinesEx = _wrap(rlapi.DrawPolyLinesEx, None, Vector2, Int, Float, Float, Float, Color)
-_DrawSplineLinear = _wrap(rlapi.DrawSplineLinear, None, Vector2Ptr, Int, Float, Color)
-_DrawSplineBasis = _wrap(rlapi.DrawSplineBasis, None, Vector2Ptr, Int, Float, Color)
-_DrawSplineCatmullRom = _wrap(rlapi.DrawSplineCatmullRom, None, Vector2Ptr, Int, Float, Color)
-_DrawSplineBezierQuadratic = _wrap(rlapi.DrawSplineBezierQuadratic, None, Vector2Ptr, Int, Float, Color)
-_DrawSplineBezierCubic = _wrap(rlapi.DrawSplineBezierCubic, None, Vector2Ptr, Int, Float, Color)
-_DrawSplineSegmentLinear = _wrap(rlapi.DrawSplineSegmentLinear, None, Vector2, Vector2, Float, Color)
-_DrawSplineSegmentBasis = _wrap(rlapi.DrawSplineSegmentBasis, None, Vector2, Vector2, Vector2, Vector2, Float, Color)
-_DrawSplineSegmentCatmullRom = _wrap(rlapi.DrawSplineSegmentCatmullRom, None, Vector2, Vector2, Vector2, Vector2, Float, Color)
-_DrawSplineSegmentBezierQuadratic = _wrap(rlapi.DrawSplineSegmentBezierQuadratic, None, Vector2, Vector2, Vector2, Float, Color)
-_DrawSplineSegmentBezierCubic = _wrap(rlapi.DrawSplineSegmentBezierCubic, None, Vector2, Vector2, Vector2, Vector2, Float, Color)
-_GetSplinePointLinear = _wrap(rlapi.GetSplinePointLinear, Vector2, Vector2, Vector2, Float)
-_GetSplinePointBasis = _wrap(rlapi.GetSplinePointBasis, Vector2, Vector2, Vector2, Vector2, Vector2, Float)
-_GetSplinePointCatmullRom = _wrap(rlapi.GetSplinePointCatmullRom, Vector2, Vector2, Vector2, Vector2, Vector2, Float)
-_GetSplinePointBezierQuad = _wrap(rlapi.GetSplinePointBezierQuad, Vector2, Vector2, Vector2, Vector2, Float)
-_GetSplinePointBezierCubic = _wrap(rlapi.GetSplinePointBezierCubic, Vector2, Vector2, Vector2, Vector2, Vector2, Float)
-_CheckCollisionRecs = _wrap(rlapi.CheckCollisionRecs, Bool, Rectangle, Rectangle)
-_CheckCollisionCircles = _wrap(rlapi.CheckCollisionCircles, Bool, Vector2, Float, Vector2, Float)
-_CheckCollisionCircleRec = _wrap(rlapi.CheckCollisionCircleRec, Bool, Vector2, Float, Rectangle)
-_CheckCollisionPointRec = _wrap(rlapi.CheckCollisionPointRec, Bool, Vector2, Rectangle)
-_CheckCollisionPointCircle = _wrap(rlapi.CheckCollisionPointCircle, Bool, Vector2, Vector2, Float)
-_CheckCollisionPointTriangle = _wrap(rlapi.CheckCollisionPointTriangle, Bool, Vector2, Vector2, Vector2, Vector2)
-_CheckCollisionPointPoly = _wrap(rlapi.CheckCollisionPointPoly, Bool, Vector2, Vector2Ptr, Int)
-_CheckCollisionLines = _wrap(rlapi.CheckCollisionLines, Bool, Vector2, Vector2, Vector2, Vector2, Vector2Ptr)
-_CheckCollisionPointLine = _wrap(rlapi.CheckCollisionPointLine, Bool, Vector2, Vector2, Vector2, Int)
-_GetCollisionRec = _wrap(rlapi.GetCollisionRec, Rectangle, Rectangle, Rectangle)
-_LoadImage = _wrap(rlapi.LoadImage, Image, CharPtr)
-_LoadImageRaw = _wrap(rlapi.LoadImageRaw, Image, CharPtr, Int, Int, Int, Int)
-_LoadImageSvg = _wrap(rlapi.LoadImageSvg, Image, CharPtr, Int, Int)
-_LoadImageAnim = _wrap(rlapi.LoadImageAnim, Image, CharPtr, IntPtr)
-_LoadImageFromMemory = _wrap(rlapi.LoadImageFromMemory, Image, CharPtr, UCharPtr, Int)
-_LoadImageFromTexture = _wrap(rlapi.LoadImageFromTexture, Image, Texture2D)
-_LoadImageFromScreen = _wrap(rlapi.LoadImageFromScreen, Image)
-_IsImageReady = _wrap(rlapi.IsImageReady, Bool, Image)
-_UnloadImage = _wrap(rlapi.UnloadImage, None, Image)
-_ExportImage = _wrap(rlapi.ExportImage, Bool, Image, CharPtr)
-_ExportImageToMemory = _wrap(rlapi.ExportImageToMemory, UCharPtr, Image, CharPtr, IntPtr)
-_ExportImageAsCode = _wrap(rlapi.ExportImageAsCode, Bool, Image, CharPtr)
-_GenImageColor = _wrap(rlapi.GenImageColor, Image, Int, Int, Color)
-_GenImageGradientLinear = _wrap(rlapi.GenImageGradientLinear, Image, Int, Int, Int, Color, Color)
-_GenImageGradientRadial = _wrap(rlapi.GenImageGradientRadial, Image, Int, Int, Float, Color, Color)
-_GenImageGradientSquare = _wrap(rlapi.GenImageGradientSquare, Image, Int, Int, Float, Color, Color)
-_GenImageChecked = _wrap(rlapi.GenImageChecked, Image, Int, Int, Int, Int, Color, Color)
-_GenImageWhiteNoise = _wrap(rlapi.GenImageWhiteNoise, Image, Int, Int, Float)
-_GenImagePerlinNoise = _wrap(rlapi.GenImagePerlinNoise, Image, Int, Int, Int, Int, Float)
-_GenImageCellular = _wrap(rlapi.GenImageCellular, Image, Int, Int, Int)
-_GenImageText = _wrap(rlapi.GenImageText, Image, Int, Int, CharPtr)
-_ImageCopy = _wrap(rlapi.ImageCopy, Image, Image)
-_ImageFromImage = _wrap(rlapi.ImageFromImage, Image, Image, Rectangle)
-_ImageText = _wrap(rlapi.ImageText, Image, CharPtr, Int, Color)
-_ImageTextEx = _wrap(rlapi.ImageTextEx, Image, Font, CharPtr, Float, Float, Color)
-_ImageFormat = _wrap(rlapi.ImageFormat, None, ImagePtr, Int)
-_ImageToPOT = _wrap(rlapi.ImageToPOT, None, ImagePtr, Color)
-_ImageCrop = _wrap(rlapi.ImageCrop, None, ImagePtr, Rectangle)
-_ImageAlphaCrop = _wrap(rlapi.ImageAlphaCrop, None, ImagePtr, Float)
-_ImageAlphaClear = _wrap(rlapi.ImageAlphaClear, None, ImagePtr, Color, Float)
-_ImageAlphaMask = _wrap(rlapi.ImageAlphaMask, None, ImagePtr, Image)
-_ImageAlphaPremultiply = _wrap(rlapi.ImageAlphaPremultiply, None, ImagePtr)
-_ImageBlurGaussian = _wrap(rlapi.ImageBlurGaussian, None, ImagePtr, Int)
-_ImageResize = _wrap(rlapi.ImageResize, None, ImagePtr, Int, Int)
-_ImageResizeNN = _wrap(rlapi.ImageResizeNN, None, ImagePtr, Int, Int)
-_ImageResizeCanvas = _wrap(rlapi.ImageResizeCanvas, None, ImagePtr, Int, Int, Int, Int, Color)
-_ImageMipmaps = _wrap(rlapi.ImageMipmaps, None, ImagePtr)
-_ImageDither = _wrap(rlapi.ImageDither, None, ImagePtr, Int, Int, Int, Int)
-_ImageFlipVertical = _wrap(rlapi.ImageFlipVertical, None, ImagePtr)
-_ImageFlipHorizontal = _wrap(rlapi.ImageFlipHorizontal, None, ImagePtr)
-_ImageRotate = _wrap(rlapi.ImageRotate, None, ImagePtr, Int)
-_ImageRotateCW = _wrap(rlapi.ImageRotateCW, None, ImagePtr)
-_ImageRotateCCW = _wrap(rlapi.ImageRotateCCW, None, ImagePtr)
-_ImageColorTint = _wrap(rlapi.ImageColorTint, None, ImagePtr, Color)
-_ImageColorInvert = _wrap(rlapi.ImageColorInvert, None, ImagePtr)
-_ImageColorGrayscale = _wrap(rlapi.ImageColorGrayscale, None, ImagePtr)
-_ImageColorContrast = _wrap(rlapi.ImageColorContrast, None, ImagePtr, Float)
-_ImageColorBrightness = _wrap(rlapi.ImageColorBrightness, None, ImagePtr, Int)
-_ImageColorReplace = _wrap(rlapi.ImageColorReplace, None, ImagePtr, Color, Color)
-_LoadImageColors = _wrap(rlapi.LoadImageColors, ColorPtr, Image)
-_LoadImagePalette = _wrap(rlapi.LoadImagePalette, ColorPtr, Image, Int, IntPtr)
-_UnloadImageColors = _wrap(rlapi.UnloadImageColors, None, ColorPtr)
-_UnloadImagePalette = _wrap(rlapi.UnloadImagePalette, None, ColorPtr)
-_GetImageAlphaBorder = _wrap(rlapi.GetImageAlphaBorder, Rectangle, Image, Float)
-_GetImageColor = _wrap(rlapi.GetImageColor, Color, Image, Int, Int)
-_ImageClearBackground = _wrap(rlapi.ImageClearBackground, None, ImagePtr, Color)
-_ImageDrawPixel = _wrap(rlapi.ImageDrawPixel, None, ImagePtr, Int, Int, Color)
-_ImageDrawPixelV = _wrap(rlapi.ImageDrawPixelV, None, ImagePtr, Vector2, Color)
-_ImageDrawLine = _wrap(rlapi.ImageDrawLine, None, ImagePtr, Int, Int, Int, Int, Color)
-_ImageDrawLineV = _wrap(rlapi.ImageDrawLineV, None, ImagePtr, Vector2, Vector2, Color)
-_ImageDrawCircle = _wrap(rlapi.ImageDrawCircle, None, ImagePtr, Int, Int, Int, Color)
-_ImageDrawCircleV = _wrap(rlapi.ImageDrawCircleV, None, ImagePtr, Vector2, Int, Color)
-_ImageDrawCircleLines = _wrap(rlapi.ImageDrawCircleLines, None, ImagePtr, Int, Int, Int, Color)
-_ImageDrawCircleLinesV = _wrap(rlapi.ImageDrawCircleLinesV, None, ImagePtr, Vector2, Int, Color)
-_ImageDrawRectangle = _wrap(rlapi.ImageDrawRectangle, None, ImagePtr, Int, Int, Int, Int, Color)
-_ImageDrawRectangleV = _wrap(rlapi.ImageDrawRectangleV, None, ImagePtr, Vector2, Vector2, Color)
-_ImageDrawRectangleRec = _wrap(rlapi.ImageDrawRectangleRec, None, ImagePtr, Rectangle, Color)
-_ImageDrawRectangleLines = _wrap(rlapi.ImageDrawRectangleLines, None, ImagePtr, Rectangle, Int, Color)
-_ImageDraw = _wrap(rlapi.ImageDraw, None, ImagePtr, Image, Rectangle, Rectangle, Color)
-_ImageDrawText = _wrap(rlapi.ImageDrawText, None, ImagePtr, CharPtr, Int, Int, Int, Color)
-_ImageDrawTextEx = _wrap(rlapi.ImageDrawTextEx, None, ImagePtr, Font, CharPtr, Vector2, Float, Float, Color)
-_LoadTexture = _wrap(rlapi.LoadTexture, Texture2D, CharPtr)
-_LoadTextureFromImage = _wrap(rlapi.LoadTextureFromImage, Texture2D, Image)
-_LoadTextureCubemap = _wrap(rlapi.LoadTextureCubemap, TextureCubemap, Image, Int)
-_LoadRenderTexture = _wrap(rlapi.LoadRenderTexture, RenderTexture2D, Int, Int)
-_IsTextureReady = _wrap(rlapi.IsTextureReady, Bool, Texture2D)
-_UnloadTexture = _wrap(rlapi.UnloadTexture, None, Texture2D)
-_IsRenderTextureReady = _wrap(rlapi.IsRenderTextureReady, Bool, RenderTexture2D)
-_UnloadRenderTexture = _wrap(rlapi.UnloadRenderTexture, None, RenderTexture2D)
-_UpdateTexture = _wrap(rlapi.UpdateTexture, None, Texture2D, VoidPtr)
-_UpdateTextureRec = _wrap(rlapi.UpdateTextureRec, None, Texture2D, Rectangle, VoidPtr)
-_GenTextureMipmaps = _wrap(rlapi.GenTextureMipmaps, None, Texture2DPtr)
-_SetTextureFilter = _wrap(rlapi.SetTextureFilter, None, Texture2D, Int)
-_SetTextureWrap = _wrap(rlapi.SetTextureWrap, None, Texture2D, Int)
-_DrawTexture = _wrap(rlapi.DrawTexture, None, Texture2D, Int, Int, Color)
-_DrawTextureV = _wrap(rlapi.DrawTextureV, None, Texture2D, Vector2, Color)
-_DrawTextureEx = _wrap(rlapi.DrawTextureEx, None, Texture2D, Vector2, Float, Float, Color)
-_DrawTextureRec = _wrap(rlapi.DrawTextureRec, None, Texture2D, Rectangle, Vector2, Color)
-_DrawTexturePro = _wrap(rlapi.DrawTexturePro, None, Texture2D, Rectangle, Rectangle, Vector2, Float, Color)
-_DrawTextureNPatch = _wrap(rlapi.DrawTextureNPatch, None, Texture2D, NPatchInfo, Rectangle, Vector2, Float, Color)
-_Fade = _wrap(rlapi.Fade, Color, Color, Float)
-_ColorToInt = _wrap(rlapi.ColorToInt, Int, Color)
-_ColorNormalize = _wrap(rlapi.ColorNormalize, Vector4, Color)
-_ColorFromNormalized = _wrap(rlapi.ColorFromNormalized, Color, Vector4)
-_ColorToHSV = _wrap(rlapi.ColorToHSV, Vector3, Color)
-_ColorFromHSV = _wrap(rlapi.ColorFromHSV, Color, Float, Float, Float)
-_ColorTint = _wrap(rlapi.ColorTint, Color, Color, Color)
-_ColorBrightness = _wrap(rlapi.ColorBrightness, Color, Color, Float)
-_ColorContrast = _wrap(rlapi.ColorContrast, Color, Color, Float)
-_ColorAlpha = _wrap(rlapi.ColorAlpha, Color, Color, Float)
-_ColorAlphaBlend = _wrap(rlapi.ColorAlphaBlend, Color, Color, Color, Color)
-_GetColor = _wrap(rlapi.GetColor, Color, UInt)
-_GetPixelColor = _wrap(rlapi.GetPixelColor, Color, VoidPtr, Int)
-_SetPixelColor = _wrap(rlapi.SetPixelColor, None, VoidPtr, Color, Int)
-_GetPixelDataSize = _wrap(rlapi.GetPixelDataSize, Int, Int, Int, Int)
-_GetFontDefault = _wrap(rlapi.GetFontDefault, Font)
-_LoadFont = _wrap(rlapi.LoadFont, Font, CharPtr)
-_LoadFontEx = _wrap(rlapi.LoadFontEx, Font, CharPtr, Int, IntPtr, Int)
-_LoadFontFromImage = _wrap(rlapi.LoadFontFromImage, Font, Image, Color, Int)
-_LoadFontFromMemory = _wrap(rlapi.LoadFontFromMemory, Font, CharPtr, UCharPtr, Int, Int, IntPtr, Int)
-_IsFontReady = _wrap(rlapi.IsFontReady, Bool, Font)
-_LoadFontData = _wrap(rlapi.LoadFontData, GlyphInfoPtr, UCharPtr, Int, Int, IntPtr, Int, Int)
-_GenImageFontAtlas = _wrap(rlapi.GenImageFontAtlas, Image, GlyphInfoPtr, RectanglePtrPtr, Int, Int, Int, Int)
-_UnloadFontData = _wrap(rlapi.UnloadFontData, None, GlyphInfoPtr, Int)
-_UnloadFont = _wrap(rlapi.UnloadFont, None, Font)
-_ExportFontAsCode = _wrap(rlapi.ExportFontAsCode, Bool, Font, CharPtr)
-_DrawFPS = _wrap(rlapi.DrawFPS, None, Int, Int)
-_DrawText = _wrap(rlapi.DrawText, None, CharPtr, Int, Int, Int, Color)
-_DrawTextEx = _wrap(rlapi.DrawTextEx, None, Font, CharPtr, Vector2, Float, Float, Color)
-_DrawTextPro = _wrap(rlapi.DrawTextPro, None, Font, CharPtr, Vector2, Vector2, Float, Float, Float, Color)
-_DrawTextCodepoint = _wrap(rlapi.DrawTextCodepoint, None, Font, Int, Vector2, Float, Color)
-_DrawTextCodepoints = _wrap(rlapi.DrawTextCodepoints, None, Font, IntPtr, Int, Vector2, Float, Float, Color)
-_SetTextLineSpacing = _wrap(rlapi.SetTextLineSpacing, None, Int)
-_MeasureText = _wrap(rlapi.MeasureText, Int, CharPtr, Int)
-_MeasureTextEx = _wrap(rlapi.MeasureTextEx, Vector2, Font, CharPtr, Float, Float)
-_GetGlyphIndex = _wrap(rlapi.GetGlyphIndex, Int, Font, Int)
-_GetGlyphInfo = _wrap(rlapi.GetGlyphInfo, GlyphInfo, Font, Int)
-_GetGlyphAtlasRec = _wrap(rlapi.GetGlyphAtlasRec, Rectangle, Font, Int)
-_LoadUTF8 = _wrap(rlapi.LoadUTF8, CharPtr, IntPtr, Int)
-_UnloadUTF8 = _wrap(rlapi.UnloadUTF8, None, CharPtr)
-_LoadCodepoints = _wrap(rlapi.LoadCodepoints, IntPtr, CharPtr, IntPtr)
-_UnloadCodepoints = _wrap(rlapi.UnloadCodepoints, None, IntPtr)
-_GetCodepointCount = _wrap(rlapi.GetCodepointCount, Int, CharPtr)
-_GetCodepoint = _wrap(rlapi.GetCodepoint, Int, CharPtr, IntPtr)
-_GetCodepointNext = _wrap(rlapi.GetCodepointNext, Int, CharPtr, IntPtr)
-_GetCodepointPrevious = _wrap(rlapi.GetCodepointPrevious, Int, CharPtr, IntPtr)
-_CodepointToUTF8 = _wrap(rlapi.CodepointToUTF8, CharPtr, Int, IntPtr)
-_TextCopy = _wrap(rlapi.TextCopy, Int, CharPtr, CharPtr)
-_TextIsEqual = _wrap(rlapi.TextIsEqual, Bool, CharPtr, CharPtr)
-_TextLength = _wrap(rlapi.TextLength, UInt, CharPtr)
-_TextFormat = _wrap(rlapi.TextFormat, CharPtr, CharPtr)
-_TextSubtext = _wrap(rlapi.TextSubtext, CharPtr, CharPtr, Int, Int)
-_TextReplace = _wrap(rlapi.TextReplace, CharPtr, CharPtr, CharPtr, CharPtr)
-_TextInsert = _wrap(rlapi.TextInsert, CharPtr, CharPtr, CharPtr, Int)
-_TextJoin = _wrap(rlapi.TextJoin, CharPtr, CharPtrPtr, Int, CharPtr)
-_TextSplit = _wrap(rlapi.TextSplit, CharPtrPtr, CharPtr, Char, IntPtr)
-_TextAppend = _wrap(rlapi.TextAppend, None, CharPtr, CharPtr, IntPtr)
-_TextFindIndex = _wrap(rlapi.TextFindIndex, Int, CharPtr, CharPtr)
-_TextToUpper = _wrap(rlapi.TextToUpper, CharPtr, CharPtr)
-_TextToLower = _wrap(rlapi.TextToLower, CharPtr, CharPtr)
-_TextToPascal = _wrap(rlapi.TextToPascal, CharPtr, CharPtr)
-_TextToInteger = _wrap(rlapi.TextToInteger, Int, CharPtr)
-_DrawLine3D = _wrap(rlapi.DrawLine3D, None, Vector3, Vector3, Color)
-_DrawPoint3D = _wrap(rlapi.DrawPoint3D, None, Vector3, Color)
-_DrawCircle3D = _wrap(rlapi.DrawCircle3D, None, Vector3, Float, Vector3, Float, Color)
-_DrawTriangle3D = _wrap(rlapi.DrawTriangle3D, None, Vector3, Vector3, Vector3, Color)
-_DrawTriangleStrip3D = _wrap(rlapi.DrawTriangleStrip3D, None, Vector3Ptr, Int, Color)
-_DrawCube = _wrap(rlapi.DrawCube, None, Vector3, Float, Float, Float, Color)
-_DrawCubeV = _wrap(rlapi.DrawCubeV, None, Vector3, Vector3, Color)
-_DrawCubeWires = _wrap(rlapi.DrawCubeWires, None, Vector3, Float, Float, Float, Color)
-_DrawCubeWiresV = _wrap(rlapi.DrawCubeWiresV, None, Vector3, Vector3, Color)
-_DrawSphere = _wrap(rlapi.DrawSphere, None, Vector3, Float, Color)
-_DrawSphereEx = _wrap(rlapi.DrawSphereEx, None, Vector3, Float, Int, Int, Color)
-_DrawSphereWires = _wrap(rlapi.DrawSphereWires, None, Vector3, Float, Int, Int, Color)
-_DrawCylinder = _wrap(rlapi.DrawCylinder, None, Vector3, Float, Float, Float, Int, Color)
-_DrawCylinderEx = _wrap(rlapi.DrawCylinderEx, None, Vector3, Vector3, Float, Float, Int, Color)
-_DrawCylinderWires = _wrap(rlapi.DrawCylinderWires, None, Vector3, Float, Float, Float, Int, Color)
-_DrawCylinderWiresEx = _wrap(rlapi.DrawCylinderWiresEx, None, Vector3, Vector3, Float, Float, Int, Color)
-_DrawCapsule = _wrap(rlapi.DrawCapsule, None, Vector3, Vector3, Float, Int, Int, Color)
-_DrawCapsuleWires = _wrap(rlapi.DrawCapsuleWires, None, Vector3, Vector3, Float, Int, Int, Color)
-_DrawPlane = _wrap(rlapi.DrawPlane, None, Vector3, Vector2, Color)
-_DrawRay = _wrap(rlapi.DrawRay, None, Ray, Color)
-_DrawGrid = _wrap(rlapi.DrawGrid, None, Int, Float)
-_LoadModel = _wrap(rlapi.LoadModel, Model, CharPtr)
-_LoadModelFromMesh = _wrap(rlapi.LoadModelFromMesh, Model, Mesh)
-_IsModelReady = _wrap(rlapi.IsModelReady, Bool, Model)
-_UnloadModel = _wrap(rlapi.UnloadModel, None, Model)
-_GetModelBoundingBox = _wrap(rlapi.GetModelBoundingBox, BoundingBox, Model)
-_DrawModel = _wrap(rlapi.DrawModel, None, Model, Vector3, Float, Color)
-_DrawModelEx = _wrap(rlapi.DrawModelEx, None, Model, Vector3, Vector3, Float, Vector3, Color)
-_DrawModelWires = _wrap(rlapi.DrawModelWires, None, Model, Vector3, Float, Color)
-_DrawModelWiresEx = _wrap(rlapi.DrawModelWiresEx, None, Model, Vector3, Vector3, Float, Vector3, Color)
-_DrawBoundingBox = _wrap(rlapi.DrawBoundingBox, None, BoundingBox, Color)
-_DrawBillboard = _wrap(rlapi.DrawBillboard, None, Camera, Texture2D, Vector3, Float, Color)
-_DrawBillboardRec = _wrap(rlapi.DrawBillboardRec, None, Camera, Texture2D, Rectangle, Vector3, Vector2, Color)
-_DrawBillboardPro = _wrap(rlapi.DrawBillboardPro, None, Camera, Texture2D, Rectangle, Vector3, Vector3, Vector2, Vector2, Float, Color)
-_UploadMesh = _wrap(rlapi.UploadMesh, None, MeshPtr, Bool)
-_UpdateMeshBuffer = _wrap(rlapi.UpdateMeshBuffer, None, Mesh, Int, VoidPtr, Int, Int)
-_UnloadMesh = _wrap(rlapi.UnloadMesh, None, Mesh)
-_DrawMesh = _wrap(rlapi.DrawMesh, None, Mesh, Material, Matrix)
-_DrawMeshInstanced = _wrap(rlapi.DrawMeshInstanced, None, Mesh, Material, MatrixPtr, Int)
-_ExportMesh = _wrap(rlapi.ExportMesh, Bool, Mesh, CharPtr)
-_GetMeshBoundingBox = _wrap(rlapi.GetMeshBoundingBox, BoundingBox, Mesh)
-_GenMeshTangents = _wrap(rlapi.GenMeshTangents, None, MeshPtr)
-_GenMeshPoly = _wrap(rlapi.GenMeshPoly, Mesh, Int, Float)
-_GenMeshPlane = _wrap(rlapi.GenMeshPlane, Mesh, Float, Float, Int, Int)
-_GenMeshCube = _wrap(rlapi.GenMeshCube, Mesh, Float, Float, Float)
-_GenMeshSphere = _wrap(rlapi.GenMeshSphere, Mesh, Float, Int, Int)
-_GenMeshHemiSphere = _wrap(rlapi.GenMeshHemiSphere, Mesh, Float, Int, Int)
-_GenMeshCylinder = _wrap(rlapi.GenMeshCylinder, Mesh, Float, Float, Int)
-_GenMeshCone = _wrap(rlapi.GenMeshCone, Mesh, Float, Float, Int)
-_GenMeshTorus = _wrap(rlapi.GenMeshTorus, Mesh, Float, Float, Int, Int)
-_GenMeshKnot = _wrap(rlapi.GenMeshKnot, Mesh, Float, Float, Int, Int)
-_GenMeshHeightmap = _wrap(rlapi.GenMeshHeightmap, Mesh, Image, Vector3)
-_GenMeshCubicmap = _wrap(rlapi.GenMeshCubicmap, Mesh, Image, Vector3)
-_LoadMaterials = _wrap(rlapi.LoadMaterials, MaterialPtr, CharPtr, IntPtr)
-_LoadMaterialDefault = _wrap(rlapi.LoadMaterialDefault, Material)
-_IsMaterialReady = _wrap(rlapi.IsMaterialReady, Bool, Material)
-_UnloadMaterial = _wrap(rlapi.UnloadMaterial, None, Material)
-_SetMaterialTexture = _wrap(rlapi.SetMaterialTexture, None, MaterialPtr, Int, Texture2D)
-_SetModelMeshMaterial = _wrap(rlapi.SetModelMeshMaterial, None, ModelPtr, Int, Int)
-_LoadModelAnimations = _wrap(rlapi.LoadModelAnimations, ModelAnimationPtr, CharPtr, IntPtr)
-_UpdateModelAnimation = _wrap(rlapi.UpdateModelAnimation, None, Model, ModelAnimation, Int)
-_UnloadModelAnimation = _wrap(rlapi.UnloadModelAnimation, None, ModelAnimation)
-_UnloadModelAnimations = _wrap(rlapi.UnloadModelAnimations, None, ModelAnimationPtr, Int)
-_IsModelAnimationValid = _wrap(rlapi.IsModelAnimationValid, Bool, Model, ModelAnimation)
-_CheckCollisionSpheres = _wrap(rlapi.CheckCollisionSpheres, Bool, Vector3, Float, Vector3, Float)
-_CheckCollisionBoxes = _wrap(rlapi.CheckCollisionBoxes, Bool, BoundingBox, BoundingBox)
-_CheckCollisionBoxSphere = _wrap(rlapi.CheckCollisionBoxSphere, Bool, BoundingBox, Vector3, Float)
-_GetRayCollisionSphere = _wrap(rlapi.GetRayCollisionSphere, RayCollision, Ray, Vector3, Float)
-_GetRayCollisionBox = _wrap(rlapi.GetRayCollisionBox, RayCollision, Ray, BoundingBox)
-_GetRayCollisionMesh = _wrap(rlapi.GetRayCollisionMesh, RayCollision, Ray, Mesh, Matrix)
-_GetRayCollisionTriangle = _wrap(rlapi.GetRayCollisionTriangle, RayCollision, Ray, Vector3, Vector3, Vector3)
-_GetRayCollisionQuad = _wrap(rlapi.GetRayCollisionQuad, RayCollision, Ray, Vector3, Vector3, Vector3, Vector3)
-_InitAudioDevice = _wrap(rlapi.InitAudioDevice, None)
-_CloseAudioDevice = _wrap(rlapi.CloseAudioDevice, None)
-_IsAudioDeviceReady = _wrap(rlapi.IsAudioDeviceReady, Bool)
-_SetMasterVolume = _wrap(rlapi.SetMasterVolume, None, Float)
-_GetMasterVolume = _wrap(rlapi.GetMasterVolume, Float)
-_LoadWave = _wrap(rlapi.LoadWave, Wave, CharPtr)
-_LoadWaveFromMemory = _wrap(rlapi.LoadWaveFromMemory, Wave, CharPtr, UCharPtr, Int)
-_IsWaveReady = _wrap(rlapi.IsWaveReady, Bool, Wave)
-_LoadSound = _wrap(rlapi.LoadSound, Sound, CharPtr)
-_LoadSoundFromWave = _wrap(rlapi.LoadSoundFromWave, Sound, Wave)
-_LoadSoundAlias = _wrap(rlapi.LoadSoundAlias, Sound, Sound)
-_IsSoundReady = _wrap(rlapi.IsSoundReady, Bool, Sound)
-_UpdateSound = _wrap(rlapi.UpdateSound, None, Sound, VoidPtr, Int)
-_UnloadWave = _wrap(rlapi.UnloadWave, None, Wave)
-_UnloadSound = _wrap(rlapi.UnloadSound, None, Sound)
-_UnloadSoundAlias = _wrap(rlapi.UnloadSoundAlias, None, Sound)
-_ExportWave = _wrap(rlapi.ExportWave, Bool, Wave, CharPtr)
-_ExportWaveAsCode = _wrap(rlapi.ExportWaveAsCode, Bool, Wave, CharPtr)
-_PlaySound = _wrap(rlapi.PlaySound, None, Sound)
-_StopSound = _wrap(rlapi.StopSound, None, Sound)
-_PauseSound = _wrap(rlapi.PauseSound, None, Sound)
-_ResumeSound = _wrap(rlapi.ResumeSound, None, Sound)
-_IsSoundPlaying = _wrap(rlapi.IsSoundPlaying, Bool, Sound)
-_SetSoundVolume = _wrap(rlapi.SetSoundVolume, None, Sound, Float)
-_SetSoundPitch = _wrap(rlapi.SetSoundPitch, None, Sound, Float)
-_SetSoundPan = _wrap(rlapi.SetSoundPan, None, Sound, Float)
-_WaveCopy = _wrap(rlapi.WaveCopy, Wave, Wave)
-_WaveCrop = _wrap(rlapi.WaveCrop, None, WavePtr, Int, Int)
-_WaveFormat = _wrap(rlapi.WaveFormat, None, WavePtr, Int, Int, Int)
-_LoadWaveSamples = _wrap(rlapi.LoadWaveSamples, FloatPtr, Wave)
-_UnloadWaveSamples = _wrap(rlapi.UnloadWaveSamples, None, FloatPtr)
-_LoadMusicStream = _wrap(rlapi.LoadMusicStream, Music, CharPtr)
-_LoadMusicStreamFromMemory = _wrap(rlapi.LoadMusicStreamFromMemory, Music, CharPtr, UCharPtr, Int)
-_IsMusicReady = _wrap(rlapi.IsMusicReady, Bool, Music)
-_UnloadMusicStream = _wrap(rlapi.UnloadMusicStream, None, Music)
-_PlayMusicStream = _wrap(rlapi.PlayMusicStream, None, Music)
-_IsMusicStreamPlaying = _wrap(rlapi.IsMusicStreamPlaying, Bool, Music)
-_UpdateMusicStream = _wrap(rlapi.UpdateMusicStream, None, Music)
-_StopMusicStream = _wrap(rlapi.StopMusicStream, None, Music)
-_PauseMusicStream = _wrap(rlapi.PauseMusicStream, None, Music)
-_ResumeMusicStream = _wrap(rlapi.ResumeMusicStream, None, Music)
-_SeekMusicStream = _wrap(rlapi.SeekMusicStream, None, Music, Float)
-_SetMusicVolume = _wrap(rlapi.SetMusicVolume, None, Music, Float)
-_SetMusicPitch = _wrap(rlapi.SetMusicPitch, None, Music, Float)
-_SetMusicPan = _wrap(rlapi.SetMusicPan, None, Music, Float)
-_GetMusicTimeLength = _wrap(rlapi.GetMusicTimeLength, Float, Music)
-_GetMusicTimePlayed = _wrap(rlapi.GetMusicTimePlayed, Float, Music)
-_LoadAudioStream = _wrap(rlapi.LoadAudioStream, AudioStream, UInt, UInt, UInt)
-_IsAudioStreamReady = _wrap(rlapi.IsAudioStreamReady, Bool, AudioStream)
-_UnloadAudioStream = _wrap(rlapi.UnloadAudioStream, None, AudioStream)
-_UpdateAudioStream = _wrap(rlapi.UpdateAudioStream, None, AudioStream, VoidPtr, Int)
-_IsAudioStreamProcessed = _wrap(rlapi.IsAudioStreamProcessed, Bool, AudioStream)
-_PlayAudioStream = _wrap(rlapi.PlayAudioStream, None, AudioStream)
-_PauseAudioStream = _wrap(rlapi.PauseAudioStream, None, AudioStream)
-_ResumeAudioStream = _wrap(rlapi.ResumeAudioStream, None, AudioStream)
-_IsAudioStreamPlaying = _wrap(rlapi.IsAudioStreamPlaying, Bool, AudioStream)
-_StopAudioStream = _wrap(rlapi.StopAudioStream, None, AudioStream)
-_SetAudioStreamVolume = _wrap(rlapi.SetAudioStreamVolume, None, AudioStream, Float)
-_SetAudioStreamPitch = _wrap(rlapi.SetAudioStreamPitch, None, AudioStream, Float)
-_SetAudioStreamPan = _wrap(rlapi.SetAudioStreamPan, None, AudioStream, Float)
-_SetAudioStreamBufferSizeDefault = _wrap(rlapi.SetAudioStreamBufferSizeDefault, None, Int)
-_SetAudioStreamCallback = _wrap(rlapi.SetAudioStreamCallback, None, AudioStream, AudioCallback)
-_AttachAudioStreamProcessor = _wrap(rlapi.AttachAudioStreamProcessor, None, AudioStream, AudioCallback)
-_DetachAudioStreamProcessor = _wrap(rlapi.DetachAudioStreamProcessor, None, AudioStream, AudioCallback)
-_AttachAudioMixedProcessor = _wrap(rlapi.AttachAudioMixedProcessor, None, AudioCallback)
-_DetachAudioMixedProcessor = _wrap(rlapi.DetachAudioMixedProcessor, None, AudioCallback)
+_InitWindow = _wrap('InitWindow', None, Int, Int, CharPtr)
+_CloseWindow = _wrap('CloseWindow', None)
+_WindowShouldClose = _wrap('WindowShouldClose', Bool)
+_IsWindowReady = _wrap('IsWindowReady', Bool)
+_IsWindowFullscreen = _wrap('IsWindowFullscreen', Bool)
+_IsWindowHidden = _wrap('IsWindowHidden', Bool)
+_IsWindowMinimized = _wrap('IsWindowMinimized', Bool)
+_IsWindowMaximized = _wrap('IsWindowMaximized', Bool)
+_IsWindowFocused = _wrap('IsWindowFocused', Bool)
+_IsWindowResized = _wrap('IsWindowResized', Bool)
+_IsWindowState = _wrap('IsWindowState', Bool, UInt)
+_SetWindowState = _wrap('SetWindowState', None, UInt)
+_ClearWindowState = _wrap('ClearWindowState', None, UInt)
+_ToggleFullscreen = _wrap('ToggleFullscreen', None)
+_ToggleBorderlessWindowed = _wrap('ToggleBorderlessWindowed', None)
+_MaximizeWindow = _wrap('MaximizeWindow', None)
+_MinimizeWindow = _wrap('MinimizeWindow', None)
+_RestoreWindow = _wrap('RestoreWindow', None)
+_SetWindowIcon = _wrap('SetWindowIcon', None, Image)
+_SetWindowIcons = _wrap('SetWindowIcons', None, ImagePtr, Int)
+_SetWindowTitle = _wrap('SetWindowTitle', None, CharPtr)
+_SetWindowPosition = _wrap('SetWindowPosition', None, Int, Int)
+_SetWindowMonitor = _wrap('SetWindowMonitor', None, Int)
+_SetWindowMinSize = _wrap('SetWindowMinSize', None, Int, Int)
+_SetWindowMaxSize = _wrap('SetWindowMaxSize', None, Int, Int)
+_SetWindowSize = _wrap('SetWindowSize', None, Int, Int)
+_SetWindowOpacity = _wrap('SetWindowOpacity', None, Float)
+_SetWindowFocused = _wrap('SetWindowFocused', None)
+_GetWindowHandle = _wrap('GetWindowHandle', VoidPtr)
+_GetScreenWidth = _wrap('GetScreenWidth', Int)
+_GetScreenHeight = _wrap('GetScreenHeight', Int)
+_GetRenderWidth = _wrap('GetRenderWidth', Int)
+_GetRenderHeight = _wrap('GetRenderHeight', Int)
+_GetMonitorCount = _wrap('GetMonitorCount', Int)
+_GetCurrentMonitor = _wrap('GetCurrentMonitor', Int)
+_GetMonitorPosition = _wrap('GetMonitorPosition', Vector2, Int)
+_GetMonitorWidth = _wrap('GetMonitorWidth', Int, Int)
+_GetMonitorHeight = _wrap('GetMonitorHeight', Int, Int)
+_GetMonitorPhysicalWidth = _wrap('GetMonitorPhysicalWidth', Int, Int)
+_GetMonitorPhysicalHeight = _wrap('GetMonitorPhysicalHeight', Int, Int)
+_GetMonitorRefreshRate = _wrap('GetMonitorRefreshRate', Int, Int)
+_GetWindowPosition = _wrap('GetWindowPosition', Vector2)
+_GetWindowScaleDPI = _wrap('GetWindowScaleDPI', Vector2)
+_GetMonitorName = _wrap('GetMonitorName', CharPtr, Int)
+_SetClipboardText = _wrap('SetClipboardText', None, CharPtr)
+_GetClipboardText = _wrap('GetClipboardText', CharPtr)
+_EnableEventWaiting = _wrap('EnableEventWaiting', None)
+_DisableEventWaiting = _wrap('DisableEventWaiting', None)
+_ShowCursor = _wrap('ShowCursor', None)
+_HideCursor = _wrap('HideCursor', None)
+_IsCursorHidden = _wrap('IsCursorHidden', Bool)
+_EnableCursor = _wrap('EnableCursor', None)
+_DisableCursor = _wrap('DisableCursor', None)
+_IsCursorOnScreen = _wrap('IsCursorOnScreen', Bool)
+_ClearBackground = _wrap('ClearBackground', None, Color)
+_BeginDrawing = _wrap('BeginDrawing', None)
+_EndDrawing = _wrap('EndDrawing', None)
+_BeginMode2D = _wrap('BeginMode2D', None, Camera2D)
+_EndMode2D = _wrap('EndMode2D', None)
+_BeginMode3D = _wrap('BeginMode3D', None, Camera3D)
+_EndMode3D = _wrap('EndMode3D', None)
+_BeginTextureMode = _wrap('BeginTextureMode', None, RenderTexture2D)
+_EndTextureMode = _wrap('EndTextureMode', None)
+_BeginShaderMode = _wrap('BeginShaderMode', None, Shader)
+_EndShaderMode = _wrap('EndShaderMode', None)
+_BeginBlendMode = _wrap('BeginBlendMode', None, Int)
+_EndBlendMode = _wrap('EndBlendMode', None)
+_BeginScissorMode = _wrap('BeginScissorMode', None, Int, Int, Int, Int)
+_EndScissorMode = _wrap('EndScissorMode', None)
+_BeginVrStereoMode = _wrap('BeginVrStereoMode', None, VrStereoConfig)
+_EndVrStereoMode = _wrap('EndVrStereoMode', None)
+_LoadVrStereoConfig = _wrap('LoadVrStereoConfig', VrStereoConfig, VrDeviceInfo)
+_UnloadVrStereoConfig = _wrap('UnloadVrStereoConfig', None, VrStereoConfig)
+_LoadShader = _wrap('LoadShader', Shader, CharPtr, CharPtr)
+_LoadShaderFromMemory = _wrap('LoadShaderFromMemory', Shader, CharPtr, CharPtr)
+_IsShaderReady = _wrap('IsShaderReady', Bool, Shader)
+_GetShaderLocation = _wrap('GetShaderLocation', Int, Shader, CharPtr)
+_GetShaderLocationAttrib = _wrap('GetShaderLocationAttrib', Int, Shader, CharPtr)
+_SetShaderValue = _wrap('SetShaderValue', None, Shader, Int, VoidPtr, Int)
+_SetShaderValueV = _wrap('SetShaderValueV', None, Shader, Int, VoidPtr, Int, Int)
+_SetShaderValueMatrix = _wrap('SetShaderValueMatrix', None, Shader, Int, Matrix)
+_SetShaderValueTexture = _wrap('SetShaderValueTexture', None, Shader, Int, Texture2D)
+_UnloadShader = _wrap('UnloadShader', None, Shader)
+_GetMouseRay = _wrap('GetMouseRay', Ray, Vector2, Camera)
+_GetCameraMatrix = _wrap('GetCameraMatrix', Matrix, Camera)
+_GetCameraMatrix2D = _wrap('GetCameraMatrix2D', Matrix, Camera2D)
+_GetWorldToScreen = _wrap('GetWorldToScreen', Vector2, Vector3, Camera)
+_GetScreenToWorld2D = _wrap('GetScreenToWorld2D', Vector2, Vector2, Camera2D)
+_GetWorldToScreenEx = _wrap('GetWorldToScreenEx', Vector2, Vector3, Camera, Int, Int)
+_GetWorldToScreen2D = _wrap('GetWorldToScreen2D', Vector2, Vector2, Camera2D)
+_SetTargetFPS = _wrap('SetTargetFPS', None, Int)
+_GetFrameTime = _wrap('GetFrameTime', Float)
+_GetTime = _wrap('GetTime', Double)
+_GetFPS = _wrap('GetFPS', Int)
+_SwapScreenBuffer = _wrap('SwapScreenBuffer', None)
+_PollInputEvents = _wrap('PollInputEvents', None)
+_WaitTime = _wrap('WaitTime', None, Double)
+_SetRandomSeed = _wrap('SetRandomSeed', None, UInt)
+_GetRandomValue = _wrap('GetRandomValue', Int, Int, Int)
+_LoadRandomSequence = _wrap('LoadRandomSequence', IntPtr, UInt, Int, Int)
+_UnloadRandomSequence = _wrap('UnloadRandomSequence', None, IntPtr)
+_TakeScreenshot = _wrap('TakeScreenshot', None, CharPtr)
+_SetConfigFlags = _wrap('SetConfigFlags', None, UInt)
+_OpenURL = _wrap('OpenURL', None, CharPtr)
+_TraceLog = _wrap('TraceLog', None, Int, CharPtr)
+_SetTraceLogLevel = _wrap('SetTraceLogLevel', None, Int)
+_MemAlloc = _wrap('MemAlloc', VoidPtr, UInt)
+_MemRealloc = _wrap('MemRealloc', VoidPtr, VoidPtr, UInt)
+_MemFree = _wrap('MemFree', None, VoidPtr)
+_SetTraceLogCallback = _wrap('SetTraceLogCallback', None, TraceLogCallback)
+_SetLoadFileDataCallback = _wrap('SetLoadFileDataCallback', None, LoadFileDataCallback)
+_SetSaveFileDataCallback = _wrap('SetSaveFileDataCallback', None, SaveFileDataCallback)
+_SetLoadFileTextCallback = _wrap('SetLoadFileTextCallback', None, LoadFileTextCallback)
+_SetSaveFileTextCallback = _wrap('SetSaveFileTextCallback', None, SaveFileTextCallback)
+_LoadFileData = _wrap('LoadFileData', UCharPtr, CharPtr, IntPtr)
+_UnloadFileData = _wrap('UnloadFileData', None, UCharPtr)
+_SaveFileData = _wrap('SaveFileData', Bool, CharPtr, VoidPtr, Int)
+_ExportDataAsCode = _wrap('ExportDataAsCode', Bool, UCharPtr, Int, CharPtr)
+_LoadFileText = _wrap('LoadFileText', CharPtr, CharPtr)
+_UnloadFileText = _wrap('UnloadFileText', None, CharPtr)
+_SaveFileText = _wrap('SaveFileText', Bool, CharPtr, CharPtr)
+_FileExists = _wrap('FileExists', Bool, CharPtr)
+_DirectoryExists = _wrap('DirectoryExists', Bool, CharPtr)
+_IsFileExtension = _wrap('IsFileExtension', Bool, CharPtr, CharPtr)
+_GetFileLength = _wrap('GetFileLength', Int, CharPtr)
+_GetFileExtension = _wrap('GetFileExtension', CharPtr, CharPtr)
+_GetFileName = _wrap('GetFileName', CharPtr, CharPtr)
+_GetFileNameWithoutExt = _wrap('GetFileNameWithoutExt', CharPtr, CharPtr)
+_GetDirectoryPath = _wrap('GetDirectoryPath', CharPtr, CharPtr)
+_GetPrevDirectoryPath = _wrap('GetPrevDirectoryPath', CharPtr, CharPtr)
+_GetWorkingDirectory = _wrap('GetWorkingDirectory', CharPtr)
+_GetApplicationDirectory = _wrap('GetApplicationDirectory', CharPtr)
+_ChangeDirectory = _wrap('ChangeDirectory', Bool, CharPtr)
+_IsPathFile = _wrap('IsPathFile', Bool, CharPtr)
+_LoadDirectoryFiles = _wrap('LoadDirectoryFiles', FilePathList, CharPtr)
+_LoadDirectoryFilesEx = _wrap('LoadDirectoryFilesEx', FilePathList, CharPtr, CharPtr, Bool)
+_UnloadDirectoryFiles = _wrap('UnloadDirectoryFiles', None, FilePathList)
+_IsFileDropped = _wrap('IsFileDropped', Bool)
+_LoadDroppedFiles = _wrap('LoadDroppedFiles', FilePathList)
+_UnloadDroppedFiles = _wrap('UnloadDroppedFiles', None, FilePathList)
+_GetFileModTime = _wrap('GetFileModTime', Long, CharPtr)
+_CompressData = _wrap('CompressData', UCharPtr, UCharPtr, Int, IntPtr)
+_DecompressData = _wrap('DecompressData', UCharPtr, UCharPtr, Int, IntPtr)
+_EncodeDataBase64 = _wrap('EncodeDataBase64', CharPtr, UCharPtr, Int, IntPtr)
+_DecodeDataBase64 = _wrap('DecodeDataBase64', UCharPtr, UCharPtr, IntPtr)
+_LoadAutomationEventList = _wrap('LoadAutomationEventList', AutomationEventList, CharPtr)
+_UnloadAutomationEventList = _wrap('UnloadAutomationEventList', None, AutomationEventListPtr)
+_ExportAutomationEventList = _wrap('ExportAutomationEventList', Bool, AutomationEventList, CharPtr)
+_SetAutomationEventList = _wrap('SetAutomationEventList', None, AutomationEventListPtr)
+_SetAutomationEventBaseFrame = _wrap('SetAutomationEventBaseFrame', None, Int)
+_StartAutomationEventRecording = _wrap('StartAutomationEventRecording', None)
+_StopAutomationEventRecording = _wrap('StopAutomationEventRecording', None)
+_PlayAutomationEvent = _wrap('PlayAutomationEvent', None, AutomationEvent)
+_IsKeyPressed = _wrap('IsKeyPressed', Bool, Int)
+_IsKeyPressedRepeat = _wrap('IsKeyPressedRepeat', Bool, Int)
+_IsKeyDown = _wrap('IsKeyDown', Bool, Int)
+_IsKeyReleased = _wrap('IsKeyReleased', Bool, Int)
+_IsKeyUp = _wrap('IsKeyUp', Bool, Int)
+_GetKeyPressed = _wrap('GetKeyPressed', Int)
+_GetCharPressed = _wrap('GetCharPressed', Int)
+_SetExitKey = _wrap('SetExitKey', None, Int)
+_IsGamepadAvailable = _wrap('IsGamepadAvailable', Bool, Int)
+_GetGamepadName = _wrap('GetGamepadName', CharPtr, Int)
+_IsGamepadButtonPressed = _wrap('IsGamepadButtonPressed', Bool, Int, Int)
+_IsGamepadButtonDown = _wrap('IsGamepadButtonDown', Bool, Int, Int)
+_IsGamepadButtonReleased = _wrap('IsGamepadButtonReleased', Bool, Int, Int)
+_IsGamepadButtonUp = _wrap('IsGamepadButtonUp', Bool, Int, Int)
+_GetGamepadButtonPressed = _wrap('GetGamepadButtonPressed', Int)
+_GetGamepadAxisCount = _wrap('GetGamepadAxisCount', Int, Int)
+_GetGamepadAxisMovement = _wrap('GetGamepadAxisMovement', Float, Int, Int)
+_SetGamepadMappings = _wrap('SetGamepadMappings', Int, CharPtr)
+_IsMouseButtonPressed = _wrap('IsMouseButtonPressed', Bool, Int)
+_IsMouseButtonDown = _wrap('IsMouseButtonDown', Bool, Int)
+_IsMouseButtonReleased = _wrap('IsMouseButtonReleased', Bool, Int)
+_IsMouseButtonUp = _wrap('IsMouseButtonUp', Bool, Int)
+_GetMouseX = _wrap('GetMouseX', Int)
+_GetMouseY = _wrap('GetMouseY', Int)
+_GetMousePosition = _wrap('GetMousePosition', Vector2)
+_GetMouseDelta = _wrap('GetMouseDelta', Vector2)
+_SetMousePosition = _wrap('SetMousePosition', None, Int, Int)
+_SetMouseOffset = _wrap('SetMouseOffset', None, Int, Int)
+_SetMouseScale = _wrap('SetMouseScale', None, Float, Float)
+_GetMouseWheelMove = _wrap('GetMouseWheelMove', Float)
+_GetMouseWheelMoveV = _wrap('GetMouseWheelMoveV', Vector2)
+_SetMouseCursor = _wrap('SetMouseCursor', None, Int)
+_GetTouchX = _wrap('GetTouchX', Int)
+_GetTouchY = _wrap('GetTouchY', Int)
+_GetTouchPosition = _wrap('GetTouchPosition', Vector2, Int)
+_GetTouchPointId = _wrap('GetTouchPointId', Int, Int)
+_GetTouchPointCount = _wrap('GetTouchPointCount', Int)
+_SetGesturesEnabled = _wrap('SetGesturesEnabled', None, UInt)
+_IsGestureDetected = _wrap('IsGestureDetected', Bool, UInt)
+_GetGestureDetected = _wrap('GetGestureDetected', Int)
+_GetGestureHoldDuration = _wrap('GetGestureHoldDuration', Float)
+_GetGestureDragVector = _wrap('GetGestureDragVector', Vector2)
+_GetGestureDragAngle = _wrap('GetGestureDragAngle', Float)
+_GetGesturePinchVector = _wrap('GetGesturePinchVector', Vector2)
+_GetGesturePinchAngle = _wrap('GetGesturePinchAngle', Float)
+_UpdateCamera = _wrap('UpdateCamera', None, CameraPtr, Int)
+_UpdateCameraPro = _wrap('UpdateCameraPro', None, CameraPtr, Vector3, Vector3, Float)
+_SetShapesTexture = _wrap('SetShapesTexture', None, Texture2D, Rectangle)
+_DrawPixel = _wrap('DrawPixel', None, Int, Int, Color)
+_DrawPixelV = _wrap('DrawPixelV', None, Vector2, Color)
+_DrawLine = _wrap('DrawLine', None, Int, Int, Int, Int, Color)
+_DrawLineV = _wrap('DrawLineV', None, Vector2, Vector2, Color)
+_DrawLineEx = _wrap('DrawLineEx', None, Vector2, Vector2, Float, Color)
+_DrawLineStrip = _wrap('DrawLineStrip', None, Vector2Ptr, Int, Color)
+_DrawLineBezier = _wrap('DrawLineBezier', None, Vector2, Vector2, Float, Color)
+_DrawCircle = _wrap('DrawCircle', None, Int, Int, Float, Color)
+_DrawCircleSector = _wrap('DrawCircleSector', None, Vector2, Float, Float, Float, Int, Color)
+_DrawCircleSectorLines = _wrap('DrawCircleSectorLines', None, Vector2, Float, Float, Float, Int, Color)
+_DrawCircleGradient = _wrap('DrawCircleGradient', None, Int, Int, Float, Color, Color)
+_DrawCircleV = _wrap('DrawCircleV', None, Vector2, Float, Color)
+_DrawCircleLines = _wrap('DrawCircleLines', None, Int, Int, Float, Color)
+_DrawCircleLinesV = _wrap('DrawCircleLinesV', None, Vector2, Float, Color)
+_DrawEllipse = _wrap('DrawEllipse', None, Int, Int, Float, Float, Color)
+_DrawEllipseLines = _wrap('DrawEllipseLines', None, Int, Int, Float, Float, Color)
+_DrawRing = _wrap('DrawRing', None, Vector2, Float, Float, Float, Float, Int, Color)
+_DrawRingLines = _wrap('DrawRingLines', None, Vector2, Float, Float, Float, Float, Int, Color)
+_DrawRectangle = _wrap('DrawRectangle', None, Int, Int, Int, Int, Color)
+_DrawRectangleV = _wrap('DrawRectangleV', None, Vector2, Vector2, Color)
+_DrawRectangleRec = _wrap('DrawRectangleRec', None, Rectangle, Color)
+_DrawRectanglePro = _wrap('DrawRectanglePro', None, Rectangle, Vector2, Float, Color)
+_DrawRectangleGradientV = _wrap('DrawRectangleGradientV', None, Int, Int, Int, Int, Color, Color)
+_DrawRectangleGradientH = _wrap('DrawRectangleGradientH', None, Int, Int, Int, Int, Color, Color)
+_DrawRectangleGradientEx = _wrap('DrawRectangleGradientEx', None, Rectangle, Color, Color, Color, Color)
+_DrawRectangleLines = _wrap('DrawRectangleLines', None, Int, Int, Int, Int, Color)
+_DrawRectangleLinesEx = _wrap('DrawRectangleLinesEx', None, Rectangle, Float, Color)
+_DrawRectangleRounded = _wrap('DrawRectangleRounded', None, Rectangle, Float, Int, Color)
+_DrawRectangleRoundedLines = _wrap('DrawRectangleRoundedLines', None, Rectangle, Float, Int, Float, Color)
+_DrawTriangle = _wrap('DrawTriangle', None, Vector2, Vector2, Vector2, Color)
+_DrawTriangleLines = _wrap('DrawTriangleLines', None, Vector2, Vector2, Vector2, Color)
+_DrawTriangleFan = _wrap('DrawTriangleFan', None, Vector2Ptr, Int, Color)
+_DrawTriangleStrip = _wrap('DrawTriangleStrip', None, Vector2Ptr, Int, Color)
+_DrawPoly = _wrap('DrawPoly', None, Vector2, Int, Float, Float, Color)
+_DrawPolyLines = _wrap('DrawPolyLines', None, Vector2, Int, Float, Float, Color)
+_DrawPolyLinesEx = _wrap('DrawPolyLinesEx', None, Vector2, Int, Float, Float, Float, Color)
+_DrawSplineLinear = _wrap('DrawSplineLinear', None, Vector2Ptr, Int, Float, Color)
+_DrawSplineBasis = _wrap('DrawSplineBasis', None, Vector2Ptr, Int, Float, Color)
+_DrawSplineCatmullRom = _wrap('DrawSplineCatmullRom', None, Vector2Ptr, Int, Float, Color)
+_DrawSplineBezierQuadratic = _wrap('DrawSplineBezierQuadratic', None, Vector2Ptr, Int, Float, Color)
+_DrawSplineBezierCubic = _wrap('DrawSplineBezierCubic', None, Vector2Ptr, Int, Float, Color)
+_DrawSplineSegmentLinear = _wrap('DrawSplineSegmentLinear', None, Vector2, Vector2, Float, Color)
+_DrawSplineSegmentBasis = _wrap('DrawSplineSegmentBasis', None, Vector2, Vector2, Vector2, Vector2, Float, Color)
+_DrawSplineSegmentCatmullRom = _wrap('DrawSplineSegmentCatmullRom', None, Vector2, Vector2, Vector2, Vector2, Float, Color)
+_DrawSplineSegmentBezierQuadratic = _wrap('DrawSplineSegmentBezierQuadratic', None, Vector2, Vector2, Vector2, Float, Color)
+_DrawSplineSegmentBezierCubic = _wrap('DrawSplineSegmentBezierCubic', None, Vector2, Vector2, Vector2, Vector2, Float, Color)
+_GetSplinePointLinear = _wrap('GetSplinePointLinear', Vector2, Vector2, Vector2, Float)
+_GetSplinePointBasis = _wrap('GetSplinePointBasis', Vector2, Vector2, Vector2, Vector2, Vector2, Float)
+_GetSplinePointCatmullRom = _wrap('GetSplinePointCatmullRom', Vector2, Vector2, Vector2, Vector2, Vector2, Float)
+_GetSplinePointBezierQuad = _wrap('GetSplinePointBezierQuad', Vector2, Vector2, Vector2, Vector2, Float)
+_GetSplinePointBezierCubic = _wrap('GetSplinePointBezierCubic', Vector2, Vector2, Vector2, Vector2, Vector2, Float)
+_CheckCollisionRecs = _wrap('CheckCollisionRecs', Bool, Rectangle, Rectangle)
+_CheckCollisionCircles = _wrap('CheckCollisionCircles', Bool, Vector2, Float, Vector2, Float)
+_CheckCollisionCircleRec = _wrap('CheckCollisionCircleRec', Bool, Vector2, Float, Rectangle)
+_CheckCollisionPointRec = _wrap('CheckCollisionPointRec', Bool, Vector2, Rectangle)
+_CheckCollisionPointCircle = _wrap('CheckCollisionPointCircle', Bool, Vector2, Vector2, Float)
+_CheckCollisionPointTriangle = _wrap('CheckCollisionPointTriangle', Bool, Vector2, Vector2, Vector2, Vector2)
+_CheckCollisionPointPoly = _wrap('CheckCollisionPointPoly', Bool, Vector2, Vector2Ptr, Int)
+_CheckCollisionLines = _wrap('CheckCollisionLines', Bool, Vector2, Vector2, Vector2, Vector2, Vector2Ptr)
+_CheckCollisionPointLine = _wrap('CheckCollisionPointLine', Bool, Vector2, Vector2, Vector2, Int)
+_GetCollisionRec = _wrap('GetCollisionRec', Rectangle, Rectangle, Rectangle)
+_LoadImage = _wrap('LoadImage', Image, CharPtr)
+_LoadImageRaw = _wrap('LoadImageRaw', Image, CharPtr, Int, Int, Int, Int)
+_LoadImageSvg = _wrap('LoadImageSvg', Image, CharPtr, Int, Int)
+_LoadImageAnim = _wrap('LoadImageAnim', Image, CharPtr, IntPtr)
+_LoadImageFromMemory = _wrap('LoadImageFromMemory', Image, CharPtr, UCharPtr, Int)
+_LoadImageFromTexture = _wrap('LoadImageFromTexture', Image, Texture2D)
+_LoadImageFromScreen = _wrap('LoadImageFromScreen', Image)
+_IsImageReady = _wrap('IsImageReady', Bool, Image)
+_UnloadImage = _wrap('UnloadImage', None, Image)
+_ExportImage = _wrap('ExportImage', Bool, Image, CharPtr)
+_ExportImageToMemory = _wrap('ExportImageToMemory', UCharPtr, Image, CharPtr, IntPtr)
+_ExportImageAsCode = _wrap('ExportImageAsCode', Bool, Image, CharPtr)
+_GenImageColor = _wrap('GenImageColor', Image, Int, Int, Color)
+_GenImageGradientLinear = _wrap('GenImageGradientLinear', Image, Int, Int, Int, Color, Color)
+_GenImageGradientRadial = _wrap('GenImageGradientRadial', Image, Int, Int, Float, Color, Color)
+_GenImageGradientSquare = _wrap('GenImageGradientSquare', Image, Int, Int, Float, Color, Color)
+_GenImageChecked = _wrap('GenImageChecked', Image, Int, Int, Int, Int, Color, Color)
+_GenImageWhiteNoise = _wrap('GenImageWhiteNoise', Image, Int, Int, Float)
+_GenImagePerlinNoise = _wrap('GenImagePerlinNoise', Image, Int, Int, Int, Int, Float)
+_GenImageCellular = _wrap('GenImageCellular', Image, Int, Int, Int)
+_GenImageText = _wrap('GenImageText', Image, Int, Int, CharPtr)
+_ImageCopy = _wrap('ImageCopy', Image, Image)
+_ImageFromImage = _wrap('ImageFromImage', Image, Image, Rectangle)
+_ImageText = _wrap('ImageText', Image, CharPtr, Int, Color)
+_ImageTextEx = _wrap('ImageTextEx', Image, Font, CharPtr, Float, Float, Color)
+_ImageFormat = _wrap('ImageFormat', None, ImagePtr, Int)
+_ImageToPOT = _wrap('ImageToPOT', None, ImagePtr, Color)
+_ImageCrop = _wrap('ImageCrop', None, ImagePtr, Rectangle)
+_ImageAlphaCrop = _wrap('ImageAlphaCrop', None, ImagePtr, Float)
+_ImageAlphaClear = _wrap('ImageAlphaClear', None, ImagePtr, Color, Float)
+_ImageAlphaMask = _wrap('ImageAlphaMask', None, ImagePtr, Image)
+_ImageAlphaPremultiply = _wrap('ImageAlphaPremultiply', None, ImagePtr)
+_ImageBlurGaussian = _wrap('ImageBlurGaussian', None, ImagePtr, Int)
+_ImageResize = _wrap('ImageResize', None, ImagePtr, Int, Int)
+_ImageResizeNN = _wrap('ImageResizeNN', None, ImagePtr, Int, Int)
+_ImageResizeCanvas = _wrap('ImageResizeCanvas', None, ImagePtr, Int, Int, Int, Int, Color)
+_ImageMipmaps = _wrap('ImageMipmaps', None, ImagePtr)
+_ImageDither = _wrap('ImageDither', None, ImagePtr, Int, Int, Int, Int)
+_ImageFlipVertical = _wrap('ImageFlipVertical', None, ImagePtr)
+_ImageFlipHorizontal = _wrap('ImageFlipHorizontal', None, ImagePtr)
+_ImageRotate = _wrap('ImageRotate', None, ImagePtr, Int)
+_ImageRotateCW = _wrap('ImageRotateCW', None, ImagePtr)
+_ImageRotateCCW = _wrap('ImageRotateCCW', None, ImagePtr)
+_ImageColorTint = _wrap('ImageColorTint', None, ImagePtr, Color)
+_ImageColorInvert = _wrap('ImageColorInvert', None, ImagePtr)
+_ImageColorGrayscale = _wrap('ImageColorGrayscale', None, ImagePtr)
+_ImageColorContrast = _wrap('ImageColorContrast', None, ImagePtr, Float)
+_ImageColorBrightness = _wrap('ImageColorBrightness', None, ImagePtr, Int)
+_ImageColorReplace = _wrap('ImageColorReplace', None, ImagePtr, Color, Color)
+_LoadImageColors = _wrap('LoadImageColors', ColorPtr, Image)
+_LoadImagePalette = _wrap('LoadImagePalette', ColorPtr, Image, Int, IntPtr)
+_UnloadImageColors = _wrap('UnloadImageColors', None, ColorPtr)
+_UnloadImagePalette = _wrap('UnloadImagePalette', None, ColorPtr)
+_GetImageAlphaBorder = _wrap('GetImageAlphaBorder', Rectangle, Image, Float)
+_GetImageColor = _wrap('GetImageColor', Color, Image, Int, Int)
+_ImageClearBackground = _wrap('ImageClearBackground', None, ImagePtr, Color)
+_ImageDrawPixel = _wrap('ImageDrawPixel', None, ImagePtr, Int, Int, Color)
+_ImageDrawPixelV = _wrap('ImageDrawPixelV', None, ImagePtr, Vector2, Color)
+_ImageDrawLine = _wrap('ImageDrawLine', None, ImagePtr, Int, Int, Int, Int, Color)
+_ImageDrawLineV = _wrap('ImageDrawLineV', None, ImagePtr, Vector2, Vector2, Color)
+_ImageDrawCircle = _wrap('ImageDrawCircle', None, ImagePtr, Int, Int, Int, Color)
+_ImageDrawCircleV = _wrap('ImageDrawCircleV', None, ImagePtr, Vector2, Int, Color)
+_ImageDrawCircleLines = _wrap('ImageDrawCircleLines', None, ImagePtr, Int, Int, Int, Color)
+_ImageDrawCircleLinesV = _wrap('ImageDrawCircleLinesV', None, ImagePtr, Vector2, Int, Color)
+_ImageDrawRectangle = _wrap('ImageDrawRectangle', None, ImagePtr, Int, Int, Int, Int, Color)
+_ImageDrawRectangleV = _wrap('ImageDrawRectangleV', None, ImagePtr, Vector2, Vector2, Color)
+_ImageDrawRectangleRec = _wrap('ImageDrawRectangleRec', None, ImagePtr, Rectangle, Color)
+_ImageDrawRectangleLines = _wrap('ImageDrawRectangleLines', None, ImagePtr, Rectangle, Int, Color)
+_ImageDraw = _wrap('ImageDraw', None, ImagePtr, Image, Rectangle, Rectangle, Color)
+_ImageDrawText = _wrap('ImageDrawText', None, ImagePtr, CharPtr, Int, Int, Int, Color)
+_ImageDrawTextEx = _wrap('ImageDrawTextEx', None, ImagePtr, Font, CharPtr, Vector2, Float, Float, Color)
+_LoadTexture = _wrap('LoadTexture', Texture2D, CharPtr)
+_LoadTextureFromImage = _wrap('LoadTextureFromImage', Texture2D, Image)
+_LoadTextureCubemap = _wrap('LoadTextureCubemap', TextureCubemap, Image, Int)
+_LoadRenderTexture = _wrap('LoadRenderTexture', RenderTexture2D, Int, Int)
+_IsTextureReady = _wrap('IsTextureReady', Bool, Texture2D)
+_UnloadTexture = _wrap('UnloadTexture', None, Texture2D)
+_IsRenderTextureReady = _wrap('IsRenderTextureReady', Bool, RenderTexture2D)
+_UnloadRenderTexture = _wrap('UnloadRenderTexture', None, RenderTexture2D)
+_UpdateTexture = _wrap('UpdateTexture', None, Texture2D, VoidPtr)
+_UpdateTextureRec = _wrap('UpdateTextureRec', None, Texture2D, Rectangle, VoidPtr)
+_GenTextureMipmaps = _wrap('GenTextureMipmaps', None, Texture2DPtr)
+_SetTextureFilter = _wrap('SetTextureFilter', None, Texture2D, Int)
+_SetTextureWrap = _wrap('SetTextureWrap', None, Texture2D, Int)
+_DrawTexture = _wrap('DrawTexture', None, Texture2D, Int, Int, Color)
+_DrawTextureV = _wrap('DrawTextureV', None, Texture2D, Vector2, Color)
+_DrawTextureEx = _wrap('DrawTextureEx', None, Texture2D, Vector2, Float, Float, Color)
+_DrawTextureRec = _wrap('DrawTextureRec', None, Texture2D, Rectangle, Vector2, Color)
+_DrawTexturePro = _wrap('DrawTexturePro', None, Texture2D, Rectangle, Rectangle, Vector2, Float, Color)
+_DrawTextureNPatch = _wrap('DrawTextureNPatch', None, Texture2D, NPatchInfo, Rectangle, Vector2, Float, Color)
+_Fade = _wrap('Fade', Color, Color, Float)
+_ColorToInt = _wrap('ColorToInt', Int, Color)
+_ColorNormalize = _wrap('ColorNormalize', Vector4, Color)
+_ColorFromNormalized = _wrap('ColorFromNormalized', Color, Vector4)
+_ColorToHSV = _wrap('ColorToHSV', Vector3, Color)
+_ColorFromHSV = _wrap('ColorFromHSV', Color, Float, Float, Float)
+_ColorTint = _wrap('ColorTint', Color, Color, Color)
+_ColorBrightness = _wrap('ColorBrightness', Color, Color, Float)
+_ColorContrast = _wrap('ColorContrast', Color, Color, Float)
+_ColorAlpha = _wrap('ColorAlpha', Color, Color, Float)
+_ColorAlphaBlend = _wrap('ColorAlphaBlend', Color, Color, Color, Color)
+_GetColor = _wrap('GetColor', Color, UInt)
+_GetPixelColor = _wrap('GetPixelColor', Color, VoidPtr, Int)
+_SetPixelColor = _wrap('SetPixelColor', None, VoidPtr, Color, Int)
+_GetPixelDataSize = _wrap('GetPixelDataSize', Int, Int, Int, Int)
+_GetFontDefault = _wrap('GetFontDefault', Font)
+_LoadFont = _wrap('LoadFont', Font, CharPtr)
+_LoadFontEx = _wrap('LoadFontEx', Font, CharPtr, Int, IntPtr, Int)
+_LoadFontFromImage = _wrap('LoadFontFromImage', Font, Image, Color, Int)
+_LoadFontFromMemory = _wrap('LoadFontFromMemory', Font, CharPtr, UCharPtr, Int, Int, IntPtr, Int)
+_IsFontReady = _wrap('IsFontReady', Bool, Font)
+_LoadFontData = _wrap('LoadFontData', GlyphInfoPtr, UCharPtr, Int, Int, IntPtr, Int, Int)
+_GenImageFontAtlas = _wrap('GenImageFontAtlas', Image, GlyphInfoPtr, RectanglePtrPtr, Int, Int, Int, Int)
+_UnloadFontData = _wrap('UnloadFontData', None, GlyphInfoPtr, Int)
+_UnloadFont = _wrap('UnloadFont', None, Font)
+_ExportFontAsCode = _wrap('ExportFontAsCode', Bool, Font, CharPtr)
+_DrawFPS = _wrap('DrawFPS', None, Int, Int)
+_DrawText = _wrap('DrawText', None, CharPtr, Int, Int, Int, Color)
+_DrawTextEx = _wrap('DrawTextEx', None, Font, CharPtr, Vector2, Float, Float, Color)
+_DrawTextPro = _wrap('DrawTextPro', None, Font, CharPtr, Vector2, Vector2, Float, Float, Float, Color)
+_DrawTextCodepoint = _wrap('DrawTextCodepoint', None, Font, Int, Vector2, Float, Color)
+_DrawTextCodepoints = _wrap('DrawTextCodepoints', None, Font, IntPtr, Int, Vector2, Float, Float, Color)
+_SetTextLineSpacing = _wrap('SetTextLineSpacing', None, Int)
+_MeasureText = _wrap('MeasureText', Int, CharPtr, Int)
+_MeasureTextEx = _wrap('MeasureTextEx', Vector2, Font, CharPtr, Float, Float)
+_GetGlyphIndex = _wrap('GetGlyphIndex', Int, Font, Int)
+_GetGlyphInfo = _wrap('GetGlyphInfo', GlyphInfo, Font, Int)
+_GetGlyphAtlasRec = _wrap('GetGlyphAtlasRec', Rectangle, Font, Int)
+_LoadUTF8 = _wrap('LoadUTF8', CharPtr, IntPtr, Int)
+_UnloadUTF8 = _wrap('UnloadUTF8', None, CharPtr)
+_LoadCodepoints = _wrap('LoadCodepoints', IntPtr, CharPtr, IntPtr)
+_UnloadCodepoints = _wrap('UnloadCodepoints', None, IntPtr)
+_GetCodepointCount = _wrap('GetCodepointCount', Int, CharPtr)
+_GetCodepoint = _wrap('GetCodepoint', Int, CharPtr, IntPtr)
+_GetCodepointNext = _wrap('GetCodepointNext', Int, CharPtr, IntPtr)
+_GetCodepointPrevious = _wrap('GetCodepointPrevious', Int, CharPtr, IntPtr)
+_CodepointToUTF8 = _wrap('CodepointToUTF8', CharPtr, Int, IntPtr)
+_TextCopy = _wrap('TextCopy', Int, CharPtr, CharPtr)
+_TextIsEqual = _wrap('TextIsEqual', Bool, CharPtr, CharPtr)
+_TextLength = _wrap('TextLength', UInt, CharPtr)
+_TextFormat = _wrap('TextFormat', CharPtr, CharPtr)
+_TextSubtext = _wrap('TextSubtext', CharPtr, CharPtr, Int, Int)
+_TextReplace = _wrap('TextReplace', CharPtr, CharPtr, CharPtr, CharPtr)
+_TextInsert = _wrap('TextInsert', CharPtr, CharPtr, CharPtr, Int)
+_TextJoin = _wrap('TextJoin', CharPtr, CharPtrPtr, Int, CharPtr)
+_TextSplit = _wrap('TextSplit', CharPtrPtr, CharPtr, Char, IntPtr)
+_TextAppend = _wrap('TextAppend', None, CharPtr, CharPtr, IntPtr)
+_TextFindIndex = _wrap('TextFindIndex', Int, CharPtr, CharPtr)
+_TextToUpper = _wrap('TextToUpper', CharPtr, CharPtr)
+_TextToLower = _wrap('TextToLower', CharPtr, CharPtr)
+_TextToPascal = _wrap('TextToPascal', CharPtr, CharPtr)
+_TextToInteger = _wrap('TextToInteger', Int, CharPtr)
+_DrawLine3D = _wrap('DrawLine3D', None, Vector3, Vector3, Color)
+_DrawPoint3D = _wrap('DrawPoint3D', None, Vector3, Color)
+_DrawCircle3D = _wrap('DrawCircle3D', None, Vector3, Float, Vector3, Float, Color)
+_DrawTriangle3D = _wrap('DrawTriangle3D', None, Vector3, Vector3, Vector3, Color)
+_DrawTriangleStrip3D = _wrap('DrawTriangleStrip3D', None, Vector3Ptr, Int, Color)
+_DrawCube = _wrap('DrawCube', None, Vector3, Float, Float, Float, Color)
+_DrawCubeV = _wrap('DrawCubeV', None, Vector3, Vector3, Color)
+_DrawCubeWires = _wrap('DrawCubeWires', None, Vector3, Float, Float, Float, Color)
+_DrawCubeWiresV = _wrap('DrawCubeWiresV', None, Vector3, Vector3, Color)
+_DrawSphere = _wrap('DrawSphere', None, Vector3, Float, Color)
+_DrawSphereEx = _wrap('DrawSphereEx', None, Vector3, Float, Int, Int, Color)
+_DrawSphereWires = _wrap('DrawSphereWires', None, Vector3, Float, Int, Int, Color)
+_DrawCylinder = _wrap('DrawCylinder', None, Vector3, Float, Float, Float, Int, Color)
+_DrawCylinderEx = _wrap('DrawCylinderEx', None, Vector3, Vector3, Float, Float, Int, Color)
+_DrawCylinderWires = _wrap('DrawCylinderWires', None, Vector3, Float, Float, Float, Int, Color)
+_DrawCylinderWiresEx = _wrap('DrawCylinderWiresEx', None, Vector3, Vector3, Float, Float, Int, Color)
+_DrawCapsule = _wrap('DrawCapsule', None, Vector3, Vector3, Float, Int, Int, Color)
+_DrawCapsuleWires = _wrap('DrawCapsuleWires', None, Vector3, Vector3, Float, Int, Int, Color)
+_DrawPlane = _wrap('DrawPlane', None, Vector3, Vector2, Color)
+_DrawRay = _wrap('DrawRay', None, Ray, Color)
+_DrawGrid = _wrap('DrawGrid', None, Int, Float)
+_LoadModel = _wrap('LoadModel', Model, CharPtr)
+_LoadModelFromMesh = _wrap('LoadModelFromMesh', Model, Mesh)
+_IsModelReady = _wrap('IsModelReady', Bool, Model)
+_UnloadModel = _wrap('UnloadModel', None, Model)
+_GetModelBoundingBox = _wrap('GetModelBoundingBox', BoundingBox, Model)
+_DrawModel = _wrap('DrawModel', None, Model, Vector3, Float, Color)
+_DrawModelEx = _wrap('DrawModelEx', None, Model, Vector3, Vector3, Float, Vector3, Color)
+_DrawModelWires = _wrap('DrawModelWires', None, Model, Vector3, Float, Color)
+_DrawModelWiresEx = _wrap('DrawModelWiresEx', None, Model, Vector3, Vector3, Float, Vector3, Color)
+_DrawBoundingBox = _wrap('DrawBoundingBox', None, BoundingBox, Color)
+_DrawBillboard = _wrap('DrawBillboard', None, Camera, Texture2D, Vector3, Float, Color)
+_DrawBillboardRec = _wrap('DrawBillboardRec', None, Camera, Texture2D, Rectangle, Vector3, Vector2, Color)
+_DrawBillboardPro = _wrap('DrawBillboardPro', None, Camera, Texture2D, Rectangle, Vector3, Vector3, Vector2, Vector2, Float, Color)
+_UploadMesh = _wrap('UploadMesh', None, MeshPtr, Bool)
+_UpdateMeshBuffer = _wrap('UpdateMeshBuffer', None, Mesh, Int, VoidPtr, Int, Int)
+_UnloadMesh = _wrap('UnloadMesh', None, Mesh)
+_DrawMesh = _wrap('DrawMesh', None, Mesh, Material, Matrix)
+_DrawMeshInstanced = _wrap('DrawMeshInstanced', None, Mesh, Material, MatrixPtr, Int)
+_ExportMesh = _wrap('ExportMesh', Bool, Mesh, CharPtr)
+_GetMeshBoundingBox = _wrap('GetMeshBoundingBox', BoundingBox, Mesh)
+_GenMeshTangents = _wrap('GenMeshTangents', None, MeshPtr)
+_GenMeshPoly = _wrap('GenMeshPoly', Mesh, Int, Float)
+_GenMeshPlane = _wrap('GenMeshPlane', Mesh, Float, Float, Int, Int)
+_GenMeshCube = _wrap('GenMeshCube', Mesh, Float, Float, Float)
+_GenMeshSphere = _wrap('GenMeshSphere', Mesh, Float, Int, Int)
+_GenMeshHemiSphere = _wrap('GenMeshHemiSphere', Mesh, Float, Int, Int)
+_GenMeshCylinder = _wrap('GenMeshCylinder', Mesh, Float, Float, Int)
+_GenMeshCone = _wrap('GenMeshCone', Mesh, Float, Float, Int)
+_GenMeshTorus = _wrap('GenMeshTorus', Mesh, Float, Float, Int, Int)
+_GenMeshKnot = _wrap('GenMeshKnot', Mesh, Float, Float, Int, Int)
+_GenMeshHeightmap = _wrap('GenMeshHeightmap', Mesh, Image, Vector3)
+_GenMeshCubicmap = _wrap('GenMeshCubicmap', Mesh, Image, Vector3)
+_LoadMaterials = _wrap('LoadMaterials', MaterialPtr, CharPtr, IntPtr)
+_LoadMaterialDefault = _wrap('LoadMaterialDefault', Material)
+_IsMaterialReady = _wrap('IsMaterialReady', Bool, Material)
+_UnloadMaterial = _wrap('UnloadMaterial', None, Material)
+_SetMaterialTexture = _wrap('SetMaterialTexture', None, MaterialPtr, Int, Texture2D)
+_SetModelMeshMaterial = _wrap('SetModelMeshMaterial', None, ModelPtr, Int, Int)
+_LoadModelAnimations = _wrap('LoadModelAnimations', ModelAnimationPtr, CharPtr, IntPtr)
+_UpdateModelAnimation = _wrap('UpdateModelAnimation', None, Model, ModelAnimation, Int)
+_UnloadModelAnimation = _wrap('UnloadModelAnimation', None, ModelAnimation)
+_UnloadModelAnimations = _wrap('UnloadModelAnimations', None, ModelAnimationPtr, Int)
+_IsModelAnimationValid = _wrap('IsModelAnimationValid', Bool, Model, ModelAnimation)
+_CheckCollisionSpheres = _wrap('CheckCollisionSpheres', Bool, Vector3, Float, Vector3, Float)
+_CheckCollisionBoxes = _wrap('CheckCollisionBoxes', Bool, BoundingBox, BoundingBox)
+_CheckCollisionBoxSphere = _wrap('CheckCollisionBoxSphere', Bool, BoundingBox, Vector3, Float)
+_GetRayCollisionSphere = _wrap('GetRayCollisionSphere', RayCollision, Ray, Vector3, Float)
+_GetRayCollisionBox = _wrap('GetRayCollisionBox', RayCollision, Ray, BoundingBox)
+_GetRayCollisionMesh = _wrap('GetRayCollisionMesh', RayCollision, Ray, Mesh, Matrix)
+_GetRayCollisionTriangle = _wrap('GetRayCollisionTriangle', RayCollision, Ray, Vector3, Vector3, Vector3)
+_GetRayCollisionQuad = _wrap('GetRayCollisionQuad', RayCollision, Ray, Vector3, Vector3, Vector3, Vector3)
+_InitAudioDevice = _wrap('InitAudioDevice', None)
+_CloseAudioDevice = _wrap('CloseAudioDevice', None)
+_IsAudioDeviceReady = _wrap('IsAudioDeviceReady', Bool)
+_SetMasterVolume = _wrap('SetMasterVolume', None, Float)
+_GetMasterVolume = _wrap('GetMasterVolume', Float)
+_LoadWave = _wrap('LoadWave', Wave, CharPtr)
+_LoadWaveFromMemory = _wrap('LoadWaveFromMemory', Wave, CharPtr, UCharPtr, Int)
+_IsWaveReady = _wrap('IsWaveReady', Bool, Wave)
+_LoadSound = _wrap('LoadSound', Sound, CharPtr)
+_LoadSoundFromWave = _wrap('LoadSoundFromWave', Sound, Wave)
+_LoadSoundAlias = _wrap('LoadSoundAlias', Sound, Sound)
+_IsSoundReady = _wrap('IsSoundReady', Bool, Sound)
+_UpdateSound = _wrap('UpdateSound', None, Sound, VoidPtr, Int)
+_UnloadWave = _wrap('UnloadWave', None, Wave)
+_UnloadSound = _wrap('UnloadSound', None, Sound)
+_UnloadSoundAlias = _wrap('UnloadSoundAlias', None, Sound)
+_ExportWave = _wrap('ExportWave', Bool, Wave, CharPtr)
+_ExportWaveAsCode = _wrap('ExportWaveAsCode', Bool, Wave, CharPtr)
+_PlaySound = _wrap('PlaySound', None, Sound)
+_StopSound = _wrap('StopSound', None, Sound)
+_PauseSound = _wrap('PauseSound', None, Sound)
+_ResumeSound = _wrap('ResumeSound', None, Sound)
+_IsSoundPlaying = _wrap('IsSoundPlaying', Bool, Sound)
+_SetSoundVolume = _wrap('SetSoundVolume', None, Sound, Float)
+_SetSoundPitch = _wrap('SetSoundPitch', None, Sound, Float)
+_SetSoundPan = _wrap('SetSoundPan', None, Sound, Float)
+_WaveCopy = _wrap('WaveCopy', Wave, Wave)
+_WaveCrop = _wrap('WaveCrop', None, WavePtr, Int, Int)
+_WaveFormat = _wrap('WaveFormat', None, WavePtr, Int, Int, Int)
+_LoadWaveSamples = _wrap('LoadWaveSamples', FloatPtr, Wave)
+_UnloadWaveSamples = _wrap('UnloadWaveSamples', None, FloatPtr)
+_LoadMusicStream = _wrap('LoadMusicStream', Music, CharPtr)
+_LoadMusicStreamFromMemory = _wrap('LoadMusicStreamFromMemory', Music, CharPtr, UCharPtr, Int)
+_IsMusicReady = _wrap('IsMusicReady', Bool, Music)
+_UnloadMusicStream = _wrap('UnloadMusicStream', None, Music)
+_PlayMusicStream = _wrap('PlayMusicStream', None, Music)
+_IsMusicStreamPlaying = _wrap('IsMusicStreamPlaying', Bool, Music)
+_UpdateMusicStream = _wrap('UpdateMusicStream', None, Music)
+_StopMusicStream = _wrap('StopMusicStream', None, Music)
+_PauseMusicStream = _wrap('PauseMusicStream', None, Music)
+_ResumeMusicStream = _wrap('ResumeMusicStream', None, Music)
+_SeekMusicStream = _wrap('SeekMusicStream', None, Music, Float)
+_SetMusicVolume = _wrap('SetMusicVolume', None, Music, Float)
+_SetMusicPitch = _wrap('SetMusicPitch', None, Music, Float)
+_SetMusicPan = _wrap('SetMusicPan', None, Music, Float)
+_GetMusicTimeLength = _wrap('GetMusicTimeLength', Float, Music)
+_GetMusicTimePlayed = _wrap('GetMusicTimePlayed', Float, Music)
+_LoadAudioStream = _wrap('LoadAudioStream', AudioStream, UInt, UInt, UInt)
+_IsAudioStreamReady = _wrap('IsAudioStreamReady', Bool, AudioStream)
+_UnloadAudioStream = _wrap('UnloadAudioStream', None, AudioStream)
+_UpdateAudioStream = _wrap('UpdateAudioStream', None, AudioStream, VoidPtr, Int)
+_IsAudioStreamProcessed = _wrap('IsAudioStreamProcessed', Bool, AudioStream)
+_PlayAudioStream = _wrap('PlayAudioStream', None, AudioStream)
+_PauseAudioStream = _wrap('PauseAudioStream', None, AudioStream)
+_ResumeAudioStream = _wrap('ResumeAudioStream', None, AudioStream)
+_IsAudioStreamPlaying = _wrap('IsAudioStreamPlaying', Bool, AudioStream)
+_StopAudioStream = _wrap('StopAudioStream', None, AudioStream)
+_SetAudioStreamVolume = _wrap('SetAudioStreamVolume', None, AudioStream, Float)
+_SetAudioStreamPitch = _wrap('SetAudioStreamPitch', None, AudioStream, Float)
+_SetAudioStreamPan = _wrap('SetAudioStreamPan', None, AudioStream, Float)
+_SetAudioStreamBufferSizeDefault = _wrap('SetAudioStreamBufferSizeDefault', None, Int)
+_SetAudioStreamCallback = _wrap('SetAudioStreamCallback', None, AudioStream, AudioCallback)
+_AttachAudioStreamProcessor = _wrap('AttachAudioStreamProcessor', None, AudioStream, AudioCallback)
+_DetachAudioStreamProcessor = _wrap('DetachAudioStreamProcessor', None, AudioStream, AudioCallback)
+_AttachAudioMixedProcessor = _wrap('AttachAudioMixedProcessor', None, AudioCallback)
+_DetachAudioMixedProcessor = _wrap('DetachAudioMixedProcessor', None, AudioCallback)
 
 
 # rlapi::raymath
@@ -8135,120 +9004,120 @@ float16._fields_ = [
 ]
 
 
-_Clamp = _wrap(rlapi.Clamp, Float, Float, Float, Float)
-_Lerp = _wrap(rlapi.Lerp, Float, Float, Float, Float)
-_Normalize = _wrap(rlapi.Normalize, Float, Float, Float, Float)
-_Remap = _wrap(rlapi.Remap, Float, Float, Float, Float, Float, Float)
-_Wrap = _wrap(rlapi.Wrap, Float, Float, Float, Float)
-_FloatEquals = _wrap(rlapi.FloatEquals, Int, Float, Float)
-_Vector2Zero = _wrap(rlapi.Vector2Zero, Vector2)
-_Vector2One = _wrap(rlapi.Vector2One, Vector2)
-_Vector2Add = _wrap(rlapi.Vector2Add, Vector2, Vector2, Vector2)
-_Vector2AddValue = _wrap(rlapi.Vector2AddValue, Vector2, Vector2, Float)
-_Vector2Subtract = _wrap(rlapi.Vector2Subtract, Vector2, Vector2, Vector2)
-_Vector2SubtractValue = _wrap(rlapi.Vector2SubtractValue, Vector2, Vector2, Float)
-_Vector2Length = _wrap(rlapi.Vector2Length, Float, Vector2)
-_Vector2LengthSqr = _wrap(rlapi.Vector2LengthSqr, Float, Vector2)
-_Vector2DotProduct = _wrap(rlapi.Vector2DotProduct, Float, Vector2, Vector2)
-_Vector2Distance = _wrap(rlapi.Vector2Distance, Float, Vector2, Vector2)
-_Vector2DistanceSqr = _wrap(rlapi.Vector2DistanceSqr, Float, Vector2, Vector2)
-_Vector2Angle = _wrap(rlapi.Vector2Angle, Float, Vector2, Vector2)
-_Vector2LineAngle = _wrap(rlapi.Vector2LineAngle, Float, Vector2, Vector2)
-_Vector2Scale = _wrap(rlapi.Vector2Scale, Vector2, Vector2, Float)
-_Vector2Multiply = _wrap(rlapi.Vector2Multiply, Vector2, Vector2, Vector2)
-_Vector2Negate = _wrap(rlapi.Vector2Negate, Vector2, Vector2)
-_Vector2Divide = _wrap(rlapi.Vector2Divide, Vector2, Vector2, Vector2)
-_Vector2Normalize = _wrap(rlapi.Vector2Normalize, Vector2, Vector2)
-_Vector2Transform = _wrap(rlapi.Vector2Transform, Vector2, Vector2, Matrix)
-_Vector2Lerp = _wrap(rlapi.Vector2Lerp, Vector2, Vector2, Vector2, Float)
-_Vector2Reflect = _wrap(rlapi.Vector2Reflect, Vector2, Vector2, Vector2)
-_Vector2Rotate = _wrap(rlapi.Vector2Rotate, Vector2, Vector2, Float)
-_Vector2MoveTowards = _wrap(rlapi.Vector2MoveTowards, Vector2, Vector2, Vector2, Float)
-_Vector2Invert = _wrap(rlapi.Vector2Invert, Vector2, Vector2)
-_Vector2Clamp = _wrap(rlapi.Vector2Clamp, Vector2, Vector2, Vector2, Vector2)
-_Vector2ClampValue = _wrap(rlapi.Vector2ClampValue, Vector2, Vector2, Float, Float)
-_Vector2Equals = _wrap(rlapi.Vector2Equals, Int, Vector2, Vector2)
-_Vector3Zero = _wrap(rlapi.Vector3Zero, Vector3)
-_Vector3One = _wrap(rlapi.Vector3One, Vector3)
-_Vector3Add = _wrap(rlapi.Vector3Add, Vector3, Vector3, Vector3)
-_Vector3AddValue = _wrap(rlapi.Vector3AddValue, Vector3, Vector3, Float)
-_Vector3Subtract = _wrap(rlapi.Vector3Subtract, Vector3, Vector3, Vector3)
-_Vector3SubtractValue = _wrap(rlapi.Vector3SubtractValue, Vector3, Vector3, Float)
-_Vector3Scale = _wrap(rlapi.Vector3Scale, Vector3, Vector3, Float)
-_Vector3Multiply = _wrap(rlapi.Vector3Multiply, Vector3, Vector3, Vector3)
-_Vector3CrossProduct = _wrap(rlapi.Vector3CrossProduct, Vector3, Vector3, Vector3)
-_Vector3Perpendicular = _wrap(rlapi.Vector3Perpendicular, Vector3, Vector3)
-_Vector3Length = _wrap(rlapi.Vector3Length, Float, Vector3)
-_Vector3LengthSqr = _wrap(rlapi.Vector3LengthSqr, Float, Vector3)
-_Vector3DotProduct = _wrap(rlapi.Vector3DotProduct, Float, Vector3, Vector3)
-_Vector3Distance = _wrap(rlapi.Vector3Distance, Float, Vector3, Vector3)
-_Vector3DistanceSqr = _wrap(rlapi.Vector3DistanceSqr, Float, Vector3, Vector3)
-_Vector3Angle = _wrap(rlapi.Vector3Angle, Float, Vector3, Vector3)
-_Vector3Negate = _wrap(rlapi.Vector3Negate, Vector3, Vector3)
-_Vector3Divide = _wrap(rlapi.Vector3Divide, Vector3, Vector3, Vector3)
-_Vector3Normalize = _wrap(rlapi.Vector3Normalize, Vector3, Vector3)
-_Vector3Project = _wrap(rlapi.Vector3Project, Vector3, Vector3, Vector3)
-_Vector3Reject = _wrap(rlapi.Vector3Reject, Vector3, Vector3, Vector3)
-_Vector3OrthoNormalize = _wrap(rlapi.Vector3OrthoNormalize, None, Vector3Ptr, Vector3Ptr)
-_Vector3Transform = _wrap(rlapi.Vector3Transform, Vector3, Vector3, Matrix)
-_Vector3RotateByQuaternion = _wrap(rlapi.Vector3RotateByQuaternion, Vector3, Vector3, Quaternion)
-_Vector3RotateByAxisAngle = _wrap(rlapi.Vector3RotateByAxisAngle, Vector3, Vector3, Vector3, Float)
-_Vector3Lerp = _wrap(rlapi.Vector3Lerp, Vector3, Vector3, Vector3, Float)
-_Vector3Reflect = _wrap(rlapi.Vector3Reflect, Vector3, Vector3, Vector3)
-_Vector3Min = _wrap(rlapi.Vector3Min, Vector3, Vector3, Vector3)
-_Vector3Max = _wrap(rlapi.Vector3Max, Vector3, Vector3, Vector3)
-_Vector3Barycenter = _wrap(rlapi.Vector3Barycenter, Vector3, Vector3, Vector3, Vector3, Vector3)
-_Vector3Unproject = _wrap(rlapi.Vector3Unproject, Vector3, Vector3, Matrix, Matrix)
-_Vector3ToFloatV = _wrap(rlapi.Vector3ToFloatV, float3, Vector3)
-_Vector3Invert = _wrap(rlapi.Vector3Invert, Vector3, Vector3)
-_Vector3Clamp = _wrap(rlapi.Vector3Clamp, Vector3, Vector3, Vector3, Vector3)
-_Vector3ClampValue = _wrap(rlapi.Vector3ClampValue, Vector3, Vector3, Float, Float)
-_Vector3Equals = _wrap(rlapi.Vector3Equals, Int, Vector3, Vector3)
-_Vector3Refract = _wrap(rlapi.Vector3Refract, Vector3, Vector3, Vector3, Float)
-_MatrixDeterminant = _wrap(rlapi.MatrixDeterminant, Float, Matrix)
-_MatrixTrace = _wrap(rlapi.MatrixTrace, Float, Matrix)
-_MatrixTranspose = _wrap(rlapi.MatrixTranspose, Matrix, Matrix)
-_MatrixInvert = _wrap(rlapi.MatrixInvert, Matrix, Matrix)
-_MatrixIdentity = _wrap(rlapi.MatrixIdentity, Matrix)
-_MatrixAdd = _wrap(rlapi.MatrixAdd, Matrix, Matrix, Matrix)
-_MatrixSubtract = _wrap(rlapi.MatrixSubtract, Matrix, Matrix, Matrix)
-_MatrixMultiply = _wrap(rlapi.MatrixMultiply, Matrix, Matrix, Matrix)
-_MatrixTranslate = _wrap(rlapi.MatrixTranslate, Matrix, Float, Float, Float)
-_MatrixRotate = _wrap(rlapi.MatrixRotate, Matrix, Vector3, Float)
-_MatrixRotateX = _wrap(rlapi.MatrixRotateX, Matrix, Float)
-_MatrixRotateY = _wrap(rlapi.MatrixRotateY, Matrix, Float)
-_MatrixRotateZ = _wrap(rlapi.MatrixRotateZ, Matrix, Float)
-_MatrixRotateXYZ = _wrap(rlapi.MatrixRotateXYZ, Matrix, Vector3)
-_MatrixRotateZYX = _wrap(rlapi.MatrixRotateZYX, Matrix, Vector3)
-_MatrixScale = _wrap(rlapi.MatrixScale, Matrix, Float, Float, Float)
-_MatrixFrustum = _wrap(rlapi.MatrixFrustum, Matrix, Double, Double, Double, Double, Double, Double)
-_MatrixPerspective = _wrap(rlapi.MatrixPerspective, Matrix, Double, Double, Double, Double)
-_MatrixOrtho = _wrap(rlapi.MatrixOrtho, Matrix, Double, Double, Double, Double, Double, Double)
-_MatrixLookAt = _wrap(rlapi.MatrixLookAt, Matrix, Vector3, Vector3, Vector3)
-_MatrixToFloatV = _wrap(rlapi.MatrixToFloatV, float16, Matrix)
-_QuaternionAdd = _wrap(rlapi.QuaternionAdd, Quaternion, Quaternion, Quaternion)
-_QuaternionAddValue = _wrap(rlapi.QuaternionAddValue, Quaternion, Quaternion, Float)
-_QuaternionSubtract = _wrap(rlapi.QuaternionSubtract, Quaternion, Quaternion, Quaternion)
-_QuaternionSubtractValue = _wrap(rlapi.QuaternionSubtractValue, Quaternion, Quaternion, Float)
-_QuaternionIdentity = _wrap(rlapi.QuaternionIdentity, Quaternion)
-_QuaternionLength = _wrap(rlapi.QuaternionLength, Float, Quaternion)
-_QuaternionNormalize = _wrap(rlapi.QuaternionNormalize, Quaternion, Quaternion)
-_QuaternionInvert = _wrap(rlapi.QuaternionInvert, Quaternion, Quaternion)
-_QuaternionMultiply = _wrap(rlapi.QuaternionMultiply, Quaternion, Quaternion, Quaternion)
-_QuaternionScale = _wrap(rlapi.QuaternionScale, Quaternion, Quaternion, Float)
-_QuaternionDivide = _wrap(rlapi.QuaternionDivide, Quaternion, Quaternion, Quaternion)
-_QuaternionLerp = _wrap(rlapi.QuaternionLerp, Quaternion, Quaternion, Quaternion, Float)
-_QuaternionNlerp = _wrap(rlapi.QuaternionNlerp, Quaternion, Quaternion, Quaternion, Float)
-_QuaternionSlerp = _wrap(rlapi.QuaternionSlerp, Quaternion, Quaternion, Quaternion, Float)
-_QuaternionFromVector3ToVector3 = _wrap(rlapi.QuaternionFromVector3ToVector3, Quaternion, Vector3, Vector3)
-_QuaternionFromMatrix = _wrap(rlapi.QuaternionFromMatrix, Quaternion, Matrix)
-_QuaternionToMatrix = _wrap(rlapi.QuaternionToMatrix, Matrix, Quaternion)
-_QuaternionFromAxisAngle = _wrap(rlapi.QuaternionFromAxisAngle, Quaternion, Vector3, Float)
-_QuaternionToAxisAngle = _wrap(rlapi.QuaternionToAxisAngle, None, Quaternion, Vector3Ptr, FloatPtr)
-_QuaternionFromEuler = _wrap(rlapi.QuaternionFromEuler, Quaternion, Float, Float, Float)
-_QuaternionToEuler = _wrap(rlapi.QuaternionToEuler, Vector3, Quaternion)
-_QuaternionTransform = _wrap(rlapi.QuaternionTransform, Quaternion, Quaternion, Matrix)
-_QuaternionEquals = _wrap(rlapi.QuaternionEquals, Int, Quaternion, Quaternion)
+_Clamp = _wrap('Clamp', Float, Float, Float, Float)
+_Lerp = _wrap('Lerp', Float, Float, Float, Float)
+_Normalize = _wrap('Normalize', Float, Float, Float, Float)
+_Remap = _wrap('Remap', Float, Float, Float, Float, Float, Float)
+_Wrap = _wrap('Wrap', Float, Float, Float, Float)
+_FloatEquals = _wrap('FloatEquals', Int, Float, Float)
+_Vector2Zero = _wrap('Vector2Zero', Vector2)
+_Vector2One = _wrap('Vector2One', Vector2)
+_Vector2Add = _wrap('Vector2Add', Vector2, Vector2, Vector2)
+_Vector2AddValue = _wrap('Vector2AddValue', Vector2, Vector2, Float)
+_Vector2Subtract = _wrap('Vector2Subtract', Vector2, Vector2, Vector2)
+_Vector2SubtractValue = _wrap('Vector2SubtractValue', Vector2, Vector2, Float)
+_Vector2Length = _wrap('Vector2Length', Float, Vector2)
+_Vector2LengthSqr = _wrap('Vector2LengthSqr', Float, Vector2)
+_Vector2DotProduct = _wrap('Vector2DotProduct', Float, Vector2, Vector2)
+_Vector2Distance = _wrap('Vector2Distance', Float, Vector2, Vector2)
+_Vector2DistanceSqr = _wrap('Vector2DistanceSqr', Float, Vector2, Vector2)
+_Vector2Angle = _wrap('Vector2Angle', Float, Vector2, Vector2)
+_Vector2LineAngle = _wrap('Vector2LineAngle', Float, Vector2, Vector2)
+_Vector2Scale = _wrap('Vector2Scale', Vector2, Vector2, Float)
+_Vector2Multiply = _wrap('Vector2Multiply', Vector2, Vector2, Vector2)
+_Vector2Negate = _wrap('Vector2Negate', Vector2, Vector2)
+_Vector2Divide = _wrap('Vector2Divide', Vector2, Vector2, Vector2)
+_Vector2Normalize = _wrap('Vector2Normalize', Vector2, Vector2)
+_Vector2Transform = _wrap('Vector2Transform', Vector2, Vector2, Matrix)
+_Vector2Lerp = _wrap('Vector2Lerp', Vector2, Vector2, Vector2, Float)
+_Vector2Reflect = _wrap('Vector2Reflect', Vector2, Vector2, Vector2)
+_Vector2Rotate = _wrap('Vector2Rotate', Vector2, Vector2, Float)
+_Vector2MoveTowards = _wrap('Vector2MoveTowards', Vector2, Vector2, Vector2, Float)
+_Vector2Invert = _wrap('Vector2Invert', Vector2, Vector2)
+_Vector2Clamp = _wrap('Vector2Clamp', Vector2, Vector2, Vector2, Vector2)
+_Vector2ClampValue = _wrap('Vector2ClampValue', Vector2, Vector2, Float, Float)
+_Vector2Equals = _wrap('Vector2Equals', Int, Vector2, Vector2)
+_Vector3Zero = _wrap('Vector3Zero', Vector3)
+_Vector3One = _wrap('Vector3One', Vector3)
+_Vector3Add = _wrap('Vector3Add', Vector3, Vector3, Vector3)
+_Vector3AddValue = _wrap('Vector3AddValue', Vector3, Vector3, Float)
+_Vector3Subtract = _wrap('Vector3Subtract', Vector3, Vector3, Vector3)
+_Vector3SubtractValue = _wrap('Vector3SubtractValue', Vector3, Vector3, Float)
+_Vector3Scale = _wrap('Vector3Scale', Vector3, Vector3, Float)
+_Vector3Multiply = _wrap('Vector3Multiply', Vector3, Vector3, Vector3)
+_Vector3CrossProduct = _wrap('Vector3CrossProduct', Vector3, Vector3, Vector3)
+_Vector3Perpendicular = _wrap('Vector3Perpendicular', Vector3, Vector3)
+_Vector3Length = _wrap('Vector3Length', Float, Vector3)
+_Vector3LengthSqr = _wrap('Vector3LengthSqr', Float, Vector3)
+_Vector3DotProduct = _wrap('Vector3DotProduct', Float, Vector3, Vector3)
+_Vector3Distance = _wrap('Vector3Distance', Float, Vector3, Vector3)
+_Vector3DistanceSqr = _wrap('Vector3DistanceSqr', Float, Vector3, Vector3)
+_Vector3Angle = _wrap('Vector3Angle', Float, Vector3, Vector3)
+_Vector3Negate = _wrap('Vector3Negate', Vector3, Vector3)
+_Vector3Divide = _wrap('Vector3Divide', Vector3, Vector3, Vector3)
+_Vector3Normalize = _wrap('Vector3Normalize', Vector3, Vector3)
+_Vector3Project = _wrap('Vector3Project', Vector3, Vector3, Vector3)
+_Vector3Reject = _wrap('Vector3Reject', Vector3, Vector3, Vector3)
+_Vector3OrthoNormalize = _wrap('Vector3OrthoNormalize', None, Vector3Ptr, Vector3Ptr)
+_Vector3Transform = _wrap('Vector3Transform', Vector3, Vector3, Matrix)
+_Vector3RotateByQuaternion = _wrap('Vector3RotateByQuaternion', Vector3, Vector3, Quaternion)
+_Vector3RotateByAxisAngle = _wrap('Vector3RotateByAxisAngle', Vector3, Vector3, Vector3, Float)
+_Vector3Lerp = _wrap('Vector3Lerp', Vector3, Vector3, Vector3, Float)
+_Vector3Reflect = _wrap('Vector3Reflect', Vector3, Vector3, Vector3)
+_Vector3Min = _wrap('Vector3Min', Vector3, Vector3, Vector3)
+_Vector3Max = _wrap('Vector3Max', Vector3, Vector3, Vector3)
+_Vector3Barycenter = _wrap('Vector3Barycenter', Vector3, Vector3, Vector3, Vector3, Vector3)
+_Vector3Unproject = _wrap('Vector3Unproject', Vector3, Vector3, Matrix, Matrix)
+_Vector3ToFloatV = _wrap('Vector3ToFloatV', float3, Vector3)
+_Vector3Invert = _wrap('Vector3Invert', Vector3, Vector3)
+_Vector3Clamp = _wrap('Vector3Clamp', Vector3, Vector3, Vector3, Vector3)
+_Vector3ClampValue = _wrap('Vector3ClampValue', Vector3, Vector3, Float, Float)
+_Vector3Equals = _wrap('Vector3Equals', Int, Vector3, Vector3)
+_Vector3Refract = _wrap('Vector3Refract', Vector3, Vector3, Vector3, Float)
+_MatrixDeterminant = _wrap('MatrixDeterminant', Float, Matrix)
+_MatrixTrace = _wrap('MatrixTrace', Float, Matrix)
+_MatrixTranspose = _wrap('MatrixTranspose', Matrix, Matrix)
+_MatrixInvert = _wrap('MatrixInvert', Matrix, Matrix)
+_MatrixIdentity = _wrap('MatrixIdentity', Matrix)
+_MatrixAdd = _wrap('MatrixAdd', Matrix, Matrix, Matrix)
+_MatrixSubtract = _wrap('MatrixSubtract', Matrix, Matrix, Matrix)
+_MatrixMultiply = _wrap('MatrixMultiply', Matrix, Matrix, Matrix)
+_MatrixTranslate = _wrap('MatrixTranslate', Matrix, Float, Float, Float)
+_MatrixRotate = _wrap('MatrixRotate', Matrix, Vector3, Float)
+_MatrixRotateX = _wrap('MatrixRotateX', Matrix, Float)
+_MatrixRotateY = _wrap('MatrixRotateY', Matrix, Float)
+_MatrixRotateZ = _wrap('MatrixRotateZ', Matrix, Float)
+_MatrixRotateXYZ = _wrap('MatrixRotateXYZ', Matrix, Vector3)
+_MatrixRotateZYX = _wrap('MatrixRotateZYX', Matrix, Vector3)
+_MatrixScale = _wrap('MatrixScale', Matrix, Float, Float, Float)
+_MatrixFrustum = _wrap('MatrixFrustum', Matrix, Double, Double, Double, Double, Double, Double)
+_MatrixPerspective = _wrap('MatrixPerspective', Matrix, Double, Double, Double, Double)
+_MatrixOrtho = _wrap('MatrixOrtho', Matrix, Double, Double, Double, Double, Double, Double)
+_MatrixLookAt = _wrap('MatrixLookAt', Matrix, Vector3, Vector3, Vector3)
+_MatrixToFloatV = _wrap('MatrixToFloatV', float16, Matrix)
+_QuaternionAdd = _wrap('QuaternionAdd', Quaternion, Quaternion, Quaternion)
+_QuaternionAddValue = _wrap('QuaternionAddValue', Quaternion, Quaternion, Float)
+_QuaternionSubtract = _wrap('QuaternionSubtract', Quaternion, Quaternion, Quaternion)
+_QuaternionSubtractValue = _wrap('QuaternionSubtractValue', Quaternion, Quaternion, Float)
+_QuaternionIdentity = _wrap('QuaternionIdentity', Quaternion)
+_QuaternionLength = _wrap('QuaternionLength', Float, Quaternion)
+_QuaternionNormalize = _wrap('QuaternionNormalize', Quaternion, Quaternion)
+_QuaternionInvert = _wrap('QuaternionInvert', Quaternion, Quaternion)
+_QuaternionMultiply = _wrap('QuaternionMultiply', Quaternion, Quaternion, Quaternion)
+_QuaternionScale = _wrap('QuaternionScale', Quaternion, Quaternion, Float)
+_QuaternionDivide = _wrap('QuaternionDivide', Quaternion, Quaternion, Quaternion)
+_QuaternionLerp = _wrap('QuaternionLerp', Quaternion, Quaternion, Quaternion, Float)
+_QuaternionNlerp = _wrap('QuaternionNlerp', Quaternion, Quaternion, Quaternion, Float)
+_QuaternionSlerp = _wrap('QuaternionSlerp', Quaternion, Quaternion, Quaternion, Float)
+_QuaternionFromVector3ToVector3 = _wrap('QuaternionFromVector3ToVector3', Quaternion, Vector3, Vector3)
+_QuaternionFromMatrix = _wrap('QuaternionFromMatrix', Quaternion, Matrix)
+_QuaternionToMatrix = _wrap('QuaternionToMatrix', Matrix, Quaternion)
+_QuaternionFromAxisAngle = _wrap('QuaternionFromAxisAngle', Quaternion, Vector3, Float)
+_QuaternionToAxisAngle = _wrap('QuaternionToAxisAngle', None, Quaternion, Vector3Ptr, FloatPtr)
+_QuaternionFromEuler = _wrap('QuaternionFromEuler', Quaternion, Float, Float, Float)
+_QuaternionToEuler = _wrap('QuaternionToEuler', Vector3, Quaternion)
+_QuaternionTransform = _wrap('QuaternionTransform', Quaternion, Quaternion, Matrix)
+_QuaternionEquals = _wrap('QuaternionEquals', Int, Quaternion, Quaternion)
 
 
 # rlapi::rlgl
@@ -8284,153 +9153,159 @@ rlRenderBatch._fields_ = [
 ]
 
 
-_rlMatrixMode = _wrap(rlapi.rlMatrixMode, None, Int)
-_rlPushMatrix = _wrap(rlapi.rlPushMatrix, None)
-_rlPopMatrix = _wrap(rlapi.rlPopMatrix, None)
-_rlLoadIdentity = _wrap(rlapi.rlLoadIdentity, None)
-_rlTranslatef = _wrap(rlapi.rlTranslatef, None, Float, Float, Float)
-_rlRotatef = _wrap(rlapi.rlRotatef, None, Float, Float, Float, Float)
-_rlScalef = _wrap(rlapi.rlScalef, None, Float, Float, Float)
-_rlMultMatrixf = _wrap(rlapi.rlMultMatrixf, None, FloatPtr)
-_rlFrustum = _wrap(rlapi.rlFrustum, None, Double, Double, Double, Double, Double, Double)
-_rlOrtho = _wrap(rlapi.rlOrtho, None, Double, Double, Double, Double, Double, Double)
-_rlViewport = _wrap(rlapi.rlViewport, None, Int, Int, Int, Int)
-_rlBegin = _wrap(rlapi.rlBegin, None, Int)
-_rlEnd = _wrap(rlapi.rlEnd, None)
-_rlVertex2i = _wrap(rlapi.rlVertex2i, None, Int, Int)
-_rlVertex2f = _wrap(rlapi.rlVertex2f, None, Float, Float)
-_rlVertex3f = _wrap(rlapi.rlVertex3f, None, Float, Float, Float)
-_rlTexCoord2f = _wrap(rlapi.rlTexCoord2f, None, Float, Float)
-_rlNormal3f = _wrap(rlapi.rlNormal3f, None, Float, Float, Float)
-_rlColor4ub = _wrap(rlapi.rlColor4ub, None, UChar, UChar, UChar, UChar)
-_rlColor3f = _wrap(rlapi.rlColor3f, None, Float, Float, Float)
-_rlColor4f = _wrap(rlapi.rlColor4f, None, Float, Float, Float, Float)
-_rlEnableVertexArray = _wrap(rlapi.rlEnableVertexArray, Bool, UInt)
-_rlDisableVertexArray = _wrap(rlapi.rlDisableVertexArray, None)
-_rlEnableVertexBuffer = _wrap(rlapi.rlEnableVertexBuffer, None, UInt)
-_rlDisableVertexBuffer = _wrap(rlapi.rlDisableVertexBuffer, None)
-_rlEnableVertexBufferElement = _wrap(rlapi.rlEnableVertexBufferElement, None, UInt)
-_rlDisableVertexBufferElement = _wrap(rlapi.rlDisableVertexBufferElement, None)
-_rlEnableVertexAttribute = _wrap(rlapi.rlEnableVertexAttribute, None, UInt)
-_rlDisableVertexAttribute = _wrap(rlapi.rlDisableVertexAttribute, None, UInt)
-_rlActiveTextureSlot = _wrap(rlapi.rlActiveTextureSlot, None, Int)
-_rlEnableTexture = _wrap(rlapi.rlEnableTexture, None, UInt)
-_rlDisableTexture = _wrap(rlapi.rlDisableTexture, None)
-_rlEnableTextureCubemap = _wrap(rlapi.rlEnableTextureCubemap, None, UInt)
-_rlDisableTextureCubemap = _wrap(rlapi.rlDisableTextureCubemap, None)
-_rlTextureParameters = _wrap(rlapi.rlTextureParameters, None, UInt, Int, Int)
-_rlCubemapParameters = _wrap(rlapi.rlCubemapParameters, None, UInt, Int, Int)
-_rlEnableShader = _wrap(rlapi.rlEnableShader, None, UInt)
-_rlDisableShader = _wrap(rlapi.rlDisableShader, None)
-_rlEnableFramebuffer = _wrap(rlapi.rlEnableFramebuffer, None, UInt)
-_rlDisableFramebuffer = _wrap(rlapi.rlDisableFramebuffer, None)
-_rlActiveDrawBuffers = _wrap(rlapi.rlActiveDrawBuffers, None, Int)
-_rlBlitFramebuffer = _wrap(rlapi.rlBlitFramebuffer, None, Int, Int, Int, Int, Int, Int, Int, Int, Int)
-_rlEnableColorBlend = _wrap(rlapi.rlEnableColorBlend, None)
-_rlDisableColorBlend = _wrap(rlapi.rlDisableColorBlend, None)
-_rlEnableDepthTest = _wrap(rlapi.rlEnableDepthTest, None)
-_rlDisableDepthTest = _wrap(rlapi.rlDisableDepthTest, None)
-_rlEnableDepthMask = _wrap(rlapi.rlEnableDepthMask, None)
-_rlDisableDepthMask = _wrap(rlapi.rlDisableDepthMask, None)
-_rlEnableBackfaceCulling = _wrap(rlapi.rlEnableBackfaceCulling, None)
-_rlDisableBackfaceCulling = _wrap(rlapi.rlDisableBackfaceCulling, None)
-_rlSetCullFace = _wrap(rlapi.rlSetCullFace, None, Int)
-_rlEnableScissorTest = _wrap(rlapi.rlEnableScissorTest, None)
-_rlDisableScissorTest = _wrap(rlapi.rlDisableScissorTest, None)
-_rlScissor = _wrap(rlapi.rlScissor, None, Int, Int, Int, Int)
-_rlEnableWireMode = _wrap(rlapi.rlEnableWireMode, None)
-_rlEnablePointMode = _wrap(rlapi.rlEnablePointMode, None)
-_rlDisableWireMode = _wrap(rlapi.rlDisableWireMode, None)
-_rlSetLineWidth = _wrap(rlapi.rlSetLineWidth, None, Float)
-_rlGetLineWidth = _wrap(rlapi.rlGetLineWidth, Float)
-_rlEnableSmoothLines = _wrap(rlapi.rlEnableSmoothLines, None)
-_rlDisableSmoothLines = _wrap(rlapi.rlDisableSmoothLines, None)
-_rlEnableStereoRender = _wrap(rlapi.rlEnableStereoRender, None)
-_rlDisableStereoRender = _wrap(rlapi.rlDisableStereoRender, None)
-_rlIsStereoRenderEnabled = _wrap(rlapi.rlIsStereoRenderEnabled, Bool)
-_rlClearColor = _wrap(rlapi.rlClearColor, None, UChar, UChar, UChar, UChar)
-_rlClearScreenBuffers = _wrap(rlapi.rlClearScreenBuffers, None)
-_rlCheckErrors = _wrap(rlapi.rlCheckErrors, None)
-_rlSetBlendMode = _wrap(rlapi.rlSetBlendMode, None, Int)
-_rlSetBlendFactors = _wrap(rlapi.rlSetBlendFactors, None, Int, Int, Int)
-_rlSetBlendFactorsSeparate = _wrap(rlapi.rlSetBlendFactorsSeparate, None, Int, Int, Int, Int, Int, Int)
-_rlglInit = _wrap(rlapi.rlglInit, None, Int, Int)
-_rlglClose = _wrap(rlapi.rlglClose, None)
-_rlLoadExtensions = _wrap(rlapi.rlLoadExtensions, None, VoidPtr)
-_rlGetVersion = _wrap(rlapi.rlGetVersion, Int)
-_rlSetFramebufferWidth = _wrap(rlapi.rlSetFramebufferWidth, None, Int)
-_rlGetFramebufferWidth = _wrap(rlapi.rlGetFramebufferWidth, Int)
-_rlSetFramebufferHeight = _wrap(rlapi.rlSetFramebufferHeight, None, Int)
-_rlGetFramebufferHeight = _wrap(rlapi.rlGetFramebufferHeight, Int)
-_rlGetTextureIdDefault = _wrap(rlapi.rlGetTextureIdDefault, UInt)
-_rlGetShaderIdDefault = _wrap(rlapi.rlGetShaderIdDefault, UInt)
-_rlGetShaderLocsDefault = _wrap(rlapi.rlGetShaderLocsDefault, IntPtr)
-_rlLoadRenderBatch = _wrap(rlapi.rlLoadRenderBatch, rlRenderBatch, Int, Int)
-_rlUnloadRenderBatch = _wrap(rlapi.rlUnloadRenderBatch, None, rlRenderBatch)
-_rlDrawRenderBatch = _wrap(rlapi.rlDrawRenderBatch, None, rlRenderBatchPtr)
-_rlSetRenderBatchActive = _wrap(rlapi.rlSetRenderBatchActive, None, rlRenderBatchPtr)
-_rlDrawRenderBatchActive = _wrap(rlapi.rlDrawRenderBatchActive, None)
-_rlCheckRenderBatchLimit = _wrap(rlapi.rlCheckRenderBatchLimit, Bool, Int)
-_rlSetTexture = _wrap(rlapi.rlSetTexture, None, UInt)
-_rlLoadVertexArray = _wrap(rlapi.rlLoadVertexArray, UInt)
-_rlLoadVertexBuffer = _wrap(rlapi.rlLoadVertexBuffer, UInt, VoidPtr, Int, Bool)
-_rlLoadVertexBufferElement = _wrap(rlapi.rlLoadVertexBufferElement, UInt, VoidPtr, Int, Bool)
-_rlUpdateVertexBuffer = _wrap(rlapi.rlUpdateVertexBuffer, None, UInt, VoidPtr, Int, Int)
-_rlUpdateVertexBufferElements = _wrap(rlapi.rlUpdateVertexBufferElements, None, UInt, VoidPtr, Int, Int)
-_rlUnloadVertexArray = _wrap(rlapi.rlUnloadVertexArray, None, UInt)
-_rlUnloadVertexBuffer = _wrap(rlapi.rlUnloadVertexBuffer, None, UInt)
-_rlSetVertexAttribute = _wrap(rlapi.rlSetVertexAttribute, None, UInt, Int, Int, Bool, Int, VoidPtr)
-_rlSetVertexAttributeDivisor = _wrap(rlapi.rlSetVertexAttributeDivisor, None, UInt, Int)
-_rlSetVertexAttributeDefault = _wrap(rlapi.rlSetVertexAttributeDefault, None, Int, VoidPtr, Int, Int)
-_rlDrawVertexArray = _wrap(rlapi.rlDrawVertexArray, None, Int, Int)
-_rlDrawVertexArrayElements = _wrap(rlapi.rlDrawVertexArrayElements, None, Int, Int, VoidPtr)
-_rlDrawVertexArrayInstanced = _wrap(rlapi.rlDrawVertexArrayInstanced, None, Int, Int, Int)
-_rlDrawVertexArrayElementsInstanced = _wrap(rlapi.rlDrawVertexArrayElementsInstanced, None, Int, Int, VoidPtr, Int)
-_rlLoadTexture = _wrap(rlapi.rlLoadTexture, UInt, VoidPtr, Int, Int, Int, Int)
-_rlLoadTextureDepth = _wrap(rlapi.rlLoadTextureDepth, UInt, Int, Int, Bool)
-_rlLoadTextureCubemap = _wrap(rlapi.rlLoadTextureCubemap, UInt, VoidPtr, Int, Int)
-_rlUpdateTexture = _wrap(rlapi.rlUpdateTexture, None, UInt, Int, Int, Int, Int, Int, VoidPtr)
-_rlGetGlTextureFormats = _wrap(rlapi.rlGetGlTextureFormats, None, Int, UIntPtr, UIntPtr, UIntPtr)
-_rlGetPixelFormatName = _wrap(rlapi.rlGetPixelFormatName, CharPtr, UInt)
-_rlUnloadTexture = _wrap(rlapi.rlUnloadTexture, None, UInt)
-_rlGenTextureMipmaps = _wrap(rlapi.rlGenTextureMipmaps, None, UInt, Int, Int, Int, IntPtr)
-_rlReadTexturePixels = _wrap(rlapi.rlReadTexturePixels, VoidPtr, UInt, Int, Int, Int)
-_rlReadScreenPixels = _wrap(rlapi.rlReadScreenPixels, UCharPtr, Int, Int)
-_rlLoadFramebuffer = _wrap(rlapi.rlLoadFramebuffer, UInt, Int, Int)
-_rlFramebufferAttach = _wrap(rlapi.rlFramebufferAttach, None, UInt, UInt, Int, Int, Int)
-_rlFramebufferComplete = _wrap(rlapi.rlFramebufferComplete, Bool, UInt)
-_rlUnloadFramebuffer = _wrap(rlapi.rlUnloadFramebuffer, None, UInt)
-_rlLoadShaderCode = _wrap(rlapi.rlLoadShaderCode, UInt, CharPtr, CharPtr)
-_rlCompileShader = _wrap(rlapi.rlCompileShader, UInt, CharPtr, Int)
-_rlLoadShaderProgram = _wrap(rlapi.rlLoadShaderProgram, UInt, UInt, UInt)
-_rlUnloadShaderProgram = _wrap(rlapi.rlUnloadShaderProgram, None, UInt)
-_rlGetLocationUniform = _wrap(rlapi.rlGetLocationUniform, Int, UInt, CharPtr)
-_rlGetLocationAttrib = _wrap(rlapi.rlGetLocationAttrib, Int, UInt, CharPtr)
-_rlSetUniform = _wrap(rlapi.rlSetUniform, None, Int, VoidPtr, Int, Int)
-_rlSetUniformMatrix = _wrap(rlapi.rlSetUniformMatrix, None, Int, Matrix)
-_rlSetUniformSampler = _wrap(rlapi.rlSetUniformSampler, None, Int, UInt)
-_rlSetShader = _wrap(rlapi.rlSetShader, None, UInt, IntPtr)
-_rlLoadComputeShaderProgram = _wrap(rlapi.rlLoadComputeShaderProgram, UInt, UInt)
-_rlComputeShaderDispatch = _wrap(rlapi.rlComputeShaderDispatch, None, UInt, UInt, UInt)
-_rlLoadShaderBuffer = _wrap(rlapi.rlLoadShaderBuffer, UInt, UInt, VoidPtr, Int)
-_rlUnloadShaderBuffer = _wrap(rlapi.rlUnloadShaderBuffer, None, UInt)
-_rlUpdateShaderBuffer = _wrap(rlapi.rlUpdateShaderBuffer, None, UInt, VoidPtr, UInt, UInt)
-_rlBindShaderBuffer = _wrap(rlapi.rlBindShaderBuffer, None, UInt, UInt)
-_rlReadShaderBuffer = _wrap(rlapi.rlReadShaderBuffer, None, UInt, VoidPtr, UInt, UInt)
-_rlCopyShaderBuffer = _wrap(rlapi.rlCopyShaderBuffer, None, UInt, UInt, UInt, UInt, UInt)
-_rlGetShaderBufferSize = _wrap(rlapi.rlGetShaderBufferSize, UInt, UInt)
-_rlBindImageTexture = _wrap(rlapi.rlBindImageTexture, None, UInt, UInt, Int, Bool)
-_rlGetMatrixModelview = _wrap(rlapi.rlGetMatrixModelview, Matrix)
-_rlGetMatrixProjection = _wrap(rlapi.rlGetMatrixProjection, Matrix)
-_rlGetMatrixTransform = _wrap(rlapi.rlGetMatrixTransform, Matrix)
-_rlGetMatrixProjectionStereo = _wrap(rlapi.rlGetMatrixProjectionStereo, Matrix, Int)
-_rlGetMatrixViewOffsetStereo = _wrap(rlapi.rlGetMatrixViewOffsetStereo, Matrix, Int)
-_rlSetMatrixProjection = _wrap(rlapi.rlSetMatrixProjection, None, Matrix)
-_rlSetMatrixModelview = _wrap(rlapi.rlSetMatrixModelview, None, Matrix)
-_rlSetMatrixProjectionStereo = _wrap(rlapi.rlSetMatrixProjectionStereo, None, Matrix, Matrix)
-_rlSetMatrixViewOffsetStereo = _wrap(rlapi.rlSetMatrixViewOffsetStereo, None, Matrix, Matrix)
-_rlLoadDrawCube = _wrap(rlapi.rlLoadDrawCube, None)
-_rlLoadDrawQuad = _wrap(rlapi.rlLoadDrawQuad, None)
+_rlMatrixMode = _wrap('rlMatrixMode', None, Int)
+_rlPushMatrix = _wrap('rlPushMatrix', None)
+_rlPopMatrix = _wrap('rlPopMatrix', None)
+_rlLoadIdentity = _wrap('rlLoadIdentity', None)
+_rlTranslatef = _wrap('rlTranslatef', None, Float, Float, Float)
+_rlRotatef = _wrap('rlRotatef', None, Float, Float, Float, Float)
+_rlScalef = _wrap('rlScalef', None, Float, Float, Float)
+_rlMultMatrixf = _wrap('rlMultMatrixf', None, FloatPtr)
+_rlFrustum = _wrap('rlFrustum', None, Double, Double, Double, Double, Double, Double)
+_rlOrtho = _wrap('rlOrtho', None, Double, Double, Double, Double, Double, Double)
+_rlViewport = _wrap('rlViewport', None, Int, Int, Int, Int)
+_rlBegin = _wrap('rlBegin', None, Int)
+_rlEnd = _wrap('rlEnd', None)
+_rlVertex2i = _wrap('rlVertex2i', None, Int, Int)
+_rlVertex2f = _wrap('rlVertex2f', None, Float, Float)
+_rlVertex3f = _wrap('rlVertex3f', None, Float, Float, Float)
+_rlTexCoord2f = _wrap('rlTexCoord2f', None, Float, Float)
+_rlNormal3f = _wrap('rlNormal3f', None, Float, Float, Float)
+_rlColor4ub = _wrap('rlColor4ub', None, UChar, UChar, UChar, UChar)
+_rlColor3f = _wrap('rlColor3f', None, Float, Float, Float)
+_rlColor4f = _wrap('rlColor4f', None, Float, Float, Float, Float)
+_rlEnableVertexArray = _wrap('rlEnableVertexArray', Bool, UInt)
+_rlDisableVertexArray = _wrap('rlDisableVertexArray', None)
+_rlEnableVertexBuffer = _wrap('rlEnableVertexBuffer', None, UInt)
+_rlDisableVertexBuffer = _wrap('rlDisableVertexBuffer', None)
+_rlEnableVertexBufferElement = _wrap('rlEnableVertexBufferElement', None, UInt)
+_rlDisableVertexBufferElement = _wrap('rlDisableVertexBufferElement', None)
+_rlEnableVertexAttribute = _wrap('rlEnableVertexAttribute', None, UInt)
+_rlDisableVertexAttribute = _wrap('rlDisableVertexAttribute', None, UInt)
+_rlActiveTextureSlot = _wrap('rlActiveTextureSlot', None, Int)
+_rlEnableTexture = _wrap('rlEnableTexture', None, UInt)
+_rlDisableTexture = _wrap('rlDisableTexture', None)
+_rlEnableTextureCubemap = _wrap('rlEnableTextureCubemap', None, UInt)
+_rlDisableTextureCubemap = _wrap('rlDisableTextureCubemap', None)
+_rlTextureParameters = _wrap('rlTextureParameters', None, UInt, Int, Int)
+_rlCubemapParameters = _wrap('rlCubemapParameters', None, UInt, Int, Int)
+_rlEnableShader = _wrap('rlEnableShader', None, UInt)
+_rlDisableShader = _wrap('rlDisableShader', None)
+_rlEnableFramebuffer = _wrap('rlEnableFramebuffer', None, UInt)
+_rlDisableFramebuffer = _wrap('rlDisableFramebuffer', None)
+_rlActiveDrawBuffers = _wrap('rlActiveDrawBuffers', None, Int)
+_rlBlitFramebuffer = _wrap('rlBlitFramebuffer', None, Int, Int, Int, Int, Int, Int, Int, Int, Int)
+_rlEnableColorBlend = _wrap('rlEnableColorBlend', None)
+_rlDisableColorBlend = _wrap('rlDisableColorBlend', None)
+_rlEnableDepthTest = _wrap('rlEnableDepthTest', None)
+_rlDisableDepthTest = _wrap('rlDisableDepthTest', None)
+_rlEnableDepthMask = _wrap('rlEnableDepthMask', None)
+_rlDisableDepthMask = _wrap('rlDisableDepthMask', None)
+_rlEnableBackfaceCulling = _wrap('rlEnableBackfaceCulling', None)
+_rlDisableBackfaceCulling = _wrap('rlDisableBackfaceCulling', None)
+_rlSetCullFace = _wrap('rlSetCullFace', None, Int)
+_rlEnableScissorTest = _wrap('rlEnableScissorTest', None)
+_rlDisableScissorTest = _wrap('rlDisableScissorTest', None)
+_rlScissor = _wrap('rlScissor', None, Int, Int, Int, Int)
+_rlEnableWireMode = _wrap('rlEnableWireMode', None)
+_rlEnablePointMode = _wrap('rlEnablePointMode', None)
+_rlDisableWireMode = _wrap('rlDisableWireMode', None)
+_rlSetLineWidth = _wrap('rlSetLineWidth', None, Float)
+_rlGetLineWidth = _wrap('rlGetLineWidth', Float)
+_rlEnableSmoothLines = _wrap('rlEnableSmoothLines', None)
+_rlDisableSmoothLines = _wrap('rlDisableSmoothLines', None)
+_rlEnableStereoRender = _wrap('rlEnableStereoRender', None)
+_rlDisableStereoRender = _wrap('rlDisableStereoRender', None)
+_rlIsStereoRenderEnabled = _wrap('rlIsStereoRenderEnabled', Bool)
+_rlClearColor = _wrap('rlClearColor', None, UChar, UChar, UChar, UChar)
+_rlClearScreenBuffers = _wrap('rlClearScreenBuffers', None)
+_rlCheckErrors = _wrap('rlCheckErrors', None)
+_rlSetBlendMode = _wrap('rlSetBlendMode', None, Int)
+_rlSetBlendFactors = _wrap('rlSetBlendFactors', None, Int, Int, Int)
+_rlSetBlendFactorsSeparate = _wrap('rlSetBlendFactorsSeparate', None, Int, Int, Int, Int, Int, Int)
+_rlglInit = _wrap('rlglInit', None, Int, Int)
+_rlglClose = _wrap('rlglClose', None)
+_rlLoadExtensions = _wrap('rlLoadExtensions', None, VoidPtr)
+_rlGetVersion = _wrap('rlGetVersion', Int)
+_rlSetFramebufferWidth = _wrap('rlSetFramebufferWidth', None, Int)
+_rlGetFramebufferWidth = _wrap('rlGetFramebufferWidth', Int)
+_rlSetFramebufferHeight = _wrap('rlSetFramebufferHeight', None, Int)
+_rlGetFramebufferHeight = _wrap('rlGetFramebufferHeight', Int)
+_rlGetTextureIdDefault = _wrap('rlGetTextureIdDefault', UInt)
+_rlGetShaderIdDefault = _wrap('rlGetShaderIdDefault', UInt)
+_rlGetShaderLocsDefault = _wrap('rlGetShaderLocsDefault', IntPtr)
+_rlLoadRenderBatch = _wrap('rlLoadRenderBatch', rlRenderBatch, Int, Int)
+_rlUnloadRenderBatch = _wrap('rlUnloadRenderBatch', None, rlRenderBatch)
+_rlDrawRenderBatch = _wrap('rlDrawRenderBatch', None, rlRenderBatchPtr)
+_rlSetRenderBatchActive = _wrap('rlSetRenderBatchActive', None, rlRenderBatchPtr)
+_rlDrawRenderBatchActive = _wrap('rlDrawRenderBatchActive', None)
+_rlCheckRenderBatchLimit = _wrap('rlCheckRenderBatchLimit', Bool, Int)
+_rlSetTexture = _wrap('rlSetTexture', None, UInt)
+_rlLoadVertexArray = _wrap('rlLoadVertexArray', UInt)
+_rlLoadVertexBuffer = _wrap('rlLoadVertexBuffer', UInt, VoidPtr, Int, Bool)
+_rlLoadVertexBufferElement = _wrap('rlLoadVertexBufferElement', UInt, VoidPtr, Int, Bool)
+_rlUpdateVertexBuffer = _wrap('rlUpdateVertexBuffer', None, UInt, VoidPtr, Int, Int)
+_rlUpdateVertexBufferElements = _wrap('rlUpdateVertexBufferElements', None, UInt, VoidPtr, Int, Int)
+_rlUnloadVertexArray = _wrap('rlUnloadVertexArray', None, UInt)
+_rlUnloadVertexBuffer = _wrap('rlUnloadVertexBuffer', None, UInt)
+_rlSetVertexAttribute = _wrap('rlSetVertexAttribute', None, UInt, Int, Int, Bool, Int, VoidPtr)
+_rlSetVertexAttributeDivisor = _wrap('rlSetVertexAttributeDivisor', None, UInt, Int)
+_rlSetVertexAttributeDefault = _wrap('rlSetVertexAttributeDefault', None, Int, VoidPtr, Int, Int)
+_rlDrawVertexArray = _wrap('rlDrawVertexArray', None, Int, Int)
+_rlDrawVertexArrayElements = _wrap('rlDrawVertexArrayElements', None, Int, Int, VoidPtr)
+_rlDrawVertexArrayInstanced = _wrap('rlDrawVertexArrayInstanced', None, Int, Int, Int)
+_rlDrawVertexArrayElementsInstanced = _wrap('rlDrawVertexArrayElementsInstanced', None, Int, Int, VoidPtr, Int)
+_rlLoadTexture = _wrap('rlLoadTexture', UInt, VoidPtr, Int, Int, Int, Int)
+_rlLoadTextureDepth = _wrap('rlLoadTextureDepth', UInt, Int, Int, Bool)
+_rlLoadTextureCubemap = _wrap('rlLoadTextureCubemap', UInt, VoidPtr, Int, Int)
+_rlUpdateTexture = _wrap('rlUpdateTexture', None, UInt, Int, Int, Int, Int, Int, VoidPtr)
+_rlGetGlTextureFormats = _wrap('rlGetGlTextureFormats', None, Int, UIntPtr, UIntPtr, UIntPtr)
+_rlGetPixelFormatName = _wrap('rlGetPixelFormatName', CharPtr, UInt)
+_rlUnloadTexture = _wrap('rlUnloadTexture', None, UInt)
+_rlGenTextureMipmaps = _wrap('rlGenTextureMipmaps', None, UInt, Int, Int, Int, IntPtr)
+_rlReadTexturePixels = _wrap('rlReadTexturePixels', VoidPtr, UInt, Int, Int, Int)
+_rlReadScreenPixels = _wrap('rlReadScreenPixels', UCharPtr, Int, Int)
+_rlLoadFramebuffer = _wrap('rlLoadFramebuffer', UInt, Int, Int)
+_rlFramebufferAttach = _wrap('rlFramebufferAttach', None, UInt, UInt, Int, Int, Int)
+_rlFramebufferComplete = _wrap('rlFramebufferComplete', Bool, UInt)
+_rlUnloadFramebuffer = _wrap('rlUnloadFramebuffer', None, UInt)
+_rlLoadShaderCode = _wrap('rlLoadShaderCode', UInt, CharPtr, CharPtr)
+_rlCompileShader = _wrap('rlCompileShader', UInt, CharPtr, Int)
+_rlLoadShaderProgram = _wrap('rlLoadShaderProgram', UInt, UInt, UInt)
+_rlUnloadShaderProgram = _wrap('rlUnloadShaderProgram', None, UInt)
+_rlGetLocationUniform = _wrap('rlGetLocationUniform', Int, UInt, CharPtr)
+_rlGetLocationAttrib = _wrap('rlGetLocationAttrib', Int, UInt, CharPtr)
+_rlSetUniform = _wrap('rlSetUniform', None, Int, VoidPtr, Int, Int)
+_rlSetUniformMatrix = _wrap('rlSetUniformMatrix', None, Int, Matrix)
+_rlSetUniformSampler = _wrap('rlSetUniformSampler', None, Int, UInt)
+_rlSetShader = _wrap('rlSetShader', None, UInt, IntPtr)
+_rlLoadComputeShaderProgram = _wrap('rlLoadComputeShaderProgram', UInt, UInt)
+_rlComputeShaderDispatch = _wrap('rlComputeShaderDispatch', None, UInt, UInt, UInt)
+_rlLoadShaderBuffer = _wrap('rlLoadShaderBuffer', UInt, UInt, VoidPtr, Int)
+_rlUnloadShaderBuffer = _wrap('rlUnloadShaderBuffer', None, UInt)
+_rlUpdateShaderBuffer = _wrap('rlUpdateShaderBuffer', None, UInt, VoidPtr, UInt, UInt)
+_rlBindShaderBuffer = _wrap('rlBindShaderBuffer', None, UInt, UInt)
+_rlReadShaderBuffer = _wrap('rlReadShaderBuffer', None, UInt, VoidPtr, UInt, UInt)
+_rlCopyShaderBuffer = _wrap('rlCopyShaderBuffer', None, UInt, UInt, UInt, UInt, UInt)
+_rlGetShaderBufferSize = _wrap('rlGetShaderBufferSize', UInt, UInt)
+_rlBindImageTexture = _wrap('rlBindImageTexture', None, UInt, UInt, Int, Bool)
+_rlGetMatrixModelview = _wrap('rlGetMatrixModelview', Matrix)
+_rlGetMatrixProjection = _wrap('rlGetMatrixProjection', Matrix)
+_rlGetMatrixTransform = _wrap('rlGetMatrixTransform', Matrix)
+_rlGetMatrixProjectionStereo = _wrap('rlGetMatrixProjectionStereo', Matrix, Int)
+_rlGetMatrixViewOffsetStereo = _wrap('rlGetMatrixViewOffsetStereo', Matrix, Int)
+_rlSetMatrixProjection = _wrap('rlSetMatrixProjection', None, Matrix)
+_rlSetMatrixModelview = _wrap('rlSetMatrixModelview', None, Matrix)
+_rlSetMatrixProjectionStereo = _wrap('rlSetMatrixProjectionStereo', None, Matrix, Matrix)
+_rlSetMatrixViewOffsetStereo = _wrap('rlSetMatrixViewOffsetStereo', None, Matrix, Matrix)
+_rlLoadDrawCube = _wrap('rlLoadDrawCube', None)
+_rlLoadDrawQuad = _wrap('rlLoadDrawQuad', None)
+
+if os.environ.get('RAYLIBPY_EAGER_BINDING', '0') not in ('', '0'):
+    bind_all_symbols()
+
+if os.environ.get('RAYLIBPY_MATH_BACKEND', 'raymath') not in ('', 'raymath'):
+    set_math_backend(os.environ['RAYLIBPY_MATH_BACKEND'])
 
 # endregion (internals)
 
@@ -8777,4792 +9652,909 @@ RL_SHADER_LOC_MAP_SPECULAR = RL_SHADER_LOC_MAP_METALNESS
 
 # region FUNCTIONS
 
-# rlapi::raylib
-# ------------------------------------------------------------------------------
-
-def init_window(width, height, title):
-    # type: (int, int, bytes | str | None) -> None
-    """Initialize window and OpenGL context"""
-    _InitWindow(_int(width), _int(height), _str_in(title))
-
-
-def close_window():
-    # type: () -> None
-    """Close window and unload OpenGL context"""
-    _CloseWindow()
-
-
-def window_should_close():
-    # type: () -> bool
-    """Check if application should close (KEY_ESCAPE pressed or windows close icon clicked)"""
-    return _WindowShouldClose()
-
-
-def is_window_ready():
-    # type: () -> bool
-    """Check if window has been initialized successfully"""
-    return _IsWindowReady()
-
-
-def is_window_fullscreen():
-    # type: () -> bool
-    """Check if window is currently fullscreen"""
-    return _IsWindowFullscreen()
-
-
-def is_window_hidden():
-    # type: () -> bool
-    """Check if window is currently hidden (only PLATFORM_DESKTOP)"""
-    return _IsWindowHidden()
-
-
-def is_window_minimized():
-    # type: () -> bool
-    """Check if window is currently minimized (only PLATFORM_DESKTOP)"""
-    return _IsWindowMinimized()
+# The functions are grouped by raylib module in submodules that are only imported
+# the first time one of their names is accessed (see `__getattr__` below).
+_SUBMODULE_EXPORTS = {
+    'core': (
+        'begin_blend_mode',
+        'begin_drawing',
+        'begin_mode2d',
+        'begin_mode3d',
+        'begin_scissor_mode',
+        'begin_shader_mode',
+        'begin_texture_mode',
+        'begin_vr_stereo_mode',
+        'change_directory',
+        'clear_background',
+        'clear_window_state',
+        'close_window',
+        'compress_data',
+        'decode_data_base64',
+        'decompress_data',
+        'directory_exists',
+        'disable_cursor',
+        'disable_event_waiting',
+        'enable_cursor',
+        'enable_event_waiting',
+        'encode_data_base64',
+        'end_blend_mode',
+        'end_drawing',
+        'end_mode2d',
+        'end_mode3d',
+        'end_scissor_mode',
+        'end_shader_mode',
+        'end_texture_mode',
+        'end_vr_stereo_mode',
+        'export_automation_event_list',
+        'export_data_as_code',
+        'file_exists',
+        'get_application_directory',
+        'get_camera_matrix',
+        'get_camera_matrix2d',
+        'get_char_pressed',
+        'get_clipboard_text',
+        'get_current_monitor',
+        'get_directory_path',
+        'get_file_extension',
+        'get_file_length',
+        'get_file_mod_time',
+        'get_file_name',
+        'get_file_name_without_ext',
+        'get_fps',
+        'get_frame_time',
+        'get_gamepad_axis_count',
+        'get_gamepad_axis_movement',
+        'get_gamepad_button_pressed',
+        'get_gamepad_name',
+        'get_gesture_detected',
+        'get_gesture_drag_angle',
+        'get_gesture_drag_vector',
+        'get_gesture_hold_duration',
+        'get_gesture_pinch_angle',
+        'get_gesture_pinch_vector',
+        'get_key_pressed',
+        'get_monitor_count',
+        'get_monitor_height',
+        'get_monitor_name',
+        'get_monitor_physical_height',
+        'get_monitor_physical_width',
+        'get_monitor_position',
+        'get_monitor_refresh_rate',
+        'get_monitor_width',
+        'get_mouse_delta',
+        'get_mouse_position',
+        'get_mouse_ray',
+        'get_mouse_wheel_move',
+        'get_mouse_wheel_move_v',
+        'get_mouse_x',
+        'get_mouse_y',
+        'get_prev_directory_path',
+        'get_random_value',
+        'get_render_height',
+        'get_render_width',
+        'get_screen_height',
+        'get_screen_to_world2d',
+        'get_screen_width',
+        'get_shader_location',
+        'get_shader_location_attrib',
+        'get_time',
+        'get_touch_point_count',
+        'get_touch_point_id',
+        'get_touch_position',
+        'get_touch_x',
+        'get_touch_y',
+        'get_window_handle',
+        'get_window_position',
+        'get_window_scale_dpi',
+        'get_working_directory',
+        'get_world_to_screen',
+        'get_world_to_screen2d',
+        'get_world_to_screen_ex',
+        'hide_cursor',
+        'init_window',
+        'is_cursor_hidden',
+        'is_cursor_on_screen',
+        'is_file_dropped',
+        'is_file_extension',
+        'is_gamepad_available',
+        'is_gamepad_button_down',
+        'is_gamepad_button_pressed',
+        'is_gamepad_button_released',
+        'is_gamepad_button_up',
+        'is_gesture_detected',
+        'is_key_down',
+        'is_key_pressed',
+        'is_key_pressed_repeat',
+        'is_key_released',
+        'is_key_up',
+        'is_mouse_button_down',
+        'is_mouse_button_pressed',
+        'is_mouse_button_released',
+        'is_mouse_button_up',
+        'is_path_file',
+        'is_shader_ready',
+        'is_window_focused',
+        'is_window_fullscreen',
+        'is_window_hidden',
+        'is_window_maximized',
+        'is_window_minimized',
+        'is_window_ready',
+        'is_window_resized',
+        'is_window_state',
+        'load_automation_event_list',
+        'load_directory_files',
+        'load_directory_files_ex',
+        'load_dropped_files',
+        'load_file_data',
+        'load_file_text',
+        'load_random_sequence',
+        'load_shader',
+        'load_shader_from_memory',
+        'load_vr_stereo_config',
+        'maximize_window',
+        'mem_alloc',
+        'mem_free',
+        'mem_realloc',
+        'minimize_window',
+        'open_url',
+        'play_automation_event',
+        'poll_input_events',
+        'restore_window',
+        'save_file_data',
+        'save_file_text',
+        'set_automation_event_base_frame',
+        'set_automation_event_list',
+        'set_clipboard_text',
+        'set_config_flags',
+        'set_exit_key',
+        'set_gamepad_mappings',
+        'set_gestures_enabled',
+        'set_load_file_data_callback',
+        'set_load_file_text_callback',
+        'set_mouse_cursor',
+        'set_mouse_offset',
+        'set_mouse_position',
+        'set_mouse_scale',
+        'set_random_seed',
+        'set_save_file_data_callback',
+        'set_save_file_text_callback',
+        'set_shader_value',
+        'set_shader_value_matrix',
+        'set_shader_value_texture',
+        'set_shader_value_v',
+        'set_target_fps',
+        'set_trace_log_callback',
+        'set_trace_log_level',
+        'set_window_focused',
+        'set_window_icon',
+        'set_window_icons',
+        'set_window_max_size',
+        'set_window_min_size',
+        'set_window_monitor',
+        'set_window_opacity',
+        'set_window_position',
+        'set_window_size',
+        'set_window_state',
+        'set_window_title',
+        'show_cursor',
+        'start_automation_event_recording',
+        'stop_automation_event_recording',
+        'swap_screen_buffer',
+        'take_screenshot',
+        'toggle_borderless_windowed',
+        'toggle_fullscreen',
+        'trace_log',
+        'unload_automation_event_list',
+        'unload_directory_files',
+        'unload_dropped_files',
+        'unload_file_data',
+        'unload_file_text',
+        'unload_random_sequence',
+        'unload_shader',
+        'unload_vr_stereo_config',
+        'update_camera',
+        'update_camera_pro',
+        'wait_time',
+        'window_should_close',
+    ),
+    'shapes': (
+        'check_collision_circle_rec',
+        'check_collision_circles',
+        'check_collision_lines',
+        'check_collision_point_circle',
+        'check_collision_point_line',
+        'check_collision_point_poly',
+        'check_collision_point_rec',
+        'check_collision_point_triangle',
+        'check_collision_recs',
+        'draw_circle',
+        'draw_circle_gradient',
+        'draw_circle_lines',
+        'draw_circle_lines_v',
+        'draw_circle_sector',
+        'draw_circle_sector_lines',
+        'draw_circle_v',
+        'draw_ellipse',
+        'draw_ellipse_lines',
+        'draw_line',
+        'draw_line_bezier',
+        'draw_line_ex',
+        'draw_line_strip',
+        'draw_line_v',
+        'draw_pixel',
+        'draw_pixel_v',
+        'draw_poly',
+        'draw_poly_lines',
+        'draw_poly_lines_ex',
+        'draw_rectangle',
+        'draw_rectangle_gradient_ex',
+        'draw_rectangle_gradient_h',
+        'draw_rectangle_gradient_v',
+        'draw_rectangle_lines',
+        'draw_rectangle_lines_ex',
+        'draw_rectangle_pro',
+        'draw_rectangle_rec',
+        'draw_rectangle_rounded',
+        'draw_rectangle_rounded_lines',
+        'draw_rectangle_v',
+        'draw_ring',
+        'draw_ring_lines',
+        'draw_spline_basis',
+        'draw_spline_bezier_cubic',
+        'draw_spline_bezier_quadratic',
+        'draw_spline_catmull_rom',
+        'draw_spline_linear',
+        'draw_spline_segment_basis',
+        'draw_spline_segment_bezier_cubic',
+        'draw_spline_segment_bezier_quadratic',
+        'draw_spline_segment_catmull_rom',
+        'draw_spline_segment_linear',
+        'draw_triangle',
+        'draw_triangle_fan',
+        'draw_triangle_lines',
+        'draw_triangle_strip',
+        'get_collision_rec',
+        'get_spline_point_basis',
+        'get_spline_point_bezier_cubic',
+        'get_spline_point_bezier_quad',
+        'get_spline_point_catmull_rom',
+        'get_spline_point_linear',
+        'set_shapes_texture',
+    ),
+    'textures': (
+        'color_alpha',
+        'color_alpha_blend',
+        'color_brightness',
+        'color_contrast',
+        'color_from_hsv',
+        'color_from_normalized',
+        'color_normalize',
+        'color_tint',
+        'color_to_hsv',
+        'color_to_int',
+        'draw_texture',
+        'draw_texture_ex',
+        'draw_texture_npatch',
+        'draw_texture_pro',
+        'draw_texture_rec',
+        'draw_texture_v',
+        'export_image',
+        'export_image_as_code',
+        'export_image_to_memory',
+        'fade',
+        'gen_image_cellular',
+        'gen_image_checked',
+        'gen_image_color',
+        'gen_image_gradient_linear',
+        'gen_image_gradient_radial',
+        'gen_image_gradient_square',
+        'gen_image_perlin_noise',
+        'gen_image_text',
+        'gen_image_white_noise',
+        'gen_texture_mipmaps',
+        'get_color',
+        'get_image_alpha_border',
+        'get_image_color',
+        'get_pixel_color',
+        'get_pixel_data_size',
+        'image_alpha_clear',
+        'image_alpha_crop',
+        'image_alpha_mask',
+        'image_alpha_premultiply',
+        'image_blur_gaussian',
+        'image_clear_background',
+        'image_color_brightness',
+        'image_color_contrast',
+        'image_color_grayscale',
+        'image_color_invert',
+        'image_color_replace',
+        'image_color_tint',
+        'image_copy',
+        'image_crop',
+        'image_dither',
+        'image_draw',
+        'image_draw_circle',
+        'image_draw_circle_lines',
+        'image_draw_circle_lines_v',
+        'image_draw_circle_v',
+        'image_draw_line',
+        'image_draw_line_v',
+        'image_draw_pixel',
+        'image_draw_pixel_v',
+        'image_draw_rectangle',
+        'image_draw_rectangle_lines',
+        'image_draw_rectangle_rec',
+        'image_draw_rectangle_v',
+        'image_draw_text',
+        'image_draw_text_ex',
+        'image_flip_horizontal',
+        'image_flip_vertical',
+        'image_format',
+        'image_from_image',
+        'image_mipmaps',
+        'image_resize',
+        'image_resize_canvas',
+        'image_resize_nn',
+        'image_rotate',
+        'image_rotate_ccw',
+        'image_rotate_cw',
+        'image_text',
+        'image_text_ex',
+        'image_to_pot',
+        'is_image_ready',
+        'is_render_texture_ready',
+        'is_texture_ready',
+        'load_image',
+        'load_image_anim',
+        'load_image_colors',
+        'load_image_from_memory',
+        'load_image_from_screen',
+        'load_image_from_texture',
+        'load_image_palette',
+        'load_image_raw',
+        'load_image_svg',
+        'load_render_texture',
+        'load_texture',
+        'load_texture_cubemap',
+        'load_texture_from_image',
+        'set_pixel_color',
+        'set_texture_filter',
+        'set_texture_wrap',
+        'unload_image',
+        'unload_image_colors',
+        'unload_image_palette',
+        'unload_render_texture',
+        'unload_texture',
+        'update_texture',
+        'update_texture_rec',
+    ),
+    'text': (
+        'codepoint_to_utf8',
+        'draw_fps',
+        'draw_text',
+        'draw_text_codepoint',
+        'draw_text_codepoints',
+        'draw_text_ex',
+        'draw_text_pro',
+        'export_font_as_code',
+        'gen_image_font_atlas',
+        'get_codepoint',
+        'get_codepoint_count',
+        'get_codepoint_next',
+        'get_codepoint_previous',
+        'get_font_default',
+        'get_glyph_atlas_rec',
+        'get_glyph_index',
+        'get_glyph_info',
+        'is_font_ready',
+        'load_codepoints',
+        'load_font',
+        'load_font_data',
+        'load_font_ex',
+        'load_font_from_image',
+        'load_font_from_memory',
+        'load_utf8',
+        'measure_text',
+        'measure_text_ex',
+        'set_text_line_spacing',
+        'text_append',
+        'text_copy',
+        'text_find_index',
+        'text_format',
+        'text_insert',
+        'text_is_equal',
+        'text_join',
+        'text_length',
+        'text_replace',
+        'text_split',
+        'text_subtext',
+        'text_to_integer',
+        'text_to_lower',
+        'text_to_pascal',
+        'text_to_upper',
+        'unload_codepoints',
+        'unload_font',
+        'unload_font_data',
+        'unload_utf8',
+    ),
+    'models': (
+        'check_collision_box_sphere',
+        'check_collision_boxes',
+        'check_collision_spheres',
+        'draw_billboard',
+        'draw_billboard_pro',
+        'draw_billboard_rec',
+        'draw_bounding_box',
+        'draw_capsule',
+        'draw_capsule_wires',
+        'draw_circle3d',
+        'draw_cube',
+        'draw_cube_v',
+        'draw_cube_wires',
+        'draw_cube_wires_v',
+        'draw_cylinder',
+        'draw_cylinder_ex',
+        'draw_cylinder_wires',
+        'draw_cylinder_wires_ex',
+        'draw_grid',
+        'draw_line3d',
+        'draw_mesh',
+        'draw_mesh_instanced',
+        'draw_model',
+        'draw_model_ex',
+        'draw_model_wires',
+        'draw_model_wires_ex',
+        'draw_plane',
+        'draw_point3d',
+        'draw_ray',
+        'draw_sphere',
+        'draw_sphere_ex',
+        'draw_sphere_wires',
+        'draw_triangle3d',
+        'draw_triangle_strip3d',
+        'export_mesh',
+        'gen_mesh_cone',
+        'gen_mesh_cube',
+        'gen_mesh_cubicmap',
+        'gen_mesh_cylinder',
+        'gen_mesh_heightmap',
+        'gen_mesh_hemi_sphere',
+        'gen_mesh_knot',
+        'gen_mesh_plane',
+        'gen_mesh_poly',
+        'gen_mesh_sphere',
+        'gen_mesh_tangents',
+        'gen_mesh_torus',
+        'get_mesh_bounding_box',
+        'get_model_bounding_box',
+        'get_ray_collision_box',
+        'get_ray_collision_mesh',
+        'get_ray_collision_quad',
+        'get_ray_collision_sphere',
+        'get_ray_collision_triangle',
+        'is_material_ready',
+        'is_model_animation_valid',
+        'is_model_ready',
+        'load_material_default',
+        'load_materials',
+        'load_model',
+        'load_model_animations',
+        'load_model_from_mesh',
+        'set_material_texture',
+        'set_model_mesh_material',
+        'unload_material',
+        'unload_mesh',
+        'unload_model',
+        'unload_model_animation',
+        'unload_model_animations',
+        'update_mesh_buffer',
+        'update_model_animation',
+        'upload_mesh',
+    ),
+    'audio': (
+        'attach_audio_mixed_processor',
+        'attach_audio_stream_processor',
+        'close_audio_device',
+        'detach_audio_mixed_processor',
+        'detach_audio_stream_processor',
+        'export_wave',
+        'export_wave_as_code',
+        'get_master_volume',
+        'get_music_time_length',
+        'get_music_time_played',
+        'init_audio_device',
+        'is_audio_device_ready',
+        'is_audio_stream_playing',
+        'is_audio_stream_processed',
+        'is_audio_stream_ready',
+        'is_music_ready',
+        'is_music_stream_playing',
+        'is_sound_playing',
+        'is_sound_ready',
+        'is_wave_ready',
+        'load_audio_stream',
+        'load_music_stream',
+        'load_music_stream_from_memory',
+        'load_sound',
+        'load_sound_alias',
+        'load_sound_from_wave',
+        'load_wave',
+        'load_wave_from_memory',
+        'load_wave_samples',
+        'pause_audio_stream',
+        'pause_music_stream',
+        'pause_sound',
+        'play_audio_stream',
+        'play_music_stream',
+        'play_sound',
+        'resume_audio_stream',
+        'resume_music_stream',
+        'resume_sound',
+        'seek_music_stream',
+        'set_audio_stream_buffer_size_default',
+        'set_audio_stream_callback',
+        'set_audio_stream_pan',
+        'set_audio_stream_pitch',
+        'set_audio_stream_volume',
+        'set_master_volume',
+        'set_music_pan',
+        'set_music_pitch',
+        'set_music_volume',
+        'set_sound_pan',
+        'set_sound_pitch',
+        'set_sound_volume',
+        'stop_audio_stream',
+        'stop_music_stream',
+        'stop_sound',
+        'unload_audio_stream',
+        'unload_music_stream',
+        'unload_sound',
+        'unload_sound_alias',
+        'unload_wave',
+        'unload_wave_samples',
+        'update_audio_stream',
+        'update_music_stream',
+        'update_sound',
+        'wave_copy',
+        'wave_crop',
+        'wave_format',
+    ),
+    'raymath': (
+        'clamp',
+        'float_equals',
+        'lerp',
+        'matrix_add',
+        'matrix_determinant',
+        'matrix_frustum',
+        'matrix_identity',
+        'matrix_invert',
+        'matrix_look_at',
+        'matrix_multiply',
+        'matrix_ortho',
+        'matrix_perspective',
+        'matrix_rotate',
+        'matrix_rotate_x',
+        'matrix_rotate_xyz',
+        'matrix_rotate_y',
+        'matrix_rotate_z',
+        'matrix_rotate_zyx',
+        'matrix_scale',
+        'matrix_subtract',
+        'matrix_to_float_v',
+        'matrix_trace',
+        'matrix_translate',
+        'matrix_transpose',
+        'normalize',
+        'quaternion_add',
+        'quaternion_add_value',
+        'quaternion_divide',
+        'quaternion_equals',
+        'quaternion_from_axis_angle',
+        'quaternion_from_euler',
+        'quaternion_from_matrix',
+        'quaternion_from_vector3_to_vector3',
+        'quaternion_identity',
+        'quaternion_invert',
+        'quaternion_length',
+        'quaternion_lerp',
+        'quaternion_multiply',
+        'quaternion_nlerp',
+        'quaternion_normalize',
+        'quaternion_scale',
+        'quaternion_slerp',
+        'quaternion_subtract',
+        'quaternion_subtract_value',
+        'quaternion_to_axis_angle',
+        'quaternion_to_euler',
+        'quaternion_to_matrix',
+        'quaternion_transform',
+        'remap',
+        'vector2_add',
+        'vector2_add_value',
+        'vector2_angle',
+        'vector2_clamp',
+        'vector2_clamp_value',
+        'vector2_distance',
+        'vector2_distance_sqr',
+        'vector2_divide',
+        'vector2_dot_product',
+        'vector2_equals',
+        'vector2_invert',
+        'vector2_length',
+        'vector2_length_sqr',
+        'vector2_lerp',
+        'vector2_line_angle',
+        'vector2_move_towards',
+        'vector2_multiply',
+        'vector2_negate',
+        'vector2_normalize',
+        'vector2_one',
+        'vector2_reflect',
+        'vector2_rotate',
+        'vector2_scale',
+        'vector2_subtract',
+        'vector2_subtract_value',
+        'vector2_transform',
+        'vector2_zero',
+        'vector3_add',
+        'vector3_add_value',
+        'vector3_angle',
+        'vector3_barycenter',
+        'vector3_clamp',
+        'vector3_clamp_value',
+        'vector3_cross_product',
+        'vector3_distance',
+        'vector3_distance_sqr',
+        'vector3_divide',
+        'vector3_dot_product',
+        'vector3_equals',
+        'vector3_invert',
+        'vector3_length',
+        'vector3_length_sqr',
+        'vector3_lerp',
+        'vector3_max',
+        'vector3_min',
+        'vector3_multiply',
+        'vector3_negate',
+        'vector3_normalize',
+        'vector3_one',
+        'vector3_ortho_normalize',
+        'vector3_perpendicular',
+        'vector3_project',
+        'vector3_reflect',
+        'vector3_refract',
+        'vector3_reject',
+        'vector3_rotate_by_axis_angle',
+        'vector3_rotate_by_quaternion',
+        'vector3_scale',
+        'vector3_subtract',
+        'vector3_subtract_value',
+        'vector3_to_float_v',
+        'vector3_transform',
+        'vector3_unproject',
+        'vector3_zero',
+        'wrap',
+    ),
+    'batch': (
+        'matrix_multiply_batch',
+        'quaternion_slerp_batch',
+        'vector3_transform_batch',
+    ),
+    'rlgl': (
+        'rl_active_draw_buffers',
+        'rl_active_texture_slot',
+        'rl_begin',
+        'rl_bind_image_texture',
+        'rl_bind_shader_buffer',
+        'rl_blit_framebuffer',
+        'rl_check_errors',
+        'rl_check_render_batch_limit',
+        'rl_clear_color',
+        'rl_clear_screen_buffers',
+        'rl_color_3ff',
+        'rl_color_4_uub',
+        'rl_color_4ff',
+        'rl_compile_shader',
+        'rl_compute_shader_dispatch',
+        'rl_copy_shader_buffer',
+        'rl_cubemap_parameters',
+        'rl_disable_backface_culling',
+        'rl_disable_color_blend',
+        'rl_disable_depth_mask',
+        'rl_disable_depth_test',
+        'rl_disable_framebuffer',
+        'rl_disable_scissor_test',
+        'rl_disable_shader',
+        'rl_disable_smooth_lines',
+        'rl_disable_stereo_render',
+        'rl_disable_texture',
+        'rl_disable_texture_cubemap',
+        'rl_disable_vertex_array',
+        'rl_disable_vertex_attribute',
+        'rl_disable_vertex_buffer',
+        'rl_disable_vertex_buffer_element',
+        'rl_disable_wire_mode',
+        'rl_draw_render_batch',
+        'rl_draw_render_batch_active',
+        'rl_draw_vertex_array',
+        'rl_draw_vertex_array_elements',
+        'rl_draw_vertex_array_elements_instanced',
+        'rl_draw_vertex_array_instanced',
+        'rl_enable_backface_culling',
+        'rl_enable_color_blend',
+        'rl_enable_depth_mask',
+        'rl_enable_depth_test',
+        'rl_enable_framebuffer',
+        'rl_enable_point_mode',
+        'rl_enable_scissor_test',
+        'rl_enable_shader',
+        'rl_enable_smooth_lines',
+        'rl_enable_stereo_render',
+        'rl_enable_texture',
+        'rl_enable_texture_cubemap',
+        'rl_enable_vertex_array',
+        'rl_enable_vertex_attribute',
+        'rl_enable_vertex_buffer',
+        'rl_enable_vertex_buffer_element',
+        'rl_enable_wire_mode',
+        'rl_end',
+        'rl_framebuffer_attach',
+        'rl_framebuffer_complete',
+        'rl_frustum',
+        'rl_gen_texture_mipmaps',
+        'rl_get_framebuffer_height',
+        'rl_get_framebuffer_width',
+        'rl_get_gl_texture_formats',
+        'rl_get_line_width',
+        'rl_get_location_attrib',
+        'rl_get_location_uniform',
+        'rl_get_matrix_modelview',
+        'rl_get_matrix_projection',
+        'rl_get_matrix_projection_stereo',
+        'rl_get_matrix_transform',
+        'rl_get_matrix_view_offset_stereo',
+        'rl_get_pixel_format_name',
+        'rl_get_shader_buffer_size',
+        'rl_get_shader_id_default',
+        'rl_get_shader_locs_default',
+        'rl_get_texture_id_default',
+        'rl_get_version',
+        'rl_is_stereo_render_enabled',
+        'rl_load_compute_shader_program',
+        'rl_load_draw_cube',
+        'rl_load_draw_quad',
+        'rl_load_extensions',
+        'rl_load_framebuffer',
+        'rl_load_identity',
+        'rl_load_render_batch',
+        'rl_load_shader_buffer',
+        'rl_load_shader_code',
+        'rl_load_shader_program',
+        'rl_load_texture',
+        'rl_load_texture_cubemap',
+        'rl_load_texture_depth',
+        'rl_load_vertex_array',
+        'rl_load_vertex_buffer',
+        'rl_load_vertex_buffer_element',
+        'rl_matrix_mode',
+        'rl_mult_matrixf',
+        'rl_normal_3ff',
+        'rl_ortho',
+        'rl_pop_matrix',
+        'rl_push_matrix',
+        'rl_read_screen_pixels',
+        'rl_read_shader_buffer',
+        'rl_read_texture_pixels',
+        'rl_rotatef',
+        'rl_scalef',
+        'rl_scissor',
+        'rl_set_blend_factors',
+        'rl_set_blend_factors_separate',
+        'rl_set_blend_mode',
+        'rl_set_cull_face',
+        'rl_set_framebuffer_height',
+        'rl_set_framebuffer_width',
+        'rl_set_line_width',
+        'rl_set_matrix_modelview',
+        'rl_set_matrix_projection',
+        'rl_set_matrix_projection_stereo',
+        'rl_set_matrix_view_offset_stereo',
+        'rl_set_render_batch_active',
+        'rl_set_shader',
+        'rl_set_texture',
+        'rl_set_uniform',
+        'rl_set_uniform_matrix',
+        'rl_set_uniform_sampler',
+        'rl_set_vertex_attribute',
+        'rl_set_vertex_attribute_default',
+        'rl_set_vertex_attribute_divisor',
+        'rl_tex_coord_2ff',
+        'rl_texture_parameters',
+        'rl_translatef',
+        'rl_unload_framebuffer',
+        'rl_unload_render_batch',
+        'rl_unload_shader_buffer',
+        'rl_unload_shader_program',
+        'rl_unload_texture',
+        'rl_unload_vertex_array',
+        'rl_unload_vertex_buffer',
+        'rl_update_shader_buffer',
+        'rl_update_texture',
+        'rl_update_vertex_buffer',
+        'rl_update_vertex_buffer_elements',
+        'rl_vertex_2ff',
+        'rl_vertex_2ii',
+        'rl_vertex_3ff',
+        'rl_viewport',
+        'rlgl_close',
+        'rlgl_init',
+    ),
+    'streaming': (
+        'MusicStreamer',
+        'StreamingAudioSource',
+        'StreamingTexture',
+    ),
+    'sprites': (
+        'SpriteBatch',
+        'draw_circles',
+        'draw_lines',
+        'draw_rectangles',
+        'sprite_vertices',
+    ),
+    'profiler': (
+        'disable_profiler',
+        'draw_profiler_overlay',
+        'enable_profiler',
+        'get_profiler_frame_count',
+        'get_profiler_stats',
+        'is_profiler_enabled',
+        'reset_profiler',
+    ),
+    'processors': (
+        'AudioProcessor',
+    ),
+    'mixer': (
+        'SoundMixer',
+    ),
+    'loader': (
+        'AssetLoader',
+    ),
+    'cache': (
+        'ResourceCache',
+    ),
+    'tracker': (
+        'disable_resource_tracking',
+        'enable_resource_tracking',
+        'format_resource_report',
+        'get_live_resources',
+        'get_resource_report',
+        'is_resource_tracking_enabled',
+        'release_finalized_resources',
+    ),
+    'pack': (
+        'AssetPack',
+        'AssetPackBuilder',
+    ),
+    'imagecache': (
+        'ImageCache',
+    ),
+}
 
+_lazy_exports = {name: submodule for submodule, names in _SUBMODULE_EXPORTS.items() for name in names}
 
-def is_window_maximized():
-    # type: () -> bool
-    """Check if window is currently maximized (only PLATFORM_DESKTOP)"""
-    return _IsWindowMaximized()
 
+def __getattr__(name):
+    """Imports the submodule defining `name` and returns it (PEP 562)"""
+    submodule = _lazy_exports.get(name)
+    if submodule is None:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    module = importlib.import_module('.' + submodule, __name__)
+    globals().update((export, getattr(module, export)) for export in module.__all__)
+    return globals()[name]
 
-def is_window_focused():
-    # type: () -> bool
-    """Check if window is currently focused (only PLATFORM_DESKTOP)"""
-    return _IsWindowFocused()
 
-
-def is_window_resized():
-    # type: () -> bool
-    """Check if window has been resized last frame"""
-    return _IsWindowResized()
-
-
-def is_window_state(flag):
-    # type: (int) -> bool
-    """Check if one specific window flag is enabled"""
-    return _IsWindowState(_int(flag))
-
-
-def set_window_state(flags):
-    # type: (int) -> None
-    """Set window configuration state using flags (only PLATFORM_DESKTOP)"""
-    _SetWindowState(_int(flags))
-
-
-def clear_window_state(flags):
-    # type: (int) -> None
-    """Clear window configuration state flags"""
-    _ClearWindowState(_int(flags))
-
-
-def toggle_fullscreen():
-    # type: () -> None
-    """Toggle window state: fullscreen/windowed (only PLATFORM_DESKTOP)"""
-    _ToggleFullscreen()
-
-
-def toggle_borderless_windowed():
-    # type: () -> None
-    """Toggle window state: borderless windowed (only PLATFORM_DESKTOP)"""
-    _ToggleBorderlessWindowed()
-
-
-def maximize_window():
-    # type: () -> None
-    """Set window state: maximized, if resizable (only PLATFORM_DESKTOP)"""
-    _MaximizeWindow()
-
-
-def minimize_window():
-    # type: () -> None
-    """Set window state: minimized, if resizable (only PLATFORM_DESKTOP)"""
-    _MinimizeWindow()
-
-
-def restore_window():
-    # type: () -> None
-    """Set window state: not minimized/maximized (only PLATFORM_DESKTOP)"""
-    _RestoreWindow()
-
-
-def set_window_icon(image):
-    # type: (Image) -> None
-    """Set icon for window (single image, RGBA 32bit, only PLATFORM_DESKTOP)"""
-    _SetWindowIcon(image)
-
-
-def set_window_icons(images, count):
-    # type: (ImagePtr, int) -> None
-    """Set icon for window (multiple images, RGBA 32bit, only PLATFORM_DESKTOP)"""
-    _SetWindowIcons(images, _int(count))
-
-
-def set_window_title(title):
-    # type: (bytes | str | None) -> None
-    """Set title for window (only PLATFORM_DESKTOP and PLATFORM_WEB)"""
-    _SetWindowTitle(_str_in(title))
-
-
-def set_window_position(x, y):
-    # type: (int, int) -> None
-    """Set window position on screen (only PLATFORM_DESKTOP)"""
-    _SetWindowPosition(_int(x), _int(y))
-
-
-def set_window_monitor(monitor):
-    # type: (int) -> None
-    """Set monitor for the current window"""
-    _SetWindowMonitor(_int(monitor))
-
-
-def set_window_min_size(width, height):
-    # type: (int, int) -> None
-    """Set window minimum dimensions (for FLAG_WINDOW_RESIZABLE)"""
-    _SetWindowMinSize(_int(width), _int(height))
-
-
-def set_window_max_size(width, height):
-    # type: (int, int) -> None
-    """Set window maximum dimensions (for FLAG_WINDOW_RESIZABLE)"""
-    _SetWindowMaxSize(_int(width), _int(height))
-
-
-def set_window_size(width, height):
-    # type: (int, int) -> None
-    """Set window dimensions"""
-    _SetWindowSize(_int(width), _int(height))
-
-
-def set_window_opacity(opacity):
-    # type: (float) -> None
-    """Set window opacity [0.0f..1.0f] (only PLATFORM_DESKTOP)"""
-    _SetWindowOpacity(_float(opacity))
-
-
-def set_window_focused():
-    # type: () -> None
-    """Set window focused (only PLATFORM_DESKTOP)"""
-    _SetWindowFocused()
-
-
-def get_window_handle():
-    # type: () -> bytes | str | None
-    """Get native window handle"""
-    return _GetWindowHandle()
-
-
-def get_screen_width():
-    # type: () -> int
-    """Get current screen width"""
-    return _GetScreenWidth()
-
-
-def get_screen_height():
-    # type: () -> int
-    """Get current screen height"""
-    return _GetScreenHeight()
-
-
-def get_render_width():
-    # type: () -> int
-    """Get current render width (it considers HiDPI)"""
-    return _GetRenderWidth()
-
-
-def get_render_height():
-    # type: () -> int
-    """Get current render height (it considers HiDPI)"""
-    return _GetRenderHeight()
-
-
-def get_monitor_count():
-    # type: () -> int
-    """Get number of connected monitors"""
-    return _GetMonitorCount()
-
-
-def get_current_monitor():
-    # type: () -> int
-    """Get current connected monitor"""
-    return _GetCurrentMonitor()
-
-
-def get_monitor_position(monitor):
-    # type: (int) -> Vector2
-    """Get specified monitor position"""
-    return _GetMonitorPosition(_int(monitor))
-
-
-def get_monitor_width(monitor):
-    # type: (int) -> int
-    """Get specified monitor width (current video mode used by monitor)"""
-    return _GetMonitorWidth(_int(monitor))
-
-
-def get_monitor_height(monitor):
-    # type: (int) -> int
-    """Get specified monitor height (current video mode used by monitor)"""
-    return _GetMonitorHeight(_int(monitor))
-
-
-def get_monitor_physical_width(monitor):
-    # type: (int) -> int
-    """Get specified monitor physical width in millimetres"""
-    return _GetMonitorPhysicalWidth(_int(monitor))
-
-
-def get_monitor_physical_height(monitor):
-    # type: (int) -> int
-    """Get specified monitor physical height in millimetres"""
-    return _GetMonitorPhysicalHeight(_int(monitor))
-
-
-def get_monitor_refresh_rate(monitor):
-    # type: (int) -> int
-    """Get specified monitor refresh rate"""
-    return _GetMonitorRefreshRate(_int(monitor))
-
-
-def get_window_position():
-    # type: () -> Vector2
-    """Get window position XY on monitor"""
-    return _GetWindowPosition()
-
-
-def get_window_scale_dpi():
-    # type: () -> Vector2
-    """Get window scale DPI factor"""
-    return _GetWindowScaleDPI()
-
-
-def get_monitor_name(monitor):
-    # type: (int) -> bytes | str | None
-    """Get the human-readable, UTF-8 encoded name of the specified monitor"""
-    return _str_out(_GetMonitorName(_int(monitor)))
-
-
-def set_clipboard_text(text):
-    # type: (bytes | str | None) -> None
-    """Set clipboard text content"""
-    _SetClipboardText(_str_in(text))
-
-
-def get_clipboard_text():
-    # type: () -> bytes | str | None
-    """Get clipboard text content"""
-    return _str_out(_GetClipboardText())
-
-
-def enable_event_waiting():
-    # type: () -> None
-    """Enable waiting for events on EndDrawing(), no automatic event polling"""
-    _EnableEventWaiting()
-
-
-def disable_event_waiting():
-    # type: () -> None
-    """Disable waiting for events on EndDrawing(), automatic events polling"""
-    _DisableEventWaiting()
-
-
-def show_cursor():
-    # type: () -> None
-    """Shows cursor"""
-    _ShowCursor()
-
-
-def hide_cursor():
-    # type: () -> None
-    """Hides cursor"""
-    _HideCursor()
-
-
-def is_cursor_hidden():
-    # type: () -> bool
-    """Check if cursor is not visible"""
-    return _IsCursorHidden()
-
-
-def enable_cursor():
-    # type: () -> None
-    """Enables cursor (unlock cursor)"""
-    _EnableCursor()
-
-
-def disable_cursor():
-    # type: () -> None
-    """Disables cursor (lock cursor)"""
-    _DisableCursor()
-
-
-def is_cursor_on_screen():
-    # type: () -> bool
-    """Check if cursor is on the screen"""
-    return _IsCursorOnScreen()
-
-
-def clear_background(color):
-    # type: (Color) -> None
-    """Set background color (framebuffer clear color)"""
-    _ClearBackground(_color(color))
-
-
-def begin_drawing():
-    # type: () -> None
-    """Setup canvas (framebuffer) to start drawing"""
-    _BeginDrawing()
-
-
-def end_drawing():
-    # type: () -> None
-    """End canvas drawing and swap buffers (double buffering)"""
-    _EndDrawing()
-
-
-def begin_mode2d(camera):
-    # type: (Camera2D) -> None
-    """Begin 2D mode with custom camera (2D)"""
-    _BeginMode2D(camera)
-
-
-def end_mode2d():
-    # type: () -> None
-    """Ends 2D mode with custom camera"""
-    _EndMode2D()
-
-
-def begin_mode3d(camera):
-    # type: (Camera3D) -> None
-    """Begin 3D mode with custom camera (3D)"""
-    _BeginMode3D(camera)
-
-
-def end_mode3d():
-    # type: () -> None
-    """Ends 3D mode and returns to default 2D orthographic mode"""
-    _EndMode3D()
-
-
-def begin_texture_mode(target):
-    # type: (RenderTexture2D) -> None
-    """Begin drawing to render texture"""
-    _BeginTextureMode(target)
-
-
-def end_texture_mode():
-    # type: () -> None
-    """Ends drawing to render texture"""
-    _EndTextureMode()
-
-
-def begin_shader_mode(shader):
-    # type: (Shader) -> None
-    """Begin custom shader drawing"""
-    _BeginShaderMode(shader)
-
-
-def end_shader_mode():
-    # type: () -> None
-    """End custom shader drawing (use default shader)"""
-    _EndShaderMode()
-
-
-def begin_blend_mode(mode):
-    # type: (int) -> None
-    """Begin blending mode (alpha, additive, multiplied, subtract, custom)"""
-    _BeginBlendMode(_int(mode))
-
-
-def end_blend_mode():
-    # type: () -> None
-    """End blending mode (reset to default: alpha blending)"""
-    _EndBlendMode()
-
-
-def begin_scissor_mode(x, y, width, height):
-    # type: (int, int, int, int) -> None
-    """Begin scissor mode (define screen area for following drawing)"""
-    _BeginScissorMode(_int(x), _int(y), _int(width), _int(height))
-
-
-def end_scissor_mode():
-    # type: () -> None
-    """End scissor mode"""
-    _EndScissorMode()
-
-
-def begin_vr_stereo_mode(config):
-    # type: (VrStereoConfig) -> None
-    """Begin stereo rendering (requires VR simulator)"""
-    _BeginVrStereoMode(config)
-
-
-def end_vr_stereo_mode():
-    # type: () -> None
-    """End stereo rendering (requires VR simulator)"""
-    _EndVrStereoMode()
-
-
-def load_vr_stereo_config(device):
-    # type: (VrDeviceInfo) -> VrStereoConfig
-    """Load VR stereo config for VR simulator device parameters"""
-    return _LoadVrStereoConfig(device)
-
-
-def unload_vr_stereo_config(config):
-    # type: (VrStereoConfig) -> None
-    """Unload VR stereo config"""
-    _UnloadVrStereoConfig(config)
-
-
-def load_shader(vs_file_name, fs_file_name):
-    # type: (bytes | str | None, bytes | str | None) -> Shader
-    """Load shader from files and bind default locations"""
-    return _LoadShader(_str_in(vs_file_name), _str_in(fs_file_name))
-
-
-def load_shader_from_memory(vs_code, fs_code):
-    # type: (bytes | str | None, bytes | str | None) -> Shader
-    """Load shader from code strings and bind default locations"""
-    return _LoadShaderFromMemory(_str_in(vs_code), _str_in(fs_code))
-
-
-def is_shader_ready(shader):
-    # type: (Shader) -> bool
-    """Check if a shader is ready"""
-    return _IsShaderReady(shader)
-
-
-def get_shader_location(shader, uniform_name):
-    # type: (Shader, bytes | str | None) -> int
-    """Get shader uniform location"""
-    return _GetShaderLocation(shader, _str_in(uniform_name))
-
-
-def get_shader_location_attrib(shader, attrib_name):
-    # type: (Shader, bytes | str | None) -> int
-    """Get shader attribute location"""
-    return _GetShaderLocationAttrib(shader, _str_in(attrib_name))
-
-
-def set_shader_value(shader, loc_index, value, uniform_type):
-    # type: (Shader, int, bytes | str | None, int) -> None
-    """Set shader uniform value"""
-    _SetShaderValue(shader, _int(loc_index), value, _int(uniform_type))
-
-
-def set_shader_value_v(shader, loc_index, value, uniform_type, count):
-    # type: (Shader, int, bytes | str | None, int, int) -> None
-    """Set shader uniform value vector"""
-    _SetShaderValueV(shader, _int(loc_index), value, _int(uniform_type), _int(count))
-
-
-def set_shader_value_matrix(shader, loc_index, mat):
-    # type: (Shader, int, Matrix) -> None
-    """Set shader uniform value (matrix 4x4)"""
-    _SetShaderValueMatrix(shader, _int(loc_index), mat)
-
-
-def set_shader_value_texture(shader, loc_index, texture):
-    # type: (Shader, int, Texture2D) -> None
-    """Set shader uniform value for texture (sampler2d)"""
-    _SetShaderValueTexture(shader, _int(loc_index), texture)
-
-
-def unload_shader(shader):
-    # type: (Shader) -> None
-    """Unload shader from GPU memory (VRAM)"""
-    _UnloadShader(shader)
-
-
-def get_mouse_ray(mouse_position, camera):
-    # type: (Vector2, Camera) -> Ray
-    """Get a ray trace from mouse position"""
-    return _GetMouseRay(_vec2(mouse_position), camera)
-
-
-def get_camera_matrix(camera):
-    # type: (Camera) -> Matrix
-    """Get camera transform matrix (view matrix)"""
-    return _GetCameraMatrix(camera)
-
-
-def get_camera_matrix2d(camera):
-    # type: (Camera2D) -> Matrix
-    """Get camera 2d transform matrix"""
-    return _GetCameraMatrix2D(camera)
-
-
-def get_world_to_screen(position, camera):
-    # type: (Vector3, Camera) -> Vector2
-    """Get the screen space position for a 3d world space position"""
-    return _GetWorldToScreen(_vec3(position), camera)
-
-
-def get_screen_to_world2d(position, camera):
-    # type: (Vector2, Camera2D) -> Vector2
-    """Get the world space position for a 2d camera screen space position"""
-    return _GetScreenToWorld2D(_vec2(position), camera)
-
-
-def get_world_to_screen_ex(position, camera, width, height):
-    # type: (Vector3, Camera, int, int) -> Vector2
-    """Get size position for a 3d world space position"""
-    return _GetWorldToScreenEx(_vec3(position), camera, _int(width), _int(height))
-
-
-def get_world_to_screen2d(position, camera):
-    # type: (Vector2, Camera2D) -> Vector2
-    """Get the screen space position for a 2d camera world space position"""
-    return _GetWorldToScreen2D(_vec2(position), camera)
-
-
-def set_target_fps(fps):
-    # type: (int) -> None
-    """Set target FPS (maximum)"""
-    _SetTargetFPS(_int(fps))
-
-
-def get_frame_time():
-    # type: () -> float
-    """Get time in seconds for last frame drawn (delta time)"""
-    return _GetFrameTime()
-
-
-def get_time():
-    # type: () -> float
-    """Get elapsed time in seconds since InitWindow()"""
-    return _GetTime()
-
-
-def get_fps():
-    # type: () -> int
-    """Get current FPS"""
-    return _GetFPS()
-
-
-def swap_screen_buffer():
-    # type: () -> None
-    """Swap back buffer with front buffer (screen drawing)"""
-    _SwapScreenBuffer()
-
-
-def poll_input_events():
-    # type: () -> None
-    """Register all input events"""
-    _PollInputEvents()
-
-
-def wait_time(seconds):
-    # type: (float) -> None
-    """Wait for some time (halt program execution)"""
-    _WaitTime(_float(seconds))
-
-
-def set_random_seed(seed):
-    # type: (int) -> None
-    """Set the seed for the random number generator"""
-    _SetRandomSeed(_int(seed))
-
-
-def get_random_value(min_, max_):
-    # type: (int, int) -> int
-    """Get a random value between min and max (both included)"""
-    return _GetRandomValue(_int(min_), _int(max_))
-
-
-def load_random_sequence(count, min_, max_):
-    # type: (int, int, int) -> IntPtr
-    """Load random values sequence, no values repeated"""
-    return _LoadRandomSequence(_int(count), _int(min_), _int(max_))
-
-
-def unload_random_sequence(sequence):
-    # type: (IntPtr) -> None
-    """Unload random values sequence"""
-    _UnloadRandomSequence(sequence)
-
-
-def take_screenshot(file_name):
-    # type: (bytes | str | None) -> None
-    """Takes a screenshot of current screen (filename extension defines format)"""
-    _TakeScreenshot(_str_in(file_name))
-
-
-def set_config_flags(flags):
-    # type: (int) -> None
-    """Setup init configuration flags (view FLAGS)"""
-    _SetConfigFlags(_int(flags))
-
-
-def open_url(url):
-    # type: (bytes | str | None) -> None
-    """Open URL with default system browser (if available)"""
-    _OpenURL(_str_in(url))
-
-
-def trace_log(log_level, text, *args):
-    # type: (int, bytes | str | None, ...) -> None
-    """Show trace log messages (LOG_DEBUG, LOG_INFO, LOG_WARNING, LOG_ERROR...)"""
-    _TraceLog(_int(log_level), _str_in(text), *args)
-
-
-def set_trace_log_level(log_level):
-    # type: (int) -> None
-    """Set the current threshold (minimum) log level"""
-    _SetTraceLogLevel(_int(log_level))
-
-
-def mem_alloc(size):
-    # type: (int) -> bytes | str | None
-    """Internal memory allocator"""
-    return _MemAlloc(_int(size))
-
-
-def mem_realloc(ptr, size):
-    # type: (bytes | str | None, int) -> bytes | str | None
-    """Internal memory reallocator"""
-    return _MemRealloc(ptr, _int(size))
-
-
-def mem_free(ptr):
-    # type: (bytes | str | None) -> None
-    """Internal memory free"""
-    _MemFree(ptr)
-
-
-def set_trace_log_callback(callback):
-    # type: (TraceLogCallback) -> None
-    """Set custom trace log"""
-    _SetTraceLogCallback(callback)
-
-
-def set_load_file_data_callback(callback):
-    # type: (LoadFileDataCallback) -> None
-    """Set custom file binary data loader"""
-    _SetLoadFileDataCallback(callback)
-
-
-def set_save_file_data_callback(callback):
-    # type: (SaveFileDataCallback) -> None
-    """Set custom file binary data saver"""
-    _SetSaveFileDataCallback(callback)
-
-
-def set_load_file_text_callback(callback):
-    # type: (LoadFileTextCallback) -> None
-    """Set custom file text data loader"""
-    _SetLoadFileTextCallback(callback)
-
-
-def set_save_file_text_callback(callback):
-    # type: (SaveFileTextCallback) -> None
-    """Set custom file text data saver"""
-    _SetSaveFileTextCallback(callback)
-
-
-def load_file_data(file_name, data_size):
-    # type: (bytes | str | None, IntPtr) -> int
-    """Load file data as byte array (read)"""
-    return _LoadFileData(_str_in(file_name), data_size)
-
-
-def unload_file_data(data):
-    # type: (int) -> None
-    """Unload file data allocated by LoadFileData()"""
-    _UnloadFileData(_int(data, (0, 255)))
-
-
-def save_file_data(file_name, data, data_size):
-    # type: (bytes | str | None, bytes | str | None, int) -> bool
-    """Save data to file from byte array (write), returns true on success"""
-    return _SaveFileData(_str_in(file_name), data, _int(data_size))
-
-
-def export_data_as_code(data, data_size, file_name):
-    # type: (int, int, bytes | str | None) -> bool
-    """Export data to code (.h), returns true on success"""
-    return _ExportDataAsCode(_int(data, (0, 255)), _int(data_size), _str_in(file_name))
-
-
-def load_file_text(file_name):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Load text data from file (read), returns a '\0' terminated string"""
-    return _str_out(_LoadFileText(_str_in(file_name)))
-
-
-def unload_file_text(text):
-    # type: (bytes | str | None) -> None
-    """Unload file text data allocated by LoadFileText()"""
-    _UnloadFileText(_str_in(text))
-
-
-def save_file_text(file_name, text):
-    # type: (bytes | str | None, bytes | str | None) -> bool
-    """Save text data to file (write), string must be '\0' terminated, returns true on success"""
-    return _SaveFileText(_str_in(file_name), _str_in(text))
-
-
-def file_exists(file_name):
-    # type: (bytes | str | None) -> bool
-    """Check if file exists"""
-    return _FileExists(_str_in(file_name))
-
-
-def directory_exists(dir_path):
-    # type: (bytes | str | None) -> bool
-    """Check if a directory path exists"""
-    return _DirectoryExists(_str_in(dir_path))
-
-
-def is_file_extension(file_name, ext):
-    # type: (bytes | str | None, bytes | str | None) -> bool
-    """Check file extension (including point: .png, .wav)"""
-    return _IsFileExtension(_str_in(file_name), _str_in(ext))
-
-
-def get_file_length(file_name):
-    # type: (bytes | str | None) -> int
-    """Get file length in bytes (NOTE: GetFileSize() conflicts with windows.h)"""
-    return _GetFileLength(_str_in(file_name))
-
-
-def get_file_extension(file_name):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get pointer to extension for a filename string (includes dot: '.png')"""
-    return _str_out(_GetFileExtension(_str_in(file_name)))
-
-
-def get_file_name(file_path):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get pointer to filename for a path string"""
-    return _str_out(_GetFileName(_str_in(file_path)))
-
-
-def get_file_name_without_ext(file_path):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get filename string without extension (uses static string)"""
-    return _str_out(_GetFileNameWithoutExt(_str_in(file_path)))
-
-
-def get_directory_path(file_path):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get full path for a given fileName with path (uses static string)"""
-    return _str_out(_GetDirectoryPath(_str_in(file_path)))
-
-
-def get_prev_directory_path(dir_path):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get previous directory path for a given path (uses static string)"""
-    return _str_out(_GetPrevDirectoryPath(_str_in(dir_path)))
-
-
-def get_working_directory():
-    # type: () -> bytes | str | None
-    """Get current working directory (uses static string)"""
-    return _str_out(_GetWorkingDirectory())
-
-
-def get_application_directory():
-    # type: () -> bytes | str | None
-    """Get the directory of the running application (uses static string)"""
-    return _str_out(_GetApplicationDirectory())
-
-
-def change_directory(dir_):
-    # type: (bytes | str | None) -> bool
-    """Change working directory, return true on success"""
-    return _ChangeDirectory(_str_in(dir_))
-
-
-def is_path_file(path):
-    # type: (bytes | str | None) -> bool
-    """Check if a given path is a file or a directory"""
-    return _IsPathFile(_str_in(path))
-
-
-def load_directory_files(dir_path):
-    # type: (bytes | str | None) -> FilePathList
-    """Load directory filepaths"""
-    return _LoadDirectoryFiles(_str_in(dir_path))
-
-
-def load_directory_files_ex(base_path, filter_, scan_subdirs):
-    # type: (bytes | str | None, bytes | str | None, bool) -> FilePathList
-    """Load directory filepaths with extension filtering and recursive directory scan"""
-    return _LoadDirectoryFilesEx(_str_in(base_path), _str_in(filter_), _bool(scan_subdirs))
-
-
-def unload_directory_files(files):
-    # type: (FilePathList) -> None
-    """Unload filepaths"""
-    _UnloadDirectoryFiles(files)
-
-
-def is_file_dropped():
-    # type: () -> bool
-    """Check if a file has been dropped into window"""
-    return _IsFileDropped()
-
-
-def load_dropped_files():
-    # type: () -> FilePathList
-    """Load dropped filepaths"""
-    return _LoadDroppedFiles()
-
-
-def unload_dropped_files(files):
-    # type: (FilePathList) -> None
-    """Unload dropped filepaths"""
-    _UnloadDroppedFiles(files)
-
-
-def get_file_mod_time(file_name):
-    # type: (bytes | str | None) -> int
-    """Get file modification time (last write time)"""
-    return _GetFileModTime(_str_in(file_name))
-
-
-def compress_data(data, data_size, comp_data_size):
-    # type: (int, int, IntPtr) -> int
-    """Compress data (DEFLATE algorithm), memory must be MemFree()"""
-    return _CompressData(_int(data, (0, 255)), _int(data_size), comp_data_size)
-
-
-def decompress_data(comp_data, comp_data_size, data_size):
-    # type: (int, int, IntPtr) -> int
-    """Decompress data (DEFLATE algorithm), memory must be MemFree()"""
-    return _DecompressData(_int(comp_data, (0, 255)), _int(comp_data_size), data_size)
-
-
-def encode_data_base64(data, data_size, output_size):
-    # type: (int, int, IntPtr) -> bytes | str | None
-    """Encode data to Base64 string, memory must be MemFree()"""
-    return _EncodeDataBase64(_int(data, (0, 255)), _int(data_size), output_size)
-
-
-def decode_data_base64(data, output_size):
-    # type: (int, IntPtr) -> int
-    """Decode Base64 string data, memory must be MemFree()"""
-    return _DecodeDataBase64(_int(data, (0, 255)), output_size)
-
-
-def load_automation_event_list(file_name):
-    # type: (bytes | str | None) -> AutomationEventList
-    """Load automation events list from file, NULL for empty list, capacity = MAX_AUTOMATION_EVENTS"""
-    return _LoadAutomationEventList(_str_in(file_name))
-
-
-def unload_automation_event_list(list_):
-    # type: (AutomationEventListPtr) -> None
-    """Unload automation events list from file"""
-    _UnloadAutomationEventList(list_)
-
-
-def export_automation_event_list(list_, file_name):
-    # type: (AutomationEventList, bytes | str | None) -> bool
-    """Export automation events list as text file"""
-    return _ExportAutomationEventList(list_, _str_in(file_name))
-
-
-def set_automation_event_list(list_):
-    # type: (AutomationEventListPtr) -> None
-    """Set automation event list to record to"""
-    _SetAutomationEventList(list_)
-
-
-def set_automation_event_base_frame(frame):
-    # type: (int) -> None
-    """Set automation event internal base frame to start recording"""
-    _SetAutomationEventBaseFrame(_int(frame))
-
-
-def start_automation_event_recording():
-    # type: () -> None
-    """Start recording automation events (AutomationEventList must be set)"""
-    _StartAutomationEventRecording()
-
-
-def stop_automation_event_recording():
-    # type: () -> None
-    """Stop recording automation events"""
-    _StopAutomationEventRecording()
-
-
-def play_automation_event(event):
-    # type: (AutomationEvent) -> None
-    """Play a recorded automation event"""
-    _PlayAutomationEvent(event)
-
-
-def is_key_pressed(key):
-    # type: (int) -> bool
-    """Check if a key has been pressed once"""
-    return _IsKeyPressed(_int(key))
-
-
-def is_key_pressed_repeat(key):
-    # type: (int) -> bool
-    """Check if a key has been pressed again (Only PLATFORM_DESKTOP)"""
-    return _IsKeyPressedRepeat(_int(key))
-
-
-def is_key_down(key):
-    # type: (int) -> bool
-    """Check if a key is being pressed"""
-    return _IsKeyDown(_int(key))
-
-
-def is_key_released(key):
-    # type: (int) -> bool
-    """Check if a key has been released once"""
-    return _IsKeyReleased(_int(key))
-
-
-def is_key_up(key):
-    # type: (int) -> bool
-    """Check if a key is NOT being pressed"""
-    return _IsKeyUp(_int(key))
-
-
-def get_key_pressed():
-    # type: () -> int
-    """Get key pressed (keycode), call it multiple times for keys queued, returns 0 when the queue is empty"""
-    return _GetKeyPressed()
-
-
-def get_char_pressed():
-    # type: () -> int
-    """Get char pressed (unicode), call it multiple times for chars queued, returns 0 when the queue is empty"""
-    return _GetCharPressed()
-
-
-def set_exit_key(key):
-    # type: (int) -> None
-    """Set a custom key to exit program (default is ESC)"""
-    _SetExitKey(_int(key))
-
-
-def is_gamepad_available(gamepad):
-    # type: (int) -> bool
-    """Check if a gamepad is available"""
-    return _IsGamepadAvailable(_int(gamepad))
-
-
-def get_gamepad_name(gamepad):
-    # type: (int) -> bytes | str | None
-    """Get gamepad internal name id"""
-    return _str_out(_GetGamepadName(_int(gamepad)))
-
-
-def is_gamepad_button_pressed(gamepad, button):
-    # type: (int, int) -> bool
-    """Check if a gamepad button has been pressed once"""
-    return _IsGamepadButtonPressed(_int(gamepad), _int(button))
-
-
-def is_gamepad_button_down(gamepad, button):
-    # type: (int, int) -> bool
-    """Check if a gamepad button is being pressed"""
-    return _IsGamepadButtonDown(_int(gamepad), _int(button))
-
-
-def is_gamepad_button_released(gamepad, button):
-    # type: (int, int) -> bool
-    """Check if a gamepad button has been released once"""
-    return _IsGamepadButtonReleased(_int(gamepad), _int(button))
-
-
-def is_gamepad_button_up(gamepad, button):
-    # type: (int, int) -> bool
-    """Check if a gamepad button is NOT being pressed"""
-    return _IsGamepadButtonUp(_int(gamepad), _int(button))
-
-
-def get_gamepad_button_pressed():
-    # type: () -> int
-    """Get the last gamepad button pressed"""
-    return _GetGamepadButtonPressed()
-
-
-def get_gamepad_axis_count(gamepad):
-    # type: (int) -> int
-    """Get gamepad axis count for a gamepad"""
-    return _GetGamepadAxisCount(_int(gamepad))
-
-
-def get_gamepad_axis_movement(gamepad, axis):
-    # type: (int, int) -> float
-    """Get axis movement value for a gamepad axis"""
-    return _GetGamepadAxisMovement(_int(gamepad), _int(axis))
-
-
-def set_gamepad_mappings(mappings):
-    # type: (bytes | str | None) -> int
-    """Set internal gamepad mappings (SDL_GameControllerDB)"""
-    return _SetGamepadMappings(_str_in(mappings))
-
-
-def is_mouse_button_pressed(button):
-    # type: (int) -> bool
-    """Check if a mouse button has been pressed once"""
-    return _IsMouseButtonPressed(_int(button))
-
-
-def is_mouse_button_down(button):
-    # type: (int) -> bool
-    """Check if a mouse button is being pressed"""
-    return _IsMouseButtonDown(_int(button))
-
-
-def is_mouse_button_released(button):
-    # type: (int) -> bool
-    """Check if a mouse button has been released once"""
-    return _IsMouseButtonReleased(_int(button))
-
-
-def is_mouse_button_up(button):
-    # type: (int) -> bool
-    """Check if a mouse button is NOT being pressed"""
-    return _IsMouseButtonUp(_int(button))
-
-
-def get_mouse_x():
-    # type: () -> int
-    """Get mouse position X"""
-    return _GetMouseX()
-
-
-def get_mouse_y():
-    # type: () -> int
-    """Get mouse position Y"""
-    return _GetMouseY()
-
-
-def get_mouse_position():
-    # type: () -> Vector2
-    """Get mouse position XY"""
-    return _GetMousePosition()
-
-
-def get_mouse_delta():
-    # type: () -> Vector2
-    """Get mouse delta between frames"""
-    return _GetMouseDelta()
-
-
-def set_mouse_position(x, y):
-    # type: (int, int) -> None
-    """Set mouse position XY"""
-    _SetMousePosition(_int(x), _int(y))
-
-
-def set_mouse_offset(offset_x, offset_y):
-    # type: (int, int) -> None
-    """Set mouse offset"""
-    _SetMouseOffset(_int(offset_x), _int(offset_y))
-
-
-def set_mouse_scale(scale_x, scale_y):
-    # type: (float, float) -> None
-    """Set mouse scaling"""
-    _SetMouseScale(_float(scale_x), _float(scale_y))
-
-
-def get_mouse_wheel_move():
-    # type: () -> float
-    """Get mouse wheel movement for X or Y, whichever is larger"""
-    return _GetMouseWheelMove()
-
-
-def get_mouse_wheel_move_v():
-    # type: () -> Vector2
-    """Get mouse wheel movement for both X and Y"""
-    return _GetMouseWheelMoveV()
-
-
-def set_mouse_cursor(cursor):
-    # type: (int) -> None
-    """Set mouse cursor"""
-    _SetMouseCursor(_int(cursor))
-
-
-def get_touch_x():
-    # type: () -> int
-    """Get touch position X for touch point 0 (relative to screen size)"""
-    return _GetTouchX()
-
-
-def get_touch_y():
-    # type: () -> int
-    """Get touch position Y for touch point 0 (relative to screen size)"""
-    return _GetTouchY()
-
-
-def get_touch_position(index):
-    # type: (int) -> Vector2
-    """Get touch position XY for a touch point index (relative to screen size)"""
-    return _GetTouchPosition(_int(index))
-
-
-def get_touch_point_id(index):
-    # type: (int) -> int
-    """Get touch point identifier for given index"""
-    return _GetTouchPointId(_int(index))
-
-
-def get_touch_point_count():
-    # type: () -> int
-    """Get number of touch points"""
-    return _GetTouchPointCount()
-
-
-def set_gestures_enabled(flags):
-    # type: (int) -> None
-    """Enable a set of gestures using flags"""
-    _SetGesturesEnabled(_int(flags))
-
-
-def is_gesture_detected(gesture):
-    # type: (int) -> bool
-    """Check if a gesture have been detected"""
-    return _IsGestureDetected(_int(gesture))
-
-
-def get_gesture_detected():
-    # type: () -> int
-    """Get latest detected gesture"""
-    return _GetGestureDetected()
-
-
-def get_gesture_hold_duration():
-    # type: () -> float
-    """Get gesture hold time in milliseconds"""
-    return _GetGestureHoldDuration()
-
-
-def get_gesture_drag_vector():
-    # type: () -> Vector2
-    """Get gesture drag vector"""
-    return _GetGestureDragVector()
-
-
-def get_gesture_drag_angle():
-    # type: () -> float
-    """Get gesture drag angle"""
-    return _GetGestureDragAngle()
-
-
-def get_gesture_pinch_vector():
-    # type: () -> Vector2
-    """Get gesture pinch delta"""
-    return _GetGesturePinchVector()
-
-
-def get_gesture_pinch_angle():
-    # type: () -> float
-    """Get gesture pinch angle"""
-    return _GetGesturePinchAngle()
-
-
-def update_camera(camera, mode):
-    # type: (CameraPtr, int) -> None
-    """Update camera position for selected mode"""
-    _UpdateCamera(camera, _int(mode))
-
-
-def update_camera_pro(camera, movement, rotation, zoom):
-    # type: (CameraPtr, Vector3, Vector3, float) -> None
-    """Update camera movement/rotation"""
-    _UpdateCameraPro(camera, _vec3(movement), _vec3(rotation), _float(zoom))
-
-
-def set_shapes_texture(texture, source):
-    # type: (Texture2D, Rectangle) -> None
-    """Set texture and rectangle to be used on shapes drawing"""
-    _SetShapesTexture(texture, _rect(source))
-
-
-def draw_pixel(pos_x, pos_y, color):
-    # type: (int, int, Color) -> None
-    """Draw a pixel"""
-    _DrawPixel(_int(pos_x), _int(pos_y), _color(color))
-
-
-def draw_pixel_v(position, color):
-    # type: (Vector2, Color) -> None
-    """Draw a pixel (Vector version)"""
-    _DrawPixelV(_vec2(position), _color(color))
-
-
-def draw_line(start_pos_x, start_pos_y, end_pos_x, end_pos_y, color):
-    # type: (int, int, int, int, Color) -> None
-    """Draw a line"""
-    _DrawLine(_int(start_pos_x), _int(start_pos_y), _int(end_pos_x), _int(end_pos_y), _color(color))
-
-
-def draw_line_v(start_pos, end_pos, color):
-    # type: (Vector2, Vector2, Color) -> None
-    """Draw a line (using gl lines)"""
-    _DrawLineV(_vec2(start_pos), _vec2(end_pos), _color(color))
-
-
-def draw_line_ex(start_pos, end_pos, thick, color):
-    # type: (Vector2, Vector2, float, Color) -> None
-    """Draw a line (using triangles/quads)"""
-    _DrawLineEx(_vec2(start_pos), _vec2(end_pos), _float(thick), _color(color))
-
-
-def draw_line_strip(points, point_count, color):
-    # type: (Vector2Ptr, int, Color) -> None
-    """Draw lines sequence (using gl lines)"""
-    _DrawLineStrip(points, _int(point_count), _color(color))
-
-
-def draw_line_bezier(start_pos, end_pos, thick, color):
-    # type: (Vector2, Vector2, float, Color) -> None
-    """Draw line segment cubic-bezier in-out interpolation"""
-    _DrawLineBezier(_vec2(start_pos), _vec2(end_pos), _float(thick), _color(color))
-
-
-def draw_circle(center_x, center_y, radius, color):
-    # type: (int, int, float, Color) -> None
-    """Draw a color-filled circle"""
-    _DrawCircle(_int(center_x), _int(center_y), _float(radius), _color(color))
-
-
-def draw_circle_sector(center, radius, start_angle, end_angle, segments, color):
-    # type: (Vector2, float, float, float, int, Color) -> None
-    """Draw a piece of a circle"""
-    _DrawCircleSector(_vec2(center), _float(radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
-
-
-def draw_circle_sector_lines(center, radius, start_angle, end_angle, segments, color):
-    # type: (Vector2, float, float, float, int, Color) -> None
-    """Draw circle sector outline"""
-    _DrawCircleSectorLines(_vec2(center), _float(radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
-
-
-def draw_circle_gradient(center_x, center_y, radius, color1, color2):
-    # type: (int, int, float, Color, Color) -> None
-    """Draw a gradient-filled circle"""
-    _DrawCircleGradient(_int(center_x), _int(center_y), _float(radius), _color(color1), _color(color2))
-
-
-def draw_circle_v(center, radius, color):
-    # type: (Vector2, float, Color) -> None
-    """Draw a color-filled circle (Vector version)"""
-    _DrawCircleV(_vec2(center), _float(radius), _color(color))
-
-
-def draw_circle_lines(center_x, center_y, radius, color):
-    # type: (int, int, float, Color) -> None
-    """Draw circle outline"""
-    _DrawCircleLines(_int(center_x), _int(center_y), _float(radius), _color(color))
-
-
-def draw_circle_lines_v(center, radius, color):
-    # type: (Vector2, float, Color) -> None
-    """Draw circle outline (Vector version)"""
-    _DrawCircleLinesV(_vec2(center), _float(radius), _color(color))
-
-
-def draw_ellipse(center_x, center_y, radius_h, radius_v, color):
-    # type: (int, int, float, float, Color) -> None
-    """Draw ellipse"""
-    _DrawEllipse(_int(center_x), _int(center_y), _float(radius_h), _float(radius_v), _color(color))
-
-
-def draw_ellipse_lines(center_x, center_y, radius_h, radius_v, color):
-    # type: (int, int, float, float, Color) -> None
-    """Draw ellipse outline"""
-    _DrawEllipseLines(_int(center_x), _int(center_y), _float(radius_h), _float(radius_v), _color(color))
-
-
-def draw_ring(center, inner_radius, outer_radius, start_angle, end_angle, segments, color):
-    # type: (Vector2, float, float, float, float, int, Color) -> None
-    """Draw ring"""
-    _DrawRing(_vec2(center), _float(inner_radius), _float(outer_radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
-
-
-def draw_ring_lines(center, inner_radius, outer_radius, start_angle, end_angle, segments, color):
-    # type: (Vector2, float, float, float, float, int, Color) -> None
-    """Draw ring outline"""
-    _DrawRingLines(_vec2(center), _float(inner_radius), _float(outer_radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
-
-
-def draw_rectangle(pos_x, pos_y, width, height, color):
-    # type: (int, int, int, int, Color) -> None
-    """Draw a color-filled rectangle"""
-    _DrawRectangle(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color))
-
-
-def draw_rectangle_v(position, size, color):
-    # type: (Vector2, Vector2, Color) -> None
-    """Draw a color-filled rectangle (Vector version)"""
-    _DrawRectangleV(_vec2(position), _vec2(size), _color(color))
-
-
-def draw_rectangle_rec(rec, color):
-    # type: (Rectangle, Color) -> None
-    """Draw a color-filled rectangle"""
-    _DrawRectangleRec(_rect(rec), _color(color))
-
-
-def draw_rectangle_pro(rec, origin, rotation, color):
-    # type: (Rectangle, Vector2, float, Color) -> None
-    """Draw a color-filled rectangle with pro parameters"""
-    _DrawRectanglePro(_rect(rec), _vec2(origin), _float(rotation), _color(color))
-
-
-def draw_rectangle_gradient_v(pos_x, pos_y, width, height, color1, color2):
-    # type: (int, int, int, int, Color, Color) -> None
-    """Draw a vertical-gradient-filled rectangle"""
-    _DrawRectangleGradientV(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color1), _color(color2))
-
-
-def draw_rectangle_gradient_h(pos_x, pos_y, width, height, color1, color2):
-    # type: (int, int, int, int, Color, Color) -> None
-    """Draw a horizontal-gradient-filled rectangle"""
-    _DrawRectangleGradientH(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color1), _color(color2))
-
-
-def draw_rectangle_gradient_ex(rec, col1, col2, col3, col4):
-    # type: (Rectangle, Color, Color, Color, Color) -> None
-    """Draw a gradient-filled rectangle with custom vertex colors"""
-    _DrawRectangleGradientEx(_rect(rec), _color(col1), _color(col2), _color(col3), _color(col4))
-
-
-def draw_rectangle_lines(pos_x, pos_y, width, height, color):
-    # type: (int, int, int, int, Color) -> None
-    """Draw rectangle outline"""
-    _DrawRectangleLines(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color))
-
-
-def draw_rectangle_lines_ex(rec, line_thick, color):
-    # type: (Rectangle, float, Color) -> None
-    """Draw rectangle outline with extended parameters"""
-    _DrawRectangleLinesEx(_rect(rec), _float(line_thick), _color(color))
-
-
-def draw_rectangle_rounded(rec, roundness, segments, color):
-    # type: (Rectangle, float, int, Color) -> None
-    """Draw rectangle with rounded edges"""
-    _DrawRectangleRounded(_rect(rec), _float(roundness), _int(segments), _color(color))
-
-
-def draw_rectangle_rounded_lines(rec, roundness, segments, line_thick, color):
-    # type: (Rectangle, float, int, float, Color) -> None
-    """Draw rectangle with rounded edges outline"""
-    _DrawRectangleRoundedLines(_rect(rec), _float(roundness), _int(segments), _float(line_thick), _color(color))
-
-
-def draw_triangle(v1, v2, v3, color):
-    # type: (Vector2, Vector2, Vector2, Color) -> None
-    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
-    _DrawTriangle(_vec2(v1), _vec2(v2), _vec2(v3), _color(color))
-
-
-def draw_triangle_lines(v1, v2, v3, color):
-    # type: (Vector2, Vector2, Vector2, Color) -> None
-    """Draw triangle outline (vertex in counter-clockwise order!)"""
-    _DrawTriangleLines(_vec2(v1), _vec2(v2), _vec2(v3), _color(color))
-
-
-def draw_triangle_fan(points, point_count, color):
-    # type: (Vector2Ptr | Array[Vector2], int, Color) -> None
-    """Draw a triangle fan defined by points (first vertex is the center)"""
-    _DrawTriangleFan(points, _int(point_count), _color(color))
-
-
-def draw_triangle_strip(points, point_count, color):
-    # type: (Vector2Ptr | Array[Vector2], int, Color) -> None
-    """Draw a triangle strip defined by points"""
-    point_count = len(points) if point_count <= 0 else point_count
-    _DrawTriangleStrip(points, _int(point_count), _color(color))
-
-
-def draw_poly(center, sides, radius, rotation, color):
-    # type: (Vector2, int, float, float, Color) -> None
-    """Draw a regular polygon (Vector version)"""
-    _DrawPoly(_vec2(center), _int(sides), _float(radius), _float(rotation), _color(color))
-
-
-def draw_poly_lines(center, sides, radius, rotation, color):
-    # type: (Vector2, int, float, float, Color) -> None
-    """Draw a polygon outline of n sides"""
-    _DrawPolyLines(_vec2(center), _int(sides), _float(radius), _float(rotation), _color(color))
-
-
-def draw_poly_lines_ex(center, sides, radius, rotation, line_thick, color):
-    # type: (Vector2, int, float, float, float, Color) -> None
-    """Draw a polygon outline of n sides with extended parameters"""
-    _DrawPolyLinesEx(_vec2(center), _int(sides), _float(radius), _float(rotation), _float(line_thick), _color(color))
-
-
-def draw_spline_linear(points, point_count, thick, color):
-    # type: (Vector2Ptr | Array[Vector2], int, float, Color) -> None
-    """Draw spline: Linear, minimum 2 points"""
-    _DrawSplineLinear(points, _int(point_count), _float(thick), _color(color))
-
-
-def draw_spline_basis(points, point_count, thick, color):
-    # type: (Vector2Ptr | Array[Vector2], int, float, Color) -> None
-    """Draw spline: B-Spline, minimum 4 points"""
-    _DrawSplineBasis(points, _int(point_count), _float(thick), _color(color))
-
-
-def draw_spline_catmull_rom(points, point_count, thick, color):
-    # type: (Vector2Ptr | Array[Vector2], int, float, Color) -> None
-    """Draw spline: Catmull-Rom, minimum 4 points"""
-    _DrawSplineCatmullRom(points, _int(point_count), _float(thick), _color(color))
-
-
-def draw_spline_bezier_quadratic(points, point_count, thick, color):
-    # type: (Vector2Ptr | Array[Vector2], int, float, Color) -> None
-    """Draw spline: Quadratic Bezier, minimum 3 points (1 control point): [p1, c2, p3, c4...]"""
-    _DrawSplineBezierQuadratic(points, _int(point_count), _float(thick), _color(color))
-
-
-def draw_spline_bezier_cubic(points, point_count, thick, color):
-    # type: (Vector2Ptr | Array[Vector2], int, float, Color) -> None
-    """Draw spline: Cubic Bezier, minimum 4 points (2 control points): [p1, c2, c3, p4, c5, c6...]"""
-    _DrawSplineBezierCubic(points, _int(point_count), _float(thick), _color(color))
-
-
-def draw_spline_segment_linear(p1, p2, thick, color):
-    # type: (Vector2, Vector2, float, Color) -> None
-    """Draw spline segment: Linear, 2 points"""
-    _DrawSplineSegmentLinear(_vec2(p1), _vec2(p2), _float(thick), _color(color))
-
-
-def draw_spline_segment_basis(p1, p2, p3, p4, thick, color):
-    # type: (Vector2, Vector2, Vector2, Vector2, float, Color) -> None
-    """Draw spline segment: B-Spline, 4 points"""
-    _DrawSplineSegmentBasis(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(thick), _color(color))
-
-
-def draw_spline_segment_catmull_rom(p1, p2, p3, p4, thick, color):
-    # type: (Vector2, Vector2, Vector2, Vector2, float, Color) -> None
-    """Draw spline segment: Catmull-Rom, 4 points"""
-    _DrawSplineSegmentCatmullRom(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(thick), _color(color))
-
-
-def draw_spline_segment_bezier_quadratic(p1, c2, p3, thick, color):
-    # type: (Vector2, Vector2, Vector2, float, Color) -> None
-    """Draw spline segment: Quadratic Bezier, 2 points, 1 control point"""
-    _DrawSplineSegmentBezierQuadratic(_vec2(p1), _vec2(c2), _vec2(p3), _float(thick), _color(color))
-
-
-def draw_spline_segment_bezier_cubic(p1, c2, c3, p4, thick, color):
-    # type: (Vector2, Vector2, Vector2, Vector2, float, Color) -> None
-    """Draw spline segment: Cubic Bezier, 2 points, 2 control points"""
-    _DrawSplineSegmentBezierCubic(_vec2(p1), _vec2(c2), _vec2(c3), _vec2(p4), _float(thick), _color(color))
-
-
-def get_spline_point_linear(start_pos, end_pos, t):
-    # type: (Vector2, Vector2, float) -> Vector2
-    """Get (evaluate) spline point: Linear"""
-    return _GetSplinePointLinear(_vec2(start_pos), _vec2(end_pos), _float(t))
-
-
-def get_spline_point_basis(p1, p2, p3, p4, t):
-    # type: (Vector2, Vector2, Vector2, Vector2, float) -> Vector2
-    """Get (evaluate) spline point: B-Spline"""
-    return _GetSplinePointBasis(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(t))
-
-
-def get_spline_point_catmull_rom(p1, p2, p3, p4, t):
-    # type: (Vector2, Vector2, Vector2, Vector2, float) -> Vector2
-    """Get (evaluate) spline point: Catmull-Rom"""
-    return _GetSplinePointCatmullRom(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(t))
-
-
-def get_spline_point_bezier_quad(p1, c2, p3, t):
-    # type: (Vector2, Vector2, Vector2, float) -> Vector2
-    """Get (evaluate) spline point: Quadratic Bezier"""
-    return _GetSplinePointBezierQuad(_vec2(p1), _vec2(c2), _vec2(p3), _float(t))
-
-
-def get_spline_point_bezier_cubic(p1, c2, c3, p4, t):
-    # type: (Vector2, Vector2, Vector2, Vector2, float) -> Vector2
-    """Get (evaluate) spline point: Cubic Bezier"""
-    return _GetSplinePointBezierCubic(_vec2(p1), _vec2(c2), _vec2(c3), _vec2(p4), _float(t))
-
-
-def check_collision_recs(rec1, rec2):
-    # type: (Rectangle, Rectangle) -> bool
-    """Check collision between two rectangles"""
-    return _CheckCollisionRecs(_rect(rec1), _rect(rec2))
-
-
-def check_collision_circles(center1, radius1, center2, radius2):
-    # type: (Vector2, float, Vector2, float) -> bool
-    """Check collision between two circles"""
-    return _CheckCollisionCircles(_vec2(center1), _float(radius1), _vec2(center2), _float(radius2))
-
-
-def check_collision_circle_rec(center, radius, rec):
-    # type: (Vector2, float, Rectangle) -> bool
-    """Check collision between circle and rectangle"""
-    return _CheckCollisionCircleRec(_vec2(center), _float(radius), _rect(rec))
-
-
-def check_collision_point_rec(point, rec):
-    # type: (Vector2, Rectangle) -> bool
-    """Check if point is inside rectangle"""
-    return _CheckCollisionPointRec(_vec2(point), _rect(rec))
-
-
-def check_collision_point_circle(point, center, radius):
-    # type: (Vector2, Vector2, float) -> bool
-    """Check if point is inside circle"""
-    return _CheckCollisionPointCircle(_vec2(point), _vec2(center), _float(radius))
-
-
-def check_collision_point_triangle(point, p1, p2, p3):
-    # type: (Vector2, Vector2, Vector2, Vector2) -> bool
-    """Check if point is inside a triangle"""
-    return _CheckCollisionPointTriangle(_vec2(point), _vec2(p1), _vec2(p2), _vec2(p3))
-
-
-def check_collision_point_poly(point, points, point_count):
-    # type: (Vector2, Vector2Ptr, int) -> bool
-    """Check if point is within a polygon described by array of vertices"""
-    return _CheckCollisionPointPoly(_vec2(point), points, _int(point_count))
-
-
-def check_collision_lines(start_pos1, end_pos1, start_pos2, end_pos2, collision_point):
-    # type: (Vector2, Vector2, Vector2, Vector2, Vector2Ptr) -> bool
-    """Check the collision between two lines defined by two points each, returns collision point by reference"""
-    return _CheckCollisionLines(_vec2(start_pos1), _vec2(end_pos1), _vec2(start_pos2), _vec2(end_pos2), collision_point)
-
-
-def check_collision_point_line(point, p1, p2, threshold):
-    # type: (Vector2, Vector2, Vector2, int) -> bool
-    """Check if point belongs to line created between two points [p1] and [p2] with defined margin in pixels [threshold]"""
-    return _CheckCollisionPointLine(_vec2(point), _vec2(p1), _vec2(p2), _int(threshold))
-
-
-def get_collision_rec(rec1, rec2):
-    # type: (Rectangle, Rectangle) -> Rectangle
-    """Get collision rectangle for two rectangles collision"""
-    return _GetCollisionRec(_rect(rec1), _rect(rec2))
-
-
-def load_image(file_name):
-    # type: (bytes | str | None) -> Image
-    """Load image from file into CPU memory (RAM)"""
-    return _LoadImage(_str_in(file_name))
-
-
-def load_image_raw(file_name, width, height, format_, header_size):
-    # type: (bytes | str | None, int, int, int, int) -> Image
-    """Load image from RAW file data"""
-    return _LoadImageRaw(_str_in(file_name), _int(width), _int(height), _int(format_), _int(header_size))
-
-
-def load_image_svg(file_name_or_string, width, height):
-    # type: (bytes | str | None, int, int) -> Image
-    """Load image from SVG file data or string with specified size"""
-    return _LoadImageSvg(_str_in(file_name_or_string), _int(width), _int(height))
-
-
-def load_image_anim(file_name, frames):
-    # type: (bytes | str | None, IntPtr) -> Image
-    """Load image sequence from file (frames appended to image.data)"""
-    return _LoadImageAnim(_str_in(file_name), frames)
-
-
-def load_image_from_memory(file_type, file_data, data_size):
-    # type: (bytes | str | None, int, int) -> Image
-    """Load image from memory buffer, fileType refers to extension: i.e. '.png'"""
-    return _LoadImageFromMemory(_str_in(file_type), _int(file_data, (0, 255)), _int(data_size))
-
-
-def load_image_from_texture(texture):
-    # type: (Texture2D) -> Image
-    """Load image from GPU texture data"""
-    return _LoadImageFromTexture(texture)
-
-
-def load_image_from_screen():
-    # type: () -> Image
-    """Load image from screen buffer and (screenshot)"""
-    return _LoadImageFromScreen()
-
-
-def is_image_ready(image):
-    # type: (Image) -> bool
-    """Check if an image is ready"""
-    return _IsImageReady(image)
-
-
-def unload_image(image):
-    # type: (Image) -> None
-    """Unload image from CPU memory (RAM)"""
-    _UnloadImage(image)
-
-
-def export_image(image, file_name):
-    # type: (Image, bytes | str | None) -> bool
-    """Export image data to file, returns true on success"""
-    return _ExportImage(image, _str_in(file_name))
-
-
-def export_image_to_memory(image, file_type, file_size):
-    # type: (Image, bytes | str | None, IntPtr) -> int
-    """Export image to memory buffer"""
-    return _ExportImageToMemory(image, _str_in(file_type), file_size)
-
-
-def export_image_as_code(image, file_name):
-    # type: (Image, bytes | str | None) -> bool
-    """Export image as code file defining an array of bytes, returns true on success"""
-    return _ExportImageAsCode(image, _str_in(file_name))
-
-
-def gen_image_color(width, height, color):
-    # type: (int, int, Color) -> Image
-    """Generate image: plain color"""
-    return _GenImageColor(_int(width), _int(height), _color(color))
-
-
-def gen_image_gradient_linear(width, height, direction, start, end):
-    # type: (int, int, int, Color, Color) -> Image
-    """Generate image: linear gradient, direction in degrees [0..360], 0=Vertical gradient"""
-    return _GenImageGradientLinear(_int(width), _int(height), _int(direction), _color(start), _color(end))
-
-
-def gen_image_gradient_radial(width, height, density, inner, outer):
-    # type: (int, int, float, Color, Color) -> Image
-    """Generate image: radial gradient"""
-    return _GenImageGradientRadial(_int(width), _int(height), _float(density), _color(inner), _color(outer))
-
-
-def gen_image_gradient_square(width, height, density, inner, outer):
-    # type: (int, int, float, Color, Color) -> Image
-    """Generate image: square gradient"""
-    return _GenImageGradientSquare(_int(width), _int(height), _float(density), _color(inner), _color(outer))
-
-
-def gen_image_checked(width, height, checks_x, checks_y, col1, col2):
-    # type: (int, int, int, int, Color, Color) -> Image
-    """Generate image: checked"""
-    return _GenImageChecked(_int(width), _int(height), _int(checks_x), _int(checks_y), _color(col1), _color(col2))
-
-
-def gen_image_white_noise(width, height, factor):
-    # type: (int, int, float) -> Image
-    """Generate image: white noise"""
-    return _GenImageWhiteNoise(_int(width), _int(height), _float(factor))
-
-
-def gen_image_perlin_noise(width, height, offset_x, offset_y, scale):
-    # type: (int, int, int, int, float) -> Image
-    """Generate image: perlin noise"""
-    return _GenImagePerlinNoise(_int(width), _int(height), _int(offset_x), _int(offset_y), _float(scale))
-
-
-def gen_image_cellular(width, height, tile_size):
-    # type: (int, int, int) -> Image
-    """Generate image: cellular algorithm, bigger tileSize means bigger cells"""
-    return _GenImageCellular(_int(width), _int(height), _int(tile_size))
-
-
-def gen_image_text(width, height, text):
-    # type: (int, int, bytes | str | None) -> Image
-    """Generate image: grayscale image from text data"""
-    return _GenImageText(_int(width), _int(height), _str_in(text))
-
-
-def image_copy(image):
-    # type: (Image) -> Image
-    """Create an image duplicate (useful for transformations)"""
-    return _ImageCopy(image)
-
-
-def image_from_image(image, rec):
-    # type: (Image, Rectangle) -> Image
-    """Create an image from another image piece"""
-    return _ImageFromImage(image, _rect(rec))
-
-
-def image_text(text, font_size, color):
-    # type: (bytes | str | None, int, Color) -> Image
-    """Create an image from text (default font)"""
-    return _ImageText(_str_in(text), _int(font_size), _color(color))
-
-
-def image_text_ex(font, text, font_size, spacing, tint):
-    # type: (Font, bytes | str | None, float, float, Color) -> Image
-    """Create an image from text (custom sprite font)"""
-    return _ImageTextEx(font, _str_in(text), _float(font_size), _float(spacing), _color(tint))
-
-
-def image_format(image, new_format):
-    # type: (ImagePtr, int) -> None
-    """Convert image data to desired format"""
-    _ImageFormat(image, _int(new_format))
-
-
-def image_to_pot(image, fill):
-    # type: (ImagePtr, Color) -> None
-    """Convert image to POT (power-of-two)"""
-    _ImageToPOT(image, _color(fill))
-
-
-def image_crop(image, crop):
-    # type: (ImagePtr, Rectangle) -> None
-    """Crop an image to a defined rectangle"""
-    _ImageCrop(image, _rect(crop))
-
-
-def image_alpha_crop(image, threshold):
-    # type: (ImagePtr, float) -> None
-    """Crop image depending on alpha value"""
-    _ImageAlphaCrop(image, _float(threshold))
-
-
-def image_alpha_clear(image, color, threshold):
-    # type: (ImagePtr, Color, float) -> None
-    """Clear alpha channel to desired color"""
-    _ImageAlphaClear(image, _color(color), _float(threshold))
-
-
-def image_alpha_mask(image, alpha_mask):
-    # type: (ImagePtr, Image) -> None
-    """Apply alpha mask to image"""
-    _ImageAlphaMask(image, alpha_mask)
-
-
-def image_alpha_premultiply(image):
-    # type: (ImagePtr) -> None
-    """Premultiply alpha channel"""
-    _ImageAlphaPremultiply(image)
-
-
-def image_blur_gaussian(image, blur_size):
-    # type: (ImagePtr, int) -> None
-    """Apply Gaussian blur using a box blur approximation"""
-    _ImageBlurGaussian(image, _int(blur_size))
-
-
-def image_resize(image, new_width, new_height):
-    # type: (ImagePtr, int, int) -> None
-    """Resize image (Bicubic scaling algorithm)"""
-    _ImageResize(image, _int(new_width), _int(new_height))
-
-
-def image_resize_nn(image, new_width, new_height):
-    # type: (ImagePtr, int, int) -> None
-    """Resize image (Nearest-Neighbor scaling algorithm)"""
-    _ImageResizeNN(image, _int(new_width), _int(new_height))
-
-
-def image_resize_canvas(image, new_width, new_height, offset_x, offset_y, fill):
-    # type: (ImagePtr, int, int, int, int, Color) -> None
-    """Resize canvas and fill with color"""
-    _ImageResizeCanvas(image, _int(new_width), _int(new_height), _int(offset_x), _int(offset_y), _color(fill))
-
-
-def image_mipmaps(image):
-    # type: (ImagePtr) -> None
-    """Compute all mipmap levels for a provided image"""
-    _ImageMipmaps(image)
-
-
-def image_dither(image, r_bpp, g_bpp, b_bpp, a_bpp):
-    # type: (ImagePtr, int, int, int, int) -> None
-    """Dither image data to 16bpp or lower (Floyd-Steinberg dithering)"""
-    _ImageDither(image, _int(r_bpp), _int(g_bpp), _int(b_bpp), _int(a_bpp))
-
-
-def image_flip_vertical(image):
-    # type: (ImagePtr) -> None
-    """Flip image vertically"""
-    _ImageFlipVertical(image)
-
-
-def image_flip_horizontal(image):
-    # type: (ImagePtr) -> None
-    """Flip image horizontally"""
-    _ImageFlipHorizontal(image)
-
-
-def image_rotate(image, degrees):
-    # type: (ImagePtr, int) -> None
-    """Rotate image by input angle in degrees (-359 to 359)"""
-    _ImageRotate(image, _int(degrees))
-
-
-def image_rotate_cw(image):
-    # type: (ImagePtr) -> None
-    """Rotate image clockwise 90deg"""
-    _ImageRotateCW(image)
-
-
-def image_rotate_ccw(image):
-    # type: (ImagePtr) -> None
-    """Rotate image counter-clockwise 90deg"""
-    _ImageRotateCCW(image)
-
-
-def image_color_tint(image, color):
-    # type: (ImagePtr, Color) -> None
-    """Modify image color: tint"""
-    _ImageColorTint(image, _color(color))
-
-
-def image_color_invert(image):
-    # type: (ImagePtr) -> None
-    """Modify image color: invert"""
-    _ImageColorInvert(image)
-
-
-def image_color_grayscale(image):
-    # type: (ImagePtr) -> None
-    """Modify image color: grayscale"""
-    _ImageColorGrayscale(image)
-
-
-def image_color_contrast(image, contrast):
-    # type: (ImagePtr, float) -> None
-    """Modify image color: contrast (-100 to 100)"""
-    _ImageColorContrast(image, _float(contrast))
-
-
-def image_color_brightness(image, brightness):
-    # type: (ImagePtr, int) -> None
-    """Modify image color: brightness (-255 to 255)"""
-    _ImageColorBrightness(image, _int(brightness))
-
-
-def image_color_replace(image, color, replace):
-    # type: (ImagePtr, Color, Color) -> None
-    """Modify image color: replace color"""
-    _ImageColorReplace(image, _color(color), _color(replace))
-
-
-def load_image_colors(image):
-    # type: (Image) -> ColorPtr
-    """Load color data from image as a Color array (RGBA - 32bit)"""
-    return _LoadImageColors(image)
-
-
-def load_image_palette(image, max_palette_size, color_count):
-    # type: (Image, int, int) -> Array[Color]
-    """Load colors palette from image as a Color array (RGBA - 32bit)"""
-    color_count = Int(color_count)
-    result = _LoadImagePalette(image, _int(max_palette_size), byref(color_count))
-    result = cast(result, POINTER(Color * color_count.value))[0]
-    _clear_in_out()
-    _push_in_out(color_count.value)
-    return result
-
-
-def unload_image_colors(colors):
-    # type: (ColorPtr) -> None
-    """Unload color data loaded with LoadImageColors()"""
-    _UnloadImageColors(colors)
-
-
-def unload_image_palette(colors):
-    # type: (ColorPtr) -> None
-    """Unload colors palette loaded with LoadImagePalette()"""
-    _UnloadImagePalette(colors)
-
-
-def get_image_alpha_border(image, threshold):
-    # type: (Image, float) -> Rectangle
-    """Get image alpha border rectangle"""
-    return _GetImageAlphaBorder(image, _float(threshold))
-
-
-def get_image_color(image, x, y):
-    # type: (Image, int, int) -> Color
-    """Get image pixel color at (x, y) position"""
-    return _GetImageColor(image, _int(x), _int(y))
-
-
-def image_clear_background(dst, color):
-    # type: (ImagePtr, Color) -> None
-    """Clear image background with given color"""
-    _ImageClearBackground(dst, _color(color))
-
-
-def image_draw_pixel(dst, pos_x, pos_y, color):
-    # type: (ImagePtr, int, int, Color) -> None
-    """Draw pixel within an image"""
-    _ImageDrawPixel(dst, _int(pos_x), _int(pos_y), _color(color))
-
-
-def image_draw_pixel_v(dst, position, color):
-    # type: (ImagePtr, Vector2, Color) -> None
-    """Draw pixel within an image (Vector version)"""
-    _ImageDrawPixelV(dst, _vec2(position), _color(color))
-
-
-def image_draw_line(dst, start_pos_x, start_pos_y, end_pos_x, end_pos_y, color):
-    # type: (ImagePtr, int, int, int, int, Color) -> None
-    """Draw line within an image"""
-    _ImageDrawLine(dst, _int(start_pos_x), _int(start_pos_y), _int(end_pos_x), _int(end_pos_y), _color(color))
-
-
-def image_draw_line_v(dst, start, end, color):
-    # type: (ImagePtr, Vector2, Vector2, Color) -> None
-    """Draw line within an image (Vector version)"""
-    _ImageDrawLineV(dst, _vec2(start), _vec2(end), _color(color))
-
-
-def image_draw_circle(dst, center_x, center_y, radius, color):
-    # type: (ImagePtr, int, int, int, Color) -> None
-    """Draw a filled circle within an image"""
-    _ImageDrawCircle(dst, _int(center_x), _int(center_y), _int(radius), _color(color))
-
-
-def image_draw_circle_v(dst, center, radius, color):
-    # type: (ImagePtr, Vector2, int, Color) -> None
-    """Draw a filled circle within an image (Vector version)"""
-    _ImageDrawCircleV(dst, _vec2(center), _int(radius), _color(color))
-
-
-def image_draw_circle_lines(dst, center_x, center_y, radius, color):
-    # type: (ImagePtr, int, int, int, Color) -> None
-    """Draw circle outline within an image"""
-    _ImageDrawCircleLines(dst, _int(center_x), _int(center_y), _int(radius), _color(color))
-
-
-def image_draw_circle_lines_v(dst, center, radius, color):
-    # type: (ImagePtr, Vector2, int, Color) -> None
-    """Draw circle outline within an image (Vector version)"""
-    _ImageDrawCircleLinesV(dst, _vec2(center), _int(radius), _color(color))
-
-
-def image_draw_rectangle(dst, pos_x, pos_y, width, height, color):
-    # type: (ImagePtr, int, int, int, int, Color) -> None
-    """Draw rectangle within an image"""
-    _ImageDrawRectangle(dst, _int(pos_x), _int(pos_y), _int(width), _int(height), _color(color))
-
-
-def image_draw_rectangle_v(dst, position, size, color):
-    # type: (ImagePtr, Vector2, Vector2, Color) -> None
-    """Draw rectangle within an image (Vector version)"""
-    _ImageDrawRectangleV(dst, _vec2(position), _vec2(size), _color(color))
-
-
-def image_draw_rectangle_rec(dst, rec, color):
-    # type: (ImagePtr, Rectangle, Color) -> None
-    """Draw rectangle within an image"""
-    _ImageDrawRectangleRec(dst, _rect(rec), _color(color))
-
-
-def image_draw_rectangle_lines(dst, rec, thick, color):
-    # type: (ImagePtr, Rectangle, int, Color) -> None
-    """Draw rectangle lines within an image"""
-    _ImageDrawRectangleLines(dst, _rect(rec), _int(thick), _color(color))
-
-
-def image_draw(dst, src, src_rec, dst_rec, tint):
-    # type: (ImagePtr, Image, Rectangle, Rectangle, Color) -> None
-    """Draw a source image within a destination image (tint applied to source)"""
-    _ImageDraw(dst, src, _rect(src_rec), _rect(dst_rec), _color(tint))
-
-
-def image_draw_text(dst, text, pos_x, pos_y, font_size, color):
-    # type: (ImagePtr, bytes | str | None, int, int, int, Color) -> None
-    """Draw text (using default font) within an image (destination)"""
-    _ImageDrawText(dst, _str_in(text), _int(pos_x), _int(pos_y), _int(font_size), _color(color))
-
-
-def image_draw_text_ex(dst, font, text, position, font_size, spacing, tint):
-    # type: (ImagePtr, Font, bytes | str | None, Vector2, float, float, Color) -> None
-    """Draw text (custom sprite font) within an image (destination)"""
-    _ImageDrawTextEx(dst, font, _str_in(text), _vec2(position), _float(font_size), _float(spacing), _color(tint))
-
-
-def load_texture(file_name):
-    # type: (bytes | str | None) -> Texture2D
-    """Load texture from file into GPU memory (VRAM)"""
-    return _LoadTexture(_str_in(file_name))
-
-
-def load_texture_from_image(image):
-    # type: (Image) -> Texture2D
-    """Load texture from image data"""
-    return _LoadTextureFromImage(image)
-
-
-def load_texture_cubemap(image, layout):
-    # type: (Image, int) -> TextureCubemap
-    """Load cubemap from image, multiple image cubemap layouts supported"""
-    return _LoadTextureCubemap(image, _int(layout))
-
-
-def load_render_texture(width, height):
-    # type: (int, int) -> RenderTexture2D
-    """Load texture for rendering (framebuffer)"""
-    return _LoadRenderTexture(_int(width), _int(height))
-
-
-def is_texture_ready(texture):
-    # type: (Texture2D) -> bool
-    """Check if a texture is ready"""
-    return _IsTextureReady(texture)
-
-
-def unload_texture(texture):
-    # type: (Texture2D) -> None
-    """Unload texture from GPU memory (VRAM)"""
-    _UnloadTexture(texture)
-
-
-def is_render_texture_ready(target):
-    # type: (RenderTexture2D) -> bool
-    """Check if a render texture is ready"""
-    return _IsRenderTextureReady(target)
-
-
-def unload_render_texture(target):
-    # type: (RenderTexture2D) -> None
-    """Unload render texture from GPU memory (VRAM)"""
-    _UnloadRenderTexture(target)
-
-
-def update_texture(texture, pixels):
-    # type: (Texture2D, bytes | str | None) -> None
-    """Update GPU texture with new data"""
-    _UpdateTexture(texture, pixels)
-
-
-def update_texture_rec(texture, rec, pixels):
-    # type: (Texture2D, Rectangle, bytes | str | None) -> None
-    """Update GPU texture rectangle with new data"""
-    _UpdateTextureRec(texture, _rect(rec), pixels)
-
-
-def gen_texture_mipmaps(texture):
-    # type: (Texture2DPtr) -> None
-    """Generate GPU mipmaps for a texture"""
-    _GenTextureMipmaps(texture)
-
-
-def set_texture_filter(texture, filter_):
-    # type: (Texture2D, int) -> None
-    """Set texture scaling filter mode"""
-    _SetTextureFilter(texture, _int(filter_))
-
-
-def set_texture_wrap(texture, wrap):
-    # type: (Texture2D, int) -> None
-    """Set texture wrapping mode"""
-    _SetTextureWrap(texture, _int(wrap))
-
-
-def draw_texture(texture, pos_x, pos_y, tint):
-    # type: (Texture2D, int, int, Color) -> None
-    """Draw a Texture2D"""
-    _DrawTexture(texture, _int(pos_x), _int(pos_y), _color(tint))
-
-
-def draw_texture_v(texture, position, tint):
-    # type: (Texture2D, Vector2, Color) -> None
-    """Draw a Texture2D with position defined as Vector2"""
-    _DrawTextureV(texture, _vec2(position), _color(tint))
-
-
-def draw_texture_ex(texture, position, rotation, scale, tint):
-    # type: (Texture2D, Vector2, float, float, Color) -> None
-    """Draw a Texture2D with extended parameters"""
-    _DrawTextureEx(texture, _vec2(position), _float(rotation), _float(scale), _color(tint))
-
-
-def draw_texture_rec(texture, source, position, tint):
-    # type: (Texture2D, Rectangle, Vector2, Color) -> None
-    """Draw a part of a texture defined by a rectangle"""
-    _DrawTextureRec(texture, _rect(source), _vec2(position), _color(tint))
-
-
-def draw_texture_pro(texture, source, dest, origin, rotation, tint):
-    # type: (Texture2D, Rectangle, Rectangle, Vector2, float, Color) -> None
-    """Draw a part of a texture defined by a rectangle with 'pro' parameters"""
-    _DrawTexturePro(texture, _rect(source), _rect(dest), _vec2(origin), _float(rotation), _color(tint))
-
-
-def draw_texture_npatch(texture, n_patch_info, dest, origin, rotation, tint):
-    # type: (Texture2D, NPatchInfo, Rectangle, Vector2, float, Color) -> None
-    """Draws a texture (or part of it) that stretches or shrinks nicely"""
-    _DrawTextureNPatch(texture, n_patch_info, _rect(dest), _vec2(origin), _float(rotation), _color(tint))
-
-
-def fade(color, alpha):
-    # type: (Color, float) -> Color
-    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
-    return _Fade(_color(color), _float(alpha))
-
-
-def color_to_int(color):
-    # type: (Color) -> int
-    """Get hexadecimal value for a Color"""
-    return _ColorToInt(_color(color))
-
-
-def color_normalize(color):
-    # type: (Color) -> Vector4
-    """Get Color normalized as float [0..1]"""
-    return _ColorNormalize(_color(color))
-
-
-def color_from_normalized(normalized):
-    # type: (Vector4) -> Color
-    """Get Color from normalized values [0..1]"""
-    return _ColorFromNormalized(_vec4(normalized))
-
-
-def color_to_hsv(color):
-    # type: (Color) -> Vector3
-    """Get HSV values for a Color, hue [0..360], saturation/value [0..1]"""
-    return _ColorToHSV(_color(color))
-
-
-def color_from_hsv(hue, saturation, value):
-    # type: (float, float, float) -> Color
-    """Get a Color from HSV values, hue [0..360], saturation/value [0..1]"""
-    return _ColorFromHSV(_float(hue), _float(saturation), _float(value))
-
-
-def color_tint(color, tint):
-    # type: (Color, Color) -> Color
-    """Get color multiplied with another color"""
-    return _ColorTint(_color(color), _color(tint))
-
-
-def color_brightness(color, factor):
-    # type: (Color, float) -> Color
-    """Get color with brightness correction, brightness factor goes from -1.0f to 1.0f"""
-    return _ColorBrightness(_color(color), _float(factor))
-
-
-def color_contrast(color, contrast):
-    # type: (Color, float) -> Color
-    """Get color with contrast correction, contrast values between -1.0f and 1.0f"""
-    return _ColorContrast(_color(color), _float(contrast))
-
-
-def color_alpha(color, alpha):
-    # type: (Color, float) -> Color
-    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
-    return _ColorAlpha(_color(color), _float(alpha))
-
-
-def color_alpha_blend(dst, src, tint):
-    # type: (Color, Color, Color) -> Color
-    """Get src alpha-blended into dst color with tint"""
-    return _ColorAlphaBlend(_color(dst), _color(src), _color(tint))
-
-
-def get_color(hex_value):
-    # type: (int) -> Color
-    """Get Color structure from hexadecimal value"""
-    return _GetColor(_int(hex_value))
-
-
-def get_pixel_color(src_ptr, format_):
-    # type: (bytes | str | None, int) -> Color
-    """Get Color from a source pixel pointer of certain format"""
-    return _GetPixelColor(src_ptr, _int(format_))
-
-
-def set_pixel_color(dst_ptr, color, format_):
-    # type: (bytes | str | None, Color, int) -> None
-    """Set color formatted into destination pixel pointer"""
-    _SetPixelColor(dst_ptr, _color(color), _int(format_))
-
-
-def get_pixel_data_size(width, height, format_):
-    # type: (int, int, int) -> int
-    """Get pixel data size in bytes for certain format"""
-    return _GetPixelDataSize(_int(width), _int(height), _int(format_))
-
-
-def get_font_default():
-    # type: () -> Font
-    """Get the default Font"""
-    return _GetFontDefault()
-
-
-def load_font(file_name):
-    # type: (bytes | str | None) -> Font
-    """Load font from file into GPU memory (VRAM)"""
-    return _LoadFont(_str_in(file_name))
-
-
-def load_font_ex(file_name, font_size, codepoints, codepoint_count):
-    # type: (bytes | str | None, int, list[int] | str, int) -> Font
-    """Load font from file with extended parameters, use NULL for codepoints and 0 for codepointCount to load the default character setFont"""
-    codepoints = int_array(codepoints)
-    result = _LoadFontEx(_str_in(file_name), _int(font_size), byref(codepoints), _int(codepoint_count))
-    result = result.contents[:codepoints]
-    return result
-
-
-def load_font_from_image(image, key, first_char):
-    # type: (Image, Color, int) -> Font
-    """Load font from Image (XNA style)"""
-    return _LoadFontFromImage(image, _color(key), _int(first_char))
-
-
-def load_font_from_memory(file_type, file_data, data_size, font_size, codepoints, codepoint_count):
-    # type: (bytes | str | None, int, int, int, list[int] | str, int) -> Font
-    """Load font from memory buffer, fileType refers to extension: i.e. '.ttf'"""
-    codepoints = int_array(codepoints)
-    return _LoadFontFromMemory(_str_in(file_type), _int(file_data, (0, 255)), _int(data_size), _int(font_size), codepoints, _int(codepoint_count))
-
-
-def is_font_ready(font):
-    # type: (Font) -> bool
-    """Check if a font is ready"""
-    return _IsFontReady(font)
-
-
-def load_font_data(file_data, data_size, font_size, codepoints, codepoint_count, type_):
-    # type: (int, int, int, list[int] | str, int, int) -> Array[GlyphInfo]
-    """Load font data for further use"""
-    codepoints = int_array(codepoints)
-    result = _LoadFontData(_int(file_data, (0, 255)), _int(data_size), _int(font_size), byref(codepoints), _int(codepoint_count), _int(type_))
-    result = cast(result, POINTER(GlyphInfo * codepoints.value))[0]
-    _clear_in_out()
-    _push_in_out(codepoints.value)
-    return result
-
-
-def gen_image_font_atlas(glyphs, glyph_recs, glyph_count, font_size, padding, pack_method):
-    # type: (GlyphInfoPtr, RectanglePtrPtr, int, int, int, int) -> Image
-    """Generate image font atlas using chars info"""
-    return _GenImageFontAtlas(glyphs, glyph_recs, _int(glyph_count), _int(font_size), _int(padding), _int(pack_method))
-
-
-def unload_font_data(glyphs, glyph_count):
-    # type: (GlyphInfoPtr, int) -> None
-    """Unload font chars info data (RAM)"""
-    _UnloadFontData(glyphs, _int(glyph_count))
-
-
-def unload_font(font):
-    # type: (Font) -> None
-    """Unload font from GPU memory (VRAM)"""
-    _UnloadFont(font)
-
-
-def export_font_as_code(font, file_name):
-    # type: (Font, bytes | str | None) -> bool
-    """Export font as code file, returns true on success"""
-    return _ExportFontAsCode(font, _str_in(file_name))
-
-
-def draw_fps(pos_x, pos_y):
-    # type: (int, int) -> None
-    """Draw current FPS"""
-    _DrawFPS(_int(pos_x), _int(pos_y))
-
-
-def draw_text(text, pos_x, pos_y, font_size, color):
-    # type: (bytes | str | None, int, int, int, Color) -> None
-    """Draw text (using default font)"""
-    _DrawText(_str_in(text), _int(pos_x), _int(pos_y), _int(font_size), _color(color))
-
-
-def draw_text_ex(font, text, position, font_size, spacing, tint):
-    # type: (Font, bytes | str | None, Vector2, float, float, Color) -> None
-    """Draw text using font and additional parameters"""
-    _DrawTextEx(font, _str_in(text), _vec2(position), _float(font_size), _float(spacing), _color(tint))
-
-
-def draw_text_pro(font, text, position, origin, rotation, font_size, spacing, tint):
-    # type: (Font, bytes | str | None, Vector2, Vector2, float, float, float, Color) -> None
-    """Draw text using Font and pro parameters (rotation)"""
-    _DrawTextPro(font, _str_in(text), _vec2(position), _vec2(origin), _float(rotation), _float(font_size), _float(spacing), _color(tint))
-
-
-def draw_text_codepoint(font, codepoint, position, font_size, tint):
-    # type: (Font, int, Vector2, float, Color) -> None
-    """Draw one character (codepoint)"""
-    _DrawTextCodepoint(font, _int(codepoint), _vec2(position), _float(font_size), _color(tint))
-
-
-def draw_text_codepoints(font, codepoints, codepoint_count, position, font_size, spacing, tint):
-    # type: (Font, IntPtr, int, Vector2, float, float, Color) -> None
-    """Draw multiple character (codepoint)"""
-    _DrawTextCodepoints(font, codepoints, _int(codepoint_count), _vec2(position), _float(font_size), _float(spacing), _color(tint))
-
-
-def set_text_line_spacing(spacing):
-    # type: (int) -> None
-    """Set vertical line spacing when drawing with line-breaks"""
-    _SetTextLineSpacing(_int(spacing))
-
-
-def measure_text(text, font_size):
-    # type: (bytes | str | None, int) -> int
-    """Measure string width for default font"""
-    return _MeasureText(_str_in(text), _int(font_size))
-
-
-def measure_text_ex(font, text, font_size, spacing):
-    # type: (Font, bytes | str | None, float, float) -> Vector2
-    """Measure string size for Font"""
-    return _MeasureTextEx(font, _str_in(text), _float(font_size), _float(spacing))
-
-
-def get_glyph_index(font, codepoint):
-    # type: (Font, int) -> int
-    """Get glyph index position in font for a codepoint (unicode character), fallback to '?' if not found"""
-    return _GetGlyphIndex(font, _int(codepoint))
-
-
-def get_glyph_info(font, codepoint):
-    # type: (Font, int) -> GlyphInfo
-    """Get glyph font info data for a codepoint (unicode character), fallback to '?' if not found"""
-    return _GetGlyphInfo(font, _int(codepoint))
-
-
-def get_glyph_atlas_rec(font, codepoint):
-    # type: (Font, int) -> Rectangle
-    """Get glyph rectangle in font atlas for a codepoint (unicode character), fallback to '?' if not found"""
-    return _GetGlyphAtlasRec(font, _int(codepoint))
-
-
-def load_utf8(codepoints, length):
-    # type: (IntPtr, int) -> bytes | str | None
-    """Load UTF-8 text encoded from codepoints array"""
-    return _LoadUTF8(codepoints, _int(length))
-
-
-def unload_utf8(text):
-    # type: (bytes | str | None) -> None
-    """Unload UTF-8 text encoded from codepoints array"""
-    _UnloadUTF8(_str_in(text))
-
-
-def load_codepoints(text, count):
-    # type: (bytes | str | None, IntPtr) -> IntPtr
-    """Load all codepoints from a UTF-8 text string, codepoints count returned by parameter"""
-    return _LoadCodepoints(_str_in(text), count)
-
-
-def unload_codepoints(codepoints):
-    # type: (IntPtr) -> None
-    """Unload codepoints data from memory"""
-    _UnloadCodepoints(codepoints)
-
-
-def get_codepoint_count(text):
-    # type: (bytes | str | None) -> int
-    """Get total number of codepoints in a UTF-8 encoded string"""
-    return _GetCodepointCount(_str_in(text))
-
-
-def get_codepoint(text, codepoint_size):
-    # type: (bytes | str | None, IntPtr) -> int
-    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
-    return _GetCodepoint(_str_in(text), codepoint_size)
-
-
-def get_codepoint_next(text, codepoint_size):
-    # type: (bytes | str | None, IntPtr) -> int
-    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
-    return _GetCodepointNext(_str_in(text), codepoint_size)
-
-
-def get_codepoint_previous(text, codepoint_size):
-    # type: (bytes | str | None, IntPtr) -> int
-    """Get previous codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
-    return _GetCodepointPrevious(_str_in(text), codepoint_size)
-
-
-def codepoint_to_utf8(codepoint, utf8_size):
-    # type: (int, IntPtr) -> bytes | str | None
-    """Encode one codepoint into UTF-8 byte array (array length returned as parameter)"""
-    return _CodepointToUTF8(_int(codepoint), utf8_size)
-
-
-def text_copy(dst, src):
-    # type: (bytes | str | None, bytes | str | None) -> int
-    """Copy one string to another, returns bytes copied"""
-    return _TextCopy(_str_in(dst), _str_in(src))
-
-
-def text_is_equal(text1, text2):
-    # type: (bytes | str | None, bytes | str | None) -> bool
-    """Check if two text string are equal"""
-    return _TextIsEqual(_str_in(text1), _str_in(text2))
-
-
-def text_length(text):
-    # type: (bytes | str | None) -> int
-    """Get text length, checks for '\0' ending"""
-    return _TextLength(_str_in(text))
-
-
-def text_format(text, *args):
-    # type: (bytes | str | None, ...) -> bytes | str | None
-    """Text formatting with variables (sprintf() style)"""
-    return _str_out(_TextFormat(_str_in(text), *args))
-
-
-def text_subtext(text, position, length):
-    # type: (bytes | str | None, int, int) -> bytes | str | None
-    """Get a piece of a text string"""
-    return _str_out(_TextSubtext(_str_in(text), _int(position), _int(length)))
-
-
-def text_replace(text, replace, by):
-    # type: (bytes | str | None, bytes | str | None, bytes | str | None) -> bytes | str | None
-    """Replace text string (WARNING: memory must be freed!)"""
-    return _str_out(_TextReplace(_str_in(text), _str_in(replace), _str_in(by)))
-
-
-def text_insert(text, insert, position):
-    # type: (bytes | str | None, bytes | str | None, int) -> bytes | str | None
-    """Insert text in a position (WARNING: memory must be freed!)"""
-    return _str_out(_TextInsert(_str_in(text), _str_in(insert), _int(position)))
-
-
-def text_join(text_list, count, delimiter):
-    # type: (CharPtrPtr | list[CharPtr | str] | None, int, bytes | str | None) -> bytes | str | None
-    """Join text strings with delimiter"""
-    return _str_out(_TextJoin(text_list, _int(count), _str_in(delimiter)))
-
-
-def text_split(text, delimiter, count):
-    # type: (bytes | str | None, int | str, IntPtr) -> CharPtrPtr | list[CharPtr | str] | None
-    """Split text into multiple strings"""
-    return _TextSplit(_str_in(text), _int(delimiter, (-128, 127)), count)
-
-
-def text_append(text, append, position):
-    # type: (bytes | str | None, bytes | str | None, IntPtr) -> None
-    """Append text at specific position and move cursor!"""
-    _TextAppend(_str_in(text), _str_in(append), position)
-
-
-def text_find_index(text, find):
-    # type: (bytes | str | None, bytes | str | None) -> int
-    """Find first text occurrence within a string"""
-    return _TextFindIndex(_str_in(text), _str_in(find))
-
-
-def text_to_upper(text):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get upper case version of provided string"""
-    return _str_out(_TextToUpper(_str_in(text)))
-
-
-def text_to_lower(text):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get lower case version of provided string"""
-    return _str_out(_TextToLower(_str_in(text)))
-
-
-def text_to_pascal(text):
-    # type: (bytes | str | None) -> bytes | str | None
-    """Get Pascal case notation version of provided string"""
-    return _str_out(_TextToPascal(_str_in(text)))
-
-
-def text_to_integer(text):
-    # type: (bytes | str | None) -> int
-    """Get integer value from text (negative values not supported)"""
-    return _TextToInteger(_str_in(text))
-
-
-def draw_line3d(start_pos, end_pos, color):
-    # type: (Vector3, Vector3, Color) -> None
-    """Draw a line in 3D world space"""
-    _DrawLine3D(_vec3(start_pos), _vec3(end_pos), _color(color))
-
-
-def draw_point3d(position, color):
-    # type: (Vector3, Color) -> None
-    """Draw a point in 3D space, actually a small line"""
-    _DrawPoint3D(_vec3(position), _color(color))
-
-
-def draw_circle3d(center, radius, rotation_axis, rotation_angle, color):
-    # type: (Vector3, float, Vector3, float, Color) -> None
-    """Draw a circle in 3D world space"""
-    _DrawCircle3D(_vec3(center), _float(radius), _vec3(rotation_axis), _float(rotation_angle), _color(color))
-
-
-def draw_triangle3d(v1, v2, v3, color):
-    # type: (Vector3, Vector3, Vector3, Color) -> None
-    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
-    _DrawTriangle3D(_vec3(v1), _vec3(v2), _vec3(v3), _color(color))
-
-
-def draw_triangle_strip3d(points, point_count, color):
-    # type: (Vector3Ptr | Array[Vector3], int, Color) -> None
-    """Draw a triangle strip defined by points"""
-    _DrawTriangleStrip3D(points, len(points) if point_count <= 0 else point_count, _color(color))
-
-
-def draw_cube(position, width, height, length, color):
-    # type: (Vector3, float, float, float, Color) -> None
-    """Draw cube"""
-    _DrawCube(_vec3(position), _float(width), _float(height), _float(length), _color(color))
-
-
-def draw_cube_v(position, size, color):
-    # type: (Vector3, Vector3, Color) -> None
-    """Draw cube (Vector version)"""
-    _DrawCubeV(_vec3(position), _vec3(size), _color(color))
-
-
-def draw_cube_wires(position, width, height, length, color):
-    # type: (Vector3, float, float, float, Color) -> None
-    """Draw cube wires"""
-    _DrawCubeWires(_vec3(position), _float(width), _float(height), _float(length), _color(color))
-
-
-def draw_cube_wires_v(position, size, color):
-    # type: (Vector3, Vector3, Color) -> None
-    """Draw cube wires (Vector version)"""
-    _DrawCubeWiresV(_vec3(position), _vec3(size), _color(color))
-
-
-def draw_sphere(center_pos, radius, color):
-    # type: (Vector3, float, Color) -> None
-    """Draw sphere"""
-    _DrawSphere(_vec3(center_pos), _float(radius), _color(color))
-
-
-def draw_sphere_ex(center_pos, radius, rings, slices, color):
-    # type: (Vector3, float, int, int, Color) -> None
-    """Draw sphere with extended parameters"""
-    _DrawSphereEx(_vec3(center_pos), _float(radius), _int(rings), _int(slices), _color(color))
-
-
-def draw_sphere_wires(center_pos, radius, rings, slices, color):
-    # type: (Vector3, float, int, int, Color) -> None
-    """Draw sphere wires"""
-    _DrawSphereWires(_vec3(center_pos), _float(radius), _int(rings), _int(slices), _color(color))
-
-
-def draw_cylinder(position, radius_top, radius_bottom, height, slices, color):
-    # type: (Vector3, float, float, float, int, Color) -> None
-    """Draw a cylinder/cone"""
-    _DrawCylinder(_vec3(position), _float(radius_top), _float(radius_bottom), _float(height), _int(slices), _color(color))
-
-
-def draw_cylinder_ex(start_pos, end_pos, start_radius, end_radius, sides, color):
-    # type: (Vector3, Vector3, float, float, int, Color) -> None
-    """Draw a cylinder with base at startPos and top at endPos"""
-    _DrawCylinderEx(_vec3(start_pos), _vec3(end_pos), _float(start_radius), _float(end_radius), _int(sides), _color(color))
-
-
-def draw_cylinder_wires(position, radius_top, radius_bottom, height, slices, color):
-    # type: (Vector3, float, float, float, int, Color) -> None
-    """Draw a cylinder/cone wires"""
-    _DrawCylinderWires(_vec3(position), _float(radius_top), _float(radius_bottom), _float(height), _int(slices), _color(color))
-
-
-def draw_cylinder_wires_ex(start_pos, end_pos, start_radius, end_radius, sides, color):
-    # type: (Vector3, Vector3, float, float, int, Color) -> None
-    """Draw a cylinder wires with base at startPos and top at endPos"""
-    _DrawCylinderWiresEx(_vec3(start_pos), _vec3(end_pos), _float(start_radius), _float(end_radius), _int(sides), _color(color))
-
-
-def draw_capsule(start_pos, end_pos, radius, slices, rings, color):
-    # type: (Vector3, Vector3, float, int, int, Color) -> None
-    """Draw a capsule with the center of its sphere caps at startPos and endPos"""
-    _DrawCapsule(_vec3(start_pos), _vec3(end_pos), _float(radius), _int(slices), _int(rings), _color(color))
-
-
-def draw_capsule_wires(start_pos, end_pos, radius, slices, rings, color):
-    # type: (Vector3, Vector3, float, int, int, Color) -> None
-    """Draw capsule wireframe with the center of its sphere caps at startPos and endPos"""
-    _DrawCapsuleWires(_vec3(start_pos), _vec3(end_pos), _float(radius), _int(slices), _int(rings), _color(color))
-
-
-def draw_plane(center_pos, size, color):
-    # type: (Vector3, Vector2, Color) -> None
-    """Draw a plane XZ"""
-    _DrawPlane(_vec3(center_pos), _vec2(size), _color(color))
-
-
-def draw_ray(ray, color):
-    # type: (Ray, Color) -> None
-    """Draw a ray line"""
-    _DrawRay(ray, _color(color))
-
-
-def draw_grid(slices, spacing):
-    # type: (int, float) -> None
-    """Draw a grid (centered at (0, 0, 0))"""
-    _DrawGrid(_int(slices), _float(spacing))
-
-
-def load_model(file_name):
-    # type: (bytes | str | None) -> Model
-    """Load model from files (meshes and materials)"""
-    return _LoadModel(_str_in(file_name))
-
-
-def load_model_from_mesh(mesh):
-    # type: (Mesh) -> Model
-    """Load model from generated mesh (default material)"""
-    return _LoadModelFromMesh(mesh)
-
-
-def is_model_ready(model):
-    # type: (Model) -> bool
-    """Check if a model is ready"""
-    return _IsModelReady(model)
-
-
-def unload_model(model):
-    # type: (Model) -> None
-    """Unload model (including meshes) from memory (RAM and/or VRAM)"""
-    _UnloadModel(model)
-
-
-def get_model_bounding_box(model):
-    # type: (Model) -> BoundingBox
-    """Compute model bounding box limits (considers all meshes)"""
-    return _GetModelBoundingBox(model)
-
-
-def draw_model(model, position, scale, tint):
-    # type: (Model, Vector3, float, Color) -> None
-    """Draw a model (with texture if set)"""
-    _DrawModel(model, _vec3(position), _float(scale), _color(tint))
-
-
-def draw_model_ex(model, position, rotation_axis, rotation_angle, scale, tint):
-    # type: (Model, Vector3, Vector3, float, Vector3, Color) -> None
-    """Draw a model with extended parameters"""
-    _DrawModelEx(model, _vec3(position), _vec3(rotation_axis), _float(rotation_angle), _vec3(scale), _color(tint))
-
-
-def draw_model_wires(model, position, scale, tint):
-    # type: (Model, Vector3, float, Color) -> None
-    """Draw a model wires (with texture if set)"""
-    _DrawModelWires(model, _vec3(position), _float(scale), _color(tint))
-
-
-def draw_model_wires_ex(model, position, rotation_axis, rotation_angle, scale, tint):
-    # type: (Model, Vector3, Vector3, float, Vector3, Color) -> None
-    """Draw a model wires (with texture if set) with extended parameters"""
-    _DrawModelWiresEx(model, _vec3(position), _vec3(rotation_axis), _float(rotation_angle), _vec3(scale), _color(tint))
-
-
-def draw_bounding_box(box, color):
-    # type: (BoundingBox, Color) -> None
-    """Draw bounding box (wires)"""
-    _DrawBoundingBox(box, _color(color))
-
-
-def draw_billboard(camera, texture, position, size, tint):
-    # type: (Camera, Texture2D, Vector3, float, Color) -> None
-    """Draw a billboard texture"""
-    _DrawBillboard(camera, texture, _vec3(position), _float(size), _color(tint))
-
-
-def draw_billboard_rec(camera, texture, source, position, size, tint):
-    # type: (Camera, Texture2D, Rectangle, Vector3, Vector2, Color) -> None
-    """Draw a billboard texture defined by source"""
-    _DrawBillboardRec(camera, texture, _rect(source), _vec3(position), _vec2(size), _color(tint))
-
-
-def draw_billboard_pro(camera, texture, source, position, up, size, origin, rotation, tint):
-    # type: (Camera, Texture2D, Rectangle, Vector3, Vector3, Vector2, Vector2, float, Color) -> None
-    """Draw a billboard texture defined by source and rotation"""
-    _DrawBillboardPro(camera, texture, _rect(source), _vec3(position), _vec3(up), _vec2(size), _vec2(origin), _float(rotation), _color(tint))
-
-
-def upload_mesh(mesh, dynamic):
-    # type: (MeshPtr, bool) -> None
-    """Upload mesh vertex data in GPU and provide VAO/VBO ids"""
-    _UploadMesh(mesh, _bool(dynamic))
-
-
-def update_mesh_buffer(mesh, index, data, data_size, offset):
-    # type: (Mesh, int, bytes | str | None, int, int) -> None
-    """Update mesh vertex data in GPU for a specific buffer index"""
-    _UpdateMeshBuffer(mesh, _int(index), data, _int(data_size), _int(offset))
-
-
-def unload_mesh(mesh):
-    # type: (Mesh) -> None
-    """Unload mesh data from CPU and GPU"""
-    _UnloadMesh(mesh)
-
-
-def draw_mesh(mesh, material, transform):
-    # type: (Mesh, Material, Matrix) -> None
-    """Draw a 3d mesh with material and transform"""
-    _DrawMesh(mesh, material, transform)
-
-
-def draw_mesh_instanced(mesh, material, transforms, instances):
-    # type: (Mesh, Material, MatrixPtr, int) -> None
-    """Draw multiple mesh instances with material and different transforms"""
-    _DrawMeshInstanced(mesh, material, transforms, _int(instances))
-
-
-def export_mesh(mesh, file_name):
-    # type: (Mesh, bytes | str | None) -> bool
-    """Export mesh data to file, returns true on success"""
-    return _ExportMesh(mesh, _str_in(file_name))
-
-
-def get_mesh_bounding_box(mesh):
-    # type: (Mesh) -> BoundingBox
-    """Compute mesh bounding box limits"""
-    return _GetMeshBoundingBox(mesh)
-
-
-def gen_mesh_tangents(mesh):
-    # type: (MeshPtr) -> None
-    """Compute mesh tangents"""
-    _GenMeshTangents(mesh)
-
-
-def gen_mesh_poly(sides, radius):
-    # type: (int, float) -> Mesh
-    """Generate polygonal mesh"""
-    return _GenMeshPoly(_int(sides), _float(radius))
-
-
-def gen_mesh_plane(width, length, res_x, res_z):
-    # type: (float, float, int, int) -> Mesh
-    """Generate plane mesh (with subdivisions)"""
-    return _GenMeshPlane(_float(width), _float(length), _int(res_x), _int(res_z))
-
-
-def gen_mesh_cube(width, height, length):
-    # type: (float, float, float) -> Mesh
-    """Generate cuboid mesh"""
-    return _GenMeshCube(_float(width), _float(height), _float(length))
-
-
-def gen_mesh_sphere(radius, rings, slices):
-    # type: (float, int, int) -> Mesh
-    """Generate sphere mesh (standard sphere)"""
-    return _GenMeshSphere(_float(radius), _int(rings), _int(slices))
-
-
-def gen_mesh_hemi_sphere(radius, rings, slices):
-    # type: (float, int, int) -> Mesh
-    """Generate half-sphere mesh (no bottom cap)"""
-    return _GenMeshHemiSphere(_float(radius), _int(rings), _int(slices))
-
-
-def gen_mesh_cylinder(radius, height, slices):
-    # type: (float, float, int) -> Mesh
-    """Generate cylinder mesh"""
-    return _GenMeshCylinder(_float(radius), _float(height), _int(slices))
-
-
-def gen_mesh_cone(radius, height, slices):
-    # type: (float, float, int) -> Mesh
-    """Generate cone/pyramid mesh"""
-    return _GenMeshCone(_float(radius), _float(height), _int(slices))
-
-
-def gen_mesh_torus(radius, size, rad_seg, sides):
-    # type: (float, float, int, int) -> Mesh
-    """Generate torus mesh"""
-    return _GenMeshTorus(_float(radius), _float(size), _int(rad_seg), _int(sides))
-
-
-def gen_mesh_knot(radius, size, rad_seg, sides):
-    # type: (float, float, int, int) -> Mesh
-    """Generate trefoil knot mesh"""
-    return _GenMeshKnot(_float(radius), _float(size), _int(rad_seg), _int(sides))
-
-
-def gen_mesh_heightmap(heightmap, size):
-    # type: (Image, Vector3) -> Mesh
-    """Generate heightmap mesh from image data"""
-    return _GenMeshHeightmap(heightmap, _vec3(size))
-
-
-def gen_mesh_cubicmap(cubicmap, cube_size):
-    # type: (Image, Vector3) -> Mesh
-    """Generate cubes-based map mesh from image data"""
-    return _GenMeshCubicmap(cubicmap, _vec3(cube_size))
-
-
-def load_materials(file_name, material_count):
-    # type: (bytes | str | None, int) -> Array[Material]
-    """Load materials from model file"""
-    material_count = Int(material_count)
-    result = _LoadMaterials(_str_in(file_name), byref(material_count))
-    result = cast(result, POINTER(Material * material_count.value))[0]
-    _clear_in_out()
-    _push_in_out(material_count.value)
-    return result
-
-
-def load_material_default():
-    # type: () -> Material
-    """Load default material (Supports: DIFFUSE, SPECULAR, NORMAL maps)"""
-    return _LoadMaterialDefault()
-
-
-def is_material_ready(material):
-    # type: (Material) -> bool
-    """Check if a material is ready"""
-    return _IsMaterialReady(material)
-
-
-def unload_material(material):
-    # type: (Material) -> None
-    """Unload material from GPU memory (VRAM)"""
-    _UnloadMaterial(material)
-
-
-def set_material_texture(material, map_type, texture):
-    # type: (MaterialPtr, int, Texture2D) -> None
-    """Set texture for a material map type (MATERIAL_MAP_DIFFUSE, MATERIAL_MAP_SPECULAR...)"""
-    _SetMaterialTexture(material, _int(map_type), texture)
-
-
-def set_model_mesh_material(model, mesh_id, material_id):
-    # type: (ModelPtr, int, int) -> None
-    """Set material for a mesh"""
-    _SetModelMeshMaterial(model, _int(mesh_id), _int(material_id))
-
-
-def load_model_animations(file_name, anim_count):
-    # type: (bytes | str | None, int) -> Array[ModelAnimation]
-    """Load model animations from file"""
-    anim_count = Int(anim_count)
-    result = _LoadModelAnimations(_str_in(file_name), byref(anim_count))
-    result = cast(result, POINTER(ModelAnimation * anim_count.value))[0]
-    _clear_in_out()
-    _push_in_out(anim_count.value)
-    return result
-
-
-def update_model_animation(model, anim, frame):
-    # type: (Model, ModelAnimation, int) -> None
-    """Update model animation pose"""
-    _UpdateModelAnimation(model, anim, _int(frame))
-
-
-def unload_model_animation(anim):
-    # type: (ModelAnimation) -> None
-    """Unload animation data"""
-    _UnloadModelAnimation(anim)
-
-
-def unload_model_animations(animations, anim_count):
-    # type: (ModelAnimationPtr, int) -> None
-    """Unload animation array data"""
-    _UnloadModelAnimations(animations, _int(anim_count))
-
-
-def is_model_animation_valid(model, anim):
-    # type: (Model, ModelAnimation) -> bool
-    """Check model animation skeleton match"""
-    return _IsModelAnimationValid(model, anim)
-
-
-def check_collision_spheres(center1, radius1, center2, radius2):
-    # type: (Vector3, float, Vector3, float) -> bool
-    """Check collision between two spheres"""
-    return _CheckCollisionSpheres(_vec3(center1), _float(radius1), _vec3(center2), _float(radius2))
-
-
-def check_collision_boxes(box1, box2):
-    # type: (BoundingBox, BoundingBox) -> bool
-    """Check collision between two bounding boxes"""
-    return _CheckCollisionBoxes(box1, box2)
-
-
-def check_collision_box_sphere(box, center, radius):
-    # type: (BoundingBox, Vector3, float) -> bool
-    """Check collision between box and sphere"""
-    return _CheckCollisionBoxSphere(box, _vec3(center), _float(radius))
-
-
-def get_ray_collision_sphere(ray, center, radius):
-    # type: (Ray, Vector3, float) -> RayCollision
-    """Get collision info between ray and sphere"""
-    return _GetRayCollisionSphere(ray, _vec3(center), _float(radius))
-
-
-def get_ray_collision_box(ray, box):
-    # type: (Ray, BoundingBox) -> RayCollision
-    """Get collision info between ray and box"""
-    return _GetRayCollisionBox(ray, box)
-
-
-def get_ray_collision_mesh(ray, mesh, transform):
-    # type: (Ray, Mesh, Matrix) -> RayCollision
-    """Get collision info between ray and mesh"""
-    return _GetRayCollisionMesh(ray, mesh, transform)
-
-
-def get_ray_collision_triangle(ray, p1, p2, p3):
-    # type: (Ray, Vector3, Vector3, Vector3) -> RayCollision
-    """Get collision info between ray and triangle"""
-    return _GetRayCollisionTriangle(ray, _vec3(p1), _vec3(p2), _vec3(p3))
-
-
-def get_ray_collision_quad(ray, p1, p2, p3, p4):
-    # type: (Ray, Vector3, Vector3, Vector3, Vector3) -> RayCollision
-    """Get collision info between ray and quad"""
-    return _GetRayCollisionQuad(ray, _vec3(p1), _vec3(p2), _vec3(p3), _vec3(p4))
-
-
-def init_audio_device():
-    # type: () -> None
-    """Initialize audio device and context"""
-    _InitAudioDevice()
-
-
-def close_audio_device():
-    # type: () -> None
-    """Close the audio device and context"""
-    _CloseAudioDevice()
-
-
-def is_audio_device_ready():
-    # type: () -> bool
-    """Check if audio device has been initialized successfully"""
-    return _IsAudioDeviceReady()
-
-
-def set_master_volume(volume):
-    # type: (float) -> None
-    """Set master volume (listener)"""
-    _SetMasterVolume(_float(volume))
-
-
-def get_master_volume():
-    # type: () -> float
-    """Get master volume (listener)"""
-    return _GetMasterVolume()
-
-
-def load_wave(file_name):
-    # type: (bytes | str | None) -> Wave
-    """Load wave data from file"""
-    return _LoadWave(_str_in(file_name))
-
-
-def load_wave_from_memory(file_type, file_data, data_size):
-    # type: (bytes | str | None, int, int) -> Wave
-    """Load wave from memory buffer, fileType refers to extension: i.e. '.wav'"""
-    return _LoadWaveFromMemory(_str_in(file_type), _int(file_data, (0, 255)), _int(data_size))
-
-
-def is_wave_ready(wave):
-    # type: (Wave) -> bool
-    """Checks if wave data is ready"""
-    return _IsWaveReady(wave)
-
-
-def load_sound(file_name):
-    # type: (bytes | str | None) -> Sound
-    """Load sound from file"""
-    return _LoadSound(_str_in(file_name))
-
-
-def load_sound_from_wave(wave):
-    # type: (Wave) -> Sound
-    """Load sound from wave data"""
-    return _LoadSoundFromWave(wave)
-
-
-def load_sound_alias(source):
-    # type: (Sound) -> Sound
-    """Create a new sound that shares the same sample data as the source sound, does not own the sound data"""
-    return _LoadSoundAlias(source)
-
-
-def is_sound_ready(sound):
-    # type: (Sound) -> bool
-    """Checks if a sound is ready"""
-    return _IsSoundReady(sound)
-
-
-def update_sound(sound, data, sample_count):
-    # type: (Sound, bytes | str | None, int) -> None
-    """Update sound buffer with new data"""
-    _UpdateSound(sound, data, _int(sample_count))
-
-
-def unload_wave(wave):
-    # type: (Wave) -> None
-    """Unload wave data"""
-    _UnloadWave(wave)
-
-
-def unload_sound(sound):
-    # type: (Sound) -> None
-    """Unload sound"""
-    _UnloadSound(sound)
-
-
-def unload_sound_alias(alias):
-    # type: (Sound) -> None
-    """Unload a sound alias (does not deallocate sample data)"""
-    _UnloadSoundAlias(alias)
-
-
-def export_wave(wave, file_name):
-    # type: (Wave, bytes | str | None) -> bool
-    """Export wave data to file, returns true on success"""
-    return _ExportWave(wave, _str_in(file_name))
-
-
-def export_wave_as_code(wave, file_name):
-    # type: (Wave, bytes | str | None) -> bool
-    """Export wave sample data to code (.h), returns true on success"""
-    return _ExportWaveAsCode(wave, _str_in(file_name))
-
-
-def play_sound(sound):
-    # type: (Sound) -> None
-    """Play a sound"""
-    _PlaySound(sound)
-
-
-def stop_sound(sound):
-    # type: (Sound) -> None
-    """Stop playing a sound"""
-    _StopSound(sound)
-
-
-def pause_sound(sound):
-    # type: (Sound) -> None
-    """Pause a sound"""
-    _PauseSound(sound)
-
-
-def resume_sound(sound):
-    # type: (Sound) -> None
-    """Resume a paused sound"""
-    _ResumeSound(sound)
-
-
-def is_sound_playing(sound):
-    # type: (Sound) -> bool
-    """Check if a sound is currently playing"""
-    return _IsSoundPlaying(sound)
-
-
-def set_sound_volume(sound, volume):
-    # type: (Sound, float) -> None
-    """Set volume for a sound (1.0 is max level)"""
-    _SetSoundVolume(sound, _float(volume))
-
-
-def set_sound_pitch(sound, pitch):
-    # type: (Sound, float) -> None
-    """Set pitch for a sound (1.0 is base level)"""
-    _SetSoundPitch(sound, _float(pitch))
-
-
-def set_sound_pan(sound, pan):
-    # type: (Sound, float) -> None
-    """Set pan for a sound (0.5 is center)"""
-    _SetSoundPan(sound, _float(pan))
-
-
-def wave_copy(wave):
-    # type: (Wave) -> Wave
-    """Copy a wave to a new wave"""
-    return _WaveCopy(wave)
-
-
-def wave_crop(wave, init_sample, final_sample):
-    # type: (WavePtr, int, int) -> None
-    """Crop a wave to defined samples range"""
-    _WaveCrop(wave, _int(init_sample), _int(final_sample))
-
-
-def wave_format(wave, sample_rate, sample_size, channels):
-    # type: (WavePtr, int, int, int) -> None
-    """Convert wave data to desired format"""
-    _WaveFormat(wave, _int(sample_rate), _int(sample_size), _int(channels))
-
-
-def load_wave_samples(wave):
-    # type: (Wave) -> FloatPtr
-    """Load samples data from wave as a 32bit float data array"""
-    return _LoadWaveSamples(wave)
-
-
-def unload_wave_samples(samples):
-    # type: (FloatPtr) -> None
-    """Unload samples data loaded with LoadWaveSamples()"""
-    _UnloadWaveSamples(samples)
-
-
-def load_music_stream(file_name):
-    # type: (bytes | str | None) -> Music
-    """Load music stream from file"""
-    return _LoadMusicStream(_str_in(file_name))
-
-
-def load_music_stream_from_memory(file_type, data, data_size):
-    # type: (bytes | str | None, int, int) -> Music
-    """Load music stream from data"""
-    return _LoadMusicStreamFromMemory(_str_in(file_type), _int(data, (0, 255)), _int(data_size))
-
-
-def is_music_ready(music):
-    # type: (Music) -> bool
-    """Checks if a music stream is ready"""
-    return _IsMusicReady(music)
-
-
-def unload_music_stream(music):
-    # type: (Music) -> None
-    """Unload music stream"""
-    _UnloadMusicStream(music)
-
-
-def play_music_stream(music):
-    # type: (Music) -> None
-    """Start music playing"""
-    _PlayMusicStream(music)
-
-
-def is_music_stream_playing(music):
-    # type: (Music) -> bool
-    """Check if music is playing"""
-    return _IsMusicStreamPlaying(music)
-
-
-def update_music_stream(music):
-    # type: (Music) -> None
-    """Updates buffers for music streaming"""
-    _UpdateMusicStream(music)
-
-
-def stop_music_stream(music):
-    # type: (Music) -> None
-    """Stop music playing"""
-    _StopMusicStream(music)
-
-
-def pause_music_stream(music):
-    # type: (Music) -> None
-    """Pause music playing"""
-    _PauseMusicStream(music)
-
-
-def resume_music_stream(music):
-    # type: (Music) -> None
-    """Resume playing paused music"""
-    _ResumeMusicStream(music)
-
-
-def seek_music_stream(music, position):
-    # type: (Music, float) -> None
-    """Seek music to a position (in seconds)"""
-    _SeekMusicStream(music, _float(position))
-
-
-def set_music_volume(music, volume):
-    # type: (Music, float) -> None
-    """Set volume for music (1.0 is max level)"""
-    _SetMusicVolume(music, _float(volume))
-
-
-def set_music_pitch(music, pitch):
-    # type: (Music, float) -> None
-    """Set pitch for a music (1.0 is base level)"""
-    _SetMusicPitch(music, _float(pitch))
-
-
-def set_music_pan(music, pan):
-    # type: (Music, float) -> None
-    """Set pan for a music (0.5 is center)"""
-    _SetMusicPan(music, _float(pan))
-
-
-def get_music_time_length(music):
-    # type: (Music) -> float
-    """Get music time length (in seconds)"""
-    return _GetMusicTimeLength(music)
-
-
-def get_music_time_played(music):
-    # type: (Music) -> float
-    """Get current music time played (in seconds)"""
-    return _GetMusicTimePlayed(music)
-
-
-def load_audio_stream(sample_rate, sample_size, channels):
-    # type: (int, int, int) -> AudioStream
-    """Load audio stream (to stream raw audio pcm data)"""
-    return _LoadAudioStream(_int(sample_rate), _int(sample_size), _int(channels))
-
-
-def is_audio_stream_ready(stream):
-    # type: (AudioStream) -> bool
-    """Checks if an audio stream is ready"""
-    return _IsAudioStreamReady(stream)
-
-
-def unload_audio_stream(stream):
-    # type: (AudioStream) -> None
-    """Unload audio stream and free memory"""
-    _UnloadAudioStream(stream)
-
-
-def update_audio_stream(stream, data, frame_count):
-    # type: (AudioStream, bytes | str | None, int) -> None
-    """Update audio stream buffers with data"""
-    _UpdateAudioStream(stream, data, _int(frame_count))
-
-
-def is_audio_stream_processed(stream):
-    # type: (AudioStream) -> bool
-    """Check if any audio stream buffers requires refill"""
-    return _IsAudioStreamProcessed(stream)
-
-
-def play_audio_stream(stream):
-    # type: (AudioStream) -> None
-    """Play audio stream"""
-    _PlayAudioStream(stream)
-
-
-def pause_audio_stream(stream):
-    # type: (AudioStream) -> None
-    """Pause audio stream"""
-    _PauseAudioStream(stream)
-
-
-def resume_audio_stream(stream):
-    # type: (AudioStream) -> None
-    """Resume audio stream"""
-    _ResumeAudioStream(stream)
-
-
-def is_audio_stream_playing(stream):
-    # type: (AudioStream) -> bool
-    """Check if audio stream is playing"""
-    return _IsAudioStreamPlaying(stream)
-
-
-def stop_audio_stream(stream):
-    # type: (AudioStream) -> None
-    """Stop audio stream"""
-    _StopAudioStream(stream)
-
-
-def set_audio_stream_volume(stream, volume):
-    # type: (AudioStream, float) -> None
-    """Set volume for audio stream (1.0 is max level)"""
-    _SetAudioStreamVolume(stream, _float(volume))
-
-
-def set_audio_stream_pitch(stream, pitch):
-    # type: (AudioStream, float) -> None
-    """Set pitch for audio stream (1.0 is base level)"""
-    _SetAudioStreamPitch(stream, _float(pitch))
-
-
-def set_audio_stream_pan(stream, pan):
-    # type: (AudioStream, float) -> None
-    """Set pan for audio stream (0.5 is centered)"""
-    _SetAudioStreamPan(stream, _float(pan))
-
-
-def set_audio_stream_buffer_size_default(size):
-    # type: (int) -> None
-    """Default size for new audio streams"""
-    _SetAudioStreamBufferSizeDefault(_int(size))
-
-
-def set_audio_stream_callback(stream, callback):
-    # type: (AudioStream, AudioCallback) -> None
-    """Audio thread callback to request new data"""
-    _SetAudioStreamCallback(stream, callback)
-
-
-def attach_audio_stream_processor(stream, processor):
-    # type: (AudioStream, AudioCallback) -> None
-    """Attach audio stream processor to stream, receives the samples as <float>s"""
-    _AttachAudioStreamProcessor(stream, processor)
-
-
-def detach_audio_stream_processor(stream, processor):
-    # type: (AudioStream, AudioCallback) -> None
-    """Detach audio stream processor from stream"""
-    _DetachAudioStreamProcessor(stream, processor)
-
-
-def attach_audio_mixed_processor(processor):
-    # type: (AudioCallback) -> None
-    """Attach audio stream processor to the entire audio pipeline, receives the samples as <float>s"""
-    _AttachAudioMixedProcessor(processor)
-
-
-def detach_audio_mixed_processor(processor):
-    # type: (AudioCallback) -> None
-    """Detach audio stream processor from the entire audio pipeline"""
-    _DetachAudioMixedProcessor(processor)
-
-
-# rlapi::raymath
-# ------------------------------------------------------------------------------
-
-def clamp(value, min_, max_):
-    # type: (float, float, float) -> float
-    return _Clamp(_float(value), _float(min_), _float(max_))
-
-
-def lerp(start, end, amount):
-    # type: (float, float, float) -> float
-    return _Lerp(_float(start), _float(end), _float(amount))
-
-
-def normalize(value, start, end):
-    # type: (float, float, float) -> float
-    return _Normalize(_float(value), _float(start), _float(end))
-
-
-def remap(value, input_start, input_end, output_start, output_end):
-    # type: (float, float, float, float, float) -> float
-    return _Remap(_float(value), _float(input_start), _float(input_end), _float(output_start), _float(output_end))
-
-
-def wrap(value, min_, max_):
-    # type: (float, float, float) -> float
-    return _Wrap(_float(value), _float(min_), _float(max_))
-
-
-def float_equals(x, y):
-    # type: (float, float) -> int
-    return _FloatEquals(_float(x), _float(y))
-
-
-def vector2_zero():
-    # type: () -> Vector2
-    return _Vector2Zero()
-
-
-def vector2_one():
-    # type: () -> Vector2
-    return _Vector2One()
-
-
-def vector2_add(v1, v2):
-    # type: (Vector2, Vector2) -> Vector2
-    return _Vector2Add(v1, v2)
-
-
-def vector2_add_value(v, add):
-    # type: (Vector2, float) -> Vector2
-    return _Vector2AddValue(v, _float(add))
-
-
-def vector2_subtract(v1, v2):
-    # type: (Vector2, Vector2) -> Vector2
-    return _Vector2Subtract(v1, v2)
-
-
-def vector2_subtract_value(v, sub):
-    # type: (Vector2, float) -> Vector2
-    return _Vector2SubtractValue(v, _float(sub))
-
-
-def vector2_length(v):
-    # type: (Vector2) -> float
-    return _Vector2Length(v)
-
-
-def vector2_length_sqr(v):
-    # type: (Vector2) -> float
-    return _Vector2LengthSqr(v)
-
-
-def vector2_dot_product(v1, v2):
-    # type: (Vector2, Vector2) -> float
-    return _Vector2DotProduct(v1, v2)
-
-
-def vector2_distance(v1, v2):
-    # type: (Vector2, Vector2) -> float
-    return _Vector2Distance(v1, v2)
-
-
-def vector2_distance_sqr(v1, v2):
-    # type: (Vector2, Vector2) -> float
-    return _Vector2DistanceSqr(v1, v2)
-
-
-def vector2_angle(v1, v2):
-    # type: (Vector2, Vector2) -> float
-    return _Vector2Angle(v1, v2)
-
-
-def vector2_line_angle(start, end):
-    # type: (Vector2, Vector2) -> float
-    return _Vector2LineAngle(start, end)
-
-
-def vector2_scale(v, scale):
-    # type: (Vector2, float) -> Vector2
-    return _Vector2Scale(v, _float(scale))
-
-
-def vector2_multiply(v1, v2):
-    # type: (Vector2, Vector2) -> Vector2
-    return _Vector2Multiply(v1, v2)
-
-
-def vector2_negate(v):
-    # type: (Vector2) -> Vector2
-    return _Vector2Negate(v)
-
-
-def vector2_divide(v1, v2):
-    # type: (Vector2, Vector2) -> Vector2
-    return _Vector2Divide(v1, v2)
-
-
-def vector2_normalize(v):
-    # type: (Vector2) -> Vector2
-    return _Vector2Normalize(v)
-
-
-def vector2_transform(v, mat):
-    # type: (Vector2, Matrix) -> Vector2
-    return _Vector2Transform(v, mat)
-
-
-def vector2_lerp(v1, v2, amount):
-    # type: (Vector2, Vector2, float) -> Vector2
-    return _Vector2Lerp(v1, v2, _float(amount))
-
-
-def vector2_reflect(v, normal):
-    # type: (Vector2, Vector2) -> Vector2
-    return _Vector2Reflect(v, normal)
-
-
-def vector2_rotate(v, angle):
-    # type: (Vector2, float) -> Vector2
-    return _Vector2Rotate(v, _float(angle))
-
-
-def vector2_move_towards(v, target, max_distance):
-    # type: (Vector2, Vector2, float) -> Vector2
-    return _Vector2MoveTowards(v, target, _float(max_distance))
-
-
-def vector2_invert(v):
-    # type: (Vector2) -> Vector2
-    return _Vector2Invert(v)
-
-
-def vector2_clamp(v, min_, max_):
-    # type: (Vector2, Vector2, Vector2) -> Vector2
-    return _Vector2Clamp(v, min_, max_)
-
-
-def vector2_clamp_value(v, min_, max_):
-    # type: (Vector2, float, float) -> Vector2
-    return _Vector2ClampValue(v, _float(min_), _float(max_))
-
-
-def vector2_equals(p, q):
-    # type: (Vector2, Vector2) -> int
-    return _Vector2Equals(p, q)
-
-
-def vector3_zero():
-    # type: () -> Vector3
-    return _Vector3Zero()
-
-
-def vector3_one():
-    # type: () -> Vector3
-    return _Vector3One()
-
-
-def vector3_add(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Add(v1, v2)
-
-
-def vector3_add_value(v, add):
-    # type: (Vector3, float) -> Vector3
-    return _Vector3AddValue(v, _float(add))
-
-
-def vector3_subtract(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Subtract(v1, v2)
-
-
-def vector3_subtract_value(v, sub):
-    # type: (Vector3, float) -> Vector3
-    return _Vector3SubtractValue(v, _float(sub))
-
-
-def vector3_scale(v, scalar):
-    # type: (Vector3, float) -> Vector3
-    return _Vector3Scale(v, _float(scalar))
-
-
-def vector3_multiply(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Multiply(v1, v2)
-
-
-def vector3_cross_product(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3CrossProduct(v1, v2)
-
-
-def vector3_perpendicular(v):
-    # type: (Vector3) -> Vector3
-    return _Vector3Perpendicular(v)
-
-
-def vector3_length(v):
-    # type: (Vector3) -> float
-    return _Vector3Length(v)
-
-
-def vector3_length_sqr(v):
-    # type: (Vector3) -> float
-    return _Vector3LengthSqr(v)
-
-
-def vector3_dot_product(v1, v2):
-    # type: (Vector3, Vector3) -> float
-    return _Vector3DotProduct(v1, v2)
-
-
-def vector3_distance(v1, v2):
-    # type: (Vector3, Vector3) -> float
-    return _Vector3Distance(v1, v2)
-
-
-def vector3_distance_sqr(v1, v2):
-    # type: (Vector3, Vector3) -> float
-    return _Vector3DistanceSqr(v1, v2)
-
-
-def vector3_angle(v1, v2):
-    # type: (Vector3, Vector3) -> float
-    return _Vector3Angle(v1, v2)
-
-
-def vector3_negate(v):
-    # type: (Vector3) -> Vector3
-    return _Vector3Negate(v)
-
-
-def vector3_divide(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Divide(v1, v2)
-
-
-def vector3_normalize(v):
-    # type: (Vector3) -> Vector3
-    return _Vector3Normalize(v)
-
-
-def vector3_project(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Project(v1, v2)
-
-
-def vector3_reject(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Reject(v1, v2)
-
-
-def vector3_ortho_normalize(v1, v2):
-    # type: (Vector3Ptr, Vector3Ptr) -> None
-    _Vector3OrthoNormalize(v1, v2)
-
-
-def vector3_transform(v, mat):
-    # type: (Vector3, Matrix) -> Vector3
-    return _Vector3Transform(v, mat)
-
-
-def vector3_rotate_by_quaternion(v, q):
-    # type: (Vector3, Quaternion) -> Vector3
-    return _Vector3RotateByQuaternion(v, q)
-
-
-def vector3_rotate_by_axis_angle(v, axis, angle):
-    # type: (Vector3, Vector3, float) -> Vector3
-    return _Vector3RotateByAxisAngle(v, axis, _float(angle))
-
-
-def vector3_lerp(v1, v2, amount):
-    # type: (Vector3, Vector3, float) -> Vector3
-    return _Vector3Lerp(v1, v2, _float(amount))
-
-
-def vector3_reflect(v, normal):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Reflect(v, normal)
-
-
-def vector3_min(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Min(v1, v2)
-
-
-def vector3_max(v1, v2):
-    # type: (Vector3, Vector3) -> Vector3
-    return _Vector3Max(v1, v2)
-
-
-def vector3_barycenter(p, a, b, c):
-    # type: (Vector3, Vector3, Vector3, Vector3) -> Vector3
-    return _Vector3Barycenter(p, a, b, c)
-
-
-def vector3_unproject(source, projection, view):
-    # type: (Vector3, Matrix, Matrix) -> Vector3
-    return _Vector3Unproject(source, projection, view)
-
-
-def vector3_to_float_v(v):
-    # type: (Vector3) -> float3
-    return _Vector3ToFloatV(v)
-
-
-def vector3_invert(v):
-    # type: (Vector3) -> Vector3
-    return _Vector3Invert(v)
-
-
-def vector3_clamp(v, min_, max_):
-    # type: (Vector3, Vector3, Vector3) -> Vector3
-    return _Vector3Clamp(v, min_, max_)
-
-
-def vector3_clamp_value(v, min_, max_):
-    # type: (Vector3, float, float) -> Vector3
-    return _Vector3ClampValue(v, _float(min_), _float(max_))
-
-
-def vector3_equals(p, q):
-    # type: (Vector3, Vector3) -> int
-    return _Vector3Equals(p, q)
-
-
-def vector3_refract(v, n, r):
-    # type: (Vector3, Vector3, float) -> Vector3
-    return _Vector3Refract(v, n, _float(r))
-
-
-def matrix_determinant(mat):
-    # type: (Matrix) -> float
-    return _MatrixDeterminant(mat)
-
-
-def matrix_trace(mat):
-    # type: (Matrix) -> float
-    return _MatrixTrace(mat)
-
-
-def matrix_transpose(mat):
-    # type: (Matrix) -> Matrix
-    return _MatrixTranspose(mat)
-
-
-def matrix_invert(mat):
-    # type: (Matrix) -> Matrix
-    return _MatrixInvert(mat)
-
-
-def matrix_identity():
-    # type: () -> Matrix
-    return _MatrixIdentity()
-
-
-def matrix_add(left, right):
-    # type: (Matrix, Matrix) -> Matrix
-    return _MatrixAdd(left, right)
-
-
-def matrix_subtract(left, right):
-    # type: (Matrix, Matrix) -> Matrix
-    return _MatrixSubtract(left, right)
-
-
-def matrix_multiply(left, right):
-    # type: (Matrix, Matrix) -> Matrix
-    return _MatrixMultiply(left, right)
-
-
-def matrix_translate(x, y, z):
-    # type: (float, float, float) -> Matrix
-    return _MatrixTranslate(_float(x), _float(y), _float(z))
-
-
-def matrix_rotate(axis, angle):
-    # type: (Vector3, float) -> Matrix
-    return _MatrixRotate(axis, _float(angle))
-
-
-def matrix_rotate_x(angle):
-    # type: (float) -> Matrix
-    return _MatrixRotateX(_float(angle))
-
-
-def matrix_rotate_y(angle):
-    # type: (float) -> Matrix
-    return _MatrixRotateY(_float(angle))
-
-
-def matrix_rotate_z(angle):
-    # type: (float) -> Matrix
-    return _MatrixRotateZ(_float(angle))
-
-
-def matrix_rotate_xyz(angle):
-    # type: (Vector3) -> Matrix
-    return _MatrixRotateXYZ(angle)
-
-
-def matrix_rotate_zyx(angle):
-    # type: (Vector3) -> Matrix
-    return _MatrixRotateZYX(angle)
-
-
-def matrix_scale(x, y, z):
-    # type: (float, float, float) -> Matrix
-    return _MatrixScale(_float(x), _float(y), _float(z))
-
-
-def matrix_frustum(left, right, bottom, top, near, far):
-    # type: (float, float, float, float, float, float) -> Matrix
-    return _MatrixFrustum(_float(left), _float(right), _float(bottom), _float(top), _float(near), _float(far))
-
-
-def matrix_perspective(fov_y, aspect, near_plane, far_plane):
-    # type: (float, float, float, float) -> Matrix
-    return _MatrixPerspective(_float(fov_y), _float(aspect), _float(near_plane), _float(far_plane))
-
-
-def matrix_ortho(left, right, bottom, top, near_plane, far_plane):
-    # type: (float, float, float, float, float, float) -> Matrix
-    return _MatrixOrtho(_float(left), _float(right), _float(bottom), _float(top), _float(near_plane), _float(far_plane))
-
-
-def matrix_look_at(eye, target, up):
-    # type: (Vector3, Vector3, Vector3) -> Matrix
-    return _MatrixLookAt(eye, target, up)
-
-
-def matrix_to_float_v(mat):
-    # type: (Matrix) -> float16
-    return _MatrixToFloatV(mat)
-
-
-def quaternion_add(q1, q2):
-    # type: (Quaternion, Quaternion) -> Quaternion
-    return _QuaternionAdd(q1, q2)
-
-
-def quaternion_add_value(q, add):
-    # type: (Quaternion, float) -> Quaternion
-    return _QuaternionAddValue(q, _float(add))
-
-
-def quaternion_subtract(q1, q2):
-    # type: (Quaternion, Quaternion) -> Quaternion
-    return _QuaternionSubtract(q1, q2)
-
-
-def quaternion_subtract_value(q, sub):
-    # type: (Quaternion, float) -> Quaternion
-    return _QuaternionSubtractValue(q, _float(sub))
-
-
-def quaternion_identity():
-    # type: () -> Quaternion
-    return _QuaternionIdentity()
-
-
-def quaternion_length(q):
-    # type: (Quaternion) -> float
-    return _QuaternionLength(q)
-
-
-def quaternion_normalize(q):
-    # type: (Quaternion) -> Quaternion
-    return _QuaternionNormalize(q)
-
-
-def quaternion_invert(q):
-    # type: (Quaternion) -> Quaternion
-    return _QuaternionInvert(q)
-
-
-def quaternion_multiply(q1, q2):
-    # type: (Quaternion, Quaternion) -> Quaternion
-    return _QuaternionMultiply(q1, q2)
-
-
-def quaternion_scale(q, mul):
-    # type: (Quaternion, float) -> Quaternion
-    return _QuaternionScale(q, _float(mul))
-
-
-def quaternion_divide(q1, q2):
-    # type: (Quaternion, Quaternion) -> Quaternion
-    return _QuaternionDivide(q1, q2)
-
-
-def quaternion_lerp(q1, q2, amount):
-    # type: (Quaternion, Quaternion, float) -> Quaternion
-    return _QuaternionLerp(q1, q2, _float(amount))
-
-
-def quaternion_nlerp(q1, q2, amount):
-    # type: (Quaternion, Quaternion, float) -> Quaternion
-    return _QuaternionNlerp(q1, q2, _float(amount))
-
-
-def quaternion_slerp(q1, q2, amount):
-    # type: (Quaternion, Quaternion, float) -> Quaternion
-    return _QuaternionSlerp(q1, q2, _float(amount))
-
-
-def quaternion_from_vector3_to_vector3(from_, to):
-    # type: (Vector3, Vector3) -> Quaternion
-    return _QuaternionFromVector3ToVector3(from_, to)
-
-
-def quaternion_from_matrix(mat):
-    # type: (Matrix) -> Quaternion
-    return _QuaternionFromMatrix(mat)
-
-
-def quaternion_to_matrix(q):
-    # type: (Quaternion) -> Matrix
-    return _QuaternionToMatrix(q)
-
-
-def quaternion_from_axis_angle(axis, angle):
-    # type: (Vector3, float) -> Quaternion
-    return _QuaternionFromAxisAngle(axis, _float(angle))
-
-
-def quaternion_to_axis_angle(q, out_axis, out_angle):
-    # type: (Quaternion, Vector3Ptr, FloatPtr) -> None
-    _QuaternionToAxisAngle(q, out_axis, out_angle)
-
-
-def quaternion_from_euler(pitch, yaw, roll):
-    # type: (float, float, float) -> Quaternion
-    return _QuaternionFromEuler(_float(pitch), _float(yaw), _float(roll))
-
-
-def quaternion_to_euler(q):
-    # type: (Quaternion) -> Vector3
-    return _QuaternionToEuler(q)
-
-
-def quaternion_transform(q, mat):
-    # type: (Quaternion, Matrix) -> Quaternion
-    return _QuaternionTransform(q, mat)
-
-
-def quaternion_equals(p, q):
-    # type: (Quaternion, Quaternion) -> int
-    return _QuaternionEquals(p, q)
-
-
-# rlapi::rlgl
-# ------------------------------------------------------------------------------
-
-def rl_matrix_mode(mode):
-    # type: (int) -> None
-    """Choose the current matrix to be transformed"""
-    _rlMatrixMode(_int(mode))
-
-
-def rl_push_matrix():
-    # type: () -> None
-    """Push the current matrix to stack"""
-    _rlPushMatrix()
-
-
-def rl_pop_matrix():
-    # type: () -> None
-    """Pop latest inserted matrix from stack"""
-    _rlPopMatrix()
-
-
-def rl_load_identity():
-    # type: () -> None
-    """Reset current matrix to identity matrix"""
-    _rlLoadIdentity()
-
-
-def rl_translatef(x, y, z):
-    # type: (float, float, float) -> None
-    """Multiply the current matrix by a translation matrix"""
-    _rlTranslatef(_float(x), _float(y), _float(z))
-
-
-def rl_rotatef(angle, x, y, z):
-    # type: (float, float, float, float) -> None
-    """Multiply the current matrix by a rotation matrix"""
-    _rlRotatef(_float(angle), _float(x), _float(y), _float(z))
-
-
-def rl_scalef(x, y, z):
-    # type: (float, float, float) -> None
-    """Multiply the current matrix by a scaling matrix"""
-    _rlScalef(_float(x), _float(y), _float(z))
-
-
-def rl_mult_matrixf(matf):
-    # type: (FloatPtr) -> None
-    """Multiply the current matrix by another matrix"""
-    _rlMultMatrixf(matf)
-
-
-def rl_frustum(left, right, bottom, top, znear, zfar):
-    # type: (float, float, float, float, float, float) -> None
-    _rlFrustum(_float(left), _float(right), _float(bottom), _float(top), _float(znear), _float(zfar))
-
-
-def rl_ortho(left, right, bottom, top, znear, zfar):
-    # type: (float, float, float, float, float, float) -> None
-    _rlOrtho(_float(left), _float(right), _float(bottom), _float(top), _float(znear), _float(zfar))
-
-
-def rl_viewport(x, y, width, height):
-    # type: (int, int, int, int) -> None
-    """Set the viewport area"""
-    _rlViewport(_int(x), _int(y), _int(width), _int(height))
-
-
-def rl_begin(mode):
-    # type: (int) -> None
-    """Initialize drawing mode (how to organize vertex)"""
-    _rlBegin(_int(mode))
-
-
-def rl_end():
-    # type: () -> None
-    """Finish vertex providing"""
-    _rlEnd()
-
-
-def rl_vertex_2ii(x, y):
-    # type: (int, int) -> None
-    """Define one vertex (position) - 2 int"""
-    _rlVertex2i(_int(x), _int(y))
-
-
-def rl_vertex_2ff(x, y):
-    # type: (float, float) -> None
-    """Define one vertex (position) - 2 float"""
-    _rlVertex2f(_float(x), _float(y))
-
-
-def rl_vertex_3ff(x, y, z):
-    # type: (float, float, float) -> None
-    """Define one vertex (position) - 3 float"""
-    _rlVertex3f(_float(x), _float(y), _float(z))
-
-
-def rl_tex_coord_2ff(x, y):
-    # type: (float, float) -> None
-    """Define one vertex (texture coordinate) - 2 float"""
-    _rlTexCoord2f(_float(x), _float(y))
-
-
-def rl_normal_3ff(x, y, z):
-    # type: (float, float, float) -> None
-    """Define one vertex (normal) - 3 float"""
-    _rlNormal3f(_float(x), _float(y), _float(z))
-
-
-def rl_color_4_uub(r, g, b, a):
-    # type: (int, int, int, int) -> None
-    """Define one vertex (color) - 4 byte"""
-    _rlColor4ub(_int(r, (0, 255)), _int(g, (0, 255)), _int(b, (0, 255)), _int(a, (0, 255)))
-
-
-def rl_color_3ff(x, y, z):
-    # type: (float, float, float) -> None
-    """Define one vertex (color) - 3 float"""
-    _rlColor3f(_float(x), _float(y), _float(z))
-
-
-def rl_color_4ff(x, y, z, w):
-    # type: (float, float, float, float) -> None
-    """Define one vertex (color) - 4 float"""
-    _rlColor4f(_float(x), _float(y), _float(z), _float(w))
-
-
-def rl_enable_vertex_array(vao_id):
-    # type: (int) -> bool
-    """Enable vertex array (VAO, if supported)"""
-    return _rlEnableVertexArray(_int(vao_id))
-
-
-def rl_disable_vertex_array():
-    # type: () -> None
-    """Disable vertex array (VAO, if supported)"""
-    _rlDisableVertexArray()
-
-
-def rl_enable_vertex_buffer(id_):
-    # type: (int) -> None
-    """Enable vertex buffer (VBO)"""
-    _rlEnableVertexBuffer(_int(id_))
-
-
-def rl_disable_vertex_buffer():
-    # type: () -> None
-    """Disable vertex buffer (VBO)"""
-    _rlDisableVertexBuffer()
-
-
-def rl_enable_vertex_buffer_element(id_):
-    # type: (int) -> None
-    """Enable vertex buffer element (VBO element)"""
-    _rlEnableVertexBufferElement(_int(id_))
-
-
-def rl_disable_vertex_buffer_element():
-    # type: () -> None
-    """Disable vertex buffer element (VBO element)"""
-    _rlDisableVertexBufferElement()
-
-
-def rl_enable_vertex_attribute(index):
-    # type: (int) -> None
-    """Enable vertex attribute index"""
-    _rlEnableVertexAttribute(_int(index))
-
-
-def rl_disable_vertex_attribute(index):
-    # type: (int) -> None
-    """Disable vertex attribute index"""
-    _rlDisableVertexAttribute(_int(index))
-
-
-def rl_active_texture_slot(slot):
-    # type: (int) -> None
-    """Select and active a texture slot"""
-    _rlActiveTextureSlot(_int(slot))
-
-
-def rl_enable_texture(id_):
-    # type: (int) -> None
-    """Enable texture"""
-    _rlEnableTexture(_int(id_))
-
-
-def rl_disable_texture():
-    # type: () -> None
-    """Disable texture"""
-    _rlDisableTexture()
-
-
-def rl_enable_texture_cubemap(id_):
-    # type: (int) -> None
-    """Enable texture cubemap"""
-    _rlEnableTextureCubemap(_int(id_))
-
-
-def rl_disable_texture_cubemap():
-    # type: () -> None
-    """Disable texture cubemap"""
-    _rlDisableTextureCubemap()
-
-
-def rl_texture_parameters(id_, param, value):
-    # type: (int, int, int) -> None
-    """Set texture parameters (filter, wrap)"""
-    _rlTextureParameters(_int(id_), _int(param), _int(value))
-
-
-def rl_cubemap_parameters(id_, param, value):
-    # type: (int, int, int) -> None
-    """Set cubemap parameters (filter, wrap)"""
-    _rlCubemapParameters(_int(id_), _int(param), _int(value))
-
-
-def rl_enable_shader(id_):
-    # type: (int) -> None
-    """Enable shader program"""
-    _rlEnableShader(_int(id_))
-
-
-def rl_disable_shader():
-    # type: () -> None
-    """Disable shader program"""
-    _rlDisableShader()
-
-
-def rl_enable_framebuffer(id_):
-    # type: (int) -> None
-    """Enable render texture (fbo)"""
-    _rlEnableFramebuffer(_int(id_))
-
-
-def rl_disable_framebuffer():
-    # type: () -> None
-    """Disable render texture (fbo), return to default framebuffer"""
-    _rlDisableFramebuffer()
-
-
-def rl_active_draw_buffers(count):
-    # type: (int) -> None
-    """Activate multiple draw color buffers"""
-    _rlActiveDrawBuffers(_int(count))
-
-
-def rl_blit_framebuffer(src_x, src_y, src_width, src_height, dst_x, dst_y, dst_width, dst_height, buffer_mask):
-    # type: (int, int, int, int, int, int, int, int, int) -> None
-    """Blit active framebuffer to main framebuffer"""
-    _rlBlitFramebuffer(_int(src_x), _int(src_y), _int(src_width), _int(src_height), _int(dst_x), _int(dst_y), _int(dst_width), _int(dst_height), _int(buffer_mask))
-
-
-def rl_enable_color_blend():
-    # type: () -> None
-    """Enable color blending"""
-    _rlEnableColorBlend()
-
-
-def rl_disable_color_blend():
-    # type: () -> None
-    """Disable color blending"""
-    _rlDisableColorBlend()
-
-
-def rl_enable_depth_test():
-    # type: () -> None
-    """Enable depth test"""
-    _rlEnableDepthTest()
-
-
-def rl_disable_depth_test():
-    # type: () -> None
-    """Disable depth test"""
-    _rlDisableDepthTest()
-
-
-def rl_enable_depth_mask():
-    # type: () -> None
-    """Enable depth write"""
-    _rlEnableDepthMask()
-
-
-def rl_disable_depth_mask():
-    # type: () -> None
-    """Disable depth write"""
-    _rlDisableDepthMask()
-
-
-def rl_enable_backface_culling():
-    # type: () -> None
-    """Enable backface culling"""
-    _rlEnableBackfaceCulling()
-
-
-def rl_disable_backface_culling():
-    # type: () -> None
-    """Disable backface culling"""
-    _rlDisableBackfaceCulling()
-
-
-def rl_set_cull_face(mode):
-    # type: (int) -> None
-    """Set face culling mode"""
-    _rlSetCullFace(_int(mode))
-
-
-def rl_enable_scissor_test():
-    # type: () -> None
-    """Enable scissor test"""
-    _rlEnableScissorTest()
-
-
-def rl_disable_scissor_test():
-    # type: () -> None
-    """Disable scissor test"""
-    _rlDisableScissorTest()
-
-
-def rl_scissor(x, y, width, height):
-    # type: (int, int, int, int) -> None
-    """Scissor test"""
-    _rlScissor(_int(x), _int(y), _int(width), _int(height))
-
-
-def rl_enable_wire_mode():
-    # type: () -> None
-    """Enable wire mode"""
-    _rlEnableWireMode()
-
-
-def rl_enable_point_mode():
-    # type: () -> None
-    """Enable point mode"""
-    _rlEnablePointMode()
-
-
-def rl_disable_wire_mode():
-    # type: () -> None
-    """Disable wire mode ( and point ) maybe rename"""
-    _rlDisableWireMode()
-
-
-def rl_set_line_width(width):
-    # type: (float) -> None
-    """Set the line drawing width"""
-    _rlSetLineWidth(_float(width))
-
-
-def rl_get_line_width():
-    # type: () -> float
-    """Get the line drawing width"""
-    return _rlGetLineWidth()
-
-
-def rl_enable_smooth_lines():
-    # type: () -> None
-    """Enable line aliasing"""
-    _rlEnableSmoothLines()
-
-
-def rl_disable_smooth_lines():
-    # type: () -> None
-    """Disable line aliasing"""
-    _rlDisableSmoothLines()
-
-
-def rl_enable_stereo_render():
-    # type: () -> None
-    """Enable stereo rendering"""
-    _rlEnableStereoRender()
-
-
-def rl_disable_stereo_render():
-    # type: () -> None
-    """Disable stereo rendering"""
-    _rlDisableStereoRender()
-
-
-def rl_is_stereo_render_enabled():
-    # type: () -> bool
-    """Check if stereo render is enabled"""
-    return _rlIsStereoRenderEnabled()
-
-
-def rl_clear_color(r, g, b, a):
-    # type: (int, int, int, int) -> None
-    """Clear color buffer with color"""
-    _rlClearColor(_int(r, (0, 255)), _int(g, (0, 255)), _int(b, (0, 255)), _int(a, (0, 255)))
-
-
-def rl_clear_screen_buffers():
-    # type: () -> None
-    """Clear used screen buffers (color and depth)"""
-    _rlClearScreenBuffers()
-
-
-def rl_check_errors():
-    # type: () -> None
-    """Check and log OpenGL error codes"""
-    _rlCheckErrors()
-
-
-def rl_set_blend_mode(mode):
-    # type: (int) -> None
-    """Set blending mode"""
-    _rlSetBlendMode(_int(mode))
-
-
-def rl_set_blend_factors(gl_src_factor, gl_dst_factor, gl_equation):
-    # type: (int, int, int) -> None
-    """Set blending mode factor and equation (using OpenGL factors)"""
-    _rlSetBlendFactors(_int(gl_src_factor), _int(gl_dst_factor), _int(gl_equation))
-
-
-def rl_set_blend_factors_separate(gl_src_rgb, gl_dst_rgb, gl_src_alpha, gl_dst_alpha, gl_eq_rgb, gl_eq_alpha):
-    # type: (int, int, int, int, int, int) -> None
-    """Set blending mode factors and equations separately (using OpenGL factors)"""
-    _rlSetBlendFactorsSeparate(_int(gl_src_rgb), _int(gl_dst_rgb), _int(gl_src_alpha), _int(gl_dst_alpha), _int(gl_eq_rgb), _int(gl_eq_alpha))
-
-
-def rlgl_init(width, height):
-    # type: (int, int) -> None
-    """Initialize rlgl (buffers, shaders, textures, states)"""
-    _rlglInit(_int(width), _int(height))
-
-
-def rlgl_close():
-    # type: () -> None
-    """De-initialize rlgl (buffers, shaders, textures)"""
-    _rlglClose()
-
-
-def rl_load_extensions(loader):
-    # type: (bytes | str | None) -> None
-    """Load OpenGL extensions (loader function required)"""
-    _rlLoadExtensions(loader)
-
-
-def rl_get_version():
-    # type: () -> int
-    """Get current OpenGL version"""
-    return _rlGetVersion()
-
-
-def rl_set_framebuffer_width(width):
-    # type: (int) -> None
-    """Set current framebuffer width"""
-    _rlSetFramebufferWidth(_int(width))
-
-
-def rl_get_framebuffer_width():
-    # type: () -> int
-    """Get default framebuffer width"""
-    return _rlGetFramebufferWidth()
-
-
-def rl_set_framebuffer_height(height):
-    # type: (int) -> None
-    """Set current framebuffer height"""
-    _rlSetFramebufferHeight(_int(height))
-
-
-def rl_get_framebuffer_height():
-    # type: () -> int
-    """Get default framebuffer height"""
-    return _rlGetFramebufferHeight()
-
-
-def rl_get_texture_id_default():
-    # type: () -> int
-    """Get default texture id"""
-    return _rlGetTextureIdDefault()
-
-
-def rl_get_shader_id_default():
-    # type: () -> int
-    """Get default shader id"""
-    return _rlGetShaderIdDefault()
-
-
-def rl_get_shader_locs_default():
-    # type: () -> IntPtr
-    """Get default shader locations"""
-    return _rlGetShaderLocsDefault()
-
-
-def rl_load_render_batch(num_buffers, buffer_elements):
-    # type: (int, int) -> rlRenderBatch
-    """Load a render batch system"""
-    return _rlLoadRenderBatch(_int(num_buffers), _int(buffer_elements))
-
-
-def rl_unload_render_batch(batch):
-    # type: (rlRenderBatch) -> None
-    """Unload render batch system"""
-    _rlUnloadRenderBatch(batch)
-
-
-def rl_draw_render_batch(batch):
-    # type: (rlRenderBatchPtr) -> None
-    """Draw render batch data (Update->Draw->Reset)"""
-    _rlDrawRenderBatch(batch)
-
-
-def rl_set_render_batch_active(batch):
-    # type: (rlRenderBatchPtr) -> None
-    """Set the active render batch for rlgl (NULL for default internal)"""
-    _rlSetRenderBatchActive(batch)
-
-
-def rl_draw_render_batch_active():
-    # type: () -> None
-    """Update and draw internal render batch"""
-    _rlDrawRenderBatchActive()
-
-
-def rl_check_render_batch_limit(v_count):
-    # type: (int) -> bool
-    """Check internal buffer overflow for a given number of vertex"""
-    return _rlCheckRenderBatchLimit(_int(v_count))
-
-
-def rl_set_texture(id_):
-    # type: (int) -> None
-    """Set current texture for render batch and check buffers limits"""
-    _rlSetTexture(_int(id_))
-
-
-def rl_load_vertex_array():
-    # type: () -> int
-    """Load vertex array (vao) if supported"""
-    return _rlLoadVertexArray()
-
-
-def rl_load_vertex_buffer(buffer, size, dynamic):
-    # type: (bytes | str | None, int, bool) -> int
-    """Load a vertex buffer attribute"""
-    return _rlLoadVertexBuffer(buffer, _int(size), _bool(dynamic))
-
-
-def rl_load_vertex_buffer_element(buffer, size, dynamic):
-    # type: (bytes | str | None, int, bool) -> int
-    """Load a new attributes element buffer"""
-    return _rlLoadVertexBufferElement(buffer, _int(size), _bool(dynamic))
-
-
-def rl_update_vertex_buffer(buffer_id, data, data_size, offset):
-    # type: (int, bytes | str | None, int, int) -> None
-    """Update GPU buffer with new data"""
-    _rlUpdateVertexBuffer(_int(buffer_id), data, _int(data_size), _int(offset))
-
-
-def rl_update_vertex_buffer_elements(id_, data, data_size, offset):
-    # type: (int, bytes | str | None, int, int) -> None
-    """Update vertex buffer elements with new data"""
-    _rlUpdateVertexBufferElements(_int(id_), data, _int(data_size), _int(offset))
-
-
-def rl_unload_vertex_array(vao_id):
-    # type: (int) -> None
-    _rlUnloadVertexArray(_int(vao_id))
-
-
-def rl_unload_vertex_buffer(vbo_id):
-    # type: (int) -> None
-    _rlUnloadVertexBuffer(_int(vbo_id))
-
-
-def rl_set_vertex_attribute(index, comp_size, type_, normalized, stride, pointer):
-    # type: (int, int, int, bool, int, bytes | str | None) -> None
-    _rlSetVertexAttribute(_int(index), _int(comp_size), _int(type_), _bool(normalized), _int(stride), pointer)
-
-
-def rl_set_vertex_attribute_divisor(index, divisor):
-    # type: (int, int) -> None
-    _rlSetVertexAttributeDivisor(_int(index), _int(divisor))
-
-
-def rl_set_vertex_attribute_default(loc_index, value, attrib_type, count):
-    # type: (int, bytes | str | None, int, int) -> None
-    """Set vertex attribute default value"""
-    _rlSetVertexAttributeDefault(_int(loc_index), value, _int(attrib_type), _int(count))
-
-
-def rl_draw_vertex_array(offset, count):
-    # type: (int, int) -> None
-    _rlDrawVertexArray(_int(offset), _int(count))
-
-
-def rl_draw_vertex_array_elements(offset, count, buffer):
-    # type: (int, int, bytes | str | None) -> None
-    _rlDrawVertexArrayElements(_int(offset), _int(count), buffer)
-
-
-def rl_draw_vertex_array_instanced(offset, count, instances):
-    # type: (int, int, int) -> None
-    _rlDrawVertexArrayInstanced(_int(offset), _int(count), _int(instances))
-
-
-def rl_draw_vertex_array_elements_instanced(offset, count, buffer, instances):
-    # type: (int, int, bytes | str | None, int) -> None
-    _rlDrawVertexArrayElementsInstanced(_int(offset), _int(count), buffer, _int(instances))
-
-
-def rl_load_texture(data, width, height, format_, mipmap_count):
-    # type: (bytes | str | None, int, int, int, int) -> int
-    """Load texture in GPU"""
-    return _rlLoadTexture(data, _int(width), _int(height), _int(format_), _int(mipmap_count))
-
-
-def rl_load_texture_depth(width, height, use_render_buffer):
-    # type: (int, int, bool) -> int
-    """Load depth texture/renderbuffer (to be attached to fbo)"""
-    return _rlLoadTextureDepth(_int(width), _int(height), _bool(use_render_buffer))
-
-
-def rl_load_texture_cubemap(data, size, format_):
-    # type: (bytes | str | None, int, int) -> int
-    """Load texture cubemap"""
-    return _rlLoadTextureCubemap(data, _int(size), _int(format_))
-
-
-def rl_update_texture(id_, offset_x, offset_y, width, height, format_, data):
-    # type: (int, int, int, int, int, int, bytes | str | None) -> None
-    """Update GPU texture with new data"""
-    _rlUpdateTexture(_int(id_), _int(offset_x), _int(offset_y), _int(width), _int(height), _int(format_), data)
-
-
-def rl_get_gl_texture_formats(format_, gl_internal_format, gl_format, gl_type):
-    # type: (int, UIntPtr, UIntPtr, UIntPtr) -> None
-    """Get OpenGL internal formats"""
-    _rlGetGlTextureFormats(_int(format_), gl_internal_format, gl_format, gl_type)
-
-
-def rl_get_pixel_format_name(format_):
-    # type: (int) -> bytes | str | None
-    """Get name string for pixel format"""
-    return _rlGetPixelFormatName(_int(format_))
-
-
-def rl_unload_texture(id_):
-    # type: (int) -> None
-    """Unload texture from GPU memory"""
-    _rlUnloadTexture(_int(id_))
-
-
-def rl_gen_texture_mipmaps(id_, width, height, format_, mipmaps):
-    # type: (int, int, int, int, IntPtr) -> None
-    """Generate mipmap data for selected texture"""
-    _rlGenTextureMipmaps(_int(id_), _int(width), _int(height), _int(format_), mipmaps)
-
-
-def rl_read_texture_pixels(id_, width, height, format_):
-    # type: (int, int, int, int) -> bytes | str | None
-    """Read texture pixel data"""
-    return _rlReadTexturePixels(_int(id_), _int(width), _int(height), _int(format_))
-
-
-def rl_read_screen_pixels(width, height):
-    # type: (int, int) -> int
-    """Read screen pixel data (color buffer)"""
-    return _rlReadScreenPixels(_int(width), _int(height))
-
-
-def rl_load_framebuffer(width, height):
-    # type: (int, int) -> int
-    """Load an empty framebuffer"""
-    return _rlLoadFramebuffer(_int(width), _int(height))
-
-
-def rl_framebuffer_attach(fbo_id, tex_id, attach_type, tex_type, mip_level):
-    # type: (int, int, int, int, int) -> None
-    """Attach texture/renderbuffer to a framebuffer"""
-    _rlFramebufferAttach(_int(fbo_id), _int(tex_id), _int(attach_type), _int(tex_type), _int(mip_level))
-
-
-def rl_framebuffer_complete(id_):
-    # type: (int) -> bool
-    """Verify framebuffer is complete"""
-    return _rlFramebufferComplete(_int(id_))
-
-
-def rl_unload_framebuffer(id_):
-    # type: (int) -> None
-    """Delete framebuffer from GPU"""
-    _rlUnloadFramebuffer(_int(id_))
-
-
-def rl_load_shader_code(vs_code, fs_code):
-    # type: (bytes | str | None, bytes | str | None) -> int
-    """Load shader from code strings"""
-    return _rlLoadShaderCode(_str_in(vs_code), _str_in(fs_code))
-
-
-def rl_compile_shader(shader_code, type_):
-    # type: (bytes | str | None, int) -> int
-    """Compile custom shader and return shader id (type: RL_VERTEX_SHADER, RL_FRAGMENT_SHADER, RL_COMPUTE_SHADER)"""
-    return _rlCompileShader(_str_in(shader_code), _int(type_))
-
-
-def rl_load_shader_program(v_shader_id, f_shader_id):
-    # type: (int, int) -> int
-    """Load custom shader program"""
-    return _rlLoadShaderProgram(_int(v_shader_id), _int(f_shader_id))
-
-
-def rl_unload_shader_program(id_):
-    # type: (int) -> None
-    """Unload shader program"""
-    _rlUnloadShaderProgram(_int(id_))
-
-
-def rl_get_location_uniform(shader_id, uniform_name):
-    # type: (int, bytes | str | None) -> int
-    """Get shader location uniform"""
-    return _rlGetLocationUniform(_int(shader_id), _str_in(uniform_name))
-
-
-def rl_get_location_attrib(shader_id, attrib_name):
-    # type: (int, bytes | str | None) -> int
-    """Get shader location attribute"""
-    return _rlGetLocationAttrib(_int(shader_id), _str_in(attrib_name))
-
-
-def rl_set_uniform(loc_index, value, uniform_type, count):
-    # type: (int, bytes | str | None, int, int) -> None
-    """Set shader value uniform"""
-    _rlSetUniform(_int(loc_index), value, _int(uniform_type), _int(count))
-
-
-def rl_set_uniform_matrix(loc_index, mat):
-    # type: (int, Matrix) -> None
-    """Set shader value matrix"""
-    _rlSetUniformMatrix(_int(loc_index), mat)
-
-
-def rl_set_uniform_sampler(loc_index, texture_id):
-    # type: (int, int) -> None
-    """Set shader value sampler"""
-    _rlSetUniformSampler(_int(loc_index), _int(texture_id))
-
-
-def rl_set_shader(id_, locs):
-    # type: (int, IntPtr) -> None
-    """Set shader currently active (id and locations)"""
-    _rlSetShader(_int(id_), locs)
-
-
-def rl_load_compute_shader_program(shader_id):
-    # type: (int) -> int
-    """Load compute shader program"""
-    return _rlLoadComputeShaderProgram(_int(shader_id))
-
-
-def rl_compute_shader_dispatch(group_x, group_y, group_z):
-    # type: (int, int, int) -> None
-    """Dispatch compute shader (equivalent to *draw* for graphics pipeline)"""
-    _rlComputeShaderDispatch(_int(group_x), _int(group_y), _int(group_z))
-
-
-def rl_load_shader_buffer(size, data, usage_hint):
-    # type: (int, bytes | str | None, int) -> int
-    """Load shader storage buffer object (SSBO)"""
-    return _rlLoadShaderBuffer(_int(size), data, _int(usage_hint))
-
-
-def rl_unload_shader_buffer(ssbo_id):
-    # type: (int) -> None
-    """Unload shader storage buffer object (SSBO)"""
-    _rlUnloadShaderBuffer(_int(ssbo_id))
-
-
-def rl_update_shader_buffer(id_, data, data_size, offset):
-    # type: (int, bytes | str | None, int, int) -> None
-    """Update SSBO buffer data"""
-    _rlUpdateShaderBuffer(_int(id_), data, _int(data_size), _int(offset))
-
-
-def rl_bind_shader_buffer(id_, index):
-    # type: (int, int) -> None
-    """Bind SSBO buffer"""
-    _rlBindShaderBuffer(_int(id_), _int(index))
-
-
-def rl_read_shader_buffer(id_, dest, count, offset):
-    # type: (int, bytes | str | None, int, int) -> None
-    """Read SSBO buffer data (GPU->CPU)"""
-    _rlReadShaderBuffer(_int(id_), dest, _int(count), _int(offset))
-
-
-def rl_copy_shader_buffer(dest_id, src_id, dest_offset, src_offset, count):
-    # type: (int, int, int, int, int) -> None
-    """Copy SSBO data between buffers"""
-    _rlCopyShaderBuffer(_int(dest_id), _int(src_id), _int(dest_offset), _int(src_offset), _int(count))
-
-
-def rl_get_shader_buffer_size(id_):
-    # type: (int) -> int
-    """Get SSBO buffer size"""
-    return _rlGetShaderBufferSize(_int(id_))
-
-
-def rl_bind_image_texture(id_, index, format_, readonly):
-    # type: (int, int, int, bool) -> None
-    """Bind image texture"""
-    _rlBindImageTexture(_int(id_), _int(index), _int(format_), _bool(readonly))
-
-
-def rl_get_matrix_modelview():
-    # type: () -> Matrix
-    """Get internal modelview matrix"""
-    return _rlGetMatrixModelview()
-
-
-def rl_get_matrix_projection():
-    # type: () -> Matrix
-    """Get internal projection matrix"""
-    return _rlGetMatrixProjection()
-
-
-def rl_get_matrix_transform():
-    # type: () -> Matrix
-    """Get internal accumulated transform matrix"""
-    return _rlGetMatrixTransform()
-
-
-def rl_get_matrix_projection_stereo(eye):
-    # type: (int) -> Matrix
-    """Get internal projection matrix for stereo render (selected eye)"""
-    return _rlGetMatrixProjectionStereo(_int(eye))
-
-
-def rl_get_matrix_view_offset_stereo(eye):
-    # type: (int) -> Matrix
-    """Get internal view offset matrix for stereo render (selected eye)"""
-    return _rlGetMatrixViewOffsetStereo(_int(eye))
-
-
-def rl_set_matrix_projection(proj):
-    # type: (Matrix) -> None
-    """Set a custom projection matrix (replaces internal projection matrix)"""
-    _rlSetMatrixProjection(proj)
-
-
-def rl_set_matrix_modelview(view):
-    # type: (Matrix) -> None
-    """Set a custom modelview matrix (replaces internal modelview matrix)"""
-    _rlSetMatrixModelview(view)
-
-
-def rl_set_matrix_projection_stereo(right, left):
-    # type: (Matrix, Matrix) -> None
-    """Set eyes projection matrices for stereo rendering"""
-    _rlSetMatrixProjectionStereo(right, left)
-
-
-def rl_set_matrix_view_offset_stereo(right, left):
-    # type: (Matrix, Matrix) -> None
-    """Set eyes view offsets matrices for stereo rendering"""
-    _rlSetMatrixViewOffsetStereo(right, left)
-
-
-def rl_load_draw_cube():
-    # type: () -> None
-    """Load and draw a cube"""
-    _rlLoadDrawCube()
-
-
-def rl_load_draw_quad():
-    # type: () -> None
-    """Load and draw a quad"""
-    _rlLoadDrawQuad()
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_exports))
 
 # endregion (functions)
 
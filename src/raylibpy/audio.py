@@ -0,0 +1,483 @@
+# audio.py
+
+#   Functions of raylib's audio module (raudio): audio device, waves, sounds,
+#   music and audio streams.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from . import (
+    _AttachAudioMixedProcessor,
+    _AttachAudioStreamProcessor,
+    _CloseAudioDevice,
+    _DetachAudioMixedProcessor,
+    _DetachAudioStreamProcessor,
+    _ExportWave,
+    _ExportWaveAsCode,
+    _GetMasterVolume,
+    _GetMusicTimeLength,
+    _GetMusicTimePlayed,
+    _InitAudioDevice,
+    _IsAudioDeviceReady,
+    _IsAudioStreamPlaying,
+    _IsAudioStreamProcessed,
+    _IsAudioStreamReady,
+    _IsMusicReady,
+    _IsMusicStreamPlaying,
+    _IsSoundPlaying,
+    _IsSoundReady,
+    _IsWaveReady,
+    _LoadAudioStream,
+    _LoadMusicStream,
+    _LoadSound,
+    _LoadSoundAlias,
+    _LoadSoundFromWave,
+    _LoadWave,
+    _LoadWaveFromMemory,
+    _LoadWaveSamples,
+    _PauseAudioStream,
+    _PauseMusicStream,
+    _PauseSound,
+    _PlayAudioStream,
+    _PlayMusicStream,
+    _PlaySound,
+    _ResumeAudioStream,
+    _ResumeMusicStream,
+    _ResumeSound,
+    _SUBMODULE_EXPORTS,
+    _SeekMusicStream,
+    _SetAudioStreamCallback,
+    _SetAudioStreamPan,
+    _SetAudioStreamPitch,
+    _SetAudioStreamVolume,
+    _SetMasterVolume,
+    _SetMusicPan,
+    _SetMusicPitch,
+    _SetMusicVolume,
+    _SetSoundPan,
+    _SetSoundPitch,
+    _SetSoundVolume,
+    _StopAudioStream,
+    _StopMusicStream,
+    _StopSound,
+    _UnloadAudioStream,
+    _UnloadMusicStream,
+    _UnloadSound,
+    _UnloadSoundAlias,
+    _UnloadWave,
+    _UnloadWaveSamples,
+    _UpdateAudioStream,
+    _UpdateMusicStream,
+    _UpdateSound,
+    _WaveCopy,
+    _WaveCrop,
+    _WaveFormat,
+    _float,
+    _int,
+    _load_music_stream_from_memory,
+    _set_audio_stream_buffer_size_default,
+    _str_in,
+    _symbol_namespaces,
+    _ubyte_buffer_in,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['audio'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def init_audio_device():
+    # type: () -> None
+    """Initialize audio device and context"""
+    _InitAudioDevice()
+
+
+def close_audio_device():
+    # type: () -> None
+    """Close the audio device and context"""
+    _CloseAudioDevice()
+
+
+def is_audio_device_ready():
+    # type: () -> bool
+    """Check if audio device has been initialized successfully"""
+    return _IsAudioDeviceReady()
+
+
+def set_master_volume(volume):
+    # type: (float) -> None
+    """Set master volume (listener)"""
+    _SetMasterVolume(_float(volume))
+
+
+def get_master_volume():
+    # type: () -> float
+    """Get master volume (listener)"""
+    return _GetMasterVolume()
+
+
+def load_wave(file_name):
+    # type: (bytes | str | None) -> Wave
+    """Load wave data from file"""
+    return _LoadWave(_str_in(file_name))
+
+
+def load_wave_from_memory(file_type, file_data, data_size):
+    # type: (bytes | str | None, Buffer, int) -> Wave
+    """Load wave from memory buffer, fileType refers to extension: i.e. '.wav'"""
+    return _LoadWaveFromMemory(_str_in(file_type), _ubyte_buffer_in(file_data), _int(data_size))
+
+
+def is_wave_ready(wave):
+    # type: (Wave) -> bool
+    """Checks if wave data is ready"""
+    return _IsWaveReady(wave)
+
+
+def load_sound(file_name):
+    # type: (bytes | str | None) -> Sound
+    """Load sound from file"""
+    return _LoadSound(_str_in(file_name))
+
+
+def load_sound_from_wave(wave):
+    # type: (Wave) -> Sound
+    """Load sound from wave data"""
+    return _LoadSoundFromWave(wave)
+
+
+def load_sound_alias(source):
+    # type: (Sound) -> Sound
+    """Create a new sound that shares the same sample data as the source sound, does not own the sound data"""
+    return _LoadSoundAlias(source)
+
+
+def is_sound_ready(sound):
+    # type: (Sound) -> bool
+    """Checks if a sound is ready"""
+    return _IsSoundReady(sound)
+
+
+def update_sound(sound, data, sample_count):
+    # type: (Sound, bytes | str | None, int) -> None
+    """Update sound buffer with new data"""
+    _UpdateSound(sound, data, _int(sample_count))
+
+
+def unload_wave(wave):
+    # type: (Wave) -> None
+    """Unload wave data"""
+    _UnloadWave(wave)
+
+
+def unload_sound(sound):
+    # type: (Sound) -> None
+    """Unload sound"""
+    _UnloadSound(sound)
+
+
+def unload_sound_alias(alias):
+    # type: (Sound) -> None
+    """Unload a sound alias (does not deallocate sample data)"""
+    _UnloadSoundAlias(alias)
+
+
+def export_wave(wave, file_name):
+    # type: (Wave, bytes | str | None) -> bool
+    """Export wave data to file, returns true on success"""
+    return _ExportWave(wave, _str_in(file_name))
+
+
+def export_wave_as_code(wave, file_name):
+    # type: (Wave, bytes | str | None) -> bool
+    """Export wave sample data to code (.h), returns true on success"""
+    return _ExportWaveAsCode(wave, _str_in(file_name))
+
+
+def play_sound(sound):
+    # type: (Sound) -> None
+    """Play a sound"""
+    _PlaySound(sound)
+
+
+def stop_sound(sound):
+    # type: (Sound) -> None
+    """Stop playing a sound"""
+    _StopSound(sound)
+
+
+def pause_sound(sound):
+    # type: (Sound) -> None
+    """Pause a sound"""
+    _PauseSound(sound)
+
+
+def resume_sound(sound):
+    # type: (Sound) -> None
+    """Resume a paused sound"""
+    _ResumeSound(sound)
+
+
+def is_sound_playing(sound):
+    # type: (Sound) -> bool
+    """Check if a sound is currently playing"""
+    return _IsSoundPlaying(sound)
+
+
+def set_sound_volume(sound, volume):
+    # type: (Sound, float) -> None
+    """Set volume for a sound (1.0 is max level)"""
+    _SetSoundVolume(sound, _float(volume))
+
+
+def set_sound_pitch(sound, pitch):
+    # type: (Sound, float) -> None
+    """Set pitch for a sound (1.0 is base level)"""
+    _SetSoundPitch(sound, _float(pitch))
+
+
+def set_sound_pan(sound, pan):
+    # type: (Sound, float) -> None
+    """Set pan for a sound (0.5 is center)"""
+    _SetSoundPan(sound, _float(pan))
+
+
+def wave_copy(wave):
+    # type: (Wave) -> Wave
+    """Copy a wave to a new wave"""
+    return _WaveCopy(wave)
+
+
+def wave_crop(wave, init_sample, final_sample):
+    # type: (WavePtr, int, int) -> None
+    """Crop a wave to defined samples range"""
+    _WaveCrop(wave, _int(init_sample), _int(final_sample))
+
+
+def wave_format(wave, sample_rate, sample_size, channels):
+    # type: (WavePtr, int, int, int) -> None
+    """Convert wave data to desired format"""
+    _WaveFormat(wave, _int(sample_rate), _int(sample_size), _int(channels))
+
+
+def load_wave_samples(wave):
+    # type: (Wave) -> FloatPtr
+    """Load samples data from wave as a 32bit float data array"""
+    return _LoadWaveSamples(wave)
+
+
+def unload_wave_samples(samples):
+    # type: (FloatPtr) -> None
+    """Unload samples data loaded with LoadWaveSamples()"""
+    _UnloadWaveSamples(samples)
+
+
+def load_music_stream(file_name):
+    # type: (bytes | str | None) -> Music
+    """Load music stream from file"""
+    return _LoadMusicStream(_str_in(file_name))
+
+
+def load_music_stream_from_memory(file_type, data, data_size):
+    # type: (bytes | str | None, Buffer, int) -> Music
+    """Load music stream from data, which must stay unchanged while the music is loaded"""
+    return _load_music_stream_from_memory(file_type, data, data_size)
+
+
+def is_music_ready(music):
+    # type: (Music) -> bool
+    """Checks if a music stream is ready"""
+    return _IsMusicReady(music)
+
+
+def unload_music_stream(music):
+    # type: (Music) -> None
+    """Unload music stream"""
+    _UnloadMusicStream(music)
+
+
+def play_music_stream(music):
+    # type: (Music) -> None
+    """Start music playing"""
+    _PlayMusicStream(music)
+
+
+def is_music_stream_playing(music):
+    # type: (Music) -> bool
+    """Check if music is playing"""
+    return _IsMusicStreamPlaying(music)
+
+
+def update_music_stream(music):
+    # type: (Music) -> None
+    """Updates buffers for music streaming"""
+    _UpdateMusicStream(music)
+
+
+def stop_music_stream(music):
+    # type: (Music) -> None
+    """Stop music playing"""
+    _StopMusicStream(music)
+
+
+def pause_music_stream(music):
+    # type: (Music) -> None
+    """Pause music playing"""
+    _PauseMusicStream(music)
+
+
+def resume_music_stream(music):
+    # type: (Music) -> None
+    """Resume playing paused music"""
+    _ResumeMusicStream(music)
+
+
+def seek_music_stream(music, position):
+    # type: (Music, float) -> None
+    """Seek music to a position (in seconds)"""
+    _SeekMusicStream(music, _float(position))
+
+
+def set_music_volume(music, volume):
+    # type: (Music, float) -> None
+    """Set volume for music (1.0 is max level)"""
+    _SetMusicVolume(music, _float(volume))
+
+
+def set_music_pitch(music, pitch):
+    # type: (Music, float) -> None
+    """Set pitch for a music (1.0 is base level)"""
+    _SetMusicPitch(music, _float(pitch))
+
+
+def set_music_pan(music, pan):
+    # type: (Music, float) -> None
+    """Set pan for a music (0.5 is center)"""
+    _SetMusicPan(music, _float(pan))
+
+
+def get_music_time_length(music):
+    # type: (Music) -> float
+    """Get music time length (in seconds)"""
+    return _GetMusicTimeLength(music)
+
+
+def get_music_time_played(music):
+    # type: (Music) -> float
+    """Get current music time played (in seconds)"""
+    return _GetMusicTimePlayed(music)
+
+
+def load_audio_stream(sample_rate, sample_size, channels):
+    # type: (int, int, int) -> AudioStream
+    """Load audio stream (to stream raw audio pcm data)"""
+    return _LoadAudioStream(_int(sample_rate), _int(sample_size), _int(channels))
+
+
+def is_audio_stream_ready(stream):
+    # type: (AudioStream) -> bool
+    """Checks if an audio stream is ready"""
+    return _IsAudioStreamReady(stream)
+
+
+def unload_audio_stream(stream):
+    # type: (AudioStream) -> None
+    """Unload audio stream and free memory"""
+    _UnloadAudioStream(stream)
+
+
+def update_audio_stream(stream, data, frame_count):
+    # type: (AudioStream, bytes | str | None, int) -> None
+    """Update audio stream buffers with data"""
+    _UpdateAudioStream(stream, data, _int(frame_count))
+
+
+def is_audio_stream_processed(stream):
+    # type: (AudioStream) -> bool
+    """Check if any audio stream buffers requires refill"""
+    return _IsAudioStreamProcessed(stream)
+
+
+def play_audio_stream(stream):
+    # type: (AudioStream) -> None
+    """Play audio stream"""
+    _PlayAudioStream(stream)
+
+
+def pause_audio_stream(stream):
+    # type: (AudioStream) -> None
+    """Pause audio stream"""
+    _PauseAudioStream(stream)
+
+
+def resume_audio_stream(stream):
+    # type: (AudioStream) -> None
+    """Resume audio stream"""
+    _ResumeAudioStream(stream)
+
+
+def is_audio_stream_playing(stream):
+    # type: (AudioStream) -> bool
+    """Check if audio stream is playing"""
+    return _IsAudioStreamPlaying(stream)
+
+
+def stop_audio_stream(stream):
+    # type: (AudioStream) -> None
+    """Stop audio stream"""
+    _StopAudioStream(stream)
+
+
+def set_audio_stream_volume(stream, volume):
+    # type: (AudioStream, float) -> None
+    """Set volume for audio stream (1.0 is max level)"""
+    _SetAudioStreamVolume(stream, _float(volume))
+
+
+def set_audio_stream_pitch(stream, pitch):
+    # type: (AudioStream, float) -> None
+    """Set pitch for audio stream (1.0 is base level)"""
+    _SetAudioStreamPitch(stream, _float(pitch))
+
+
+def set_audio_stream_pan(stream, pan):
+    # type: (AudioStream, float) -> None
+    """Set pan for audio stream (0.5 is centered)"""
+    _SetAudioStreamPan(stream, _float(pan))
+
+
+def set_audio_stream_buffer_size_default(size):
+    # type: (int) -> None
+    """Default size for new audio streams"""
+    _set_audio_stream_buffer_size_default(size)
+
+
+def set_audio_stream_callback(stream, callback):
+    # type: (AudioStream, AudioCallback) -> None
+    """Audio thread callback to request new data"""
+    _SetAudioStreamCallback(stream, callback)
+
+
+def attach_audio_stream_processor(stream, processor):
+    # type: (AudioStream, AudioCallback | AudioProcessor) -> None
+    """Attach audio stream processor to stream, receives the samples as <float>s"""
+    _AttachAudioStreamProcessor(stream, processor)
+
+
+def detach_audio_stream_processor(stream, processor):
+    # type: (AudioStream, AudioCallback) -> None
+    """Detach audio stream processor from stream"""
+    _DetachAudioStreamProcessor(stream, processor)
+
+
+def attach_audio_mixed_processor(processor):
+    # type: (AudioCallback | AudioProcessor) -> None
+    """Attach audio stream processor to the entire audio pipeline, receives the samples as <float>s"""
+    _AttachAudioMixedProcessor(processor)
+
+
+def detach_audio_mixed_processor(processor):
+    # type: (AudioCallback) -> None
+    """Detach audio stream processor from the entire audio pipeline"""
+    _DetachAudioMixedProcessor(processor)
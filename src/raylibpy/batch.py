@@ -0,0 +1,94 @@
+# batch.py
+
+#   Vectorized raymath: matrix, vector and quaternion functions applied to whole
+#   NumPy arrays at once instead of one value per FFI call (requires NumPy).
+#
+#   Layouts:
+#   - matrices: (N, 16) float32, each row in Matrix field order (m0, m4, m8, m12,
+#     m1, m5, ...), i.e. the memory layout of raylibpy.Matrix, so
+#     `rows.reshape(-1, 4, 4)[i]` is the matrix as raymath writes it and
+#     `Matrix.from_buffer_copy(rows[i])` converts a row back
+#   - quaternions: (N, 4) float32 as (x, y, z, w)
+#   - vectors: (N, 3) float32
+#
+#   A single Matrix/Vector3/Quaternion, ctypes arrays of them and Vector3Array
+#   are accepted too, and a batch of one is broadcast against the other operand.
+#   Results are computed in float32 following raymath's formulas; they can
+#   differ from the C functions in the last bit because NumPy may reorder or
+#   fuse the floating point operations.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from . import (
+    BaseArray,
+    Structure,
+    _SUBMODULE_EXPORTS,
+    _VectorArray,
+    _numpy,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['batch'])
+
+EPSILON = 0.000001
+
+
+def _as_batch(values, width):
+    """Returns `values` as a C-contiguous (N, width) float32 array, without copying when possible"""
+    np = _numpy()
+    if isinstance(values, _VectorArray):
+        values = values.numpy()
+    elif isinstance(values, (Structure, BaseArray)):
+        values = np.frombuffer(values, dtype=np.float32)
+    return np.ascontiguousarray(values, dtype=np.float32).reshape(-1, width)
+
+
+def matrix_multiply_batch(left, right):
+    # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    """Multiplies N pairs of matrices like matrix_multiply(left[i], right[i]), returns (N, 16)"""
+    np = _numpy()
+    left = _as_batch(left, 16).reshape(-1, 4, 4)
+    right = _as_batch(right, 16).reshape(-1, 4, 4)
+    # MatrixMultiply(left, right) applies left first: in row/column notation it is right @ left
+    return np.matmul(right, left).reshape(-1, 16)
+
+
+def vector3_transform_batch(v, mat):
+    # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    """Transforms N vectors like vector3_transform(v[i], mat[i]), returns (N, 3)"""
+    np = _numpy()
+    v = _as_batch(v, 3)
+    mat = _as_batch(mat, 16).reshape(-1, 4, 4)
+    return np.matmul(mat[:, :3, :3], v[:, :, None])[:, :, 0] + mat[:, :3, 3]
+
+
+def quaternion_slerp_batch(q1, q2, amount):
+    # type: (numpy.ndarray, numpy.ndarray, float | numpy.ndarray) -> numpy.ndarray
+    """Interpolates N pairs of quaternions like quaternion_slerp(q1[i], q2[i], amount[i]), returns (N, 4)
+
+    `amount` is a float or an array of N floats.
+    """
+    np = _numpy()
+    q1 = _as_batch(q1, 4)
+    q2 = _as_batch(q2, 4)
+    amount = np.asarray(amount, dtype=np.float32).reshape(-1, 1)
+
+    cos_half_theta = np.sum(q1 * q2, axis=1, keepdims=True)
+    q2 = np.where(cos_half_theta < 0, -q2, q2)
+    cos_half_theta = np.abs(cos_half_theta)
+
+    # Nlerp, used when the quaternions are close
+    nlerp = q1 + amount * (q2 - q1)
+    length = np.sqrt(np.sum(nlerp * nlerp, axis=1, keepdims=True))
+    nlerp /= np.where(length == 0, np.float32(1), length)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        half_theta = np.arccos(np.minimum(cos_half_theta, np.float32(1)))
+        sin_half_theta = np.sqrt(np.float32(1) - cos_half_theta * cos_half_theta)
+        ratio_a = np.sin((1 - amount) * half_theta) / sin_half_theta
+        ratio_b = np.sin(amount * half_theta) / sin_half_theta
+        slerp = q1 * ratio_a + q2 * ratio_b
+
+    slerp = np.where(np.abs(sin_half_theta) < EPSILON, q1 * np.float32(0.5) + q2 * np.float32(0.5), slerp)
+    result = np.where(cos_half_theta > np.float32(0.95), nlerp, slerp)
+    return np.where(cos_half_theta >= 1, np.broadcast_to(q1, result.shape), result).astype(np.float32, copy=False)
@@ -0,0 +1,234 @@
+# cache.py
+
+#   A cache of loaded resources (textures, fonts, models, sounds or anything
+#   with a load and an unload function), keyed by the file and load parameters
+#   so the same resource is only loaded once, and reference counted: acquire()
+#   and the typed helpers add a reference, release() removes one.
+#
+#   Resources nobody references anymore stay loaded, ready to be acquired again,
+#   until the memory they use (estimated) exceeds the budget of their pool:
+#   'vram' for textures, fonts and models, 'ram' for sounds. The least recently
+#   used are then unloaded first; referenced resources are never unloaded.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   cache = ResourceCache(vram_budget=256 * 2 ** 20)    # bytes, after init_window()
+#   hero = cache.texture('hero.png')                # loaded
+#   again = cache.texture('hero.png')               # same Texture, 2 references
+#   font = cache.font('ui.ttf', 24)
+#   cache.release(hero)
+#   cache.release(again)                            # unreferenced: unloaded when over budget
+#   print(cache.hits, cache.misses, cache.evictions, cache.usage('vram'))
+#   cache.unload()                                  # before close_window()
+
+import collections
+
+from . import (
+    _GetPixelDataSize,
+    _LoadFontEx,
+    _LoadModel,
+    _LoadSound,
+    _LoadTexture,
+    _SUBMODULE_EXPORTS,
+    _UnloadModel,
+    _UnloadSound,
+    _UnloadTexture,
+    _str_in,
+    _symbol_namespaces,
+    _unload_font,
+    int_array,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['cache'])
+
+_symbol_namespaces.append(globals())
+
+
+# region SIZE ESTIMATES
+
+def _texture_size(texture):
+    """Bytes of a texture and its mipmaps (each a quarter of the previous one)"""
+    size = _GetPixelDataSize(texture.width, texture.height, texture.format)
+    return size * 4 // 3 if texture.mipmaps > 1 else size
+
+
+def _font_size(font):
+    return _texture_size(font.texture)
+
+
+def _mesh_size(mesh):
+    """Bytes of the vertex buffers of a mesh"""
+    per_vertex = 0
+    for name, size in (('vertices', 12), ('texcoords', 8), ('texcoords2', 8), ('normals', 12), ('tangents', 16)):
+        if getattr(mesh, name):
+            per_vertex += size
+    return mesh.vertex_count * per_vertex + (mesh.triangle_count * 6 if mesh.indices else 0)
+
+
+def _model_size(model):
+    size = sum(_mesh_size(model.meshes[index]) for index in range(model.mesh_count))
+    for index in range(model.material_count):
+        material = model.materials[index]
+        if material.maps:
+            # the diffuse map (loaded textures replace raylib's 1x1 default one)
+            size += _texture_size(material.maps[0].texture)
+    return size
+
+
+def _sound_size(sound):
+    return sound.frame_count * sound.stream.channels * sound.stream.sample_size // 8
+
+# endregion (size estimates)
+
+
+class _Entry(object):
+    __slots__ = ('key', 'resource', 'unload', 'size', 'pool', 'references')
+
+    def __init__(self, key, resource, unload, size, pool):
+        self.key = key
+        self.resource = resource
+        self.unload = unload
+        self.size = size
+        self.pool = pool
+        self.references = 0
+
+
+class ResourceCache(object):
+    """Loads each resource once, counts its references and unloads the unused ones over budget
+
+    Budgets are in bytes, None for no limit.
+    """
+
+    def __init__(self, vram_budget=None, ram_budget=None):
+        # type: (int | None, int | None) -> None
+        self.budgets = {'vram': vram_budget, 'ram': ram_budget}
+        self._entries = collections.OrderedDict()   # key -> _Entry, least recently used first
+        self._handles = {}                          # id(resource) -> key
+        self._usage = collections.Counter()         # pool -> bytes
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def reset_stats(self):
+        # type: () -> None
+        self.hits = 0
+        self.misses = 0                 # loads
+        self.evictions = 0              # unreferenced resources unloaded to stay within a budget
+
+    @property
+    def hit_rate(self):
+        # type: () -> float
+        """Fraction of the acquisitions served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / float(total) if total else 0.0
+
+    def usage(self, pool):
+        # type: (str) -> int
+        """Estimated bytes used by the resources of `pool` ('vram' or 'ram'), referenced or not"""
+        return self._usage[pool]
+
+    def references(self, resource):
+        # type: (object) -> int
+        """Number of references to `resource`, 0 if it is not in the cache"""
+        key = self._handles.get(id(resource))
+        return self._entries[key].references if key is not None else 0
+
+    def acquire(self, key, load, unload, size=None, pool='vram'):
+        # type: (Hashable, Callable[[], T], Callable[[T], None], Callable[[T], int] | None, str) -> T
+        """Returns the resource cached under `key`, loaded with load() if needed, and adds a reference
+
+        `size` estimates the bytes used by a loaded resource, counted in the
+        budget of `pool`. Resources are identified by object: release() needs the
+        object returned here.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            resource = load()
+            entry = _Entry(key, resource, unload, size(resource) if size else 0, pool)
+            self._entries[key] = entry
+            self._handles[id(resource)] = key
+            self._usage[pool] += entry.size
+        entry.references += 1
+        self._evict(entry.pool)
+        return entry.resource
+
+    def release(self, resource):
+        # type: (object) -> None
+        """Removes a reference to `resource`, which is unloaded when over budget and unreferenced"""
+        key = self._handles.get(id(resource))
+        if key is None:
+            raise KeyError("resource not in the cache: {!r}".format(resource))
+        entry = self._entries[key]
+        if entry.references <= 0:
+            raise ValueError("resource released more times than acquired: {!r}".format(key))
+        entry.references -= 1
+        self._evict(entry.pool)
+
+    def texture(self, file_name):
+        # type: (str) -> Texture
+        """Acquires the texture loaded from `file_name`"""
+        return self.acquire(('texture', file_name), lambda: _LoadTexture(_str_in(file_name)), _UnloadTexture, _texture_size)
+
+    def font(self, file_name, font_size=32, codepoints=None):
+        # type: (str, int, list[int] | str | None) -> Font
+        """Acquires the font loaded from `file_name` at `font_size` with `codepoints` (default glyphs if None)"""
+        key = ('font', file_name, int(font_size), tuple(codepoints) if codepoints else None)
+
+        def load():
+            points = int_array(codepoints) if codepoints else None
+            return _LoadFontEx(_str_in(file_name), int(font_size), points, len(points) if points else 0)
+
+        return self.acquire(key, load, _unload_font, _font_size)
+
+    def model(self, file_name):
+        # type: (str) -> Model
+        """Acquires the model loaded from `file_name`"""
+        return self.acquire(('model', file_name), lambda: _LoadModel(_str_in(file_name)), _UnloadModel, _model_size)
+
+    def sound(self, file_name):
+        # type: (str) -> Sound
+        """Acquires the sound loaded from `file_name`"""
+        return self.acquire(('sound', file_name), lambda: _LoadSound(_str_in(file_name)), _UnloadSound, _sound_size, 'ram')
+
+    def trim(self, pool=None):
+        # type: (str | None) -> int
+        """Unloads all the unreferenced resources (of `pool`), returns how many"""
+        unused = [entry for entry in self._entries.values()
+                  if not entry.references and (pool is None or entry.pool == pool)]
+        for entry in unused:
+            self._remove(entry)
+        return len(unused)
+
+    def unload(self):
+        # type: () -> None
+        """Unloads all the resources, referenced or not"""
+        for entry in list(self._entries.values()):
+            self._remove(entry)
+
+    def _evict(self, pool):
+        budget = self.budgets.get(pool)
+        if budget is None or self._usage[pool] <= budget:
+            return
+        for entry in list(self._entries.values()):
+            if entry.pool == pool and not entry.references:
+                self._remove(entry)
+                self.evictions += 1
+                if self._usage[pool] <= budget:
+                    break
+
+    def _remove(self, entry):
+        del self._entries[entry.key]
+        del self._handles[id(entry.resource)]
+        self._usage[entry.pool] -= entry.size
+        entry.unload(entry.resource)
@@ -0,0 +1,1432 @@
+# core.py
+
+#   Functions of raylib's core module (rcore): window and cursor handling, drawing
+#   modes, shaders, timing, files and compression, automation events, input,
+#   gestures and camera.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from . import (
+    _BeginBlendMode,
+    _BeginDrawing,
+    _BeginMode2D,
+    _BeginMode3D,
+    _BeginScissorMode,
+    _BeginShaderMode,
+    _BeginTextureMode,
+    _BeginVrStereoMode,
+    _ChangeDirectory,
+    _ClearBackground,
+    _ClearWindowState,
+    _CloseWindow,
+    _CompressData,
+    _DecodeDataBase64,
+    _DecompressData,
+    _DirectoryExists,
+    _DisableCursor,
+    _DisableEventWaiting,
+    _EnableCursor,
+    _EnableEventWaiting,
+    _EncodeDataBase64,
+    _EndBlendMode,
+    _EndDrawing,
+    _EndMode2D,
+    _EndMode3D,
+    _EndScissorMode,
+    _EndShaderMode,
+    _EndTextureMode,
+    _EndVrStereoMode,
+    _ExportAutomationEventList,
+    _ExportDataAsCode,
+    _FileExists,
+    _GetApplicationDirectory,
+    _GetCameraMatrix,
+    _GetCameraMatrix2D,
+    _GetCharPressed,
+    _GetClipboardText,
+    _GetCurrentMonitor,
+    _GetDirectoryPath,
+    _GetFPS,
+    _GetFileExtension,
+    _GetFileLength,
+    _GetFileModTime,
+    _GetFileName,
+    _GetFileNameWithoutExt,
+    _GetFrameTime,
+    _GetGamepadAxisCount,
+    _GetGamepadAxisMovement,
+    _GetGamepadButtonPressed,
+    _GetGamepadName,
+    _GetGestureDetected,
+    _GetGestureDragAngle,
+    _GetGestureDragVector,
+    _GetGestureHoldDuration,
+    _GetGesturePinchAngle,
+    _GetGesturePinchVector,
+    _GetKeyPressed,
+    _GetMonitorCount,
+    _GetMonitorHeight,
+    _GetMonitorName,
+    _GetMonitorPhysicalHeight,
+    _GetMonitorPhysicalWidth,
+    _GetMonitorPosition,
+    _GetMonitorRefreshRate,
+    _GetMonitorWidth,
+    _GetMouseDelta,
+    _GetMousePosition,
+    _GetMouseRay,
+    _GetMouseWheelMove,
+    _GetMouseWheelMoveV,
+    _GetMouseX,
+    _GetMouseY,
+    _GetPrevDirectoryPath,
+    _GetRandomValue,
+    _GetRenderHeight,
+    _GetRenderWidth,
+    _GetScreenHeight,
+    _GetScreenToWorld2D,
+    _GetScreenWidth,
+    _GetShaderLocation,
+    _GetShaderLocationAttrib,
+    _GetTime,
+    _GetTouchPointCount,
+    _GetTouchPointId,
+    _GetTouchPosition,
+    _GetTouchX,
+    _GetTouchY,
+    _GetWindowHandle,
+    _GetWindowPosition,
+    _GetWindowScaleDPI,
+    _GetWorkingDirectory,
+    _GetWorldToScreen,
+    _GetWorldToScreen2D,
+    _GetWorldToScreenEx,
+    _HideCursor,
+    _InitWindow,
+    _IsCursorHidden,
+    _IsCursorOnScreen,
+    _IsFileDropped,
+    _IsFileExtension,
+    _IsGamepadAvailable,
+    _IsGamepadButtonDown,
+    _IsGamepadButtonPressed,
+    _IsGamepadButtonReleased,
+    _IsGamepadButtonUp,
+    _IsGestureDetected,
+    _IsKeyDown,
+    _IsKeyPressed,
+    _IsKeyPressedRepeat,
+    _IsKeyReleased,
+    _IsKeyUp,
+    _IsMouseButtonDown,
+    _IsMouseButtonPressed,
+    _IsMouseButtonReleased,
+    _IsMouseButtonUp,
+    _IsPathFile,
+    _IsShaderReady,
+    _IsWindowFocused,
+    _IsWindowFullscreen,
+    _IsWindowHidden,
+    _IsWindowMaximized,
+    _IsWindowMinimized,
+    _IsWindowReady,
+    _IsWindowResized,
+    _IsWindowState,
+    _LoadAutomationEventList,
+    _LoadDirectoryFiles,
+    _LoadDirectoryFilesEx,
+    _LoadDroppedFiles,
+    _LoadFileData,
+    _LoadFileText,
+    _LoadRandomSequence,
+    _LoadShader,
+    _LoadShaderFromMemory,
+    _LoadVrStereoConfig,
+    _MaximizeWindow,
+    _MemAlloc,
+    _MemFree,
+    _MemRealloc,
+    _MinimizeWindow,
+    _OpenURL,
+    _PlayAutomationEvent,
+    _PollInputEvents,
+    _RestoreWindow,
+    _SUBMODULE_EXPORTS,
+    _SaveFileData,
+    _SaveFileText,
+    _SetAutomationEventBaseFrame,
+    _SetAutomationEventList,
+    _SetClipboardText,
+    _SetConfigFlags,
+    _SetExitKey,
+    _SetGamepadMappings,
+    _SetGesturesEnabled,
+    _SetLoadFileTextCallback,
+    _SetMouseCursor,
+    _SetMouseOffset,
+    _SetMousePosition,
+    _SetMouseScale,
+    _SetRandomSeed,
+    _SetSaveFileDataCallback,
+    _SetSaveFileTextCallback,
+    _SetShaderValue,
+    _SetShaderValueMatrix,
+    _SetShaderValueTexture,
+    _SetShaderValueV,
+    _SetTargetFPS,
+    _SetTraceLogCallback,
+    _SetTraceLogLevel,
+    _SetWindowFocused,
+    _SetWindowIcon,
+    _SetWindowIcons,
+    _SetWindowMaxSize,
+    _SetWindowMinSize,
+    _SetWindowMonitor,
+    _SetWindowOpacity,
+    _SetWindowPosition,
+    _SetWindowSize,
+    _SetWindowState,
+    _SetWindowTitle,
+    _ShowCursor,
+    _StartAutomationEventRecording,
+    _StopAutomationEventRecording,
+    _SwapScreenBuffer,
+    _TakeScreenshot,
+    _ToggleBorderlessWindowed,
+    _ToggleFullscreen,
+    _TraceLog,
+    _UnloadAutomationEventList,
+    _UnloadDirectoryFiles,
+    _UnloadDroppedFiles,
+    _UnloadFileData,
+    _UnloadFileText,
+    _UnloadRandomSequence,
+    _UnloadShader,
+    _UnloadVrStereoConfig,
+    _UpdateCamera,
+    _UpdateCameraPro,
+    _WaitTime,
+    _WindowShouldClose,
+    _bool,
+    _color,
+    _float,
+    _int,
+    _set_load_file_data_callback,
+    _str_in,
+    _str_out,
+    _symbol_namespaces,
+    _ubyte_buffer_in,
+    _vec2,
+    _vec3,
+    clear_text_measure_cache,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['core'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def init_window(width, height, title):
+    # type: (int, int, bytes | str | None) -> None
+    """Initialize window and OpenGL context"""
+    _InitWindow(_int(width), _int(height), _str_in(title))
+    # measures of the default font taken before it was loaded
+    clear_text_measure_cache()
+
+
+def close_window():
+    # type: () -> None
+    """Close window and unload OpenGL context"""
+    _CloseWindow()
+    # the default font is unloaded: its texture id may be reused by the next window
+    clear_text_measure_cache()
+
+
+def window_should_close():
+    # type: () -> bool
+    """Check if application should close (KEY_ESCAPE pressed or windows close icon clicked)"""
+    return _WindowShouldClose()
+
+
+def is_window_ready():
+    # type: () -> bool
+    """Check if window has been initialized successfully"""
+    return _IsWindowReady()
+
+
+def is_window_fullscreen():
+    # type: () -> bool
+    """Check if window is currently fullscreen"""
+    return _IsWindowFullscreen()
+
+
+def is_window_hidden():
+    # type: () -> bool
+    """Check if window is currently hidden (only PLATFORM_DESKTOP)"""
+    return _IsWindowHidden()
+
+
+def is_window_minimized():
+    # type: () -> bool
+    """Check if window is currently minimized (only PLATFORM_DESKTOP)"""
+    return _IsWindowMinimized()
+
+
+def is_window_maximized():
+    # type: () -> bool
+    """Check if window is currently maximized (only PLATFORM_DESKTOP)"""
+    return _IsWindowMaximized()
+
+
+def is_window_focused():
+    # type: () -> bool
+    """Check if window is currently focused (only PLATFORM_DESKTOP)"""
+    return _IsWindowFocused()
+
+
+def is_window_resized():
+    # type: () -> bool
+    """Check if window has been resized last frame"""
+    return _IsWindowResized()
+
+
+def is_window_state(flag):
+    # type: (int) -> bool
+    """Check if one specific window flag is enabled"""
+    return _IsWindowState(_int(flag))
+
+
+def set_window_state(flags):
+    # type: (int) -> None
+    """Set window configuration state using flags (only PLATFORM_DESKTOP)"""
+    _SetWindowState(_int(flags))
+
+
+def clear_window_state(flags):
+    # type: (int) -> None
+    """Clear window configuration state flags"""
+    _ClearWindowState(_int(flags))
+
+
+def toggle_fullscreen():
+    # type: () -> None
+    """Toggle window state: fullscreen/windowed (only PLATFORM_DESKTOP)"""
+    _ToggleFullscreen()
+
+
+def toggle_borderless_windowed():
+    # type: () -> None
+    """Toggle window state: borderless windowed (only PLATFORM_DESKTOP)"""
+    _ToggleBorderlessWindowed()
+
+
+def maximize_window():
+    # type: () -> None
+    """Set window state: maximized, if resizable (only PLATFORM_DESKTOP)"""
+    _MaximizeWindow()
+
+
+def minimize_window():
+    # type: () -> None
+    """Set window state: minimized, if resizable (only PLATFORM_DESKTOP)"""
+    _MinimizeWindow()
+
+
+def restore_window():
+    # type: () -> None
+    """Set window state: not minimized/maximized (only PLATFORM_DESKTOP)"""
+    _RestoreWindow()
+
+
+def set_window_icon(image):
+    # type: (Image) -> None
+    """Set icon for window (single image, RGBA 32bit, only PLATFORM_DESKTOP)"""
+    _SetWindowIcon(image)
+
+
+def set_window_icons(images, count):
+    # type: (ImagePtr, int) -> None
+    """Set icon for window (multiple images, RGBA 32bit, only PLATFORM_DESKTOP)"""
+    _SetWindowIcons(images, _int(count))
+
+
+def set_window_title(title):
+    # type: (bytes | str | None) -> None
+    """Set title for window (only PLATFORM_DESKTOP and PLATFORM_WEB)"""
+    _SetWindowTitle(_str_in(title))
+
+
+def set_window_position(x, y):
+    # type: (int, int) -> None
+    """Set window position on screen (only PLATFORM_DESKTOP)"""
+    _SetWindowPosition(_int(x), _int(y))
+
+
+def set_window_monitor(monitor):
+    # type: (int) -> None
+    """Set monitor for the current window"""
+    _SetWindowMonitor(_int(monitor))
+
+
+def set_window_min_size(width, height):
+    # type: (int, int) -> None
+    """Set window minimum dimensions (for FLAG_WINDOW_RESIZABLE)"""
+    _SetWindowMinSize(_int(width), _int(height))
+
+
+def set_window_max_size(width, height):
+    # type: (int, int) -> None
+    """Set window maximum dimensions (for FLAG_WINDOW_RESIZABLE)"""
+    _SetWindowMaxSize(_int(width), _int(height))
+
+
+def set_window_size(width, height):
+    # type: (int, int) -> None
+    """Set window dimensions"""
+    _SetWindowSize(_int(width), _int(height))
+
+
+def set_window_opacity(opacity):
+    # type: (float) -> None
+    """Set window opacity [0.0f..1.0f] (only PLATFORM_DESKTOP)"""
+    _SetWindowOpacity(_float(opacity))
+
+
+def set_window_focused():
+    # type: () -> None
+    """Set window focused (only PLATFORM_DESKTOP)"""
+    _SetWindowFocused()
+
+
+def get_window_handle():
+    # type: () -> bytes | str | None
+    """Get native window handle"""
+    return _GetWindowHandle()
+
+
+def get_screen_width():
+    # type: () -> int
+    """Get current screen width"""
+    return _GetScreenWidth()
+
+
+def get_screen_height():
+    # type: () -> int
+    """Get current screen height"""
+    return _GetScreenHeight()
+
+
+def get_render_width():
+    # type: () -> int
+    """Get current render width (it considers HiDPI)"""
+    return _GetRenderWidth()
+
+
+def get_render_height():
+    # type: () -> int
+    """Get current render height (it considers HiDPI)"""
+    return _GetRenderHeight()
+
+
+def get_monitor_count():
+    # type: () -> int
+    """Get number of connected monitors"""
+    return _GetMonitorCount()
+
+
+def get_current_monitor():
+    # type: () -> int
+    """Get current connected monitor"""
+    return _GetCurrentMonitor()
+
+
+def get_monitor_position(monitor):
+    # type: (int) -> Vector2
+    """Get specified monitor position"""
+    return _GetMonitorPosition(_int(monitor))
+
+
+def get_monitor_width(monitor):
+    # type: (int) -> int
+    """Get specified monitor width (current video mode used by monitor)"""
+    return _GetMonitorWidth(_int(monitor))
+
+
+def get_monitor_height(monitor):
+    # type: (int) -> int
+    """Get specified monitor height (current video mode used by monitor)"""
+    return _GetMonitorHeight(_int(monitor))
+
+
+def get_monitor_physical_width(monitor):
+    # type: (int) -> int
+    """Get specified monitor physical width in millimetres"""
+    return _GetMonitorPhysicalWidth(_int(monitor))
+
+
+def get_monitor_physical_height(monitor):
+    # type: (int) -> int
+    """Get specified monitor physical height in millimetres"""
+    return _GetMonitorPhysicalHeight(_int(monitor))
+
+
+def get_monitor_refresh_rate(monitor):
+    # type: (int) -> int
+    """Get specified monitor refresh rate"""
+    return _GetMonitorRefreshRate(_int(monitor))
+
+
+def get_window_position():
+    # type: () -> Vector2
+    """Get window position XY on monitor"""
+    return _GetWindowPosition()
+
+
+def get_window_scale_dpi():
+    # type: () -> Vector2
+    """Get window scale DPI factor"""
+    return _GetWindowScaleDPI()
+
+
+def get_monitor_name(monitor):
+    # type: (int) -> bytes | str | None
+    """Get the human-readable, UTF-8 encoded name of the specified monitor"""
+    return _str_out(_GetMonitorName(_int(monitor)))
+
+
+def set_clipboard_text(text):
+    # type: (bytes | str | None) -> None
+    """Set clipboard text content"""
+    _SetClipboardText(_str_in(text))
+
+
+def get_clipboard_text():
+    # type: () -> bytes | str | None
+    """Get clipboard text content"""
+    return _str_out(_GetClipboardText())
+
+
+def enable_event_waiting():
+    # type: () -> None
+    """Enable waiting for events on EndDrawing(), no automatic event polling"""
+    _EnableEventWaiting()
+
+
+def disable_event_waiting():
+    # type: () -> None
+    """Disable waiting for events on EndDrawing(), automatic events polling"""
+    _DisableEventWaiting()
+
+
+def show_cursor():
+    # type: () -> None
+    """Shows cursor"""
+    _ShowCursor()
+
+
+def hide_cursor():
+    # type: () -> None
+    """Hides cursor"""
+    _HideCursor()
+
+
+def is_cursor_hidden():
+    # type: () -> bool
+    """Check if cursor is not visible"""
+    return _IsCursorHidden()
+
+
+def enable_cursor():
+    # type: () -> None
+    """Enables cursor (unlock cursor)"""
+    _EnableCursor()
+
+
+def disable_cursor():
+    # type: () -> None
+    """Disables cursor (lock cursor)"""
+    _DisableCursor()
+
+
+def is_cursor_on_screen():
+    # type: () -> bool
+    """Check if cursor is on the screen"""
+    return _IsCursorOnScreen()
+
+
+def clear_background(color):
+    # type: (Color) -> None
+    """Set background color (framebuffer clear color)"""
+    _ClearBackground(_color(color))
+
+
+def begin_drawing():
+    # type: () -> None
+    """Setup canvas (framebuffer) to start drawing"""
+    _BeginDrawing()
+
+
+def end_drawing():
+    # type: () -> None
+    """End canvas drawing and swap buffers (double buffering)"""
+    _EndDrawing()
+
+
+def begin_mode2d(camera):
+    # type: (Camera2D) -> None
+    """Begin 2D mode with custom camera (2D)"""
+    _BeginMode2D(camera)
+
+
+def end_mode2d():
+    # type: () -> None
+    """Ends 2D mode with custom camera"""
+    _EndMode2D()
+
+
+def begin_mode3d(camera):
+    # type: (Camera3D) -> None
+    """Begin 3D mode with custom camera (3D)"""
+    _BeginMode3D(camera)
+
+
+def end_mode3d():
+    # type: () -> None
+    """Ends 3D mode and returns to default 2D orthographic mode"""
+    _EndMode3D()
+
+
+def begin_texture_mode(target):
+    # type: (RenderTexture2D) -> None
+    """Begin drawing to render texture"""
+    _BeginTextureMode(target)
+
+
+def end_texture_mode():
+    # type: () -> None
+    """Ends drawing to render texture"""
+    _EndTextureMode()
+
+
+def begin_shader_mode(shader):
+    # type: (Shader) -> None
+    """Begin custom shader drawing"""
+    _BeginShaderMode(shader)
+
+
+def end_shader_mode():
+    # type: () -> None
+    """End custom shader drawing (use default shader)"""
+    _EndShaderMode()
+
+
+def begin_blend_mode(mode):
+    # type: (int) -> None
+    """Begin blending mode (alpha, additive, multiplied, subtract, custom)"""
+    _BeginBlendMode(_int(mode))
+
+
+def end_blend_mode():
+    # type: () -> None
+    """End blending mode (reset to default: alpha blending)"""
+    _EndBlendMode()
+
+
+def begin_scissor_mode(x, y, width, height):
+    # type: (int, int, int, int) -> None
+    """Begin scissor mode (define screen area for following drawing)"""
+    _BeginScissorMode(_int(x), _int(y), _int(width), _int(height))
+
+
+def end_scissor_mode():
+    # type: () -> None
+    """End scissor mode"""
+    _EndScissorMode()
+
+
+def begin_vr_stereo_mode(config):
+    # type: (VrStereoConfig) -> None
+    """Begin stereo rendering (requires VR simulator)"""
+    _BeginVrStereoMode(config)
+
+
+def end_vr_stereo_mode():
+    # type: () -> None
+    """End stereo rendering (requires VR simulator)"""
+    _EndVrStereoMode()
+
+
+def load_vr_stereo_config(device):
+    # type: (VrDeviceInfo) -> VrStereoConfig
+    """Load VR stereo config for VR simulator device parameters"""
+    return _LoadVrStereoConfig(device)
+
+
+def unload_vr_stereo_config(config):
+    # type: (VrStereoConfig) -> None
+    """Unload VR stereo config"""
+    _UnloadVrStereoConfig(config)
+
+
+def load_shader(vs_file_name, fs_file_name):
+    # type: (bytes | str | None, bytes | str | None) -> Shader
+    """Load shader from files and bind default locations"""
+    return _LoadShader(_str_in(vs_file_name), _str_in(fs_file_name))
+
+
+def load_shader_from_memory(vs_code, fs_code):
+    # type: (bytes | str | None, bytes | str | None) -> Shader
+    """Load shader from code strings and bind default locations"""
+    return _LoadShaderFromMemory(_str_in(vs_code), _str_in(fs_code))
+
+
+def is_shader_ready(shader):
+    # type: (Shader) -> bool
+    """Check if a shader is ready"""
+    return _IsShaderReady(shader)
+
+
+def get_shader_location(shader, uniform_name):
+    # type: (Shader, bytes | str | None) -> int
+    """Get shader uniform location"""
+    return _GetShaderLocation(shader, _str_in(uniform_name))
+
+
+def get_shader_location_attrib(shader, attrib_name):
+    # type: (Shader, bytes | str | None) -> int
+    """Get shader attribute location"""
+    return _GetShaderLocationAttrib(shader, _str_in(attrib_name))
+
+
+def set_shader_value(shader, loc_index, value, uniform_type):
+    # type: (Shader, int, bytes | str | None, int) -> None
+    """Set shader uniform value"""
+    _SetShaderValue(shader, _int(loc_index), value, _int(uniform_type))
+
+
+def set_shader_value_v(shader, loc_index, value, uniform_type, count):
+    # type: (Shader, int, bytes | str | None, int, int) -> None
+    """Set shader uniform value vector"""
+    _SetShaderValueV(shader, _int(loc_index), value, _int(uniform_type), _int(count))
+
+
+def set_shader_value_matrix(shader, loc_index, mat):
+    # type: (Shader, int, Matrix) -> None
+    """Set shader uniform value (matrix 4x4)"""
+    _SetShaderValueMatrix(shader, _int(loc_index), mat)
+
+
+def set_shader_value_texture(shader, loc_index, texture):
+    # type: (Shader, int, Texture2D) -> None
+    """Set shader uniform value for texture (sampler2d)"""
+    _SetShaderValueTexture(shader, _int(loc_index), texture)
+
+
+def unload_shader(shader):
+    # type: (Shader) -> None
+    """Unload shader from GPU memory (VRAM)"""
+    _UnloadShader(shader)
+
+
+def get_mouse_ray(mouse_position, camera):
+    # type: (Vector2, Camera) -> Ray
+    """Get a ray trace from mouse position"""
+    return _GetMouseRay(_vec2(mouse_position), camera)
+
+
+def get_camera_matrix(camera):
+    # type: (Camera) -> Matrix
+    """Get camera transform matrix (view matrix)"""
+    return _GetCameraMatrix(camera)
+
+
+def get_camera_matrix2d(camera):
+    # type: (Camera2D) -> Matrix
+    """Get camera 2d transform matrix"""
+    return _GetCameraMatrix2D(camera)
+
+
+def get_world_to_screen(position, camera):
+    # type: (Vector3, Camera) -> Vector2
+    """Get the screen space position for a 3d world space position"""
+    return _GetWorldToScreen(_vec3(position), camera)
+
+
+def get_screen_to_world2d(position, camera):
+    # type: (Vector2, Camera2D) -> Vector2
+    """Get the world space position for a 2d camera screen space position"""
+    return _GetScreenToWorld2D(_vec2(position), camera)
+
+
+def get_world_to_screen_ex(position, camera, width, height):
+    # type: (Vector3, Camera, int, int) -> Vector2
+    """Get size position for a 3d world space position"""
+    return _GetWorldToScreenEx(_vec3(position), camera, _int(width), _int(height))
+
+
+def get_world_to_screen2d(position, camera):
+    # type: (Vector2, Camera2D) -> Vector2
+    """Get the screen space position for a 2d camera world space position"""
+    return _GetWorldToScreen2D(_vec2(position), camera)
+
+
+def set_target_fps(fps):
+    # type: (int) -> None
+    """Set target FPS (maximum)"""
+    _SetTargetFPS(_int(fps))
+
+
+def get_frame_time():
+    # type: () -> float
+    """Get time in seconds for last frame drawn (delta time)"""
+    return _GetFrameTime()
+
+
+def get_time():
+    # type: () -> float
+    """Get elapsed time in seconds since InitWindow()"""
+    return _GetTime()
+
+
+def get_fps():
+    # type: () -> int
+    """Get current FPS"""
+    return _GetFPS()
+
+
+def swap_screen_buffer():
+    # type: () -> None
+    """Swap back buffer with front buffer (screen drawing)"""
+    _SwapScreenBuffer()
+
+
+def poll_input_events():
+    # type: () -> None
+    """Register all input events"""
+    _PollInputEvents()
+
+
+def wait_time(seconds):
+    # type: (float) -> None
+    """Wait for some time (halt program execution)"""
+    _WaitTime(_float(seconds))
+
+
+def set_random_seed(seed):
+    # type: (int) -> None
+    """Set the seed for the random number generator"""
+    _SetRandomSeed(_int(seed))
+
+
+def get_random_value(min_, max_):
+    # type: (int, int) -> int
+    """Get a random value between min and max (both included)"""
+    return _GetRandomValue(_int(min_), _int(max_))
+
+
+def load_random_sequence(count, min_, max_):
+    # type: (int, int, int) -> IntPtr
+    """Load random values sequence, no values repeated"""
+    return _LoadRandomSequence(_int(count), _int(min_), _int(max_))
+
+
+def unload_random_sequence(sequence):
+    # type: (IntPtr) -> None
+    """Unload random values sequence"""
+    _UnloadRandomSequence(sequence)
+
+
+def take_screenshot(file_name):
+    # type: (bytes | str | None) -> None
+    """Takes a screenshot of current screen (filename extension defines format)"""
+    _TakeScreenshot(_str_in(file_name))
+
+
+def set_config_flags(flags):
+    # type: (int) -> None
+    """Setup init configuration flags (view FLAGS)"""
+    _SetConfigFlags(_int(flags))
+
+
+def open_url(url):
+    # type: (bytes | str | None) -> None
+    """Open URL with default system browser (if available)"""
+    _OpenURL(_str_in(url))
+
+
+def trace_log(log_level, text, *args):
+    # type: (int, bytes | str | None, ...) -> None
+    """Show trace log messages (LOG_DEBUG, LOG_INFO, LOG_WARNING, LOG_ERROR...)"""
+    _TraceLog(_int(log_level), _str_in(text), *args)
+
+
+def set_trace_log_level(log_level):
+    # type: (int) -> None
+    """Set the current threshold (minimum) log level"""
+    _SetTraceLogLevel(_int(log_level))
+
+
+def mem_alloc(size):
+    # type: (int) -> bytes | str | None
+    """Internal memory allocator"""
+    return _MemAlloc(_int(size))
+
+
+def mem_realloc(ptr, size):
+    # type: (bytes | str | None, int) -> bytes | str | None
+    """Internal memory reallocator"""
+    return _MemRealloc(ptr, _int(size))
+
+
+def mem_free(ptr):
+    # type: (bytes | str | None) -> None
+    """Internal memory free"""
+    _MemFree(ptr)
+
+
+def set_trace_log_callback(callback):
+    # type: (TraceLogCallback) -> None
+    """Set custom trace log"""
+    _SetTraceLogCallback(callback)
+
+
+def set_load_file_data_callback(callback):
+    # type: (LoadFileDataCallback) -> None
+    """Set custom file binary data loader (None for raylib's), used by mounted asset packs for the other files"""
+    _set_load_file_data_callback(callback)
+
+
+def set_save_file_data_callback(callback):
+    # type: (SaveFileDataCallback) -> None
+    """Set custom file binary data saver"""
+    _SetSaveFileDataCallback(callback)
+
+
+def set_load_file_text_callback(callback):
+    # type: (LoadFileTextCallback) -> None
+    """Set custom file text data loader"""
+    _SetLoadFileTextCallback(callback)
+
+
+def set_save_file_text_callback(callback):
+    # type: (SaveFileTextCallback) -> None
+    """Set custom file text data saver"""
+    _SetSaveFileTextCallback(callback)
+
+
+def load_file_data(file_name, data_size):
+    # type: (bytes | str | None, IntPtr) -> int
+    """Load file data as byte array (read)"""
+    return _LoadFileData(_str_in(file_name), data_size)
+
+
+def unload_file_data(data):
+    # type: (int) -> None
+    """Unload file data allocated by LoadFileData()"""
+    _UnloadFileData(_ubyte_buffer_in(data))
+
+
+def save_file_data(file_name, data, data_size):
+    # type: (bytes | str | None, bytes | str | None, int) -> bool
+    """Save data to file from byte array (write), returns true on success"""
+    return _SaveFileData(_str_in(file_name), data, _int(data_size))
+
+
+def export_data_as_code(data, data_size, file_name):
+    # type: (int, int, bytes | str | None) -> bool
+    """Export data to code (.h), returns true on success"""
+    return _ExportDataAsCode(_ubyte_buffer_in(data), _int(data_size), _str_in(file_name))
+
+
+def load_file_text(file_name):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Load text data from file (read), returns a '\0' terminated string"""
+    return _str_out(_LoadFileText(_str_in(file_name)))
+
+
+def unload_file_text(text):
+    # type: (bytes | str | None) -> None
+    """Unload file text data allocated by LoadFileText()"""
+    _UnloadFileText(_str_in(text))
+
+
+def save_file_text(file_name, text):
+    # type: (bytes | str | None, bytes | str | None) -> bool
+    """Save text data to file (write), string must be '\0' terminated, returns true on success"""
+    return _SaveFileText(_str_in(file_name), _str_in(text))
+
+
+def file_exists(file_name):
+    # type: (bytes | str | None) -> bool
+    """Check if file exists"""
+    return _FileExists(_str_in(file_name))
+
+
+def directory_exists(dir_path):
+    # type: (bytes | str | None) -> bool
+    """Check if a directory path exists"""
+    return _DirectoryExists(_str_in(dir_path))
+
+
+def is_file_extension(file_name, ext):
+    # type: (bytes | str | None, bytes | str | None) -> bool
+    """Check file extension (including point: .png, .wav)"""
+    return _IsFileExtension(_str_in(file_name), _str_in(ext))
+
+
+def get_file_length(file_name):
+    # type: (bytes | str | None) -> int
+    """Get file length in bytes (NOTE: GetFileSize() conflicts with windows.h)"""
+    return _GetFileLength(_str_in(file_name))
+
+
+def get_file_extension(file_name):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get pointer to extension for a filename string (includes dot: '.png')"""
+    return _str_out(_GetFileExtension(_str_in(file_name)))
+
+
+def get_file_name(file_path):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get pointer to filename for a path string"""
+    return _str_out(_GetFileName(_str_in(file_path)))
+
+
+def get_file_name_without_ext(file_path):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get filename string without extension (uses static string)"""
+    return _str_out(_GetFileNameWithoutExt(_str_in(file_path)))
+
+
+def get_directory_path(file_path):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get full path for a given fileName with path (uses static string)"""
+    return _str_out(_GetDirectoryPath(_str_in(file_path)))
+
+
+def get_prev_directory_path(dir_path):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get previous directory path for a given path (uses static string)"""
+    return _str_out(_GetPrevDirectoryPath(_str_in(dir_path)))
+
+
+def get_working_directory():
+    # type: () -> bytes | str | None
+    """Get current working directory (uses static string)"""
+    return _str_out(_GetWorkingDirectory())
+
+
+def get_application_directory():
+    # type: () -> bytes | str | None
+    """Get the directory of the running application (uses static string)"""
+    return _str_out(_GetApplicationDirectory())
+
+
+def change_directory(dir_):
+    # type: (bytes | str | None) -> bool
+    """Change working directory, return true on success"""
+    return _ChangeDirectory(_str_in(dir_))
+
+
+def is_path_file(path):
+    # type: (bytes | str | None) -> bool
+    """Check if a given path is a file or a directory"""
+    return _IsPathFile(_str_in(path))
+
+
+def load_directory_files(dir_path):
+    # type: (bytes | str | None) -> FilePathList
+    """Load directory filepaths"""
+    return _LoadDirectoryFiles(_str_in(dir_path))
+
+
+def load_directory_files_ex(base_path, filter_, scan_subdirs):
+    # type: (bytes | str | None, bytes | str | None, bool) -> FilePathList
+    """Load directory filepaths with extension filtering and recursive directory scan"""
+    return _LoadDirectoryFilesEx(_str_in(base_path), _str_in(filter_), _bool(scan_subdirs))
+
+
+def unload_directory_files(files):
+    # type: (FilePathList) -> None
+    """Unload filepaths"""
+    _UnloadDirectoryFiles(files)
+
+
+def is_file_dropped():
+    # type: () -> bool
+    """Check if a file has been dropped into window"""
+    return _IsFileDropped()
+
+
+def load_dropped_files():
+    # type: () -> FilePathList
+    """Load dropped filepaths"""
+    return _LoadDroppedFiles()
+
+
+def unload_dropped_files(files):
+    # type: (FilePathList) -> None
+    """Unload dropped filepaths"""
+    _UnloadDroppedFiles(files)
+
+
+def get_file_mod_time(file_name):
+    # type: (bytes | str | None) -> int
+    """Get file modification time (last write time)"""
+    return _GetFileModTime(_str_in(file_name))
+
+
+def compress_data(data, data_size, comp_data_size):
+    # type: (int, int, IntPtr) -> int
+    """Compress data (DEFLATE algorithm), memory must be MemFree()"""
+    return _CompressData(_ubyte_buffer_in(data), _int(data_size), comp_data_size)
+
+
+def decompress_data(comp_data, comp_data_size, data_size):
+    # type: (int, int, IntPtr) -> int
+    """Decompress data (DEFLATE algorithm), memory must be MemFree()"""
+    return _DecompressData(_ubyte_buffer_in(comp_data), _int(comp_data_size), data_size)
+
+
+def encode_data_base64(data, data_size, output_size):
+    # type: (int, int, IntPtr) -> bytes | str | None
+    """Encode data to Base64 string, memory must be MemFree()"""
+    return _EncodeDataBase64(_ubyte_buffer_in(data), _int(data_size), output_size)
+
+
+def decode_data_base64(data, output_size):
+    # type: (int, IntPtr) -> int
+    """Decode Base64 string data, memory must be MemFree()"""
+    return _DecodeDataBase64(_ubyte_buffer_in(data), output_size)
+
+
+def load_automation_event_list(file_name):
+    # type: (bytes | str | None) -> AutomationEventList
+    """Load automation events list from file, NULL for empty list, capacity = MAX_AUTOMATION_EVENTS"""
+    return _LoadAutomationEventList(_str_in(file_name))
+
+
+def unload_automation_event_list(list_):
+    # type: (AutomationEventListPtr) -> None
+    """Unload automation events list from file"""
+    _UnloadAutomationEventList(list_)
+
+
+def export_automation_event_list(list_, file_name):
+    # type: (AutomationEventList, bytes | str | None) -> bool
+    """Export automation events list as text file"""
+    return _ExportAutomationEventList(list_, _str_in(file_name))
+
+
+def set_automation_event_list(list_):
+    # type: (AutomationEventListPtr) -> None
+    """Set automation event list to record to"""
+    _SetAutomationEventList(list_)
+
+
+def set_automation_event_base_frame(frame):
+    # type: (int) -> None
+    """Set automation event internal base frame to start recording"""
+    _SetAutomationEventBaseFrame(_int(frame))
+
+
+def start_automation_event_recording():
+    # type: () -> None
+    """Start recording automation events (AutomationEventList must be set)"""
+    _StartAutomationEventRecording()
+
+
+def stop_automation_event_recording():
+    # type: () -> None
+    """Stop recording automation events"""
+    _StopAutomationEventRecording()
+
+
+def play_automation_event(event):
+    # type: (AutomationEvent) -> None
+    """Play a recorded automation event"""
+    _PlayAutomationEvent(event)
+
+
+def is_key_pressed(key):
+    # type: (int) -> bool
+    """Check if a key has been pressed once"""
+    return _IsKeyPressed(_int(key))
+
+
+def is_key_pressed_repeat(key):
+    # type: (int) -> bool
+    """Check if a key has been pressed again (Only PLATFORM_DESKTOP)"""
+    return _IsKeyPressedRepeat(_int(key))
+
+
+def is_key_down(key):
+    # type: (int) -> bool
+    """Check if a key is being pressed"""
+    return _IsKeyDown(_int(key))
+
+
+def is_key_released(key):
+    # type: (int) -> bool
+    """Check if a key has been released once"""
+    return _IsKeyReleased(_int(key))
+
+
+def is_key_up(key):
+    # type: (int) -> bool
+    """Check if a key is NOT being pressed"""
+    return _IsKeyUp(_int(key))
+
+
+def get_key_pressed():
+    # type: () -> int
+    """Get key pressed (keycode), call it multiple times for keys queued, returns 0 when the queue is empty"""
+    return _GetKeyPressed()
+
+
+def get_char_pressed():
+    # type: () -> int
+    """Get char pressed (unicode), call it multiple times for chars queued, returns 0 when the queue is empty"""
+    return _GetCharPressed()
+
+
+def set_exit_key(key):
+    # type: (int) -> None
+    """Set a custom key to exit program (default is ESC)"""
+    _SetExitKey(_int(key))
+
+
+def is_gamepad_available(gamepad):
+    # type: (int) -> bool
+    """Check if a gamepad is available"""
+    return _IsGamepadAvailable(_int(gamepad))
+
+
+def get_gamepad_name(gamepad):
+    # type: (int) -> bytes | str | None
+    """Get gamepad internal name id"""
+    return _str_out(_GetGamepadName(_int(gamepad)))
+
+
+def is_gamepad_button_pressed(gamepad, button):
+    # type: (int, int) -> bool
+    """Check if a gamepad button has been pressed once"""
+    return _IsGamepadButtonPressed(_int(gamepad), _int(button))
+
+
+def is_gamepad_button_down(gamepad, button):
+    # type: (int, int) -> bool
+    """Check if a gamepad button is being pressed"""
+    return _IsGamepadButtonDown(_int(gamepad), _int(button))
+
+
+def is_gamepad_button_released(gamepad, button):
+    # type: (int, int) -> bool
+    """Check if a gamepad button has been released once"""
+    return _IsGamepadButtonReleased(_int(gamepad), _int(button))
+
+
+def is_gamepad_button_up(gamepad, button):
+    # type: (int, int) -> bool
+    """Check if a gamepad button is NOT being pressed"""
+    return _IsGamepadButtonUp(_int(gamepad), _int(button))
+
+
+def get_gamepad_button_pressed():
+    # type: () -> int
+    """Get the last gamepad button pressed"""
+    return _GetGamepadButtonPressed()
+
+
+def get_gamepad_axis_count(gamepad):
+    # type: (int) -> int
+    """Get gamepad axis count for a gamepad"""
+    return _GetGamepadAxisCount(_int(gamepad))
+
+
+def get_gamepad_axis_movement(gamepad, axis):
+    # type: (int, int) -> float
+    """Get axis movement value for a gamepad axis"""
+    return _GetGamepadAxisMovement(_int(gamepad), _int(axis))
+
+
+def set_gamepad_mappings(mappings):
+    # type: (bytes | str | None) -> int
+    """Set internal gamepad mappings (SDL_GameControllerDB)"""
+    return _SetGamepadMappings(_str_in(mappings))
+
+
+def is_mouse_button_pressed(button):
+    # type: (int) -> bool
+    """Check if a mouse button has been pressed once"""
+    return _IsMouseButtonPressed(_int(button))
+
+
+def is_mouse_button_down(button):
+    # type: (int) -> bool
+    """Check if a mouse button is being pressed"""
+    return _IsMouseButtonDown(_int(button))
+
+
+def is_mouse_button_released(button):
+    # type: (int) -> bool
+    """Check if a mouse button has been released once"""
+    return _IsMouseButtonReleased(_int(button))
+
+
+def is_mouse_button_up(button):
+    # type: (int) -> bool
+    """Check if a mouse button is NOT being pressed"""
+    return _IsMouseButtonUp(_int(button))
+
+
+def get_mouse_x():
+    # type: () -> int
+    """Get mouse position X"""
+    return _GetMouseX()
+
+
+def get_mouse_y():
+    # type: () -> int
+    """Get mouse position Y"""
+    return _GetMouseY()
+
+
+def get_mouse_position():
+    # type: () -> Vector2
+    """Get mouse position XY"""
+    return _GetMousePosition()
+
+
+def get_mouse_delta():
+    # type: () -> Vector2
+    """Get mouse delta between frames"""
+    return _GetMouseDelta()
+
+
+def set_mouse_position(x, y):
+    # type: (int, int) -> None
+    """Set mouse position XY"""
+    _SetMousePosition(_int(x), _int(y))
+
+
+def set_mouse_offset(offset_x, offset_y):
+    # type: (int, int) -> None
+    """Set mouse offset"""
+    _SetMouseOffset(_int(offset_x), _int(offset_y))
+
+
+def set_mouse_scale(scale_x, scale_y):
+    # type: (float, float) -> None
+    """Set mouse scaling"""
+    _SetMouseScale(_float(scale_x), _float(scale_y))
+
+
+def get_mouse_wheel_move():
+    # type: () -> float
+    """Get mouse wheel movement for X or Y, whichever is larger"""
+    return _GetMouseWheelMove()
+
+
+def get_mouse_wheel_move_v():
+    # type: () -> Vector2
+    """Get mouse wheel movement for both X and Y"""
+    return _GetMouseWheelMoveV()
+
+
+def set_mouse_cursor(cursor):
+    # type: (int) -> None
+    """Set mouse cursor"""
+    _SetMouseCursor(_int(cursor))
+
+
+def get_touch_x():
+    # type: () -> int
+    """Get touch position X for touch point 0 (relative to screen size)"""
+    return _GetTouchX()
+
+
+def get_touch_y():
+    # type: () -> int
+    """Get touch position Y for touch point 0 (relative to screen size)"""
+    return _GetTouchY()
+
+
+def get_touch_position(index):
+    # type: (int) -> Vector2
+    """Get touch position XY for a touch point index (relative to screen size)"""
+    return _GetTouchPosition(_int(index))
+
+
+def get_touch_point_id(index):
+    # type: (int) -> int
+    """Get touch point identifier for given index"""
+    return _GetTouchPointId(_int(index))
+
+
+def get_touch_point_count():
+    # type: () -> int
+    """Get number of touch points"""
+    return _GetTouchPointCount()
+
+
+def set_gestures_enabled(flags):
+    # type: (int) -> None
+    """Enable a set of gestures using flags"""
+    _SetGesturesEnabled(_int(flags))
+
+
+def is_gesture_detected(gesture):
+    # type: (int) -> bool
+    """Check if a gesture have been detected"""
+    return _IsGestureDetected(_int(gesture))
+
+
+def get_gesture_detected():
+    # type: () -> int
+    """Get latest detected gesture"""
+    return _GetGestureDetected()
+
+
+def get_gesture_hold_duration():
+    # type: () -> float
+    """Get gesture hold time in milliseconds"""
+    return _GetGestureHoldDuration()
+
+
+def get_gesture_drag_vector():
+    # type: () -> Vector2
+    """Get gesture drag vector"""
+    return _GetGestureDragVector()
+
+
+def get_gesture_drag_angle():
+    # type: () -> float
+    """Get gesture drag angle"""
+    return _GetGestureDragAngle()
+
+
+def get_gesture_pinch_vector():
+    # type: () -> Vector2
+    """Get gesture pinch delta"""
+    return _GetGesturePinchVector()
+
+
+def get_gesture_pinch_angle():
+    # type: () -> float
+    """Get gesture pinch angle"""
+    return _GetGesturePinchAngle()
+
+
+def update_camera(camera, mode):
+    # type: (CameraPtr, int) -> None
+    """Update camera position for selected mode"""
+    _UpdateCamera(camera, _int(mode))
+
+
+def update_camera_pro(camera, movement, rotation, zoom):
+    # type: (CameraPtr, Vector3, Vector3, float) -> None
+    """Update camera movement/rotation"""
+    _UpdateCameraPro(camera, _vec3(movement), _vec3(rotation), _float(zoom))
@@ -0,0 +1,206 @@
+# imagecache.py
+
+#   A cache of decoded images on disk: the first load of an image decodes its
+#   file (PNG, QOI, JPG...), optionally converts it to a pixel format and
+#   generates its mipmaps, and stores the pixels raw; the next loads read them
+#   straight into the memory of the Image, without decoding anything.
+#
+#   A cached image is keyed by a hash of the source path, the pixel format and
+#   whether it has mipmaps, and invalidated when the modification time of the
+#   source (get_file_mod_time) or its size change.
+#
+#   Format of a cached image (little endian):
+#
+#       header      8s magic 'RLPYIMG\0', u32 version, i32 width, i32 height, i32 mipmaps, i32 format,
+#                   i64 source modification time, i64 source size
+#       pixels      the data of the Image, mipmap levels included
+#
+#   so an image without mipmaps can also be read by
+#   Image.load_raw(path, width, height, format, header size).
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   images = ImageCache('.cache/images')
+#   hero = images.load_texture('hero.png', mipmaps=True)    # decoded the first time, read raw after
+#   atlas = images.load_image('atlas.qoi', PIXELFORMAT_UNCOMPRESSED_R5G6B5)
+#   print(images.hits, images.misses, images.invalidations)
+#
+#   loader.then_upload(loader.submit(images.load_image, 'map.png'), ...)    # on an AssetLoader pool
+
+import ctypes
+import hashlib
+import os
+import struct
+import threading
+from time import perf_counter
+
+from . import (
+    Image,
+    _GetFileModTime,
+    _GetPixelDataSize,
+    _ImageFormat,
+    _ImageMipmaps,
+    _LoadImage,
+    _LoadTextureFromImage,
+    _MemAlloc,
+    _MemFree,
+    _SUBMODULE_EXPORTS,
+    _UnloadImage,
+    _str_in,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['imagecache'])
+
+_symbol_namespaces.append(globals())
+
+_MAGIC = b'RLPYIMG\0'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIiiiiqq')
+_EXTENSION = '.rlimg'
+
+
+def _data_size(width, height, mipmaps, format_):
+    """Bytes of the data of an image and its mipmap levels, as raylib lays them out"""
+    size = 0
+    for _ in range(max(mipmaps, 1)):
+        size += _GetPixelDataSize(width, height, format_)
+        width, height = max(width // 2, 1), max(height // 2, 1)
+    return size
+
+
+class ImageCache(object):
+    """Stores decoded images as raw pixels in `directory`, loaded back without decoding"""
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.reset_stats()
+
+    def reset_stats(self):
+        # type: () -> None
+        self.hits = 0                   # images read from the cache
+        self.misses = 0                 # images decoded from their source
+        self.invalidations = 0          # cached images whose source had changed
+        self.load_time = 0.0            # seconds spent in load_image()
+
+    @property
+    def hit_rate(self):
+        # type: () -> float
+        """Fraction of the loads served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / float(total) if total else 0.0
+
+    def path(self, file_name, format_=None, mipmaps=False):
+        # type: (str, int | None, bool) -> str
+        """Returns the path of the cached image of `file_name` in `format_` (None: as decoded), with `mipmaps`"""
+        source = os.path.normcase(os.path.abspath(file_name))
+        digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, '{}-{}{}{}'.format(
+            digest, 'src' if format_ is None else int(format_), '-mip' if mipmaps else '', _EXTENSION))
+
+    def load_image(self, file_name, format_=None, mipmaps=False):
+        # type: (str, int | None, bool) -> Image
+        """Loads the image of `file_name` converted to `format_` (None: as decoded) and with `mipmaps`
+
+        Read from the cache when it is up to date, otherwise decoded, converted
+        and stored. Images that can not be read or decoded (no data) are not stored.
+        """
+        start = perf_counter()
+        try:
+            path = self.path(file_name, format_, mipmaps)
+            try:
+                source_size = os.path.getsize(file_name)
+            except OSError:
+                source_size = None      # missing: raylib logs a warning and returns an empty image
+            if source_size is not None:
+                mod_time = _GetFileModTime(_str_in(file_name))
+                image = self._read(path, mod_time, source_size)
+                if image is not None:
+                    self.hits += 1
+                    return image
+
+            self.misses += 1
+            image = _LoadImage(_str_in(file_name))
+            if source_size is None or not image.data:
+                return image
+            if format_ is not None and image.format != format_:
+                _ImageFormat(image, int(format_))
+            if mipmaps and image.mipmaps == 1:
+                _ImageMipmaps(image)
+            self._write(path, image, mod_time, source_size)    # an optimisation: the image is returned anyway
+            return image
+        finally:
+            self.load_time += perf_counter() - start
+
+    def load_texture(self, file_name, format_=None, mipmaps=False):
+        # type: (str, int | None, bool) -> Texture
+        """Loads the image of `file_name` with load_image() and creates its texture, on the OpenGL thread"""
+        image = self.load_image(file_name, format_, mipmaps)
+        texture = _LoadTextureFromImage(image)
+        _UnloadImage(image)
+        return texture
+
+    def invalidate(self, file_name):
+        # type: (str) -> int
+        """Removes the cached images of `file_name`, in any format, returns how many"""
+        prefix = os.path.basename(self.path(file_name)).split('-')[0] + '-'
+        return self._remove(name for name in os.listdir(self.directory) if name.startswith(prefix))
+
+    def clear(self):
+        # type: () -> int
+        """Removes all the cached images, returns how many"""
+        return self._remove(name for name in os.listdir(self.directory) if name.endswith(_EXTENSION))
+
+    def _read(self, path, mod_time, source_size):
+        """Reads the cached image at `path` if it is up to date, else removes it and returns None"""
+        try:
+            file = open(path, 'rb')
+        except OSError:
+            return None
+        with file:
+            header = file.read(_HEADER.size)
+            if len(header) == _HEADER.size:
+                magic, version, width, height, mipmaps, format_, cached_mod_time, cached_size = _HEADER.unpack(header)
+                if magic == _MAGIC and version == _VERSION and (cached_mod_time, cached_size) == (mod_time, source_size):
+                    size = _data_size(width, height, mipmaps, format_)
+                    data = _MemAlloc(size)
+                    if not data:
+                        raise MemoryError("could not allocate {} bytes for the image".format(size))
+                    # one copy, from the file to the memory of the image
+                    if file.readinto((ctypes.c_ubyte * size).from_address(data)) == size:
+                        return Image(data, width, height, mipmaps, format_)
+                    _MemFree(data)
+        self.invalidations += 1
+        self._remove([os.path.basename(path)])
+        return None
+
+    def _write(self, path, image, mod_time, source_size):
+        """Stores `image` at `path`, returns False if it could not (read-only or full cache directory...)"""
+        size = _data_size(image.width, image.height, image.mipmaps, image.format)
+        temporary = '{}.{}-{}.tmp'.format(path, os.getpid(), threading.get_ident())
+        try:
+            with open(temporary, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, _VERSION, image.width, image.height, image.mipmaps, image.format,
+                                        mod_time, source_size))
+                file.write((ctypes.c_ubyte * size).from_address(image.data))
+            # atomic: concurrent loads see the previous file or the complete new one
+            os.replace(temporary, path)
+        except OSError:
+            self._remove([os.path.basename(temporary)])
+            return False
+        return True
+
+    def _remove(self, names):
+        count = 0
+        for name in names:
+            try:
+                os.remove(os.path.join(self.directory, name))
+                count += 1
+            except OSError:
+                pass
+        return count
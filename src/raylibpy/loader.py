@@ -0,0 +1,241 @@
+# loader.py
+
+#   Asynchronous asset loading: files are read and decoded (images, waves, font
+#   glyphs and atlases, raw bytes) on a pool of threads, the ctypes calls
+#   releasing the GIL while raylib decodes, and only the steps needing the
+#   OpenGL context (texture creation, mesh upload, model loading) are queued for
+#   the thread owning it, which runs them within a time budget per frame.
+#
+#   Every load returns a concurrent.futures.Future; asyncio code can await it
+#   through asyncio.wrap_future().
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   loader = AssetLoader(workers=4, upload_budget=0.004)
+#   hero = loader.load_texture('hero.png')          # Future[Texture]
+#   step = loader.load_wave('step.wav')             # Future[Wave]
+#   while not window_should_close():
+#       loader.process_uploads()                    # on the window thread, at most ~4 ms
+#       if hero.done():
+#           draw_texture(hero.result(), 0, 0, WHITE)
+#       ...
+#   loader.shutdown()
+#
+#   font = await asyncio.wrap_future(loader.load_font('ui.ttf', 24))
+
+import collections
+import ctypes
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+
+from . import (
+    FONT_DEFAULT,
+    Font,
+    RectanglePtr,
+    Texture2D,
+    _GenImageFontAtlas,
+    _LoadFontData,
+    _LoadFontEx,
+    _LoadImage,
+    _LoadModel,
+    _LoadTextureFromImage,
+    _LoadWave,
+    _SUBMODULE_EXPORTS,
+    _UnloadImage,
+    _UploadMesh,
+    _str_in,
+    _symbol_namespaces,
+    int_array,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['loader'])
+
+_symbol_namespaces.append(globals())
+
+_GLYPH_PADDING = 4          # FONT_TTF_DEFAULT_CHARS_PADDING, as LoadFontEx
+_DEFAULT_GLYPHS = 95        # glyphs loaded by LoadFontData without codepoints: ' ' to '~'
+
+
+def _read_file(file_name):
+    with open(file_name, 'rb') as file:
+        return file.read()
+
+
+def _codepoints(codepoints):
+    """Returns an int array of `codepoints` (ints or a str) and its length, (None, 0) for the default ones"""
+    if not codepoints:
+        return None, 0
+    return int_array(codepoints), len(codepoints)
+
+
+def _decode_font(file_name, font_size, codepoints):
+    """Loads the glyphs and atlas image of a TTF/OTF font, returns (Font without texture, atlas) or None"""
+    data = _read_file(file_name)
+    buffer = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+    points, count = _codepoints(codepoints)
+    glyphs = _LoadFontData(buffer, len(data), font_size, points, count, FONT_DEFAULT)
+    if not glyphs:
+        return None
+    glyph_count = count or _DEFAULT_GLYPHS
+    recs = RectanglePtr()
+    atlas = _GenImageFontAtlas(glyphs, ctypes.byref(recs), glyph_count, font_size, _GLYPH_PADDING, 0)
+    return Font(font_size, glyph_count, _GLYPH_PADDING, Texture2D(), recs, glyphs), atlas
+
+
+class AssetLoader(object):
+    """Loads assets on a thread pool and runs their GPU uploads from process_uploads()
+
+    process_uploads() must be called by the thread owning the OpenGL context,
+    usually once per frame; it runs the queued uploads in order until
+    `upload_budget` seconds have been spent (at least one per call).
+    """
+
+    def __init__(self, workers=4, upload_budget=0.004):
+        # type: (int, float) -> None
+        self.upload_budget = float(upload_budget)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='raylibpy-loader')
+        self._uploads = collections.deque()     # (future, function, args), appended from any thread
+        self.reset_stats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def reset_stats(self):
+        # type: () -> None
+        self.jobs = 0                   # jobs submitted to the pool
+        self.uploads = 0                # uploads run by process_uploads()
+        self.upload_time = 0.0          # seconds spent by the last process_uploads()
+        self.max_upload_time = 0.0
+
+    @property
+    def pending_uploads(self):
+        # type: () -> int
+        """Number of uploads waiting for process_uploads()"""
+        return len(self._uploads)
+
+    def submit(self, function, *args):
+        # type: (Callable, ...) -> Future
+        """Runs function(*args) on the pool, it must not use the OpenGL context"""
+        self.jobs += 1
+        return self._executor.submit(function, *args)
+
+    def upload(self, function, *args):
+        # type: (Callable, ...) -> Future
+        """Queues function(*args) to be run by process_uploads() on the OpenGL thread"""
+        future = Future()
+        self._uploads.append((future, function, args))
+        return future
+
+    def then_upload(self, future, function):
+        # type: (Future, Callable) -> Future
+        """Queues function(result of `future`) for process_uploads() once `future` is done"""
+        result = Future()
+
+        def done(source):
+            if source.cancelled():
+                result.cancel()
+                result.set_running_or_notify_cancel()
+            elif source.exception() is not None:
+                result.set_exception(source.exception())
+            else:
+                self._uploads.append((result, function, (source.result(),)))
+
+        future.add_done_callback(done)
+        return result
+
+    def load_file_data(self, file_name):
+        # type: (str) -> Future[bytes]
+        """Reads a file on the pool"""
+        return self.submit(_read_file, file_name)
+
+    def load_image(self, file_name):
+        # type: (bytes | str | None) -> Future[Image]
+        """Loads an image on the pool"""
+        return self.submit(_LoadImage, _str_in(file_name))
+
+    def load_wave(self, file_name):
+        # type: (bytes | str | None) -> Future[Wave]
+        """Loads a wave on the pool"""
+        return self.submit(_LoadWave, _str_in(file_name))
+
+    def load_texture(self, file_name):
+        # type: (bytes | str | None) -> Future[Texture]
+        """Decodes an image on the pool, then creates its texture (and unloads it) on the OpenGL thread"""
+        return self.then_upload(self.load_image(file_name), self._texture_from_image)
+
+    def load_font(self, file_name, font_size=32, codepoints=None):
+        # type: (str, int, list[int] | str | None) -> Future[Font]
+        """Loads a TTF/OTF font: glyphs and atlas on the pool, atlas texture on the OpenGL thread
+
+        Like load_font_ex(), the default glyphs are ' ' to '~'. Files that can not
+        be decoded are loaded with load_font_ex() on the OpenGL thread instead.
+        """
+        decoded = self.submit(_decode_font, file_name, int(font_size), codepoints)
+        return self.then_upload(decoded, lambda result: self._font_from_atlas(result, file_name, font_size, codepoints))
+
+    def load_model(self, file_name):
+        # type: (bytes | str | None) -> Future[Model]
+        """Loads a model on the OpenGL thread: raylib uploads its meshes and textures while parsing it"""
+        return self.upload(_LoadModel, _str_in(file_name))
+
+    def upload_mesh(self, mesh, dynamic=False):
+        # type: (Mesh, bool) -> Future[Mesh]
+        """Uploads a mesh generated or loaded on any thread, on the OpenGL thread"""
+        def upload():
+            _UploadMesh(ctypes.byref(mesh), bool(dynamic))
+            return mesh
+        return self.upload(upload)
+
+    def process_uploads(self, budget=None):
+        # type: (float | None) -> int
+        """Runs queued uploads until `budget` (upload_budget by default) seconds are spent, returns how many ran"""
+        budget = self.upload_budget if budget is None else budget
+        start = perf_counter()
+        count = 0
+        while self._uploads and not (count and perf_counter() - start >= budget):
+            future, function, args = self._uploads.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args))
+            except Exception as error:
+                future.set_exception(error)
+            count += 1
+        self.uploads += count
+        self.upload_time = perf_counter() - start
+        if self.upload_time > self.max_upload_time:
+            self.max_upload_time = self.upload_time
+        return count
+
+    def shutdown(self, wait=True):
+        # type: (bool) -> None
+        """Stops the pool (waiting for its jobs with `wait`) and cancels the queued uploads"""
+        self._executor.shutdown(wait=wait)
+        while self._uploads:
+            self._uploads.popleft()[0].cancel()
+
+    # region UPLOADS
+
+    @staticmethod
+    def _texture_from_image(image):
+        texture = _LoadTextureFromImage(image)
+        _UnloadImage(image)
+        return texture
+
+    @staticmethod
+    def _font_from_atlas(decoded, file_name, font_size, codepoints):
+        if decoded is None:
+            points, count = _codepoints(codepoints)
+            return _LoadFontEx(_str_in(file_name), int(font_size), points, count)
+        font, atlas = decoded
+        font.texture = _LoadTextureFromImage(atlas)
+        _UnloadImage(atlas)
+        return font
+
+    # endregion (uploads)
@@ -0,0 +1,300 @@
+# mixer.py
+
+#   A sound effects mixer playing any number of triggers on a fixed pool of
+#   voices: sound aliases (load_sound_alias) sharing the sample data of the
+#   sounds played, created on demand and reused.
+#
+#   play() only queues a trigger; update(), called once per frame, retires the
+#   voices that finished, starts the queued triggers by priority and applies the
+#   volume changes, so a burst of hundreds of triggers in a frame costs at most
+#   one voice start per voice of the pool. When the pool is full, a trigger
+#   steals the oldest of the voices with the lowest priority, if it does not
+#   have a lower priority itself, or is dropped.
+#
+#   Every voice plays on a bus (a name: 'sfx', 'ui'...) whose volume scales the
+#   volume of all of its voices.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   mixer = SoundMixer(voices=32)                   # after init_audio_device()
+#   mixer.set_bus_volume('ui', 0.5)
+#   while not window_should_close():
+#       for bullet in hits:
+#           mixer.play(impact, priority=1, pitch=random.uniform(0.9, 1.1))
+#       mixer.play(click, bus='ui', priority=5)
+#       mixer.update()
+#       ...
+#   print(mixer.active_voices, mixer.stolen, mixer.dropped, mixer.update_time)
+#   mixer.unload()                                  # before unloading the sounds
+
+import ctypes
+from time import perf_counter
+
+from . import (
+    _IsSoundPlaying,
+    _LoadSoundAlias,
+    _PlaySound,
+    _SUBMODULE_EXPORTS,
+    _SetSoundPan,
+    _SetSoundPitch,
+    _SetSoundVolume,
+    _StopSound,
+    _UnloadSoundAlias,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['mixer'])
+
+_symbol_namespaces.append(globals())
+
+
+def _sound_key(sound):
+    """Identifies the sample data of `sound`, shared by its aliases"""
+    return ctypes.cast(sound.stream.buffer, ctypes.c_void_p).value
+
+
+class _Voice(object):
+    """A voice of the pool: an alias of the sound it plays, and the trigger it plays"""
+
+    __slots__ = ('alias', 'key', 'settings', 'id', 'bus', 'priority', 'volume', 'order')
+
+    def __init__(self, alias, key):
+        self.alias = alias
+        self.key = key
+        self.settings = [1.0, 1.0, 0.5]    # volume, pitch and pan last set on the alias
+        self.id = None
+
+
+class SoundMixer(object):
+    """Plays sounds on a fixed pool of voices with priorities and volume buses
+
+    Triggers are queued by play() and started by update(), once per frame. Up
+    to `max_idle` aliases of the voices that finished are kept for reuse (as
+    many as there are voices by default).
+    """
+
+    def __init__(self, voices=32, max_idle=None):
+        # type: (int, int | None) -> None
+        self.voices = int(voices)
+        if self.voices < 1:
+            raise ValueError("a mixer needs at least one voice")
+        self.max_idle = self.voices if max_idle is None else int(max_idle)
+        self.master_volume = 1.0
+
+        self._buses = {}        # name -> volume
+        self._dirty = False     # a volume changed: reapply the volumes of the active voices
+        self._pending = []      # (priority, id, sound, key, bus, volume, pitch, pan) queued by play()
+        self._active = []       # _Voice
+        self._idle = {}         # sound key -> idle _Voice of that sound
+        self._idle_count = 0
+        self._next_id = 1
+        self._order = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        # type: () -> None
+        self.triggers = 0               # calls of play()
+        self.started = 0
+        self.stolen = 0                 # voices stopped to start a trigger with a higher priority
+        self.dropped = 0                # triggers not started: pool full of higher priorities, or stopped before update()
+        self.peak_voices = 0
+        self.update_time = 0.0          # seconds spent in the last update()
+        self.max_update_time = 0.0
+
+    @property
+    def active_voices(self):
+        # type: () -> int
+        """Number of voices playing as of the last update()"""
+        return len(self._active)
+
+    @property
+    def pending(self):
+        # type: () -> int
+        """Number of triggers waiting for the next update()"""
+        return len(self._pending)
+
+    def get_bus_volume(self, bus):
+        # type: (str) -> float
+        return self._buses.get(bus, 1.0)
+
+    def set_bus_volume(self, bus, volume):
+        # type: (str, float) -> None
+        """Sets the volume of all the voices of `bus` (1.0 by default), applied by the next update()"""
+        self._buses[bus] = float(volume)
+        self._dirty = True
+
+    def set_master_volume(self, volume):
+        # type: (float) -> None
+        """Sets the volume of all the voices of the mixer, applied by the next update()"""
+        self.master_volume = float(volume)
+        self._dirty = True
+
+    def play(self, sound, bus='sfx', priority=0, volume=1.0, pitch=1.0, pan=0.5):
+        # type: (Sound, str, int, float, float, float) -> int
+        """Queues `sound` to be played by the next update(), returns the id of its voice"""
+        voice_id = self._next_id
+        self._next_id += 1
+        self.triggers += 1
+        self._pending.append((priority, voice_id, sound, _sound_key(sound), bus, float(volume), float(pitch), float(pan)))
+        return voice_id
+
+    def is_playing(self, voice_id):
+        # type: (int) -> bool
+        """Checks if the voice `voice_id` is queued or was playing as of the last update()"""
+        return any(trigger[1] == voice_id for trigger in self._pending) or \
+            any(voice.id == voice_id for voice in self._active)
+
+    def stop(self, voice_id):
+        # type: (int) -> None
+        """Stops the voice `voice_id`, or cancels it if it is still queued"""
+        for index, trigger in enumerate(self._pending):
+            if trigger[1] == voice_id:
+                del self._pending[index]
+                self.dropped += 1
+                return
+        for index, voice in enumerate(self._active):
+            if voice.id == voice_id:
+                _StopSound(voice.alias)
+                self._release(self._active.pop(index))
+                return
+
+    def stop_all(self, bus=None):
+        # type: (str | None) -> None
+        """Stops all the voices, or those of `bus`, queued ones included"""
+        pending = [trigger for trigger in self._pending if bus is not None and trigger[4] != bus]
+        self.dropped += len(self._pending) - len(pending)
+        self._pending = pending
+        active = []
+        for voice in self._active:
+            if bus is None or voice.bus == bus:
+                _StopSound(voice.alias)
+                self._release(voice)
+            else:
+                active.append(voice)
+        self._active = active
+
+    def update(self):
+        # type: () -> None
+        """Retires the finished voices, starts the queued triggers and applies the volume changes"""
+        start = perf_counter()
+        active = []
+        for voice in self._active:
+            if _IsSoundPlaying(voice.alias):
+                active.append(voice)
+            else:
+                self._release(voice)
+        self._active = active
+
+        if self._dirty:
+            for voice in active:
+                self._apply(voice, voice.volume, voice.settings[1], voice.settings[2])
+            self._dirty = False
+
+        if self._pending:
+            pending, self._pending = self._pending, []
+            # highest priority first, then first come first served
+            pending.sort(key=lambda trigger: (-trigger[0], trigger[1]))
+            started = pending[:self.voices]
+            self.dropped += len(pending) - len(started)
+            for trigger in started:
+                if not self._start(trigger):
+                    self.dropped += 1
+
+        if len(self._active) > self.peak_voices:
+            self.peak_voices = len(self._active)
+        self.update_time = perf_counter() - start
+        if self.update_time > self.max_update_time:
+            self.max_update_time = self.update_time
+
+    def forget(self, sound):
+        # type: (Sound) -> None
+        """Stops the voices playing `sound` and unloads its aliases, to be called before unloading it"""
+        key = _sound_key(sound)
+        self._pending = [trigger for trigger in self._pending if trigger[3] != key]
+        active = []
+        for voice in self._active:
+            if voice.key == key:
+                _StopSound(voice.alias)
+                _UnloadSoundAlias(voice.alias)
+            else:
+                active.append(voice)
+        self._active = active
+        for voice in self._idle.pop(key, ()):
+            _UnloadSoundAlias(voice.alias)
+            self._idle_count -= 1
+
+    def unload(self):
+        # type: () -> None
+        """Stops all the voices and unloads all the aliases of the mixer"""
+        self._pending = []
+        for voice in self._active:
+            _StopSound(voice.alias)
+            _UnloadSoundAlias(voice.alias)
+        self._active = []
+        for voices in self._idle.values():
+            for voice in voices:
+                _UnloadSoundAlias(voice.alias)
+        self._idle.clear()
+        self._idle_count = 0
+
+    # region VOICES
+
+    def _start(self, trigger):
+        priority, voice_id, sound, key, bus, volume, pitch, pan = trigger
+        if len(self._active) >= self.voices:
+            # steal the oldest of the voices with the lowest priority
+            victim = min(self._active, key=lambda voice: (voice.priority, voice.order))
+            if victim.priority > priority:
+                return False
+            _StopSound(victim.alias)
+            self._active.remove(victim)
+            self._release(victim)
+            self.stolen += 1
+
+        voice = self._acquire(sound, key)
+        voice.id = voice_id
+        voice.bus = bus
+        voice.priority = priority
+        voice.volume = volume
+        voice.order = self._order
+        self._order += 1
+        self._apply(voice, volume, pitch, pan)
+        _PlaySound(voice.alias)
+        self._active.append(voice)
+        self.started += 1
+        return True
+
+    def _acquire(self, sound, key):
+        """Returns an idle voice for the sound `key`, creating its alias if needed"""
+        voices = self._idle.get(key)
+        if voices:
+            self._idle_count -= 1
+            return voices.pop()
+        return _Voice(_LoadSoundAlias(sound), key)
+
+    def _release(self, voice):
+        voice.id = None
+        if self._idle_count >= self.max_idle:
+            _UnloadSoundAlias(voice.alias)
+            return
+        self._idle.setdefault(voice.key, []).append(voice)
+        self._idle_count += 1
+
+    def _apply(self, voice, volume, pitch, pan):
+        """Sets the volume (scaled by the bus and master volumes), pitch and pan of the alias of `voice`"""
+        settings = voice.settings
+        volume *= self._buses.get(voice.bus, 1.0) * self.master_volume
+        if settings[0] != volume:
+            _SetSoundVolume(voice.alias, volume)
+            settings[0] = volume
+        if settings[1] != pitch:
+            _SetSoundPitch(voice.alias, pitch)
+            settings[1] = pitch
+        if settings[2] != pan:
+            _SetSoundPan(voice.alias, pan)
+            settings[2] = pan
+
+    # endregion (voices)
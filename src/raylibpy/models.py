@@ -0,0 +1,547 @@
+# models.py
+
+#   Functions of raylib's models module (rmodels): basic 3D shapes, model, mesh,
+#   material and animation management, mesh generation and 3D collisions.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from ctypes import POINTER, byref, cast
+
+from . import (
+    Int,
+    Material,
+    ModelAnimation,
+    _CheckCollisionBoxSphere,
+    _CheckCollisionBoxes,
+    _CheckCollisionSpheres,
+    _DrawBillboard,
+    _DrawBillboardPro,
+    _DrawBillboardRec,
+    _DrawBoundingBox,
+    _DrawCapsule,
+    _DrawCapsuleWires,
+    _DrawCircle3D,
+    _DrawCube,
+    _DrawCubeV,
+    _DrawCubeWires,
+    _DrawCubeWiresV,
+    _DrawCylinder,
+    _DrawCylinderEx,
+    _DrawCylinderWires,
+    _DrawCylinderWiresEx,
+    _DrawGrid,
+    _DrawLine3D,
+    _DrawMesh,
+    _DrawMeshInstanced,
+    _DrawModel,
+    _DrawModelEx,
+    _DrawModelWires,
+    _DrawModelWiresEx,
+    _DrawPlane,
+    _DrawPoint3D,
+    _DrawRay,
+    _DrawSphere,
+    _DrawSphereEx,
+    _DrawSphereWires,
+    _DrawTriangle3D,
+    _DrawTriangleStrip3D,
+    _ExportMesh,
+    _GenMeshCone,
+    _GenMeshCube,
+    _GenMeshCubicmap,
+    _GenMeshCylinder,
+    _GenMeshHeightmap,
+    _GenMeshHemiSphere,
+    _GenMeshKnot,
+    _GenMeshPlane,
+    _GenMeshPoly,
+    _GenMeshSphere,
+    _GenMeshTangents,
+    _GenMeshTorus,
+    _GetMeshBoundingBox,
+    _GetModelBoundingBox,
+    _GetRayCollisionBox,
+    _GetRayCollisionMesh,
+    _GetRayCollisionQuad,
+    _GetRayCollisionSphere,
+    _GetRayCollisionTriangle,
+    _IsMaterialReady,
+    _IsModelAnimationValid,
+    _IsModelReady,
+    _LoadMaterialDefault,
+    _LoadMaterials,
+    _LoadModel,
+    _LoadModelAnimations,
+    _LoadModelFromMesh,
+    _SUBMODULE_EXPORTS,
+    _SetMaterialTexture,
+    _SetModelMeshMaterial,
+    _UnloadMaterial,
+    _UnloadMesh,
+    _UnloadModel,
+    _UnloadModelAnimation,
+    _UnloadModelAnimations,
+    _UpdateMeshBuffer,
+    _UpdateModelAnimation,
+    _UploadMesh,
+    _bool,
+    _clear_in_out,
+    _color,
+    _float,
+    _int,
+    _push_in_out,
+    _rect,
+    _str_in,
+    _symbol_namespaces,
+    _vec2,
+    _vec3,
+    _vec3_array,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['models'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def draw_line3d(start_pos, end_pos, color):
+    # type: (Vector3, Vector3, Color) -> None
+    """Draw a line in 3D world space"""
+    _DrawLine3D(_vec3(start_pos), _vec3(end_pos), _color(color))
+
+
+def draw_point3d(position, color):
+    # type: (Vector3, Color) -> None
+    """Draw a point in 3D space, actually a small line"""
+    _DrawPoint3D(_vec3(position), _color(color))
+
+
+def draw_circle3d(center, radius, rotation_axis, rotation_angle, color):
+    # type: (Vector3, float, Vector3, float, Color) -> None
+    """Draw a circle in 3D world space"""
+    _DrawCircle3D(_vec3(center), _float(radius), _vec3(rotation_axis), _float(rotation_angle), _color(color))
+
+
+def draw_triangle3d(v1, v2, v3, color):
+    # type: (Vector3, Vector3, Vector3, Color) -> None
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    _DrawTriangle3D(_vec3(v1), _vec3(v2), _vec3(v3), _color(color))
+
+
+def draw_triangle_strip3d(points, point_count, color):
+    # type: (Vector3Ptr | Array[Vector3] | Vector3Array, int, Color) -> None
+    """Draw a triangle strip defined by points"""
+    _DrawTriangleStrip3D(_vec3_array(points), len(points) if point_count <= 0 else point_count, _color(color))
+
+
+def draw_cube(position, width, height, length, color):
+    # type: (Vector3, float, float, float, Color) -> None
+    """Draw cube"""
+    _DrawCube(_vec3(position), _float(width), _float(height), _float(length), _color(color))
+
+
+def draw_cube_v(position, size, color):
+    # type: (Vector3, Vector3, Color) -> None
+    """Draw cube (Vector version)"""
+    _DrawCubeV(_vec3(position), _vec3(size), _color(color))
+
+
+def draw_cube_wires(position, width, height, length, color):
+    # type: (Vector3, float, float, float, Color) -> None
+    """Draw cube wires"""
+    _DrawCubeWires(_vec3(position), _float(width), _float(height), _float(length), _color(color))
+
+
+def draw_cube_wires_v(position, size, color):
+    # type: (Vector3, Vector3, Color) -> None
+    """Draw cube wires (Vector version)"""
+    _DrawCubeWiresV(_vec3(position), _vec3(size), _color(color))
+
+
+def draw_sphere(center_pos, radius, color):
+    # type: (Vector3, float, Color) -> None
+    """Draw sphere"""
+    _DrawSphere(_vec3(center_pos), _float(radius), _color(color))
+
+
+def draw_sphere_ex(center_pos, radius, rings, slices, color):
+    # type: (Vector3, float, int, int, Color) -> None
+    """Draw sphere with extended parameters"""
+    _DrawSphereEx(_vec3(center_pos), _float(radius), _int(rings), _int(slices), _color(color))
+
+
+def draw_sphere_wires(center_pos, radius, rings, slices, color):
+    # type: (Vector3, float, int, int, Color) -> None
+    """Draw sphere wires"""
+    _DrawSphereWires(_vec3(center_pos), _float(radius), _int(rings), _int(slices), _color(color))
+
+
+def draw_cylinder(position, radius_top, radius_bottom, height, slices, color):
+    # type: (Vector3, float, float, float, int, Color) -> None
+    """Draw a cylinder/cone"""
+    _DrawCylinder(_vec3(position), _float(radius_top), _float(radius_bottom), _float(height), _int(slices), _color(color))
+
+
+def draw_cylinder_ex(start_pos, end_pos, start_radius, end_radius, sides, color):
+    # type: (Vector3, Vector3, float, float, int, Color) -> None
+    """Draw a cylinder with base at startPos and top at endPos"""
+    _DrawCylinderEx(_vec3(start_pos), _vec3(end_pos), _float(start_radius), _float(end_radius), _int(sides), _color(color))
+
+
+def draw_cylinder_wires(position, radius_top, radius_bottom, height, slices, color):
+    # type: (Vector3, float, float, float, int, Color) -> None
+    """Draw a cylinder/cone wires"""
+    _DrawCylinderWires(_vec3(position), _float(radius_top), _float(radius_bottom), _float(height), _int(slices), _color(color))
+
+
+def draw_cylinder_wires_ex(start_pos, end_pos, start_radius, end_radius, sides, color):
+    # type: (Vector3, Vector3, float, float, int, Color) -> None
+    """Draw a cylinder wires with base at startPos and top at endPos"""
+    _DrawCylinderWiresEx(_vec3(start_pos), _vec3(end_pos), _float(start_radius), _float(end_radius), _int(sides), _color(color))
+
+
+def draw_capsule(start_pos, end_pos, radius, slices, rings, color):
+    # type: (Vector3, Vector3, float, int, int, Color) -> None
+    """Draw a capsule with the center of its sphere caps at startPos and endPos"""
+    _DrawCapsule(_vec3(start_pos), _vec3(end_pos), _float(radius), _int(slices), _int(rings), _color(color))
+
+
+def draw_capsule_wires(start_pos, end_pos, radius, slices, rings, color):
+    # type: (Vector3, Vector3, float, int, int, Color) -> None
+    """Draw capsule wireframe with the center of its sphere caps at startPos and endPos"""
+    _DrawCapsuleWires(_vec3(start_pos), _vec3(end_pos), _float(radius), _int(slices), _int(rings), _color(color))
+
+
+def draw_plane(center_pos, size, color):
+    # type: (Vector3, Vector2, Color) -> None
+    """Draw a plane XZ"""
+    _DrawPlane(_vec3(center_pos), _vec2(size), _color(color))
+
+
+def draw_ray(ray, color):
+    # type: (Ray, Color) -> None
+    """Draw a ray line"""
+    _DrawRay(ray, _color(color))
+
+
+def draw_grid(slices, spacing):
+    # type: (int, float) -> None
+    """Draw a grid (centered at (0, 0, 0))"""
+    _DrawGrid(_int(slices), _float(spacing))
+
+
+def load_model(file_name):
+    # type: (bytes | str | None) -> Model
+    """Load model from files (meshes and materials)"""
+    return _LoadModel(_str_in(file_name))
+
+
+def load_model_from_mesh(mesh):
+    # type: (Mesh) -> Model
+    """Load model from generated mesh (default material)"""
+    return _LoadModelFromMesh(mesh)
+
+
+def is_model_ready(model):
+    # type: (Model) -> bool
+    """Check if a model is ready"""
+    return _IsModelReady(model)
+
+
+def unload_model(model):
+    # type: (Model) -> None
+    """Unload model (including meshes) from memory (RAM and/or VRAM)"""
+    _UnloadModel(model)
+
+
+def get_model_bounding_box(model):
+    # type: (Model) -> BoundingBox
+    """Compute model bounding box limits (considers all meshes)"""
+    return _GetModelBoundingBox(model)
+
+
+def draw_model(model, position, scale, tint):
+    # type: (Model, Vector3, float, Color) -> None
+    """Draw a model (with texture if set)"""
+    _DrawModel(model, _vec3(position), _float(scale), _color(tint))
+
+
+def draw_model_ex(model, position, rotation_axis, rotation_angle, scale, tint):
+    # type: (Model, Vector3, Vector3, float, Vector3, Color) -> None
+    """Draw a model with extended parameters"""
+    _DrawModelEx(model, _vec3(position), _vec3(rotation_axis), _float(rotation_angle), _vec3(scale), _color(tint))
+
+
+def draw_model_wires(model, position, scale, tint):
+    # type: (Model, Vector3, float, Color) -> None
+    """Draw a model wires (with texture if set)"""
+    _DrawModelWires(model, _vec3(position), _float(scale), _color(tint))
+
+
+def draw_model_wires_ex(model, position, rotation_axis, rotation_angle, scale, tint):
+    # type: (Model, Vector3, Vector3, float, Vector3, Color) -> None
+    """Draw a model wires (with texture if set) with extended parameters"""
+    _DrawModelWiresEx(model, _vec3(position), _vec3(rotation_axis), _float(rotation_angle), _vec3(scale), _color(tint))
+
+
+def draw_bounding_box(box, color):
+    # type: (BoundingBox, Color) -> None
+    """Draw bounding box (wires)"""
+    _DrawBoundingBox(box, _color(color))
+
+
+def draw_billboard(camera, texture, position, size, tint):
+    # type: (Camera, Texture2D, Vector3, float, Color) -> None
+    """Draw a billboard texture"""
+    _DrawBillboard(camera, texture, _vec3(position), _float(size), _color(tint))
+
+
+def draw_billboard_rec(camera, texture, source, position, size, tint):
+    # type: (Camera, Texture2D, Rectangle, Vector3, Vector2, Color) -> None
+    """Draw a billboard texture defined by source"""
+    _DrawBillboardRec(camera, texture, _rect(source), _vec3(position), _vec2(size), _color(tint))
+
+
+def draw_billboard_pro(camera, texture, source, position, up, size, origin, rotation, tint):
+    # type: (Camera, Texture2D, Rectangle, Vector3, Vector3, Vector2, Vector2, float, Color) -> None
+    """Draw a billboard texture defined by source and rotation"""
+    _DrawBillboardPro(camera, texture, _rect(source), _vec3(position), _vec3(up), _vec2(size), _vec2(origin), _float(rotation), _color(tint))
+
+
+def upload_mesh(mesh, dynamic):
+    # type: (MeshPtr, bool) -> None
+    """Upload mesh vertex data in GPU and provide VAO/VBO ids"""
+    _UploadMesh(mesh, _bool(dynamic))
+
+
+def update_mesh_buffer(mesh, index, data, data_size, offset):
+    # type: (Mesh, int, bytes | str | None, int, int) -> None
+    """Update mesh vertex data in GPU for a specific buffer index"""
+    _UpdateMeshBuffer(mesh, _int(index), data, _int(data_size), _int(offset))
+
+
+def unload_mesh(mesh):
+    # type: (Mesh) -> None
+    """Unload mesh data from CPU and GPU"""
+    _UnloadMesh(mesh)
+
+
+def draw_mesh(mesh, material, transform):
+    # type: (Mesh, Material, Matrix) -> None
+    """Draw a 3d mesh with material and transform"""
+    _DrawMesh(mesh, material, transform)
+
+
+def draw_mesh_instanced(mesh, material, transforms, instances):
+    # type: (Mesh, Material, MatrixPtr, int) -> None
+    """Draw multiple mesh instances with material and different transforms"""
+    _DrawMeshInstanced(mesh, material, transforms, _int(instances))
+
+
+def export_mesh(mesh, file_name):
+    # type: (Mesh, bytes | str | None) -> bool
+    """Export mesh data to file, returns true on success"""
+    return _ExportMesh(mesh, _str_in(file_name))
+
+
+def get_mesh_bounding_box(mesh):
+    # type: (Mesh) -> BoundingBox
+    """Compute mesh bounding box limits"""
+    return _GetMeshBoundingBox(mesh)
+
+
+def gen_mesh_tangents(mesh):
+    # type: (MeshPtr) -> None
+    """Compute mesh tangents"""
+    _GenMeshTangents(mesh)
+
+
+def gen_mesh_poly(sides, radius):
+    # type: (int, float) -> Mesh
+    """Generate polygonal mesh"""
+    return _GenMeshPoly(_int(sides), _float(radius))
+
+
+def gen_mesh_plane(width, length, res_x, res_z):
+    # type: (float, float, int, int) -> Mesh
+    """Generate plane mesh (with subdivisions)"""
+    return _GenMeshPlane(_float(width), _float(length), _int(res_x), _int(res_z))
+
+
+def gen_mesh_cube(width, height, length):
+    # type: (float, float, float) -> Mesh
+    """Generate cuboid mesh"""
+    return _GenMeshCube(_float(width), _float(height), _float(length))
+
+
+def gen_mesh_sphere(radius, rings, slices):
+    # type: (float, int, int) -> Mesh
+    """Generate sphere mesh (standard sphere)"""
+    return _GenMeshSphere(_float(radius), _int(rings), _int(slices))
+
+
+def gen_mesh_hemi_sphere(radius, rings, slices):
+    # type: (float, int, int) -> Mesh
+    """Generate half-sphere mesh (no bottom cap)"""
+    return _GenMeshHemiSphere(_float(radius), _int(rings), _int(slices))
+
+
+def gen_mesh_cylinder(radius, height, slices):
+    # type: (float, float, int) -> Mesh
+    """Generate cylinder mesh"""
+    return _GenMeshCylinder(_float(radius), _float(height), _int(slices))
+
+
+def gen_mesh_cone(radius, height, slices):
+    # type: (float, float, int) -> Mesh
+    """Generate cone/pyramid mesh"""
+    return _GenMeshCone(_float(radius), _float(height), _int(slices))
+
+
+def gen_mesh_torus(radius, size, rad_seg, sides):
+    # type: (float, float, int, int) -> Mesh
+    """Generate torus mesh"""
+    return _GenMeshTorus(_float(radius), _float(size), _int(rad_seg), _int(sides))
+
+
+def gen_mesh_knot(radius, size, rad_seg, sides):
+    # type: (float, float, int, int) -> Mesh
+    """Generate trefoil knot mesh"""
+    return _GenMeshKnot(_float(radius), _float(size), _int(rad_seg), _int(sides))
+
+
+def gen_mesh_heightmap(heightmap, size):
+    # type: (Image, Vector3) -> Mesh
+    """Generate heightmap mesh from image data"""
+    return _GenMeshHeightmap(heightmap, _vec3(size))
+
+
+def gen_mesh_cubicmap(cubicmap, cube_size):
+    # type: (Image, Vector3) -> Mesh
+    """Generate cubes-based map mesh from image data"""
+    return _GenMeshCubicmap(cubicmap, _vec3(cube_size))
+
+
+def load_materials(file_name, material_count):
+    # type: (bytes | str | None, int) -> Array[Material]
+    """Load materials from model file"""
+    material_count = Int(material_count)
+    result = _LoadMaterials(_str_in(file_name), byref(material_count))
+    result = cast(result, POINTER(Material * material_count.value))[0]
+    _clear_in_out()
+    _push_in_out(material_count.value)
+    return result
+
+
+def load_material_default():
+    # type: () -> Material
+    """Load default material (Supports: DIFFUSE, SPECULAR, NORMAL maps)"""
+    return _LoadMaterialDefault()
+
+
+def is_material_ready(material):
+    # type: (Material) -> bool
+    """Check if a material is ready"""
+    return _IsMaterialReady(material)
+
+
+def unload_material(material):
+    # type: (Material) -> None
+    """Unload material from GPU memory (VRAM)"""
+    _UnloadMaterial(material)
+
+
+def set_material_texture(material, map_type, texture):
+    # type: (MaterialPtr, int, Texture2D) -> None
+    """Set texture for a material map type (MATERIAL_MAP_DIFFUSE, MATERIAL_MAP_SPECULAR...)"""
+    _SetMaterialTexture(material, _int(map_type), texture)
+
+
+def set_model_mesh_material(model, mesh_id, material_id):
+    # type: (ModelPtr, int, int) -> None
+    """Set material for a mesh"""
+    _SetModelMeshMaterial(model, _int(mesh_id), _int(material_id))
+
+
+def load_model_animations(file_name, anim_count):
+    # type: (bytes | str | None, int) -> Array[ModelAnimation]
+    """Load model animations from file"""
+    anim_count = Int(anim_count)
+    result = _LoadModelAnimations(_str_in(file_name), byref(anim_count))
+    result = cast(result, POINTER(ModelAnimation * anim_count.value))[0]
+    _clear_in_out()
+    _push_in_out(anim_count.value)
+    return result
+
+
+def update_model_animation(model, anim, frame):
+    # type: (Model, ModelAnimation, int) -> None
+    """Update model animation pose"""
+    _UpdateModelAnimation(model, anim, _int(frame))
+
+
+def unload_model_animation(anim):
+    # type: (ModelAnimation) -> None
+    """Unload animation data"""
+    _UnloadModelAnimation(anim)
+
+
+def unload_model_animations(animations, anim_count):
+    # type: (ModelAnimationPtr, int) -> None
+    """Unload animation array data"""
+    _UnloadModelAnimations(animations, _int(anim_count))
+
+
+def is_model_animation_valid(model, anim):
+    # type: (Model, ModelAnimation) -> bool
+    """Check model animation skeleton match"""
+    return _IsModelAnimationValid(model, anim)
+
+
+def check_collision_spheres(center1, radius1, center2, radius2):
+    # type: (Vector3, float, Vector3, float) -> bool
+    """Check collision between two spheres"""
+    return _CheckCollisionSpheres(_vec3(center1), _float(radius1), _vec3(center2), _float(radius2))
+
+
+def check_collision_boxes(box1, box2):
+    # type: (BoundingBox, BoundingBox) -> bool
+    """Check collision between two bounding boxes"""
+    return _CheckCollisionBoxes(box1, box2)
+
+
+def check_collision_box_sphere(box, center, radius):
+    # type: (BoundingBox, Vector3, float) -> bool
+    """Check collision between box and sphere"""
+    return _CheckCollisionBoxSphere(box, _vec3(center), _float(radius))
+
+
+def get_ray_collision_sphere(ray, center, radius):
+    # type: (Ray, Vector3, float) -> RayCollision
+    """Get collision info between ray and sphere"""
+    return _GetRayCollisionSphere(ray, _vec3(center), _float(radius))
+
+
+def get_ray_collision_box(ray, box):
+    # type: (Ray, BoundingBox) -> RayCollision
+    """Get collision info between ray and box"""
+    return _GetRayCollisionBox(ray, box)
+
+
+def get_ray_collision_mesh(ray, mesh, transform):
+    # type: (Ray, Mesh, Matrix) -> RayCollision
+    """Get collision info between ray and mesh"""
+    return _GetRayCollisionMesh(ray, mesh, transform)
+
+
+def get_ray_collision_triangle(ray, p1, p2, p3):
+    # type: (Ray, Vector3, Vector3, Vector3) -> RayCollision
+    """Get collision info between ray and triangle"""
+    return _GetRayCollisionTriangle(ray, _vec3(p1), _vec3(p2), _vec3(p3))
+
+
+def get_ray_collision_quad(ray, p1, p2, p3, p4):
+    # type: (Ray, Vector3, Vector3, Vector3, Vector3) -> RayCollision
+    """Get collision info between ray and quad"""
+    return _GetRayCollisionQuad(ray, _vec3(p1), _vec3(p2), _vec3(p3), _vec3(p4))
@@ -0,0 +1,353 @@
+# pack.py
+
+#   Asset packs: many files stored in one, read through a memory mapping so
+#   loading an asset costs no open, stat or read call, and no copy: raylib
+#   decodes it straight from the mapped pages.
+#
+#   Format (little endian):
+#
+#       header      8s magic 'RLPYPACK', u32 version, u32 alignment, u32 entry count, u32 reserved, u64 index offset
+#       blobs       the entries, each starting at a multiple of the alignment
+#       index       per entry: u64 offset, u64 size, u32 CRC-32, u16 name size, name (UTF-8, '/' separated)
+#
+#   A mounted pack also serves the files raylib loads by name through
+#   LoadFileData (load_image, load_wave, load_font_ex...), via
+#   set_load_file_data_callback; raylib takes ownership of the data it gets this
+#   way, so these loads copy the entry once. Music streams are decoded from the
+#   file by name without LoadFileData: load them with AssetPack.load_music().
+#   The files not in a mounted pack are loaded by the callback the application
+#   set with set_load_file_data_callback, if any, which is back in place once
+#   the last pack is unmounted.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   $ python -m raylibpy.pack assets.rpk assets/ [--alignment 64]
+#
+#   with AssetPackBuilder('assets.rpk') as builder:
+#       builder.add_directory('assets')             # entries named 'sprites/hero.png'...
+#
+#   pack = AssetPack('assets.rpk')
+#   hero = pack.load_image('sprites/hero.png')      # decoded from the mapping
+#   theme = pack.load_music('music/theme.ogg')      # streamed from the mapping
+#   pack.mount()                                    # load_texture('sprites/hero.png') reads the pack
+#   ...
+#   pack.close()                                    # after unloading the music streamed from it
+
+import argparse
+import ctypes
+import mmap
+import os
+import posixpath
+import struct
+import sys
+import zlib
+
+from . import (
+    LoadFileDataCallback,
+    UCharPtr,
+    _LoadFontFromMemory,
+    _LoadImageFromMemory,
+    _LoadMusicStreamFromMemory,
+    _LoadWaveFromMemory,
+    _MemAlloc,
+    _SUBMODULE_EXPORTS,
+    _load_file_data_callbacks,
+    _override_load_file_data_callback,
+    _str_in,
+    _symbol_namespaces,
+    int_array,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['pack'])
+
+_symbol_namespaces.append(globals())
+
+_MAGIC = b'RLPYPACK'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIIIQ')
+_ENTRY = struct.Struct('<QQIH')
+
+_mounted = []                   # AssetPack serving LoadFileData, first mounted first
+_callback = None                # the LoadFileDataCallback installed while packs are mounted
+
+
+def _entry_name(name):
+    """Returns `name` as stored in the index: a normalized, '/' separated relative path"""
+    name = posixpath.normpath(name.replace('\\', '/'))
+    return name[2:] if name.startswith('./') else name
+
+
+class AssetPackBuilder(object):
+    """Writes an asset pack, entry by entry, the index being written by close()"""
+
+    def __init__(self, file_name, alignment=64):
+        # type: (str, int) -> None
+        if alignment < 1 or alignment & (alignment - 1):
+            raise ValueError("alignment must be a power of two, got {}".format(alignment))
+        self.alignment = int(alignment)
+        self._file = open(file_name, 'wb')
+        self._file.write(b'\0' * _HEADER.size)
+        self._entries = {}      # name -> (offset, size, crc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, name, data):
+        # type: (str, Buffer) -> None
+        """Adds the bytes of `data` as the entry `name`"""
+        name = _entry_name(name)
+        if name in self._entries:
+            raise ValueError("duplicate entry: {!r}".format(name))
+        view = memoryview(data).cast('B')
+        position = self._file.tell()
+        offset = (position + self.alignment - 1) & ~(self.alignment - 1)
+        self._file.write(b'\0' * (offset - position))
+        self._file.write(view)
+        self._entries[name] = (offset, len(view), zlib.crc32(view) & 0xFFFFFFFF)
+
+    def add_file(self, path, name=None):
+        # type: (str, str | None) -> None
+        """Adds the file `path` as the entry `name` (its path by default)"""
+        with open(path, 'rb') as file:
+            self.add(path if name is None else name, file.read())
+
+    def add_directory(self, directory, prefix=''):
+        # type: (str, str) -> int
+        """Adds the files under `directory`, named by their path relative to it after `prefix`; returns how many"""
+        count = 0
+        for root, directories, files in os.walk(directory):
+            directories.sort()
+            for file_name in sorted(files):
+                path = os.path.join(root, file_name)
+                self.add_file(path, posixpath.join(prefix, os.path.relpath(path, directory).replace(os.sep, '/')))
+                count += 1
+        return count
+
+    def close(self):
+        # type: () -> None
+        """Writes the index and the header, and closes the file"""
+        if self._file is None:
+            return
+        index_offset = self._file.tell()
+        for name, (offset, size, crc) in self._entries.items():
+            encoded = name.encode('utf-8')
+            self._file.write(_ENTRY.pack(offset, size, crc, len(encoded)))
+            self._file.write(encoded)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, self.alignment, len(self._entries), 0, index_offset))
+        self._file.close()
+        self._file = None
+
+
+class AssetPack(object):
+    """A memory mapped asset pack, loading its entries without copying them
+
+    The memory of an entry is only valid while the pack is open: close it after
+    unloading the music streamed from it and releasing the views of view().
+    """
+
+    def __init__(self, file_name):
+        # type: (str) -> None
+        self.file_name = file_name
+        self._file = open(file_name, 'rb')
+        # copy on write: a writable mapping ctypes can point into, pages are only copied if written
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, self.alignment, count, _, index_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError("not a version {} asset pack: {!r}".format(_VERSION, file_name))
+
+        self._entries = {}      # name -> (offset, size, crc)
+        position = index_offset
+        for _ in range(count):
+            offset, size, crc, name_size = _ENTRY.unpack_from(self._map, position)
+            position += _ENTRY.size
+            name = bytes(self._map[position:position + name_size]).decode('utf-8')
+            position += name_size
+            self._entries[name] = (offset, size, crc)
+        self._memory = (ctypes.c_ubyte * len(self._map)).from_buffer(self._map)
+        self._address = ctypes.addressof(self._memory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __contains__(self, name):
+        return _entry_name(name) in self._entries
+
+    def __repr__(self):
+        return "AssetPack({!r}, {} entries)".format(self.file_name, len(self._entries))
+
+    def names(self):
+        # type: () -> list[str]
+        return list(self._entries)
+
+    def size(self, name):
+        # type: (str) -> int
+        """Returns the size in bytes of the entry `name`"""
+        return self._entry(name)[1]
+
+    def address(self, name):
+        # type: (str) -> int
+        """Returns the address of the entry `name` in the mapping"""
+        return self._address + self._entry(name)[0]
+
+    def view(self, name):
+        # type: (str) -> memoryview
+        """Returns the bytes of the entry `name` as a memoryview of the mapping"""
+        offset, size, _ = self._entry(name)
+        return memoryview(self._map)[offset:offset + size]
+
+    def read(self, name):
+        # type: (str) -> bytes
+        """Returns a copy of the bytes of the entry `name`"""
+        offset, size, _ = self._entry(name)
+        return self._map[offset:offset + size]
+
+    def verify(self):
+        # type: () -> list[str]
+        """Checks the CRC-32 of every entry, returns the names of the corrupted ones"""
+        return [name for name, (offset, size, crc) in self._entries.items()
+                if zlib.crc32(memoryview(self._map)[offset:offset + size]) & 0xFFFFFFFF != crc]
+
+    def load_image(self, name):
+        # type: (str) -> Image
+        """Loads the image stored as `name`, the file type being its extension"""
+        return _LoadImageFromMemory(self._file_type(name), self._pointer(name), self.size(name))
+
+    def load_wave(self, name):
+        # type: (str) -> Wave
+        """Loads the wave stored as `name`, the file type being its extension"""
+        return _LoadWaveFromMemory(self._file_type(name), self._pointer(name), self.size(name))
+
+    def load_font(self, name, font_size=32, codepoints=None):
+        # type: (str, int, list[int] | str | None) -> Font
+        """Loads the font stored as `name` at `font_size`, with `codepoints` (the default glyphs if None)"""
+        points = int_array(codepoints) if codepoints else None
+        return _LoadFontFromMemory(self._file_type(name), self._pointer(name), self.size(name),
+                                   int(font_size), points, len(points) if points else 0)
+
+    def load_music(self, name):
+        # type: (str) -> Music
+        """Loads the music stored as `name`, streamed from the mapping: unload it before closing the pack"""
+        return _LoadMusicStreamFromMemory(self._file_type(name), self._pointer(name), self.size(name))
+
+    def mount(self):
+        # type: () -> None
+        """Serves the files raylib loads with LoadFileData from this pack, before the packs mounted later"""
+        global _callback
+
+        if self in _mounted:
+            return
+        _mounted.append(self)
+        if _callback is None:
+            _callback = LoadFileDataCallback(_load_file_data)
+            _override_load_file_data_callback(_callback)
+
+    def unmount(self):
+        # type: () -> None
+        """Stops serving files from this pack, restores the previous file loading if it was the last one"""
+        global _callback
+
+        if self not in _mounted:
+            return
+        _mounted.remove(self)
+        if not _mounted:
+            _override_load_file_data_callback(None)     # the application's callback, or raylib's loading
+            _callback = None
+
+    def close(self):
+        # type: () -> None
+        """Unmounts the pack and unmaps it
+
+        Raises BufferError, leaving the pack open and mounted, while views returned
+        by view() are alive.
+        """
+        if self._map is not None:
+            self._memory = None
+            try:
+                self._map.close()
+            except BufferError:
+                self._memory = (ctypes.c_ubyte * len(self._map)).from_buffer(self._map)
+                raise BufferError("cannot close {!r}: views of its entries are still alive".format(self.file_name))
+            self._map = None
+        self.unmount()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _entry(self, name):
+        entry = self._entries.get(_entry_name(name))
+        if entry is None:
+            raise KeyError("no entry {!r} in {!r}".format(name, self.file_name))
+        return entry
+
+    def _pointer(self, name):
+        return ctypes.cast(self.address(name), UCharPtr)
+
+    @staticmethod
+    def _file_type(name):
+        return _str_in(posixpath.splitext(name)[1])
+
+
+def _load_file_data(file_name, data_size):
+    """LoadFileDataCallback serving the mounted packs, and the application's callback or the file system for the other files"""
+    try:
+        name = _entry_name(file_name.decode('utf-8'))
+        for pack in _mounted:
+            entry = pack._entries.get(name)
+            if entry is not None:
+                source, size = pack._address + entry[0], entry[1]
+                break
+        else:
+            application = _load_file_data_callbacks['application']
+            if application:
+                return application(file_name, data_size)    # allocated by it with MemAlloc, freed by raylib
+            # the callback replaces raylib's own file loading
+            with open(file_name, 'rb') as file:
+                source = file.read()
+            size = len(source)
+        data = _MemAlloc(size)
+        if not data:
+            return None
+        ctypes.memmove(data, source, size)
+        data_size[0] = size
+        return data
+    except Exception:
+        data_size[0] = 0
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m raylibpy.pack', description='Builds an asset pack from directories')
+    parser.add_argument('output', help='asset pack to write')
+    parser.add_argument('directories', nargs='+', help='directories whose files are added, named relative to them')
+    parser.add_argument('--alignment', type=int, default=64, help='alignment of the entries in bytes (power of two)')
+    args = parser.parse_args(argv)
+
+    with AssetPackBuilder(args.output, args.alignment) as builder:
+        for directory in args.directories:
+            builder.add_directory(directory)
+    print("{}: {} entries, {} bytes".format(args.output, len(builder), os.path.getsize(args.output)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+# processors.py
+
+#   Audio processors written in Python: a function receiving the samples of an
+#   audio stream (or of the whole mix) as a (frames, channels) float32 NumPy
+#   array sharing the mixer's buffer, to modify in place (filters, compressors,
+#   meters...).
+#
+#   The function runs on the audio thread, which has to take the GIL for every
+#   call. With a latency budget, the samples are gathered into fixed blocks of
+#   that duration and the function runs once per block, so the per call cost of
+#   Python and NumPy is paid once per block instead of once per mixer period,
+#   at the price of delaying the audio by the block duration.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   def lowpass(samples):                           # (frames, 2) float32, in place
+#       ...
+#
+#   processor = AudioProcessor(lowpass, latency=0.02)   # blocks of 20 ms
+#   processor.attach(music)                         # a Music, Sound or AudioStream, None for the mix
+#   ...
+#   print(processor.max_process_time, processor.overruns)
+#   processor.detach()
+
+import ctypes
+from time import perf_counter
+
+from . import (
+    AudioCallback,
+    _AttachAudioMixedProcessor,
+    _AttachAudioStreamProcessor,
+    _DetachAudioMixedProcessor,
+    _DetachAudioStreamProcessor,
+    _SUBMODULE_EXPORTS,
+    _numpy,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['processors'])
+
+_symbol_namespaces.append(globals())
+
+_DEVICE_CHANNELS = 2        # processors receive the samples converted to the device format: 2 float32 channels
+
+_attached = set()           # attached processors, kept alive while the audio thread may call their callback
+
+
+class AudioProcessor(object):
+    """Runs a Python function over the samples of an audio stream or of the mix, as NumPy arrays
+
+    `process(samples)` receives a (frames, channels) float32 array and modifies
+    it in place, or returns the processed samples. `sample_rate` is the one of
+    the audio device, used for the latency and the timing statistics. With a
+    `latency` (seconds), the function runs on blocks of that duration and the
+    audio is delayed by one block.
+
+    An exception raised by the function is kept in `error` and stops the
+    processing: the audio then goes through unchanged.
+    """
+
+    def __init__(self, process, channels=_DEVICE_CHANNELS, sample_rate=44100, latency=0.0):
+        # type: (Callable[[numpy.ndarray], numpy.ndarray | None], int, int, float) -> None
+        np = _numpy()
+        self.process = process
+        self.channels = int(channels)
+        self.sample_rate = int(sample_rate)
+        self.block_frames = int(round(latency * self.sample_rate))
+        self.enabled = True
+        self.error = None
+
+        self._callback = AudioCallback(self._run)
+        self._as_parameter_ = self._callback    # can be given to attach_audio_stream_processor() and co
+        self._stream = None
+        self._attached = False
+        self._view = (None, 0, None)            # buffer address, frames, array over the buffer
+        self._input = np.zeros((self.block_frames, self.channels), dtype=np.float32)
+        self._output = np.zeros((self.block_frames, self.channels), dtype=np.float32)
+        self._fill = 0
+        self.reset_stats()
+
+    @property
+    def latency(self):
+        # type: () -> float
+        """Delay added to the audio, in seconds"""
+        return self.block_frames / float(self.sample_rate)
+
+    @property
+    def attached(self):
+        # type: () -> bool
+        return self._attached
+
+    def attach(self, stream=None):
+        # type: (AudioStream | Music | Sound | None) -> None
+        """Attaches the processor to `stream`, or to the entire audio pipeline if None"""
+        self.detach()
+        stream = getattr(stream, 'stream', stream)
+        if stream is None:
+            _AttachAudioMixedProcessor(self._callback)
+        else:
+            _AttachAudioStreamProcessor(stream, self._callback)
+        self._stream = stream
+        self._attached = True
+        _attached.add(self)
+
+    def detach(self):
+        # type: () -> None
+        """Detaches the processor and clears its pending block"""
+        if not self._attached:
+            return
+        if self._stream is None:
+            _DetachAudioMixedProcessor(self._callback)
+        else:
+            _DetachAudioStreamProcessor(self._stream, self._callback)
+        self._stream = None
+        self._attached = False
+        _attached.discard(self)
+        self._input[:] = 0
+        self._output[:] = 0
+        self._fill = 0
+
+    def reset_stats(self):
+        # type: () -> None
+        self.calls = 0                  # calls of the function
+        self.frames_processed = 0
+        self.process_time = 0.0         # seconds spent in the function
+        self.max_process_time = 0.0
+        self.overruns = 0               # calls slower than the duration of the audio they processed
+
+    def _samples(self, buffer, frames):
+        address, count, array = self._view
+        if address != buffer or count != frames:
+            data = (ctypes.c_float * (frames * self.channels)).from_address(buffer)
+            array = _numpy().frombuffer(data, dtype='float32').reshape(frames, self.channels)
+            self._view = (buffer, frames, array)
+        return array
+
+    def _apply(self, samples):
+        start = perf_counter()
+        result = self.process(samples)
+        if result is not None and result is not samples:
+            samples[...] = result
+        elapsed = perf_counter() - start
+
+        frames = len(samples)
+        self.calls += 1
+        self.frames_processed += frames
+        self.process_time += elapsed
+        if elapsed > self.max_process_time:
+            self.max_process_time = elapsed
+        if elapsed * self.sample_rate > frames:
+            self.overruns += 1
+
+    def _run(self, buffer, frames):
+        if not (buffer and frames and self.enabled) or self.error is not None:
+            return
+        try:
+            samples = self._samples(buffer, frames)
+            if not self.block_frames:
+                self._apply(samples)
+                return
+            # the output lags the input by one block: each period is swapped with the
+            # processed samples of the previous block
+            position = 0
+            while position < frames:
+                count = min(frames - position, self.block_frames - self._fill)
+                end, fill_end = position + count, self._fill + count
+                self._input[self._fill:fill_end] = samples[position:end]
+                samples[position:end] = self._output[self._fill:fill_end]
+                position, self._fill = end, fill_end
+                if self._fill == self.block_frames:
+                    self._apply(self._input)
+                    self._input, self._output = self._output, self._input
+                    self._fill = 0
+        except Exception as error:
+            self.error = error
@@ -0,0 +1,245 @@
+# profiler.py
+
+#   Opt-in per-frame profiler of the calls into raylib: how many times each C
+#   function was called, the time spent in it and the time the Python wrappers
+#   spent marshalling its arguments and results, per frame.
+#
+#   Enabling it interposes timing wrappers on the `_X` internals (the ctypes
+#   functions the wrappers call) in every namespace using them, and replaces the
+#   public wrapper functions of the submodules imported so far with wrappers
+#   measuring their own overhead; disabling it withdraws them, so a disabled
+#   profiler costs nothing. It stacks with the other interposers (resource
+#   tracking, math backend). Functions imported with `from raylibpy import x`
+#   before enabling, and the submodules imported after, still count their C
+#   calls, but not their marshalling time.
+#
+#   A frame is everything from the end of the previous end_drawing() to the end
+#   of this one, so update code run before begin_drawing() is part of it. Note
+#   that EndDrawing includes the wait for the target FPS / vertical sync.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   enable_profiler()
+#   while not window_should_close():
+#       begin_drawing()
+#       ...
+#       draw_profiler_overlay(10, 10)               # last frame, not counted itself
+#       end_drawing()
+#   stats = get_profiler_stats()                    # {'DrawTexturePro': {'calls': 500, 'time': ..., 'marshalling': ...}, ...}
+#   disable_profiler()
+
+import sys
+import threading
+from time import perf_counter
+from types import FunctionType
+
+from . import (
+    GREEN,
+    _LazySymbol,
+    _SUBMODULE_EXPORTS,
+    _color,
+    _interpose,
+    _str_in,
+    _symbol_namespaces,
+    _symbol_table,
+    _withdraw,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['profiler'])
+
+_FRAME_END = 'EndDrawing'       # a frame ends (and the next starts) when this C function returns
+
+_enabled = False
+_originals = []                 # (namespace, name, public function) to put back on disable
+_local = threading.local()      # per thread stack of the public wrapper calls in progress
+
+_frame = {}                     # C function name -> [calls, time, marshalling] of the frame in progress
+_last_frame = {}
+_totals = {}
+_frames = 0
+
+
+# region RECORDING
+
+def _stats(table, name):
+    entry = table.get(name)
+    if entry is None:
+        entry = table[name] = [0, 0.0, 0.0]
+    return entry
+
+
+def _callers():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _end_frame():
+    global _frame, _last_frame, _frames
+
+    for name, (calls, time_, marshalling) in _frame.items():
+        entry = _stats(_totals, name)
+        entry[0] += calls
+        entry[1] += time_
+        entry[2] += marshalling
+    _last_frame, _frame = _frame, {}
+    _frames += 1
+
+
+def _profile_c_function(name, function):
+    """Returns a wrapper of the C function (or its override) `function` recording its calls"""
+    def profiled(*args):
+        start = perf_counter()
+        try:
+            return function(*args)
+        finally:
+            elapsed = perf_counter() - start
+            entry = _stats(_frame, name)
+            entry[0] += 1
+            entry[1] += elapsed
+            stack = _callers()
+            if stack:
+                caller = stack[-1]
+                caller[0] += elapsed
+                caller[1].append(entry)
+            if name == _FRAME_END:
+                if stack:
+                    stack[0][2] = True  # the frame ends when the outermost wrapper returns
+                else:
+                    _end_frame()
+
+    profiled.__wrapped__ = function
+    return profiled
+
+
+def _profile_wrapper(function):
+    """Returns a wrapper of the public function `function` recording its marshalling time
+
+    The time it spends outside of the C functions (and nested wrappers) it calls is split
+    among those C functions.
+    """
+    def profiled(*args, **kwargs):
+        stack = _callers()
+        caller = [0.0, [], False]   # time in C functions and nested wrappers, their stats, frame ended
+        stack.append(caller)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            entries = caller[1]
+            if entries:
+                share = (elapsed - caller[0]) / len(entries)
+                for entry in entries:
+                    entry[2] += share
+            if caller[2]:
+                _end_frame()
+
+    profiled.__wrapped__ = function
+    profiled.__name__ = function.__name__
+    profiled.__doc__ = function.__doc__
+    return profiled
+
+# endregion (recording)
+
+
+def enable_profiler():
+    # type: () -> None
+    """Starts recording the calls into raylib, per frame (see get_profiler_stats())"""
+    global _enabled
+
+    if _enabled:
+        return
+    for c_name in list(_symbol_table):
+        _interpose(c_name, __name__, _profile_c_function)
+
+    package = sys.modules[__package__]
+    for symbols in list(_symbol_namespaces):
+        module = sys.modules.get(symbols.get('__name__'))
+        if module is None or module is package or module.__name__ == __name__:
+            continue
+        if module.__name__.rpartition('.')[2] not in _SUBMODULE_EXPORTS:
+            continue
+        for name in module.__all__:
+            function = module.__dict__.get(name)
+            if not isinstance(function, FunctionType) or function.__module__ != module.__name__:
+                continue
+            profiled = _profile_wrapper(function)
+            for namespace in (module.__dict__, package.__dict__):
+                if namespace.get(name) is function:
+                    _originals.append((namespace, name, function))
+                    namespace[name] = profiled
+    _enabled = True
+
+
+def disable_profiler():
+    # type: () -> None
+    """Stops recording and restores the unwrapped functions, keeps the statistics"""
+    global _enabled
+
+    if not _enabled:
+        return
+    for c_name in list(_symbol_table):
+        _withdraw(c_name, __name__)
+    for namespace, name, original in reversed(_originals):
+        namespace[name] = original
+    del _originals[:]
+    _enabled = False
+
+
+def is_profiler_enabled():
+    # type: () -> bool
+    """Returns True if the calls into raylib are being recorded"""
+    return _enabled
+
+
+def reset_profiler():
+    # type: () -> None
+    """Clears the recorded statistics"""
+    global _frames, _frame, _last_frame
+
+    _frame, _last_frame = {}, {}
+    _totals.clear()
+    _frames = 0
+
+
+def get_profiler_stats(totals=False):
+    # type: (bool) -> dict[str, dict[str, int | float]]
+    """Returns {C function name: {'calls': int, 'time': seconds, 'marshalling': seconds}}
+
+    For the last complete frame, or with `totals` summed over all the frames recorded
+    (the number of frames is get_profiler_frame_count()).
+    """
+    table = _totals if totals else _last_frame
+    return {
+        name: {'calls': calls, 'time': time_, 'marshalling': marshalling}
+        for name, (calls, time_, marshalling) in table.items()
+    }
+
+
+def get_profiler_frame_count():
+    # type: () -> int
+    """Returns the number of frames recorded since the profiler was enabled or reset"""
+    return _frames
+
+
+def draw_profiler_overlay(pos_x, pos_y, font_size=10, color=GREEN, lines=12):
+    # type: (int, int, int, Color, int) -> None
+    """Draws the costliest C functions of the last frame with draw_text (not recorded itself)"""
+    draw_text = _symbol_table['DrawText']
+    if isinstance(draw_text, _LazySymbol):
+        draw_text = draw_text.bind()
+    stats = sorted(_last_frame.items(), key=lambda item: item[1][1] + item[1][2], reverse=True)
+    total = sum(entry[1] + entry[2] for _, entry in stats)
+    rows = ["frame {}: {} calls, {:.2f} ms".format(_frames, sum(entry[0] for _, entry in stats), total * 1e3)]
+    for name, (calls, time_, marshalling) in stats[:lines]:
+        rows.append("{:<24} {:>5} {:>8.3f} ms {:>8.3f} ms".format(name[:24], calls, time_ * 1e3, marshalling * 1e3))
+    for index, row in enumerate(rows):
+        draw_text(_str_in(row), int(pos_x), int(pos_y) + index * (font_size + 2), int(font_size), _color(color))
@@ -0,0 +1,253 @@
+# pymath.py
+
+#   Pure Python implementation of the component-wise raymath operations on
+#   Vector2, Vector3 and Vector4/Quaternion.
+#
+#   Each component of the result is a single float operation on float32 inputs,
+#   computed in double precision and rounded once to float32 when the result is
+#   packed, which is bit-for-bit what raymath computes in float32. Scalar
+#   arguments are rounded to float32 first, as ctypes does when calling C.
+#   Divisions by zero are delegated to raymath so they yield inf/nan as in C.
+#
+#   Compound operations (length, normalize, lerp, ...) need a rounding step per
+#   intermediate result and stay faster through the FFI, so they are not here.
+#
+#   How to use:
+#
+#   raylibpy.set_math_backend('python')     # or RAYLIBPY_MATH_BACKEND=python
+
+from math import copysign, inf
+from struct import Struct
+
+from . import (
+    Vector2,
+    Vector3,
+    Vector4,
+    _symbol_table,
+)
+
+_pack_f = Struct('f').pack
+_unpack_f = Struct('f').unpack
+_pack_2f = Struct('2f').pack
+_pack_3f = Struct('3f').pack
+_pack_4f = Struct('4f').pack
+_new_vector2 = Vector2.from_buffer_copy
+_new_vector3 = Vector3.from_buffer_copy
+_new_vector4 = Vector4.from_buffer_copy
+
+
+def _f32(value):
+    # type: (float) -> float
+    """Rounds `value` to float32 like ctypes does for a float argument"""
+    try:
+        return _unpack_f(_pack_f(value))[0]
+    except OverflowError:
+        return copysign(inf, value)
+
+
+def _vector2(x, y):
+    # type: (float, float) -> Vector2
+    try:
+        return _new_vector2(_pack_2f(x, y))
+    except OverflowError:
+        # ctypes stores out of range components as inf, like a float32 overflow
+        return Vector2(x, y)
+
+
+def _vector3(x, y, z):
+    # type: (float, float, float) -> Vector3
+    try:
+        return _new_vector3(_pack_3f(x, y, z))
+    except OverflowError:
+        return Vector3(x, y, z)
+
+
+def _vector4(x, y, z, w):
+    # type: (float, float, float, float) -> Vector4
+    try:
+        return _new_vector4(_pack_4f(x, y, z, w))
+    except OverflowError:
+        return Vector4(x, y, z, w)
+
+
+# region VECTOR2
+
+def vector2_add(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _vector2(v1.x + v2.x, v1.y + v2.y)
+
+
+def vector2_add_value(v, add):
+    # type: (Vector2, float) -> Vector2
+    add = _f32(add)
+    return _vector2(v.x + add, v.y + add)
+
+
+def vector2_subtract(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _vector2(v1.x - v2.x, v1.y - v2.y)
+
+
+def vector2_subtract_value(v, sub):
+    # type: (Vector2, float) -> Vector2
+    sub = _f32(sub)
+    return _vector2(v.x - sub, v.y - sub)
+
+
+def vector2_scale(v, scale):
+    # type: (Vector2, float) -> Vector2
+    scale = _f32(scale)
+    return _vector2(v.x * scale, v.y * scale)
+
+
+def vector2_multiply(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _vector2(v1.x * v2.x, v1.y * v2.y)
+
+
+def vector2_negate(v):
+    # type: (Vector2) -> Vector2
+    return _vector2(-v.x, -v.y)
+
+
+def vector2_divide(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    try:
+        return _vector2(v1.x / v2.x, v1.y / v2.y)
+    except ZeroDivisionError:
+        return _symbol_table['Vector2Divide'](v1, v2)
+
+
+def vector2_invert(v):
+    # type: (Vector2) -> Vector2
+    try:
+        return _vector2(1.0 / v.x, 1.0 / v.y)
+    except ZeroDivisionError:
+        return _symbol_table['Vector2Invert'](v)
+
+# endregion (vector2)
+
+# region VECTOR3
+
+def vector3_add(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _vector3(v1.x + v2.x, v1.y + v2.y, v1.z + v2.z)
+
+
+def vector3_add_value(v, add):
+    # type: (Vector3, float) -> Vector3
+    add = _f32(add)
+    return _vector3(v.x + add, v.y + add, v.z + add)
+
+
+def vector3_subtract(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _vector3(v1.x - v2.x, v1.y - v2.y, v1.z - v2.z)
+
+
+def vector3_subtract_value(v, sub):
+    # type: (Vector3, float) -> Vector3
+    sub = _f32(sub)
+    return _vector3(v.x - sub, v.y - sub, v.z - sub)
+
+
+def vector3_scale(v, scalar):
+    # type: (Vector3, float) -> Vector3
+    scalar = _f32(scalar)
+    return _vector3(v.x * scalar, v.y * scalar, v.z * scalar)
+
+
+def vector3_multiply(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _vector3(v1.x * v2.x, v1.y * v2.y, v1.z * v2.z)
+
+
+def vector3_negate(v):
+    # type: (Vector3) -> Vector3
+    return _vector3(-v.x, -v.y, -v.z)
+
+
+def vector3_divide(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    try:
+        return _vector3(v1.x / v2.x, v1.y / v2.y, v1.z / v2.z)
+    except ZeroDivisionError:
+        return _symbol_table['Vector3Divide'](v1, v2)
+
+
+def vector3_invert(v):
+    # type: (Vector3) -> Vector3
+    try:
+        return _vector3(1.0 / v.x, 1.0 / v.y, 1.0 / v.z)
+    except ZeroDivisionError:
+        return _symbol_table['Vector3Invert'](v)
+
+# endregion (vector3)
+
+# region QUATERNION
+
+def quaternion_add(q1, q2):
+    # type: (Vector4, Vector4) -> Vector4
+    return _vector4(q1.x + q2.x, q1.y + q2.y, q1.z + q2.z, q1.w + q2.w)
+
+
+def quaternion_add_value(q, add):
+    # type: (Vector4, float) -> Vector4
+    add = _f32(add)
+    return _vector4(q.x + add, q.y + add, q.z + add, q.w + add)
+
+
+def quaternion_subtract(q1, q2):
+    # type: (Vector4, Vector4) -> Vector4
+    return _vector4(q1.x - q2.x, q1.y - q2.y, q1.z - q2.z, q1.w - q2.w)
+
+
+def quaternion_subtract_value(q, sub):
+    # type: (Vector4, float) -> Vector4
+    sub = _f32(sub)
+    return _vector4(q.x - sub, q.y - sub, q.z - sub, q.w - sub)
+
+
+def quaternion_scale(q, mul):
+    # type: (Vector4, float) -> Vector4
+    mul = _f32(mul)
+    return _vector4(q.x * mul, q.y * mul, q.z * mul, q.w * mul)
+
+
+def quaternion_divide(q1, q2):
+    # type: (Vector4, Vector4) -> Vector4
+    try:
+        return _vector4(q1.x / q2.x, q1.y / q2.y, q1.z / q2.z, q1.w / q2.w)
+    except ZeroDivisionError:
+        return _symbol_table['QuaternionDivide'](q1, q2)
+
+# endregion (quaternion)
+
+
+# C function name -> replacement, installed by raylibpy.set_math_backend('python')
+OVERRIDES = {
+    'Vector2Add': vector2_add,
+    'Vector2AddValue': vector2_add_value,
+    'Vector2Subtract': vector2_subtract,
+    'Vector2SubtractValue': vector2_subtract_value,
+    'Vector2Scale': vector2_scale,
+    'Vector2Multiply': vector2_multiply,
+    'Vector2Negate': vector2_negate,
+    'Vector2Divide': vector2_divide,
+    'Vector2Invert': vector2_invert,
+    'Vector3Add': vector3_add,
+    'Vector3AddValue': vector3_add_value,
+    'Vector3Subtract': vector3_subtract,
+    'Vector3SubtractValue': vector3_subtract_value,
+    'Vector3Scale': vector3_scale,
+    'Vector3Multiply': vector3_multiply,
+    'Vector3Negate': vector3_negate,
+    'Vector3Divide': vector3_divide,
+    'Vector3Invert': vector3_invert,
+    'QuaternionAdd': quaternion_add,
+    'QuaternionAddValue': quaternion_add_value,
+    'QuaternionSubtract': quaternion_subtract,
+    'QuaternionSubtractValue': quaternion_subtract_value,
+    'QuaternionScale': quaternion_scale,
+    'QuaternionDivide': quaternion_divide,
+}
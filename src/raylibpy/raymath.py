@@ -0,0 +1,701 @@
+# raymath.py
+
+#   Math functions for vectors, matrices and quaternions (raymath).
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from . import (
+    _Clamp,
+    _FloatEquals,
+    _Lerp,
+    _MatrixAdd,
+    _MatrixDeterminant,
+    _MatrixFrustum,
+    _MatrixIdentity,
+    _MatrixInvert,
+    _MatrixLookAt,
+    _MatrixMultiply,
+    _MatrixOrtho,
+    _MatrixPerspective,
+    _MatrixRotate,
+    _MatrixRotateX,
+    _MatrixRotateXYZ,
+    _MatrixRotateY,
+    _MatrixRotateZ,
+    _MatrixRotateZYX,
+    _MatrixScale,
+    _MatrixSubtract,
+    _MatrixToFloatV,
+    _MatrixTrace,
+    _MatrixTranslate,
+    _MatrixTranspose,
+    _Normalize,
+    _QuaternionAdd,
+    _QuaternionAddValue,
+    _QuaternionDivide,
+    _QuaternionEquals,
+    _QuaternionFromAxisAngle,
+    _QuaternionFromEuler,
+    _QuaternionFromMatrix,
+    _QuaternionFromVector3ToVector3,
+    _QuaternionIdentity,
+    _QuaternionInvert,
+    _QuaternionLength,
+    _QuaternionLerp,
+    _QuaternionMultiply,
+    _QuaternionNlerp,
+    _QuaternionNormalize,
+    _QuaternionScale,
+    _QuaternionSlerp,
+    _QuaternionSubtract,
+    _QuaternionSubtractValue,
+    _QuaternionToAxisAngle,
+    _QuaternionToEuler,
+    _QuaternionToMatrix,
+    _QuaternionTransform,
+    _Remap,
+    _SUBMODULE_EXPORTS,
+    _Vector2Add,
+    _Vector2AddValue,
+    _Vector2Angle,
+    _Vector2Clamp,
+    _Vector2ClampValue,
+    _Vector2Distance,
+    _Vector2DistanceSqr,
+    _Vector2Divide,
+    _Vector2DotProduct,
+    _Vector2Equals,
+    _Vector2Invert,
+    _Vector2Length,
+    _Vector2LengthSqr,
+    _Vector2Lerp,
+    _Vector2LineAngle,
+    _Vector2MoveTowards,
+    _Vector2Multiply,
+    _Vector2Negate,
+    _Vector2Normalize,
+    _Vector2One,
+    _Vector2Reflect,
+    _Vector2Rotate,
+    _Vector2Scale,
+    _Vector2Subtract,
+    _Vector2SubtractValue,
+    _Vector2Transform,
+    _Vector2Zero,
+    _Vector3Add,
+    _Vector3AddValue,
+    _Vector3Angle,
+    _Vector3Barycenter,
+    _Vector3Clamp,
+    _Vector3ClampValue,
+    _Vector3CrossProduct,
+    _Vector3Distance,
+    _Vector3DistanceSqr,
+    _Vector3Divide,
+    _Vector3DotProduct,
+    _Vector3Equals,
+    _Vector3Invert,
+    _Vector3Length,
+    _Vector3LengthSqr,
+    _Vector3Lerp,
+    _Vector3Max,
+    _Vector3Min,
+    _Vector3Multiply,
+    _Vector3Negate,
+    _Vector3Normalize,
+    _Vector3One,
+    _Vector3OrthoNormalize,
+    _Vector3Perpendicular,
+    _Vector3Project,
+    _Vector3Reflect,
+    _Vector3Refract,
+    _Vector3Reject,
+    _Vector3RotateByAxisAngle,
+    _Vector3RotateByQuaternion,
+    _Vector3Scale,
+    _Vector3Subtract,
+    _Vector3SubtractValue,
+    _Vector3ToFloatV,
+    _Vector3Transform,
+    _Vector3Unproject,
+    _Vector3Zero,
+    _Wrap,
+    _float,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['raymath'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def clamp(value, min_, max_):
+    # type: (float, float, float) -> float
+    return _Clamp(_float(value), _float(min_), _float(max_))
+
+
+def lerp(start, end, amount):
+    # type: (float, float, float) -> float
+    return _Lerp(_float(start), _float(end), _float(amount))
+
+
+def normalize(value, start, end):
+    # type: (float, float, float) -> float
+    return _Normalize(_float(value), _float(start), _float(end))
+
+
+def remap(value, input_start, input_end, output_start, output_end):
+    # type: (float, float, float, float, float) -> float
+    return _Remap(_float(value), _float(input_start), _float(input_end), _float(output_start), _float(output_end))
+
+
+def wrap(value, min_, max_):
+    # type: (float, float, float) -> float
+    return _Wrap(_float(value), _float(min_), _float(max_))
+
+
+def float_equals(x, y):
+    # type: (float, float) -> int
+    return _FloatEquals(_float(x), _float(y))
+
+
+def vector2_zero():
+    # type: () -> Vector2
+    return _Vector2Zero()
+
+
+def vector2_one():
+    # type: () -> Vector2
+    return _Vector2One()
+
+
+def vector2_add(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _Vector2Add(v1, v2)
+
+
+def vector2_add_value(v, add):
+    # type: (Vector2, float) -> Vector2
+    return _Vector2AddValue(v, _float(add))
+
+
+def vector2_subtract(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _Vector2Subtract(v1, v2)
+
+
+def vector2_subtract_value(v, sub):
+    # type: (Vector2, float) -> Vector2
+    return _Vector2SubtractValue(v, _float(sub))
+
+
+def vector2_length(v):
+    # type: (Vector2) -> float
+    return _Vector2Length(v)
+
+
+def vector2_length_sqr(v):
+    # type: (Vector2) -> float
+    return _Vector2LengthSqr(v)
+
+
+def vector2_dot_product(v1, v2):
+    # type: (Vector2, Vector2) -> float
+    return _Vector2DotProduct(v1, v2)
+
+
+def vector2_distance(v1, v2):
+    # type: (Vector2, Vector2) -> float
+    return _Vector2Distance(v1, v2)
+
+
+def vector2_distance_sqr(v1, v2):
+    # type: (Vector2, Vector2) -> float
+    return _Vector2DistanceSqr(v1, v2)
+
+
+def vector2_angle(v1, v2):
+    # type: (Vector2, Vector2) -> float
+    return _Vector2Angle(v1, v2)
+
+
+def vector2_line_angle(start, end):
+    # type: (Vector2, Vector2) -> float
+    return _Vector2LineAngle(start, end)
+
+
+def vector2_scale(v, scale):
+    # type: (Vector2, float) -> Vector2
+    return _Vector2Scale(v, _float(scale))
+
+
+def vector2_multiply(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _Vector2Multiply(v1, v2)
+
+
+def vector2_negate(v):
+    # type: (Vector2) -> Vector2
+    return _Vector2Negate(v)
+
+
+def vector2_divide(v1, v2):
+    # type: (Vector2, Vector2) -> Vector2
+    return _Vector2Divide(v1, v2)
+
+
+def vector2_normalize(v):
+    # type: (Vector2) -> Vector2
+    return _Vector2Normalize(v)
+
+
+def vector2_transform(v, mat):
+    # type: (Vector2, Matrix) -> Vector2
+    return _Vector2Transform(v, mat)
+
+
+def vector2_lerp(v1, v2, amount):
+    # type: (Vector2, Vector2, float) -> Vector2
+    return _Vector2Lerp(v1, v2, _float(amount))
+
+
+def vector2_reflect(v, normal):
+    # type: (Vector2, Vector2) -> Vector2
+    return _Vector2Reflect(v, normal)
+
+
+def vector2_rotate(v, angle):
+    # type: (Vector2, float) -> Vector2
+    return _Vector2Rotate(v, _float(angle))
+
+
+def vector2_move_towards(v, target, max_distance):
+    # type: (Vector2, Vector2, float) -> Vector2
+    return _Vector2MoveTowards(v, target, _float(max_distance))
+
+
+def vector2_invert(v):
+    # type: (Vector2) -> Vector2
+    return _Vector2Invert(v)
+
+
+def vector2_clamp(v, min_, max_):
+    # type: (Vector2, Vector2, Vector2) -> Vector2
+    return _Vector2Clamp(v, min_, max_)
+
+
+def vector2_clamp_value(v, min_, max_):
+    # type: (Vector2, float, float) -> Vector2
+    return _Vector2ClampValue(v, _float(min_), _float(max_))
+
+
+def vector2_equals(p, q):
+    # type: (Vector2, Vector2) -> int
+    return _Vector2Equals(p, q)
+
+
+def vector3_zero():
+    # type: () -> Vector3
+    return _Vector3Zero()
+
+
+def vector3_one():
+    # type: () -> Vector3
+    return _Vector3One()
+
+
+def vector3_add(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Add(v1, v2)
+
+
+def vector3_add_value(v, add):
+    # type: (Vector3, float) -> Vector3
+    return _Vector3AddValue(v, _float(add))
+
+
+def vector3_subtract(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Subtract(v1, v2)
+
+
+def vector3_subtract_value(v, sub):
+    # type: (Vector3, float) -> Vector3
+    return _Vector3SubtractValue(v, _float(sub))
+
+
+def vector3_scale(v, scalar):
+    # type: (Vector3, float) -> Vector3
+    return _Vector3Scale(v, _float(scalar))
+
+
+def vector3_multiply(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Multiply(v1, v2)
+
+
+def vector3_cross_product(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3CrossProduct(v1, v2)
+
+
+def vector3_perpendicular(v):
+    # type: (Vector3) -> Vector3
+    return _Vector3Perpendicular(v)
+
+
+def vector3_length(v):
+    # type: (Vector3) -> float
+    return _Vector3Length(v)
+
+
+def vector3_length_sqr(v):
+    # type: (Vector3) -> float
+    return _Vector3LengthSqr(v)
+
+
+def vector3_dot_product(v1, v2):
+    # type: (Vector3, Vector3) -> float
+    return _Vector3DotProduct(v1, v2)
+
+
+def vector3_distance(v1, v2):
+    # type: (Vector3, Vector3) -> float
+    return _Vector3Distance(v1, v2)
+
+
+def vector3_distance_sqr(v1, v2):
+    # type: (Vector3, Vector3) -> float
+    return _Vector3DistanceSqr(v1, v2)
+
+
+def vector3_angle(v1, v2):
+    # type: (Vector3, Vector3) -> float
+    return _Vector3Angle(v1, v2)
+
+
+def vector3_negate(v):
+    # type: (Vector3) -> Vector3
+    return _Vector3Negate(v)
+
+
+def vector3_divide(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Divide(v1, v2)
+
+
+def vector3_normalize(v):
+    # type: (Vector3) -> Vector3
+    return _Vector3Normalize(v)
+
+
+def vector3_project(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Project(v1, v2)
+
+
+def vector3_reject(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Reject(v1, v2)
+
+
+def vector3_ortho_normalize(v1, v2):
+    # type: (Vector3Ptr, Vector3Ptr) -> None
+    _Vector3OrthoNormalize(v1, v2)
+
+
+def vector3_transform(v, mat):
+    # type: (Vector3, Matrix) -> Vector3
+    return _Vector3Transform(v, mat)
+
+
+def vector3_rotate_by_quaternion(v, q):
+    # type: (Vector3, Quaternion) -> Vector3
+    return _Vector3RotateByQuaternion(v, q)
+
+
+def vector3_rotate_by_axis_angle(v, axis, angle):
+    # type: (Vector3, Vector3, float) -> Vector3
+    return _Vector3RotateByAxisAngle(v, axis, _float(angle))
+
+
+def vector3_lerp(v1, v2, amount):
+    # type: (Vector3, Vector3, float) -> Vector3
+    return _Vector3Lerp(v1, v2, _float(amount))
+
+
+def vector3_reflect(v, normal):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Reflect(v, normal)
+
+
+def vector3_min(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Min(v1, v2)
+
+
+def vector3_max(v1, v2):
+    # type: (Vector3, Vector3) -> Vector3
+    return _Vector3Max(v1, v2)
+
+
+def vector3_barycenter(p, a, b, c):
+    # type: (Vector3, Vector3, Vector3, Vector3) -> Vector3
+    return _Vector3Barycenter(p, a, b, c)
+
+
+def vector3_unproject(source, projection, view):
+    # type: (Vector3, Matrix, Matrix) -> Vector3
+    return _Vector3Unproject(source, projection, view)
+
+
+def vector3_to_float_v(v):
+    # type: (Vector3) -> float3
+    return _Vector3ToFloatV(v)
+
+
+def vector3_invert(v):
+    # type: (Vector3) -> Vector3
+    return _Vector3Invert(v)
+
+
+def vector3_clamp(v, min_, max_):
+    # type: (Vector3, Vector3, Vector3) -> Vector3
+    return _Vector3Clamp(v, min_, max_)
+
+
+def vector3_clamp_value(v, min_, max_):
+    # type: (Vector3, float, float) -> Vector3
+    return _Vector3ClampValue(v, _float(min_), _float(max_))
+
+
+def vector3_equals(p, q):
+    # type: (Vector3, Vector3) -> int
+    return _Vector3Equals(p, q)
+
+
+def vector3_refract(v, n, r):
+    # type: (Vector3, Vector3, float) -> Vector3
+    return _Vector3Refract(v, n, _float(r))
+
+
+def matrix_determinant(mat):
+    # type: (Matrix) -> float
+    return _MatrixDeterminant(mat)
+
+
+def matrix_trace(mat):
+    # type: (Matrix) -> float
+    return _MatrixTrace(mat)
+
+
+def matrix_transpose(mat):
+    # type: (Matrix) -> Matrix
+    return _MatrixTranspose(mat)
+
+
+def matrix_invert(mat):
+    # type: (Matrix) -> Matrix
+    return _MatrixInvert(mat)
+
+
+def matrix_identity():
+    # type: () -> Matrix
+    return _MatrixIdentity()
+
+
+def matrix_add(left, right):
+    # type: (Matrix, Matrix) -> Matrix
+    return _MatrixAdd(left, right)
+
+
+def matrix_subtract(left, right):
+    # type: (Matrix, Matrix) -> Matrix
+    return _MatrixSubtract(left, right)
+
+
+def matrix_multiply(left, right):
+    # type: (Matrix, Matrix) -> Matrix
+    return _MatrixMultiply(left, right)
+
+
+def matrix_translate(x, y, z):
+    # type: (float, float, float) -> Matrix
+    return _MatrixTranslate(_float(x), _float(y), _float(z))
+
+
+def matrix_rotate(axis, angle):
+    # type: (Vector3, float) -> Matrix
+    return _MatrixRotate(axis, _float(angle))
+
+
+def matrix_rotate_x(angle):
+    # type: (float) -> Matrix
+    return _MatrixRotateX(_float(angle))
+
+
+def matrix_rotate_y(angle):
+    # type: (float) -> Matrix
+    return _MatrixRotateY(_float(angle))
+
+
+def matrix_rotate_z(angle):
+    # type: (float) -> Matrix
+    return _MatrixRotateZ(_float(angle))
+
+
+def matrix_rotate_xyz(angle):
+    # type: (Vector3) -> Matrix
+    return _MatrixRotateXYZ(angle)
+
+
+def matrix_rotate_zyx(angle):
+    # type: (Vector3) -> Matrix
+    return _MatrixRotateZYX(angle)
+
+
+def matrix_scale(x, y, z):
+    # type: (float, float, float) -> Matrix
+    return _MatrixScale(_float(x), _float(y), _float(z))
+
+
+def matrix_frustum(left, right, bottom, top, near, far):
+    # type: (float, float, float, float, float, float) -> Matrix
+    return _MatrixFrustum(_float(left), _float(right), _float(bottom), _float(top), _float(near), _float(far))
+
+
+def matrix_perspective(fov_y, aspect, near_plane, far_plane):
+    # type: (float, float, float, float) -> Matrix
+    return _MatrixPerspective(_float(fov_y), _float(aspect), _float(near_plane), _float(far_plane))
+
+
+def matrix_ortho(left, right, bottom, top, near_plane, far_plane):
+    # type: (float, float, float, float, float, float) -> Matrix
+    return _MatrixOrtho(_float(left), _float(right), _float(bottom), _float(top), _float(near_plane), _float(far_plane))
+
+
+def matrix_look_at(eye, target, up):
+    # type: (Vector3, Vector3, Vector3) -> Matrix
+    return _MatrixLookAt(eye, target, up)
+
+
+def matrix_to_float_v(mat):
+    # type: (Matrix) -> float16
+    return _MatrixToFloatV(mat)
+
+
+def quaternion_add(q1, q2):
+    # type: (Quaternion, Quaternion) -> Quaternion
+    return _QuaternionAdd(q1, q2)
+
+
+def quaternion_add_value(q, add):
+    # type: (Quaternion, float) -> Quaternion
+    return _QuaternionAddValue(q, _float(add))
+
+
+def quaternion_subtract(q1, q2):
+    # type: (Quaternion, Quaternion) -> Quaternion
+    return _QuaternionSubtract(q1, q2)
+
+
+def quaternion_subtract_value(q, sub):
+    # type: (Quaternion, float) -> Quaternion
+    return _QuaternionSubtractValue(q, _float(sub))
+
+
+def quaternion_identity():
+    # type: () -> Quaternion
+    return _QuaternionIdentity()
+
+
+def quaternion_length(q):
+    # type: (Quaternion) -> float
+    return _QuaternionLength(q)
+
+
+def quaternion_normalize(q):
+    # type: (Quaternion) -> Quaternion
+    return _QuaternionNormalize(q)
+
+
+def quaternion_invert(q):
+    # type: (Quaternion) -> Quaternion
+    return _QuaternionInvert(q)
+
+
+def quaternion_multiply(q1, q2):
+    # type: (Quaternion, Quaternion) -> Quaternion
+    return _QuaternionMultiply(q1, q2)
+
+
+def quaternion_scale(q, mul):
+    # type: (Quaternion, float) -> Quaternion
+    return _QuaternionScale(q, _float(mul))
+
+
+def quaternion_divide(q1, q2):
+    # type: (Quaternion, Quaternion) -> Quaternion
+    return _QuaternionDivide(q1, q2)
+
+
+def quaternion_lerp(q1, q2, amount):
+    # type: (Quaternion, Quaternion, float) -> Quaternion
+    return _QuaternionLerp(q1, q2, _float(amount))
+
+
+def quaternion_nlerp(q1, q2, amount):
+    # type: (Quaternion, Quaternion, float) -> Quaternion
+    return _QuaternionNlerp(q1, q2, _float(amount))
+
+
+def quaternion_slerp(q1, q2, amount):
+    # type: (Quaternion, Quaternion, float) -> Quaternion
+    return _QuaternionSlerp(q1, q2, _float(amount))
+
+
+def quaternion_from_vector3_to_vector3(from_, to):
+    # type: (Vector3, Vector3) -> Quaternion
+    return _QuaternionFromVector3ToVector3(from_, to)
+
+
+def quaternion_from_matrix(mat):
+    # type: (Matrix) -> Quaternion
+    return _QuaternionFromMatrix(mat)
+
+
+def quaternion_to_matrix(q):
+    # type: (Quaternion) -> Matrix
+    return _QuaternionToMatrix(q)
+
+
+def quaternion_from_axis_angle(axis, angle):
+    # type: (Vector3, float) -> Quaternion
+    return _QuaternionFromAxisAngle(axis, _float(angle))
+
+
+def quaternion_to_axis_angle(q, out_axis, out_angle):
+    # type: (Quaternion, Vector3Ptr, FloatPtr) -> None
+    _QuaternionToAxisAngle(q, out_axis, out_angle)
+
+
+def quaternion_from_euler(pitch, yaw, roll):
+    # type: (float, float, float) -> Quaternion
+    return _QuaternionFromEuler(_float(pitch), _float(yaw), _float(roll))
+
+
+def quaternion_to_euler(q):
+    # type: (Quaternion) -> Vector3
+    return _QuaternionToEuler(q)
+
+
+def quaternion_transform(q, mat):
+    # type: (Quaternion, Matrix) -> Quaternion
+    return _QuaternionTransform(q, mat)
+
+
+def quaternion_equals(p, q):
+    # type: (Quaternion, Quaternion) -> int
+    return _QuaternionEquals(p, q)
@@ -0,0 +1,1039 @@
+# rlgl.py
+
+#   Functions of rlgl, raylib's OpenGL abstraction layer.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from . import (
+    _SUBMODULE_EXPORTS,
+    _bool,
+    _float,
+    _int,
+    _rlActiveDrawBuffers,
+    _rlActiveTextureSlot,
+    _rlBegin,
+    _rlBindImageTexture,
+    _rlBindShaderBuffer,
+    _rlBlitFramebuffer,
+    _rlCheckErrors,
+    _rlCheckRenderBatchLimit,
+    _rlClearColor,
+    _rlClearScreenBuffers,
+    _rlColor3f,
+    _rlColor4f,
+    _rlColor4ub,
+    _rlCompileShader,
+    _rlComputeShaderDispatch,
+    _rlCopyShaderBuffer,
+    _rlCubemapParameters,
+    _rlDisableBackfaceCulling,
+    _rlDisableColorBlend,
+    _rlDisableDepthMask,
+    _rlDisableDepthTest,
+    _rlDisableFramebuffer,
+    _rlDisableScissorTest,
+    _rlDisableShader,
+    _rlDisableSmoothLines,
+    _rlDisableStereoRender,
+    _rlDisableTexture,
+    _rlDisableTextureCubemap,
+    _rlDisableVertexArray,
+    _rlDisableVertexAttribute,
+    _rlDisableVertexBuffer,
+    _rlDisableVertexBufferElement,
+    _rlDisableWireMode,
+    _rlDrawRenderBatch,
+    _rlDrawRenderBatchActive,
+    _rlDrawVertexArray,
+    _rlDrawVertexArrayElements,
+    _rlDrawVertexArrayElementsInstanced,
+    _rlDrawVertexArrayInstanced,
+    _rlEnableBackfaceCulling,
+    _rlEnableColorBlend,
+    _rlEnableDepthMask,
+    _rlEnableDepthTest,
+    _rlEnableFramebuffer,
+    _rlEnablePointMode,
+    _rlEnableScissorTest,
+    _rlEnableShader,
+    _rlEnableSmoothLines,
+    _rlEnableStereoRender,
+    _rlEnableTexture,
+    _rlEnableTextureCubemap,
+    _rlEnableVertexArray,
+    _rlEnableVertexAttribute,
+    _rlEnableVertexBuffer,
+    _rlEnableVertexBufferElement,
+    _rlEnableWireMode,
+    _rlEnd,
+    _rlFramebufferAttach,
+    _rlFramebufferComplete,
+    _rlFrustum,
+    _rlGenTextureMipmaps,
+    _rlGetFramebufferHeight,
+    _rlGetFramebufferWidth,
+    _rlGetGlTextureFormats,
+    _rlGetLineWidth,
+    _rlGetLocationAttrib,
+    _rlGetLocationUniform,
+    _rlGetMatrixModelview,
+    _rlGetMatrixProjection,
+    _rlGetMatrixProjectionStereo,
+    _rlGetMatrixTransform,
+    _rlGetMatrixViewOffsetStereo,
+    _rlGetPixelFormatName,
+    _rlGetShaderBufferSize,
+    _rlGetShaderIdDefault,
+    _rlGetShaderLocsDefault,
+    _rlGetTextureIdDefault,
+    _rlGetVersion,
+    _rlIsStereoRenderEnabled,
+    _rlLoadComputeShaderProgram,
+    _rlLoadDrawCube,
+    _rlLoadDrawQuad,
+    _rlLoadExtensions,
+    _rlLoadFramebuffer,
+    _rlLoadIdentity,
+    _rlLoadRenderBatch,
+    _rlLoadShaderBuffer,
+    _rlLoadShaderCode,
+    _rlLoadShaderProgram,
+    _rlLoadTexture,
+    _rlLoadTextureCubemap,
+    _rlLoadTextureDepth,
+    _rlLoadVertexArray,
+    _rlLoadVertexBuffer,
+    _rlLoadVertexBufferElement,
+    _rlMatrixMode,
+    _rlMultMatrixf,
+    _rlNormal3f,
+    _rlOrtho,
+    _rlPopMatrix,
+    _rlPushMatrix,
+    _rlReadScreenPixels,
+    _rlReadShaderBuffer,
+    _rlReadTexturePixels,
+    _rlRotatef,
+    _rlScalef,
+    _rlScissor,
+    _rlSetBlendFactors,
+    _rlSetBlendFactorsSeparate,
+    _rlSetBlendMode,
+    _rlSetCullFace,
+    _rlSetFramebufferHeight,
+    _rlSetFramebufferWidth,
+    _rlSetLineWidth,
+    _rlSetMatrixModelview,
+    _rlSetMatrixProjection,
+    _rlSetMatrixProjectionStereo,
+    _rlSetMatrixViewOffsetStereo,
+    _rlSetRenderBatchActive,
+    _rlSetShader,
+    _rlSetTexture,
+    _rlSetUniform,
+    _rlSetUniformMatrix,
+    _rlSetUniformSampler,
+    _rlSetVertexAttribute,
+    _rlSetVertexAttributeDefault,
+    _rlSetVertexAttributeDivisor,
+    _rlTexCoord2f,
+    _rlTextureParameters,
+    _rlTranslatef,
+    _rlUnloadFramebuffer,
+    _rlUnloadRenderBatch,
+    _rlUnloadShaderBuffer,
+    _rlUnloadShaderProgram,
+    _rlUnloadTexture,
+    _rlUnloadVertexArray,
+    _rlUnloadVertexBuffer,
+    _rlUpdateShaderBuffer,
+    _rlUpdateTexture,
+    _rlUpdateVertexBuffer,
+    _rlUpdateVertexBufferElements,
+    _rlVertex2f,
+    _rlVertex2i,
+    _rlVertex3f,
+    _rlViewport,
+    _rlglClose,
+    _rlglInit,
+    _str_in,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['rlgl'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def rl_matrix_mode(mode):
+    # type: (int) -> None
+    """Choose the current matrix to be transformed"""
+    _rlMatrixMode(_int(mode))
+
+
+def rl_push_matrix():
+    # type: () -> None
+    """Push the current matrix to stack"""
+    _rlPushMatrix()
+
+
+def rl_pop_matrix():
+    # type: () -> None
+    """Pop latest inserted matrix from stack"""
+    _rlPopMatrix()
+
+
+def rl_load_identity():
+    # type: () -> None
+    """Reset current matrix to identity matrix"""
+    _rlLoadIdentity()
+
+
+def rl_translatef(x, y, z):
+    # type: (float, float, float) -> None
+    """Multiply the current matrix by a translation matrix"""
+    _rlTranslatef(_float(x), _float(y), _float(z))
+
+
+def rl_rotatef(angle, x, y, z):
+    # type: (float, float, float, float) -> None
+    """Multiply the current matrix by a rotation matrix"""
+    _rlRotatef(_float(angle), _float(x), _float(y), _float(z))
+
+
+def rl_scalef(x, y, z):
+    # type: (float, float, float) -> None
+    """Multiply the current matrix by a scaling matrix"""
+    _rlScalef(_float(x), _float(y), _float(z))
+
+
+def rl_mult_matrixf(matf):
+    # type: (FloatPtr) -> None
+    """Multiply the current matrix by another matrix"""
+    _rlMultMatrixf(matf)
+
+
+def rl_frustum(left, right, bottom, top, znear, zfar):
+    # type: (float, float, float, float, float, float) -> None
+    _rlFrustum(_float(left), _float(right), _float(bottom), _float(top), _float(znear), _float(zfar))
+
+
+def rl_ortho(left, right, bottom, top, znear, zfar):
+    # type: (float, float, float, float, float, float) -> None
+    _rlOrtho(_float(left), _float(right), _float(bottom), _float(top), _float(znear), _float(zfar))
+
+
+def rl_viewport(x, y, width, height):
+    # type: (int, int, int, int) -> None
+    """Set the viewport area"""
+    _rlViewport(_int(x), _int(y), _int(width), _int(height))
+
+
+def rl_begin(mode):
+    # type: (int) -> None
+    """Initialize drawing mode (how to organize vertex)"""
+    _rlBegin(_int(mode))
+
+
+def rl_end():
+    # type: () -> None
+    """Finish vertex providing"""
+    _rlEnd()
+
+
+def rl_vertex_2ii(x, y):
+    # type: (int, int) -> None
+    """Define one vertex (position) - 2 int"""
+    _rlVertex2i(_int(x), _int(y))
+
+
+def rl_vertex_2ff(x, y):
+    # type: (float, float) -> None
+    """Define one vertex (position) - 2 float"""
+    _rlVertex2f(_float(x), _float(y))
+
+
+def rl_vertex_3ff(x, y, z):
+    # type: (float, float, float) -> None
+    """Define one vertex (position) - 3 float"""
+    _rlVertex3f(_float(x), _float(y), _float(z))
+
+
+def rl_tex_coord_2ff(x, y):
+    # type: (float, float) -> None
+    """Define one vertex (texture coordinate) - 2 float"""
+    _rlTexCoord2f(_float(x), _float(y))
+
+
+def rl_normal_3ff(x, y, z):
+    # type: (float, float, float) -> None
+    """Define one vertex (normal) - 3 float"""
+    _rlNormal3f(_float(x), _float(y), _float(z))
+
+
+def rl_color_4_uub(r, g, b, a):
+    # type: (int, int, int, int) -> None
+    """Define one vertex (color) - 4 byte"""
+    _rlColor4ub(_int(r, (0, 255)), _int(g, (0, 255)), _int(b, (0, 255)), _int(a, (0, 255)))
+
+
+def rl_color_3ff(x, y, z):
+    # type: (float, float, float) -> None
+    """Define one vertex (color) - 3 float"""
+    _rlColor3f(_float(x), _float(y), _float(z))
+
+
+def rl_color_4ff(x, y, z, w):
+    # type: (float, float, float, float) -> None
+    """Define one vertex (color) - 4 float"""
+    _rlColor4f(_float(x), _float(y), _float(z), _float(w))
+
+
+def rl_enable_vertex_array(vao_id):
+    # type: (int) -> bool
+    """Enable vertex array (VAO, if supported)"""
+    return _rlEnableVertexArray(_int(vao_id))
+
+
+def rl_disable_vertex_array():
+    # type: () -> None
+    """Disable vertex array (VAO, if supported)"""
+    _rlDisableVertexArray()
+
+
+def rl_enable_vertex_buffer(id_):
+    # type: (int) -> None
+    """Enable vertex buffer (VBO)"""
+    _rlEnableVertexBuffer(_int(id_))
+
+
+def rl_disable_vertex_buffer():
+    # type: () -> None
+    """Disable vertex buffer (VBO)"""
+    _rlDisableVertexBuffer()
+
+
+def rl_enable_vertex_buffer_element(id_):
+    # type: (int) -> None
+    """Enable vertex buffer element (VBO element)"""
+    _rlEnableVertexBufferElement(_int(id_))
+
+
+def rl_disable_vertex_buffer_element():
+    # type: () -> None
+    """Disable vertex buffer element (VBO element)"""
+    _rlDisableVertexBufferElement()
+
+
+def rl_enable_vertex_attribute(index):
+    # type: (int) -> None
+    """Enable vertex attribute index"""
+    _rlEnableVertexAttribute(_int(index))
+
+
+def rl_disable_vertex_attribute(index):
+    # type: (int) -> None
+    """Disable vertex attribute index"""
+    _rlDisableVertexAttribute(_int(index))
+
+
+def rl_active_texture_slot(slot):
+    # type: (int) -> None
+    """Select and active a texture slot"""
+    _rlActiveTextureSlot(_int(slot))
+
+
+def rl_enable_texture(id_):
+    # type: (int) -> None
+    """Enable texture"""
+    _rlEnableTexture(_int(id_))
+
+
+def rl_disable_texture():
+    # type: () -> None
+    """Disable texture"""
+    _rlDisableTexture()
+
+
+def rl_enable_texture_cubemap(id_):
+    # type: (int) -> None
+    """Enable texture cubemap"""
+    _rlEnableTextureCubemap(_int(id_))
+
+
+def rl_disable_texture_cubemap():
+    # type: () -> None
+    """Disable texture cubemap"""
+    _rlDisableTextureCubemap()
+
+
+def rl_texture_parameters(id_, param, value):
+    # type: (int, int, int) -> None
+    """Set texture parameters (filter, wrap)"""
+    _rlTextureParameters(_int(id_), _int(param), _int(value))
+
+
+def rl_cubemap_parameters(id_, param, value):
+    # type: (int, int, int) -> None
+    """Set cubemap parameters (filter, wrap)"""
+    _rlCubemapParameters(_int(id_), _int(param), _int(value))
+
+
+def rl_enable_shader(id_):
+    # type: (int) -> None
+    """Enable shader program"""
+    _rlEnableShader(_int(id_))
+
+
+def rl_disable_shader():
+    # type: () -> None
+    """Disable shader program"""
+    _rlDisableShader()
+
+
+def rl_enable_framebuffer(id_):
+    # type: (int) -> None
+    """Enable render texture (fbo)"""
+    _rlEnableFramebuffer(_int(id_))
+
+
+def rl_disable_framebuffer():
+    # type: () -> None
+    """Disable render texture (fbo), return to default framebuffer"""
+    _rlDisableFramebuffer()
+
+
+def rl_active_draw_buffers(count):
+    # type: (int) -> None
+    """Activate multiple draw color buffers"""
+    _rlActiveDrawBuffers(_int(count))
+
+
+def rl_blit_framebuffer(src_x, src_y, src_width, src_height, dst_x, dst_y, dst_width, dst_height, buffer_mask):
+    # type: (int, int, int, int, int, int, int, int, int) -> None
+    """Blit active framebuffer to main framebuffer"""
+    _rlBlitFramebuffer(_int(src_x), _int(src_y), _int(src_width), _int(src_height), _int(dst_x), _int(dst_y), _int(dst_width), _int(dst_height), _int(buffer_mask))
+
+
+def rl_enable_color_blend():
+    # type: () -> None
+    """Enable color blending"""
+    _rlEnableColorBlend()
+
+
+def rl_disable_color_blend():
+    # type: () -> None
+    """Disable color blending"""
+    _rlDisableColorBlend()
+
+
+def rl_enable_depth_test():
+    # type: () -> None
+    """Enable depth test"""
+    _rlEnableDepthTest()
+
+
+def rl_disable_depth_test():
+    # type: () -> None
+    """Disable depth test"""
+    _rlDisableDepthTest()
+
+
+def rl_enable_depth_mask():
+    # type: () -> None
+    """Enable depth write"""
+    _rlEnableDepthMask()
+
+
+def rl_disable_depth_mask():
+    # type: () -> None
+    """Disable depth write"""
+    _rlDisableDepthMask()
+
+
+def rl_enable_backface_culling():
+    # type: () -> None
+    """Enable backface culling"""
+    _rlEnableBackfaceCulling()
+
+
+def rl_disable_backface_culling():
+    # type: () -> None
+    """Disable backface culling"""
+    _rlDisableBackfaceCulling()
+
+
+def rl_set_cull_face(mode):
+    # type: (int) -> None
+    """Set face culling mode"""
+    _rlSetCullFace(_int(mode))
+
+
+def rl_enable_scissor_test():
+    # type: () -> None
+    """Enable scissor test"""
+    _rlEnableScissorTest()
+
+
+def rl_disable_scissor_test():
+    # type: () -> None
+    """Disable scissor test"""
+    _rlDisableScissorTest()
+
+
+def rl_scissor(x, y, width, height):
+    # type: (int, int, int, int) -> None
+    """Scissor test"""
+    _rlScissor(_int(x), _int(y), _int(width), _int(height))
+
+
+def rl_enable_wire_mode():
+    # type: () -> None
+    """Enable wire mode"""
+    _rlEnableWireMode()
+
+
+def rl_enable_point_mode():
+    # type: () -> None
+    """Enable point mode"""
+    _rlEnablePointMode()
+
+
+def rl_disable_wire_mode():
+    # type: () -> None
+    """Disable wire mode ( and point ) maybe rename"""
+    _rlDisableWireMode()
+
+
+def rl_set_line_width(width):
+    # type: (float) -> None
+    """Set the line drawing width"""
+    _rlSetLineWidth(_float(width))
+
+
+def rl_get_line_width():
+    # type: () -> float
+    """Get the line drawing width"""
+    return _rlGetLineWidth()
+
+
+def rl_enable_smooth_lines():
+    # type: () -> None
+    """Enable line aliasing"""
+    _rlEnableSmoothLines()
+
+
+def rl_disable_smooth_lines():
+    # type: () -> None
+    """Disable line aliasing"""
+    _rlDisableSmoothLines()
+
+
+def rl_enable_stereo_render():
+    # type: () -> None
+    """Enable stereo rendering"""
+    _rlEnableStereoRender()
+
+
+def rl_disable_stereo_render():
+    # type: () -> None
+    """Disable stereo rendering"""
+    _rlDisableStereoRender()
+
+
+def rl_is_stereo_render_enabled():
+    # type: () -> bool
+    """Check if stereo render is enabled"""
+    return _rlIsStereoRenderEnabled()
+
+
+def rl_clear_color(r, g, b, a):
+    # type: (int, int, int, int) -> None
+    """Clear color buffer with color"""
+    _rlClearColor(_int(r, (0, 255)), _int(g, (0, 255)), _int(b, (0, 255)), _int(a, (0, 255)))
+
+
+def rl_clear_screen_buffers():
+    # type: () -> None
+    """Clear used screen buffers (color and depth)"""
+    _rlClearScreenBuffers()
+
+
+def rl_check_errors():
+    # type: () -> None
+    """Check and log OpenGL error codes"""
+    _rlCheckErrors()
+
+
+def rl_set_blend_mode(mode):
+    # type: (int) -> None
+    """Set blending mode"""
+    _rlSetBlendMode(_int(mode))
+
+
+def rl_set_blend_factors(gl_src_factor, gl_dst_factor, gl_equation):
+    # type: (int, int, int) -> None
+    """Set blending mode factor and equation (using OpenGL factors)"""
+    _rlSetBlendFactors(_int(gl_src_factor), _int(gl_dst_factor), _int(gl_equation))
+
+
+def rl_set_blend_factors_separate(gl_src_rgb, gl_dst_rgb, gl_src_alpha, gl_dst_alpha, gl_eq_rgb, gl_eq_alpha):
+    # type: (int, int, int, int, int, int) -> None
+    """Set blending mode factors and equations separately (using OpenGL factors)"""
+    _rlSetBlendFactorsSeparate(_int(gl_src_rgb), _int(gl_dst_rgb), _int(gl_src_alpha), _int(gl_dst_alpha), _int(gl_eq_rgb), _int(gl_eq_alpha))
+
+
+def rlgl_init(width, height):
+    # type: (int, int) -> None
+    """Initialize rlgl (buffers, shaders, textures, states)"""
+    _rlglInit(_int(width), _int(height))
+
+
+def rlgl_close():
+    # type: () -> None
+    """De-initialize rlgl (buffers, shaders, textures)"""
+    _rlglClose()
+
+
+def rl_load_extensions(loader):
+    # type: (bytes | str | None) -> None
+    """Load OpenGL extensions (loader function required)"""
+    _rlLoadExtensions(loader)
+
+
+def rl_get_version():
+    # type: () -> int
+    """Get current OpenGL version"""
+    return _rlGetVersion()
+
+
+def rl_set_framebuffer_width(width):
+    # type: (int) -> None
+    """Set current framebuffer width"""
+    _rlSetFramebufferWidth(_int(width))
+
+
+def rl_get_framebuffer_width():
+    # type: () -> int
+    """Get default framebuffer width"""
+    return _rlGetFramebufferWidth()
+
+
+def rl_set_framebuffer_height(height):
+    # type: (int) -> None
+    """Set current framebuffer height"""
+    _rlSetFramebufferHeight(_int(height))
+
+
+def rl_get_framebuffer_height():
+    # type: () -> int
+    """Get default framebuffer height"""
+    return _rlGetFramebufferHeight()
+
+
+def rl_get_texture_id_default():
+    # type: () -> int
+    """Get default texture id"""
+    return _rlGetTextureIdDefault()
+
+
+def rl_get_shader_id_default():
+    # type: () -> int
+    """Get default shader id"""
+    return _rlGetShaderIdDefault()
+
+
+def rl_get_shader_locs_default():
+    # type: () -> IntPtr
+    """Get default shader locations"""
+    return _rlGetShaderLocsDefault()
+
+
+def rl_load_render_batch(num_buffers, buffer_elements):
+    # type: (int, int) -> rlRenderBatch
+    """Load a render batch system"""
+    return _rlLoadRenderBatch(_int(num_buffers), _int(buffer_elements))
+
+
+def rl_unload_render_batch(batch):
+    # type: (rlRenderBatch) -> None
+    """Unload render batch system"""
+    _rlUnloadRenderBatch(batch)
+
+
+def rl_draw_render_batch(batch):
+    # type: (rlRenderBatchPtr) -> None
+    """Draw render batch data (Update->Draw->Reset)"""
+    _rlDrawRenderBatch(batch)
+
+
+def rl_set_render_batch_active(batch):
+    # type: (rlRenderBatchPtr) -> None
+    """Set the active render batch for rlgl (NULL for default internal)"""
+    _rlSetRenderBatchActive(batch)
+
+
+def rl_draw_render_batch_active():
+    # type: () -> None
+    """Update and draw internal render batch"""
+    _rlDrawRenderBatchActive()
+
+
+def rl_check_render_batch_limit(v_count):
+    # type: (int) -> bool
+    """Check internal buffer overflow for a given number of vertex"""
+    return _rlCheckRenderBatchLimit(_int(v_count))
+
+
+def rl_set_texture(id_):
+    # type: (int) -> None
+    """Set current texture for render batch and check buffers limits"""
+    _rlSetTexture(_int(id_))
+
+
+def rl_load_vertex_array():
+    # type: () -> int
+    """Load vertex array (vao) if supported"""
+    return _rlLoadVertexArray()
+
+
+def rl_load_vertex_buffer(buffer, size, dynamic):
+    # type: (bytes | str | None, int, bool) -> int
+    """Load a vertex buffer attribute"""
+    return _rlLoadVertexBuffer(buffer, _int(size), _bool(dynamic))
+
+
+def rl_load_vertex_buffer_element(buffer, size, dynamic):
+    # type: (bytes | str | None, int, bool) -> int
+    """Load a new attributes element buffer"""
+    return _rlLoadVertexBufferElement(buffer, _int(size), _bool(dynamic))
+
+
+def rl_update_vertex_buffer(buffer_id, data, data_size, offset):
+    # type: (int, bytes | str | None, int, int) -> None
+    """Update GPU buffer with new data"""
+    _rlUpdateVertexBuffer(_int(buffer_id), data, _int(data_size), _int(offset))
+
+
+def rl_update_vertex_buffer_elements(id_, data, data_size, offset):
+    # type: (int, bytes | str | None, int, int) -> None
+    """Update vertex buffer elements with new data"""
+    _rlUpdateVertexBufferElements(_int(id_), data, _int(data_size), _int(offset))
+
+
+def rl_unload_vertex_array(vao_id):
+    # type: (int) -> None
+    _rlUnloadVertexArray(_int(vao_id))
+
+
+def rl_unload_vertex_buffer(vbo_id):
+    # type: (int) -> None
+    _rlUnloadVertexBuffer(_int(vbo_id))
+
+
+def rl_set_vertex_attribute(index, comp_size, type_, normalized, stride, pointer):
+    # type: (int, int, int, bool, int, bytes | str | None) -> None
+    _rlSetVertexAttribute(_int(index), _int(comp_size), _int(type_), _bool(normalized), _int(stride), pointer)
+
+
+def rl_set_vertex_attribute_divisor(index, divisor):
+    # type: (int, int) -> None
+    _rlSetVertexAttributeDivisor(_int(index), _int(divisor))
+
+
+def rl_set_vertex_attribute_default(loc_index, value, attrib_type, count):
+    # type: (int, bytes | str | None, int, int) -> None
+    """Set vertex attribute default value"""
+    _rlSetVertexAttributeDefault(_int(loc_index), value, _int(attrib_type), _int(count))
+
+
+def rl_draw_vertex_array(offset, count):
+    # type: (int, int) -> None
+    _rlDrawVertexArray(_int(offset), _int(count))
+
+
+def rl_draw_vertex_array_elements(offset, count, buffer):
+    # type: (int, int, bytes | str | None) -> None
+    _rlDrawVertexArrayElements(_int(offset), _int(count), buffer)
+
+
+def rl_draw_vertex_array_instanced(offset, count, instances):
+    # type: (int, int, int) -> None
+    _rlDrawVertexArrayInstanced(_int(offset), _int(count), _int(instances))
+
+
+def rl_draw_vertex_array_elements_instanced(offset, count, buffer, instances):
+    # type: (int, int, bytes | str | None, int) -> None
+    _rlDrawVertexArrayElementsInstanced(_int(offset), _int(count), buffer, _int(instances))
+
+
+def rl_load_texture(data, width, height, format_, mipmap_count):
+    # type: (bytes | str | None, int, int, int, int) -> int
+    """Load texture in GPU"""
+    return _rlLoadTexture(data, _int(width), _int(height), _int(format_), _int(mipmap_count))
+
+
+def rl_load_texture_depth(width, height, use_render_buffer):
+    # type: (int, int, bool) -> int
+    """Load depth texture/renderbuffer (to be attached to fbo)"""
+    return _rlLoadTextureDepth(_int(width), _int(height), _bool(use_render_buffer))
+
+
+def rl_load_texture_cubemap(data, size, format_):
+    # type: (bytes | str | None, int, int) -> int
+    """Load texture cubemap"""
+    return _rlLoadTextureCubemap(data, _int(size), _int(format_))
+
+
+def rl_update_texture(id_, offset_x, offset_y, width, height, format_, data):
+    # type: (int, int, int, int, int, int, bytes | str | None) -> None
+    """Update GPU texture with new data"""
+    _rlUpdateTexture(_int(id_), _int(offset_x), _int(offset_y), _int(width), _int(height), _int(format_), data)
+
+
+def rl_get_gl_texture_formats(format_, gl_internal_format, gl_format, gl_type):
+    # type: (int, UIntPtr, UIntPtr, UIntPtr) -> None
+    """Get OpenGL internal formats"""
+    _rlGetGlTextureFormats(_int(format_), gl_internal_format, gl_format, gl_type)
+
+
+def rl_get_pixel_format_name(format_):
+    # type: (int) -> bytes | str | None
+    """Get name string for pixel format"""
+    return _rlGetPixelFormatName(_int(format_))
+
+
+def rl_unload_texture(id_):
+    # type: (int) -> None
+    """Unload texture from GPU memory"""
+    _rlUnloadTexture(_int(id_))
+
+
+def rl_gen_texture_mipmaps(id_, width, height, format_, mipmaps):
+    # type: (int, int, int, int, IntPtr) -> None
+    """Generate mipmap data for selected texture"""
+    _rlGenTextureMipmaps(_int(id_), _int(width), _int(height), _int(format_), mipmaps)
+
+
+def rl_read_texture_pixels(id_, width, height, format_):
+    # type: (int, int, int, int) -> bytes | str | None
+    """Read texture pixel data"""
+    return _rlReadTexturePixels(_int(id_), _int(width), _int(height), _int(format_))
+
+
+def rl_read_screen_pixels(width, height):
+    # type: (int, int) -> int
+    """Read screen pixel data (color buffer)"""
+    return _rlReadScreenPixels(_int(width), _int(height))
+
+
+def rl_load_framebuffer(width, height):
+    # type: (int, int) -> int
+    """Load an empty framebuffer"""
+    return _rlLoadFramebuffer(_int(width), _int(height))
+
+
+def rl_framebuffer_attach(fbo_id, tex_id, attach_type, tex_type, mip_level):
+    # type: (int, int, int, int, int) -> None
+    """Attach texture/renderbuffer to a framebuffer"""
+    _rlFramebufferAttach(_int(fbo_id), _int(tex_id), _int(attach_type), _int(tex_type), _int(mip_level))
+
+
+def rl_framebuffer_complete(id_):
+    # type: (int) -> bool
+    """Verify framebuffer is complete"""
+    return _rlFramebufferComplete(_int(id_))
+
+
+def rl_unload_framebuffer(id_):
+    # type: (int) -> None
+    """Delete framebuffer from GPU"""
+    _rlUnloadFramebuffer(_int(id_))
+
+
+def rl_load_shader_code(vs_code, fs_code):
+    # type: (bytes | str | None, bytes | str | None) -> int
+    """Load shader from code strings"""
+    return _rlLoadShaderCode(_str_in(vs_code), _str_in(fs_code))
+
+
+def rl_compile_shader(shader_code, type_):
+    # type: (bytes | str | None, int) -> int
+    """Compile custom shader and return shader id (type: RL_VERTEX_SHADER, RL_FRAGMENT_SHADER, RL_COMPUTE_SHADER)"""
+    return _rlCompileShader(_str_in(shader_code), _int(type_))
+
+
+def rl_load_shader_program(v_shader_id, f_shader_id):
+    # type: (int, int) -> int
+    """Load custom shader program"""
+    return _rlLoadShaderProgram(_int(v_shader_id), _int(f_shader_id))
+
+
+def rl_unload_shader_program(id_):
+    # type: (int) -> None
+    """Unload shader program"""
+    _rlUnloadShaderProgram(_int(id_))
+
+
+def rl_get_location_uniform(shader_id, uniform_name):
+    # type: (int, bytes | str | None) -> int
+    """Get shader location uniform"""
+    return _rlGetLocationUniform(_int(shader_id), _str_in(uniform_name))
+
+
+def rl_get_location_attrib(shader_id, attrib_name):
+    # type: (int, bytes | str | None) -> int
+    """Get shader location attribute"""
+    return _rlGetLocationAttrib(_int(shader_id), _str_in(attrib_name))
+
+
+def rl_set_uniform(loc_index, value, uniform_type, count):
+    # type: (int, bytes | str | None, int, int) -> None
+    """Set shader value uniform"""
+    _rlSetUniform(_int(loc_index), value, _int(uniform_type), _int(count))
+
+
+def rl_set_uniform_matrix(loc_index, mat):
+    # type: (int, Matrix) -> None
+    """Set shader value matrix"""
+    _rlSetUniformMatrix(_int(loc_index), mat)
+
+
+def rl_set_uniform_sampler(loc_index, texture_id):
+    # type: (int, int) -> None
+    """Set shader value sampler"""
+    _rlSetUniformSampler(_int(loc_index), _int(texture_id))
+
+
+def rl_set_shader(id_, locs):
+    # type: (int, IntPtr) -> None
+    """Set shader currently active (id and locations)"""
+    _rlSetShader(_int(id_), locs)
+
+
+def rl_load_compute_shader_program(shader_id):
+    # type: (int) -> int
+    """Load compute shader program"""
+    return _rlLoadComputeShaderProgram(_int(shader_id))
+
+
+def rl_compute_shader_dispatch(group_x, group_y, group_z):
+    # type: (int, int, int) -> None
+    """Dispatch compute shader (equivalent to *draw* for graphics pipeline)"""
+    _rlComputeShaderDispatch(_int(group_x), _int(group_y), _int(group_z))
+
+
+def rl_load_shader_buffer(size, data, usage_hint):
+    # type: (int, bytes | str | None, int) -> int
+    """Load shader storage buffer object (SSBO)"""
+    return _rlLoadShaderBuffer(_int(size), data, _int(usage_hint))
+
+
+def rl_unload_shader_buffer(ssbo_id):
+    # type: (int) -> None
+    """Unload shader storage buffer object (SSBO)"""
+    _rlUnloadShaderBuffer(_int(ssbo_id))
+
+
+def rl_update_shader_buffer(id_, data, data_size, offset):
+    # type: (int, bytes | str | None, int, int) -> None
+    """Update SSBO buffer data"""
+    _rlUpdateShaderBuffer(_int(id_), data, _int(data_size), _int(offset))
+
+
+def rl_bind_shader_buffer(id_, index):
+    # type: (int, int) -> None
+    """Bind SSBO buffer"""
+    _rlBindShaderBuffer(_int(id_), _int(index))
+
+
+def rl_read_shader_buffer(id_, dest, count, offset):
+    # type: (int, bytes | str | None, int, int) -> None
+    """Read SSBO buffer data (GPU->CPU)"""
+    _rlReadShaderBuffer(_int(id_), dest, _int(count), _int(offset))
+
+
+def rl_copy_shader_buffer(dest_id, src_id, dest_offset, src_offset, count):
+    # type: (int, int, int, int, int) -> None
+    """Copy SSBO data between buffers"""
+    _rlCopyShaderBuffer(_int(dest_id), _int(src_id), _int(dest_offset), _int(src_offset), _int(count))
+
+
+def rl_get_shader_buffer_size(id_):
+    # type: (int) -> int
+    """Get SSBO buffer size"""
+    return _rlGetShaderBufferSize(_int(id_))
+
+
+def rl_bind_image_texture(id_, index, format_, readonly):
+    # type: (int, int, int, bool) -> None
+    """Bind image texture"""
+    _rlBindImageTexture(_int(id_), _int(index), _int(format_), _bool(readonly))
+
+
+def rl_get_matrix_modelview():
+    # type: () -> Matrix
+    """Get internal modelview matrix"""
+    return _rlGetMatrixModelview()
+
+
+def rl_get_matrix_projection():
+    # type: () -> Matrix
+    """Get internal projection matrix"""
+    return _rlGetMatrixProjection()
+
+
+def rl_get_matrix_transform():
+    # type: () -> Matrix
+    """Get internal accumulated transform matrix"""
+    return _rlGetMatrixTransform()
+
+
+def rl_get_matrix_projection_stereo(eye):
+    # type: (int) -> Matrix
+    """Get internal projection matrix for stereo render (selected eye)"""
+    return _rlGetMatrixProjectionStereo(_int(eye))
+
+
+def rl_get_matrix_view_offset_stereo(eye):
+    # type: (int) -> Matrix
+    """Get internal view offset matrix for stereo render (selected eye)"""
+    return _rlGetMatrixViewOffsetStereo(_int(eye))
+
+
+def rl_set_matrix_projection(proj):
+    # type: (Matrix) -> None
+    """Set a custom projection matrix (replaces internal projection matrix)"""
+    _rlSetMatrixProjection(proj)
+
+
+def rl_set_matrix_modelview(view):
+    # type: (Matrix) -> None
+    """Set a custom modelview matrix (replaces internal modelview matrix)"""
+    _rlSetMatrixModelview(view)
+
+
+def rl_set_matrix_projection_stereo(right, left):
+    # type: (Matrix, Matrix) -> None
+    """Set eyes projection matrices for stereo rendering"""
+    _rlSetMatrixProjectionStereo(right, left)
+
+
+def rl_set_matrix_view_offset_stereo(right, left):
+    # type: (Matrix, Matrix) -> None
+    """Set eyes view offsets matrices for stereo rendering"""
+    _rlSetMatrixViewOffsetStereo(right, left)
+
+
+def rl_load_draw_cube():
+    # type: () -> None
+    """Load and draw a cube"""
+    _rlLoadDrawCube()
+
+
+def rl_load_draw_quad():
+    # type: () -> None
+    """Load and draw a quad"""
+    _rlLoadDrawQuad()
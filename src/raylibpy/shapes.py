@@ -0,0 +1,458 @@
+# shapes.py
+
+#   Functions of raylib's shapes module (rshapes): basic 2D shapes, splines and
+#   2D collision checks.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from . import (
+    _CheckCollisionCircleRec,
+    _CheckCollisionCircles,
+    _CheckCollisionLines,
+    _CheckCollisionPointCircle,
+    _CheckCollisionPointLine,
+    _CheckCollisionPointPoly,
+    _CheckCollisionPointRec,
+    _CheckCollisionPointTriangle,
+    _CheckCollisionRecs,
+    _DrawCircle,
+    _DrawCircleGradient,
+    _DrawCircleLines,
+    _DrawCircleLinesV,
+    _DrawCircleSector,
+    _DrawCircleSectorLines,
+    _DrawCircleV,
+    _DrawEllipse,
+    _DrawEllipseLines,
+    _DrawLine,
+    _DrawLineBezier,
+    _DrawLineEx,
+    _DrawLineStrip,
+    _DrawLineV,
+    _DrawPixel,
+    _DrawPixelV,
+    _DrawPoly,
+    _DrawPolyLines,
+    _DrawPolyLinesEx,
+    _DrawRectangle,
+    _DrawRectangleGradientEx,
+    _DrawRectangleGradientH,
+    _DrawRectangleGradientV,
+    _DrawRectangleLines,
+    _DrawRectangleLinesEx,
+    _DrawRectanglePro,
+    _DrawRectangleRec,
+    _DrawRectangleRounded,
+    _DrawRectangleRoundedLines,
+    _DrawRectangleV,
+    _DrawRing,
+    _DrawRingLines,
+    _DrawSplineBasis,
+    _DrawSplineBezierCubic,
+    _DrawSplineBezierQuadratic,
+    _DrawSplineCatmullRom,
+    _DrawSplineLinear,
+    _DrawSplineSegmentBasis,
+    _DrawSplineSegmentBezierCubic,
+    _DrawSplineSegmentBezierQuadratic,
+    _DrawSplineSegmentCatmullRom,
+    _DrawSplineSegmentLinear,
+    _DrawTriangle,
+    _DrawTriangleFan,
+    _DrawTriangleLines,
+    _DrawTriangleStrip,
+    _GetCollisionRec,
+    _GetSplinePointBasis,
+    _GetSplinePointBezierCubic,
+    _GetSplinePointBezierQuad,
+    _GetSplinePointCatmullRom,
+    _GetSplinePointLinear,
+    _SUBMODULE_EXPORTS,
+    _SetShapesTexture,
+    _color,
+    _float,
+    _int,
+    _rect,
+    _symbol_namespaces,
+    _vec2,
+    _vec2_array,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['shapes'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def set_shapes_texture(texture, source):
+    # type: (Texture2D, Rectangle) -> None
+    """Set texture and rectangle to be used on shapes drawing"""
+    _SetShapesTexture(texture, _rect(source))
+
+
+def draw_pixel(pos_x, pos_y, color):
+    # type: (int, int, Color) -> None
+    """Draw a pixel"""
+    _DrawPixel(_int(pos_x), _int(pos_y), _color(color))
+
+
+def draw_pixel_v(position, color):
+    # type: (Vector2, Color) -> None
+    """Draw a pixel (Vector version)"""
+    _DrawPixelV(_vec2(position), _color(color))
+
+
+def draw_line(start_pos_x, start_pos_y, end_pos_x, end_pos_y, color):
+    # type: (int, int, int, int, Color) -> None
+    """Draw a line"""
+    _DrawLine(_int(start_pos_x), _int(start_pos_y), _int(end_pos_x), _int(end_pos_y), _color(color))
+
+
+def draw_line_v(start_pos, end_pos, color):
+    # type: (Vector2, Vector2, Color) -> None
+    """Draw a line (using gl lines)"""
+    _DrawLineV(_vec2(start_pos), _vec2(end_pos), _color(color))
+
+
+def draw_line_ex(start_pos, end_pos, thick, color):
+    # type: (Vector2, Vector2, float, Color) -> None
+    """Draw a line (using triangles/quads)"""
+    _DrawLineEx(_vec2(start_pos), _vec2(end_pos), _float(thick), _color(color))
+
+
+def draw_line_strip(points, point_count, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, Color) -> None
+    """Draw lines sequence (using gl lines)"""
+    _DrawLineStrip(_vec2_array(points), _int(point_count), _color(color))
+
+
+def draw_line_bezier(start_pos, end_pos, thick, color):
+    # type: (Vector2, Vector2, float, Color) -> None
+    """Draw line segment cubic-bezier in-out interpolation"""
+    _DrawLineBezier(_vec2(start_pos), _vec2(end_pos), _float(thick), _color(color))
+
+
+def draw_circle(center_x, center_y, radius, color):
+    # type: (int, int, float, Color) -> None
+    """Draw a color-filled circle"""
+    _DrawCircle(_int(center_x), _int(center_y), _float(radius), _color(color))
+
+
+def draw_circle_sector(center, radius, start_angle, end_angle, segments, color):
+    # type: (Vector2, float, float, float, int, Color) -> None
+    """Draw a piece of a circle"""
+    _DrawCircleSector(_vec2(center), _float(radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
+
+
+def draw_circle_sector_lines(center, radius, start_angle, end_angle, segments, color):
+    # type: (Vector2, float, float, float, int, Color) -> None
+    """Draw circle sector outline"""
+    _DrawCircleSectorLines(_vec2(center), _float(radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
+
+
+def draw_circle_gradient(center_x, center_y, radius, color1, color2):
+    # type: (int, int, float, Color, Color) -> None
+    """Draw a gradient-filled circle"""
+    _DrawCircleGradient(_int(center_x), _int(center_y), _float(radius), _color(color1), _color(color2))
+
+
+def draw_circle_v(center, radius, color):
+    # type: (Vector2, float, Color) -> None
+    """Draw a color-filled circle (Vector version)"""
+    _DrawCircleV(_vec2(center), _float(radius), _color(color))
+
+
+def draw_circle_lines(center_x, center_y, radius, color):
+    # type: (int, int, float, Color) -> None
+    """Draw circle outline"""
+    _DrawCircleLines(_int(center_x), _int(center_y), _float(radius), _color(color))
+
+
+def draw_circle_lines_v(center, radius, color):
+    # type: (Vector2, float, Color) -> None
+    """Draw circle outline (Vector version)"""
+    _DrawCircleLinesV(_vec2(center), _float(radius), _color(color))
+
+
+def draw_ellipse(center_x, center_y, radius_h, radius_v, color):
+    # type: (int, int, float, float, Color) -> None
+    """Draw ellipse"""
+    _DrawEllipse(_int(center_x), _int(center_y), _float(radius_h), _float(radius_v), _color(color))
+
+
+def draw_ellipse_lines(center_x, center_y, radius_h, radius_v, color):
+    # type: (int, int, float, float, Color) -> None
+    """Draw ellipse outline"""
+    _DrawEllipseLines(_int(center_x), _int(center_y), _float(radius_h), _float(radius_v), _color(color))
+
+
+def draw_ring(center, inner_radius, outer_radius, start_angle, end_angle, segments, color):
+    # type: (Vector2, float, float, float, float, int, Color) -> None
+    """Draw ring"""
+    _DrawRing(_vec2(center), _float(inner_radius), _float(outer_radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
+
+
+def draw_ring_lines(center, inner_radius, outer_radius, start_angle, end_angle, segments, color):
+    # type: (Vector2, float, float, float, float, int, Color) -> None
+    """Draw ring outline"""
+    _DrawRingLines(_vec2(center), _float(inner_radius), _float(outer_radius), _float(start_angle), _float(end_angle), _int(segments), _color(color))
+
+
+def draw_rectangle(pos_x, pos_y, width, height, color):
+    # type: (int, int, int, int, Color) -> None
+    """Draw a color-filled rectangle"""
+    _DrawRectangle(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color))
+
+
+def draw_rectangle_v(position, size, color):
+    # type: (Vector2, Vector2, Color) -> None
+    """Draw a color-filled rectangle (Vector version)"""
+    _DrawRectangleV(_vec2(position), _vec2(size), _color(color))
+
+
+def draw_rectangle_rec(rec, color):
+    # type: (Rectangle, Color) -> None
+    """Draw a color-filled rectangle"""
+    _DrawRectangleRec(_rect(rec), _color(color))
+
+
+def draw_rectangle_pro(rec, origin, rotation, color):
+    # type: (Rectangle, Vector2, float, Color) -> None
+    """Draw a color-filled rectangle with pro parameters"""
+    _DrawRectanglePro(_rect(rec), _vec2(origin), _float(rotation), _color(color))
+
+
+def draw_rectangle_gradient_v(pos_x, pos_y, width, height, color1, color2):
+    # type: (int, int, int, int, Color, Color) -> None
+    """Draw a vertical-gradient-filled rectangle"""
+    _DrawRectangleGradientV(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color1), _color(color2))
+
+
+def draw_rectangle_gradient_h(pos_x, pos_y, width, height, color1, color2):
+    # type: (int, int, int, int, Color, Color) -> None
+    """Draw a horizontal-gradient-filled rectangle"""
+    _DrawRectangleGradientH(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color1), _color(color2))
+
+
+def draw_rectangle_gradient_ex(rec, col1, col2, col3, col4):
+    # type: (Rectangle, Color, Color, Color, Color) -> None
+    """Draw a gradient-filled rectangle with custom vertex colors"""
+    _DrawRectangleGradientEx(_rect(rec), _color(col1), _color(col2), _color(col3), _color(col4))
+
+
+def draw_rectangle_lines(pos_x, pos_y, width, height, color):
+    # type: (int, int, int, int, Color) -> None
+    """Draw rectangle outline"""
+    _DrawRectangleLines(_int(pos_x), _int(pos_y), _int(width), _int(height), _color(color))
+
+
+def draw_rectangle_lines_ex(rec, line_thick, color):
+    # type: (Rectangle, float, Color) -> None
+    """Draw rectangle outline with extended parameters"""
+    _DrawRectangleLinesEx(_rect(rec), _float(line_thick), _color(color))
+
+
+def draw_rectangle_rounded(rec, roundness, segments, color):
+    # type: (Rectangle, float, int, Color) -> None
+    """Draw rectangle with rounded edges"""
+    _DrawRectangleRounded(_rect(rec), _float(roundness), _int(segments), _color(color))
+
+
+def draw_rectangle_rounded_lines(rec, roundness, segments, line_thick, color):
+    # type: (Rectangle, float, int, float, Color) -> None
+    """Draw rectangle with rounded edges outline"""
+    _DrawRectangleRoundedLines(_rect(rec), _float(roundness), _int(segments), _float(line_thick), _color(color))
+
+
+def draw_triangle(v1, v2, v3, color):
+    # type: (Vector2, Vector2, Vector2, Color) -> None
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    _DrawTriangle(_vec2(v1), _vec2(v2), _vec2(v3), _color(color))
+
+
+def draw_triangle_lines(v1, v2, v3, color):
+    # type: (Vector2, Vector2, Vector2, Color) -> None
+    """Draw triangle outline (vertex in counter-clockwise order!)"""
+    _DrawTriangleLines(_vec2(v1), _vec2(v2), _vec2(v3), _color(color))
+
+
+def draw_triangle_fan(points, point_count, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, Color) -> None
+    """Draw a triangle fan defined by points (first vertex is the center)"""
+    _DrawTriangleFan(_vec2_array(points), _int(point_count), _color(color))
+
+
+def draw_triangle_strip(points, point_count, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, Color) -> None
+    """Draw a triangle strip defined by points"""
+    point_count = len(points) if point_count <= 0 else point_count
+    _DrawTriangleStrip(_vec2_array(points), _int(point_count), _color(color))
+
+
+def draw_poly(center, sides, radius, rotation, color):
+    # type: (Vector2, int, float, float, Color) -> None
+    """Draw a regular polygon (Vector version)"""
+    _DrawPoly(_vec2(center), _int(sides), _float(radius), _float(rotation), _color(color))
+
+
+def draw_poly_lines(center, sides, radius, rotation, color):
+    # type: (Vector2, int, float, float, Color) -> None
+    """Draw a polygon outline of n sides"""
+    _DrawPolyLines(_vec2(center), _int(sides), _float(radius), _float(rotation), _color(color))
+
+
+def draw_poly_lines_ex(center, sides, radius, rotation, line_thick, color):
+    # type: (Vector2, int, float, float, float, Color) -> None
+    """Draw a polygon outline of n sides with extended parameters"""
+    _DrawPolyLinesEx(_vec2(center), _int(sides), _float(radius), _float(rotation), _float(line_thick), _color(color))
+
+
+def draw_spline_linear(points, point_count, thick, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, float, Color) -> None
+    """Draw spline: Linear, minimum 2 points"""
+    _DrawSplineLinear(_vec2_array(points), _int(point_count), _float(thick), _color(color))
+
+
+def draw_spline_basis(points, point_count, thick, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, float, Color) -> None
+    """Draw spline: B-Spline, minimum 4 points"""
+    _DrawSplineBasis(_vec2_array(points), _int(point_count), _float(thick), _color(color))
+
+
+def draw_spline_catmull_rom(points, point_count, thick, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, float, Color) -> None
+    """Draw spline: Catmull-Rom, minimum 4 points"""
+    _DrawSplineCatmullRom(_vec2_array(points), _int(point_count), _float(thick), _color(color))
+
+
+def draw_spline_bezier_quadratic(points, point_count, thick, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, float, Color) -> None
+    """Draw spline: Quadratic Bezier, minimum 3 points (1 control point): [p1, c2, p3, c4...]"""
+    _DrawSplineBezierQuadratic(_vec2_array(points), _int(point_count), _float(thick), _color(color))
+
+
+def draw_spline_bezier_cubic(points, point_count, thick, color):
+    # type: (Vector2Ptr | Array[Vector2] | Vector2Array, int, float, Color) -> None
+    """Draw spline: Cubic Bezier, minimum 4 points (2 control points): [p1, c2, c3, p4, c5, c6...]"""
+    _DrawSplineBezierCubic(_vec2_array(points), _int(point_count), _float(thick), _color(color))
+
+
+def draw_spline_segment_linear(p1, p2, thick, color):
+    # type: (Vector2, Vector2, float, Color) -> None
+    """Draw spline segment: Linear, 2 points"""
+    _DrawSplineSegmentLinear(_vec2(p1), _vec2(p2), _float(thick), _color(color))
+
+
+def draw_spline_segment_basis(p1, p2, p3, p4, thick, color):
+    # type: (Vector2, Vector2, Vector2, Vector2, float, Color) -> None
+    """Draw spline segment: B-Spline, 4 points"""
+    _DrawSplineSegmentBasis(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(thick), _color(color))
+
+
+def draw_spline_segment_catmull_rom(p1, p2, p3, p4, thick, color):
+    # type: (Vector2, Vector2, Vector2, Vector2, float, Color) -> None
+    """Draw spline segment: Catmull-Rom, 4 points"""
+    _DrawSplineSegmentCatmullRom(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(thick), _color(color))
+
+
+def draw_spline_segment_bezier_quadratic(p1, c2, p3, thick, color):
+    # type: (Vector2, Vector2, Vector2, float, Color) -> None
+    """Draw spline segment: Quadratic Bezier, 2 points, 1 control point"""
+    _DrawSplineSegmentBezierQuadratic(_vec2(p1), _vec2(c2), _vec2(p3), _float(thick), _color(color))
+
+
+def draw_spline_segment_bezier_cubic(p1, c2, c3, p4, thick, color):
+    # type: (Vector2, Vector2, Vector2, Vector2, float, Color) -> None
+    """Draw spline segment: Cubic Bezier, 2 points, 2 control points"""
+    _DrawSplineSegmentBezierCubic(_vec2(p1), _vec2(c2), _vec2(c3), _vec2(p4), _float(thick), _color(color))
+
+
+def get_spline_point_linear(start_pos, end_pos, t):
+    # type: (Vector2, Vector2, float) -> Vector2
+    """Get (evaluate) spline point: Linear"""
+    return _GetSplinePointLinear(_vec2(start_pos), _vec2(end_pos), _float(t))
+
+
+def get_spline_point_basis(p1, p2, p3, p4, t):
+    # type: (Vector2, Vector2, Vector2, Vector2, float) -> Vector2
+    """Get (evaluate) spline point: B-Spline"""
+    return _GetSplinePointBasis(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(t))
+
+
+def get_spline_point_catmull_rom(p1, p2, p3, p4, t):
+    # type: (Vector2, Vector2, Vector2, Vector2, float) -> Vector2
+    """Get (evaluate) spline point: Catmull-Rom"""
+    return _GetSplinePointCatmullRom(_vec2(p1), _vec2(p2), _vec2(p3), _vec2(p4), _float(t))
+
+
+def get_spline_point_bezier_quad(p1, c2, p3, t):
+    # type: (Vector2, Vector2, Vector2, float) -> Vector2
+    """Get (evaluate) spline point: Quadratic Bezier"""
+    return _GetSplinePointBezierQuad(_vec2(p1), _vec2(c2), _vec2(p3), _float(t))
+
+
+def get_spline_point_bezier_cubic(p1, c2, c3, p4, t):
+    # type: (Vector2, Vector2, Vector2, Vector2, float) -> Vector2
+    """Get (evaluate) spline point: Cubic Bezier"""
+    return _GetSplinePointBezierCubic(_vec2(p1), _vec2(c2), _vec2(c3), _vec2(p4), _float(t))
+
+
+def check_collision_recs(rec1, rec2):
+    # type: (Rectangle, Rectangle) -> bool
+    """Check collision between two rectangles"""
+    return _CheckCollisionRecs(_rect(rec1), _rect(rec2))
+
+
+def check_collision_circles(center1, radius1, center2, radius2):
+    # type: (Vector2, float, Vector2, float) -> bool
+    """Check collision between two circles"""
+    return _CheckCollisionCircles(_vec2(center1), _float(radius1), _vec2(center2), _float(radius2))
+
+
+def check_collision_circle_rec(center, radius, rec):
+    # type: (Vector2, float, Rectangle) -> bool
+    """Check collision between circle and rectangle"""
+    return _CheckCollisionCircleRec(_vec2(center), _float(radius), _rect(rec))
+
+
+def check_collision_point_rec(point, rec):
+    # type: (Vector2, Rectangle) -> bool
+    """Check if point is inside rectangle"""
+    return _CheckCollisionPointRec(_vec2(point), _rect(rec))
+
+
+def check_collision_point_circle(point, center, radius):
+    # type: (Vector2, Vector2, float) -> bool
+    """Check if point is inside circle"""
+    return _CheckCollisionPointCircle(_vec2(point), _vec2(center), _float(radius))
+
+
+def check_collision_point_triangle(point, p1, p2, p3):
+    # type: (Vector2, Vector2, Vector2, Vector2) -> bool
+    """Check if point is inside a triangle"""
+    return _CheckCollisionPointTriangle(_vec2(point), _vec2(p1), _vec2(p2), _vec2(p3))
+
+
+def check_collision_point_poly(point, points, point_count):
+    # type: (Vector2, Vector2Ptr | Array[Vector2] | Vector2Array, int) -> bool
+    """Check if point is within a polygon described by array of vertices"""
+    return _CheckCollisionPointPoly(_vec2(point), _vec2_array(points), _int(point_count))
+
+
+def check_collision_lines(start_pos1, end_pos1, start_pos2, end_pos2, collision_point):
+    # type: (Vector2, Vector2, Vector2, Vector2, Vector2Ptr) -> bool
+    """Check the collision between two lines defined by two points each, returns collision point by reference"""
+    return _CheckCollisionLines(_vec2(start_pos1), _vec2(end_pos1), _vec2(start_pos2), _vec2(end_pos2), collision_point)
+
+
+def check_collision_point_line(point, p1, p2, threshold):
+    # type: (Vector2, Vector2, Vector2, int) -> bool
+    """Check if point belongs to line created between two points [p1] and [p2] with defined margin in pixels [threshold]"""
+    return _CheckCollisionPointLine(_vec2(point), _vec2(p1), _vec2(p2), _int(threshold))
+
+
+def get_collision_rec(rec1, rec2):
+    # type: (Rectangle, Rectangle) -> Rectangle
+    """Get collision rectangle for two rectangles collision"""
+    return _GetCollisionRec(_rect(rec1), _rect(rec2))
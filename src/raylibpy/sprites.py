@@ -0,0 +1,370 @@
+# sprites.py
+
+#   Batched 2D drawing: thousands of texture_pro-style sprites of one texture,
+#   rectangles, circles or thick lines from NumPy arrays with a fixed number of
+#   FFI calls, by computing the triangles with NumPy and drawing them from a
+#   vertex array through rlgl (requires NumPy; OpenGL 3.3/ES3 or VAO support,
+#   otherwise it falls back to one raylib call per item).
+#
+#   Arguments are NumPy arrays with one row per item, or anything NumPy converts
+#   (sequences, buffers, ctypes arrays, Vector2Array); a single row, struct or
+#   scalar is used for every item.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   batch = SpriteBatch(texture)
+#   ...
+#   begin_drawing()
+#   batch.draw(sources, dests, origins, rotations, tints)    # (N, 4), (N, 4), (N, 2), (N,), (N, 4)
+#   draw_circles(centers, radii, RED)                       # (N, 2), (N,)
+#   draw_lines(starts, ends, 2.0, colors)                   # (N, 2), (N, 2), (N,) or scalar, (N, 4)
+#   end_drawing()
+
+from . import (
+    DEG2RAD,
+    RL_FLOAT,
+    RL_SHADER_LOC_COLOR_DIFFUSE,
+    RL_SHADER_LOC_MATRIX_MVP,
+    RL_SHADER_LOC_VERTEX_COLOR,
+    RL_SHADER_LOC_VERTEX_POSITION,
+    RL_SHADER_LOC_VERTEX_TEXCOORD01,
+    RL_SHADER_UNIFORM_VEC4,
+    RL_UNSIGNED_BYTE,
+    BaseArray,
+    Color,
+    Rectangle,
+    Structure,
+    Vector2,
+    _DrawCircleV,
+    _DrawLineEx,
+    _DrawRectangleRec,
+    _DrawTexturePro,
+    _MatrixMultiply,
+    _SUBMODULE_EXPORTS,
+    _VectorArray,
+    _numpy,
+    _rlActiveTextureSlot,
+    _rlDisableShader,
+    _rlDisableTexture,
+    _rlDisableVertexArray,
+    _rlDrawRenderBatchActive,
+    _rlDrawVertexArray,
+    _rlEnableShader,
+    _rlEnableTexture,
+    _rlEnableVertexArray,
+    _rlEnableVertexAttribute,
+    _rlGetMatrixModelview,
+    _rlGetMatrixProjection,
+    _rlGetMatrixTransform,
+    _rlGetShaderIdDefault,
+    _rlGetShaderLocsDefault,
+    _rlGetTextureIdDefault,
+    _rlLoadVertexArray,
+    _rlLoadVertexBuffer,
+    _rlSetUniform,
+    _rlSetUniformMatrix,
+    _rlSetVertexAttribute,
+    _rlUnloadVertexArray,
+    _rlUnloadVertexBuffer,
+    _rlUpdateVertexBuffer,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['sprites'])
+
+_symbol_namespaces.append(globals())
+
+# Corners of each quad (top-left, bottom-left, bottom-right, top-right), split in two triangles like rlgl does
+_QUAD_CORNERS = (0, 1, 2, 0, 2, 3)
+
+# Depth of the vertices, inside the [0, 1] range of the default 2D projection
+_DEPTH = -0.5
+
+# (attribute location, components, type, normalized, bytes per vertex) of the vertex buffers
+_VERTEX_ATTRIBUTES = (
+    (RL_SHADER_LOC_VERTEX_POSITION, 3, RL_FLOAT, False, 12),
+    (RL_SHADER_LOC_VERTEX_TEXCOORD01, 2, RL_FLOAT, False, 8),
+    (RL_SHADER_LOC_VERTEX_COLOR, 4, RL_UNSIGNED_BYTE, True, 4),
+)
+
+
+def _items(values, width, dtype):
+    """Returns `values` as an (N, width) array, without copying when possible"""
+    np = _numpy()
+    if isinstance(values, _VectorArray):
+        values = values.numpy()
+    elif isinstance(values, (Structure, BaseArray)):
+        values = np.frombuffer(values, dtype=dtype)
+    return np.asarray(values, dtype=dtype).reshape(-1, width)
+
+
+def _rows(values, width, count, dtype):
+    """Returns `values` as a (count, width) array (or (count,) if width is 1), broadcasting a single row"""
+    np = _numpy()
+    values = _items(values, width, dtype)
+    if width == 1:
+        return np.broadcast_to(values.reshape(-1), (count,))
+    return np.broadcast_to(values.reshape(-1, width), (count, width))
+
+
+def _positions(xy, count_per_item):
+    """Returns (N, count_per_item, 2) vertex coordinates as contiguous (N * count_per_item, 3) positions"""
+    np = _numpy()
+    positions = np.empty(xy.shape[:2] + (3,), dtype=np.float32)
+    positions[:, :, :2] = xy
+    positions[:, :, 2] = _DEPTH
+    return positions.reshape(-1, 3)
+
+
+class _TriangleStream(object):
+    """Vertex array with dynamic position/texcoord/color buffers, drawn with the default shader"""
+
+    def __init__(self, capacity=6144):
+        self.capacity = max(3, int(capacity))      # vertices
+        self._vao = None                            # created on first draw, when a GL context exists
+        self._vbos = ()
+        self._white = None
+
+    def draw(self, texture_id, positions, texcoords, colors):
+        # type: (int, numpy.ndarray, numpy.ndarray | None, numpy.ndarray) -> bool
+        """Draws triangles from contiguous float32 (V, 3), float32 (V, 2) and uint8 (V, 4) arrays
+
+        Returns False without drawing when vertex arrays are not supported.
+        """
+        np = _numpy()
+        count = len(positions)
+        if self._vao is None:
+            self._load(self.capacity)
+        if not self._vao:
+            return False
+        if count > self.capacity:
+            self.unload()
+            self._load(1 << (count - 1).bit_length())
+        if texcoords is None:
+            texcoords = np.zeros((count, 2), dtype=np.float32)
+
+        _rlDrawRenderBatchActive()      # keeps the order with what was drawn before
+        locs = _rlGetShaderLocsDefault()
+        mvp = _MatrixMultiply(_MatrixMultiply(_rlGetMatrixTransform(), _rlGetMatrixModelview()), _rlGetMatrixProjection())
+        _rlEnableShader(_rlGetShaderIdDefault())
+        _rlSetUniformMatrix(locs[RL_SHADER_LOC_MATRIX_MVP], mvp)
+        _rlSetUniform(locs[RL_SHADER_LOC_COLOR_DIFFUSE], self._white.ctypes.data, RL_SHADER_UNIFORM_VEC4, 1)
+        _rlActiveTextureSlot(0)
+        _rlEnableTexture(texture_id)
+        _rlEnableVertexArray(self._vao)
+        for vbo, data in zip(self._vbos, (positions, texcoords, colors)):
+            _rlUpdateVertexBuffer(vbo, data.ctypes.data, data.nbytes, 0)
+        _rlDrawVertexArray(0, count)
+        _rlDisableVertexArray()
+        _rlDisableTexture()
+        _rlDisableShader()
+        return True
+
+    def unload(self):
+        # type: () -> None
+        """Unloads the vertex array and buffers, they are loaded again by the next draw()"""
+        for vbo in self._vbos:
+            _rlUnloadVertexBuffer(vbo)
+        if self._vao:
+            _rlUnloadVertexArray(self._vao)
+        self._vao = None
+        self._vbos = ()
+
+    def _load(self, capacity):
+        self._white = _numpy().ones(4, dtype='float32')
+        self._vao = _rlLoadVertexArray()
+        if not self._vao:
+            return  # no VAO support (OpenGL 1.1/ES2 without extension)
+        self.capacity = capacity
+        locs = _rlGetShaderLocsDefault()
+        _rlEnableVertexArray(self._vao)
+        vbos = []
+        for loc, components, type_, normalized, size in _VERTEX_ATTRIBUTES:
+            vbos.append(_rlLoadVertexBuffer(None, capacity * size, True))
+            _rlSetVertexAttribute(locs[loc], components, type_, normalized, 0, None)
+            _rlEnableVertexAttribute(locs[loc])
+        _rlDisableVertexArray()
+        self._vbos = tuple(vbos)
+
+
+# Stream shared by the batched shape functions
+_shapes_stream = _TriangleStream()
+
+
+def sprite_vertices(texture_width, texture_height, sources, dests, origins, rotations):
+    # type: (int, int, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]
+    """Computes the triangle positions (N*6, 3) and texcoords (N*6, 2) of draw_texture_pro sprites"""
+    np = _numpy()
+    count = len(dests)
+    sx, sy, sw, sh = (sources[:, i] for i in range(4))
+    dx, dy, dw, dh = (dests[:, i] for i in range(4))
+
+    # Negative source width mirrors horizontally, negative height shifts y (texcoords then go upwards)
+    flip_x = sw < 0
+    sw = np.abs(sw)
+    sy = np.where(sh < 0, sy - sh, sy)
+
+    cos = np.cos(rotations * np.float32(DEG2RAD))
+    sin = np.sin(rotations * np.float32(DEG2RAD))
+    ox, oy = -origins[:, 0], -origins[:, 1]
+    left, right = ox, ox + dw
+    top, bottom = oy, oy + dh
+
+    corners = np.empty((count, 4, 2), dtype=np.float32)
+    for i, (cx, cy) in enumerate(((left, top), (left, bottom), (right, bottom), (right, top))):
+        corners[:, i, 0] = dx + cx * cos - cy * sin
+        corners[:, i, 1] = dy + cx * sin + cy * cos
+
+    u0 = sx / np.float32(texture_width)
+    u1 = (sx + sw) / np.float32(texture_width)
+    u0, u1 = np.where(flip_x, u1, u0), np.where(flip_x, u0, u1)
+    v0 = sy / np.float32(texture_height)
+    v1 = (sy + sh) / np.float32(texture_height)
+
+    uvs = np.empty((count, 4, 2), dtype=np.float32)
+    uvs[:, 0, 0], uvs[:, 0, 1] = u0, v0
+    uvs[:, 1, 0], uvs[:, 1, 1] = u0, v1
+    uvs[:, 2, 0], uvs[:, 2, 1] = u1, v1
+    uvs[:, 3, 0], uvs[:, 3, 1] = u1, v0
+
+    return _positions(corners[:, _QUAD_CORNERS], 6), np.ascontiguousarray(uvs[:, _QUAD_CORNERS].reshape(-1, 2))
+
+
+def _vertex_colors(colors, count, vertices_per_item):
+    """Returns the colors of N items repeated for each of their vertices, as contiguous (V, 4) uint8"""
+    np = _numpy()
+    return np.ascontiguousarray(np.repeat(_rows(colors, 4, count, np.uint8), vertices_per_item, axis=0))
+
+
+def draw_rectangles(recs, colors):
+    # type: (numpy.ndarray, numpy.ndarray | Color) -> None
+    """Draws N color-filled rectangles like draw_rectangle_rec, from (N, 4) rectangles and colors"""
+    np = _numpy()
+    recs = _items(recs, 4, np.float32)
+    count = len(recs)
+    if count == 0:
+        return
+    x, y, width, height = (recs[:, i] for i in range(4))
+    corners = np.empty((count, 4, 2), dtype=np.float32)
+    corners[:, 0, 0], corners[:, 0, 1] = x, y
+    corners[:, 1, 0], corners[:, 1, 1] = x, y + height
+    corners[:, 2, 0], corners[:, 2, 1] = x + width, y + height
+    corners[:, 3, 0], corners[:, 3, 1] = x + width, y
+    if not _shapes_stream.draw(_rlGetTextureIdDefault(), _positions(corners[:, _QUAD_CORNERS], 6), None, _vertex_colors(colors, count, 6)):
+        for rec, color in zip(recs.tolist(), _rows(colors, 4, count, np.uint8).tolist()):
+            _DrawRectangleRec(Rectangle(*rec), Color(*color))
+
+
+def draw_circles(centers, radii, colors, segments=36):
+    # type: (numpy.ndarray, numpy.ndarray | float, numpy.ndarray | Color, int) -> None
+    """Draws N color-filled circles like draw_circle_v, from (N, 2) centers, (N,) radii and colors
+
+    Each circle is made of `segments` triangles.
+    """
+    np = _numpy()
+    centers = _items(centers, 2, np.float32)
+    count = len(centers)
+    if count == 0:
+        return
+    segments = max(3, int(segments))
+    radii = _rows(radii, 1, count, np.float32)
+    angles = np.linspace(0, 2 * np.pi, segments + 1, dtype=np.float32)
+    rim = np.stack((np.cos(angles), np.sin(angles)), axis=1)                       # (segments + 1, 2)
+    rim = centers[:, None, :] + radii[:, None, None] * rim[None, :, :]             # (N, segments + 1, 2)
+
+    # Same winding as DrawCircleSector: center, next angle, angle
+    triangles = np.empty((count, segments, 3, 2), dtype=np.float32)
+    triangles[:, :, 0] = centers[:, None, :]
+    triangles[:, :, 1] = rim[:, 1:]
+    triangles[:, :, 2] = rim[:, :-1]
+    vertices = segments * 3
+    if not _shapes_stream.draw(_rlGetTextureIdDefault(), _positions(triangles.reshape(count, vertices, 2), vertices), None, _vertex_colors(colors, count, vertices)):
+        for center, radius, color in zip(centers.tolist(), radii.tolist(), _rows(colors, 4, count, np.uint8).tolist()):
+            _DrawCircleV(Vector2(*center), radius, Color(*color))
+
+
+def draw_lines(start_positions, end_positions, thick, colors):
+    # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray | float, numpy.ndarray | Color) -> None
+    """Draws N lines like draw_line_ex, from (N, 2) start and end positions, (N,) thicknesses and colors"""
+    np = _numpy()
+    starts = _items(start_positions, 2, np.float32)
+    count = len(starts)
+    if count == 0:
+        return
+    ends = _rows(end_positions, 2, count, np.float32)
+    thick = _rows(thick, 1, count, np.float32)
+    delta = ends - starts
+    length = np.sqrt(np.sum(delta * delta, axis=1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scale = np.where(length > 0, thick / (2 * length), 0).astype(np.float32)
+    radius = np.stack((-scale * delta[:, 1], scale * delta[:, 0]), axis=1)
+
+    # Same triangles as DrawLineEx: its strip (start - r, start + r, end - r, end + r) as (2, 0, 1), (3, 2, 1)
+    strip = np.stack((starts - radius, starts + radius, ends - radius, ends + radius), axis=1)
+    if not _shapes_stream.draw(_rlGetTextureIdDefault(), _positions(strip[:, (2, 0, 1, 3, 2, 1)], 6), None, _vertex_colors(colors, count, 6)):
+        for start, end, line_thick, color in zip(starts.tolist(), ends.tolist(), thick.tolist(), _rows(colors, 4, count, np.uint8).tolist()):
+            _DrawLineEx(Vector2(*start), Vector2(*end), line_thick, Color(*color))
+
+
+class SpriteBatch(object):
+    """Draws many sprites of one texture per call, from arrays of draw_texture_pro arguments"""
+
+    def __init__(self, texture, capacity=1024):
+        # type: (Texture2D, int) -> None
+        self.texture = texture
+        self.sprites_drawn = 0      # since the last reset_stats()
+        self.draw_calls = 0         # since the last reset_stats()
+        self._stream = _TriangleStream(max(1, int(capacity)) * 6)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unload()
+
+    @property
+    def capacity(self):
+        # type: () -> int
+        """Sprites that fit in the vertex buffers, they grow when more are drawn at once"""
+        return self._stream.capacity // 6
+
+    def draw(self, sources, dests, origins=(0.0, 0.0), rotations=0.0, tints=(255, 255, 255, 255)):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> None
+        """Draws len(dests) sprites, like draw_texture_pro for each row of the arguments
+
+        `sources` and `dests` are (N, 4) rectangles, `origins` (N, 2), `rotations` (N,)
+        in degrees and `tints` (N, 4) RGBA; a single row is used for every sprite.
+        """
+        np = _numpy()
+        dests = _items(dests, 4, np.float32)
+        count = len(dests)
+        if count == 0 or not self.texture.id:
+            return
+        sources = _rows(sources, 4, count, np.float32)
+        origins = _rows(origins, 2, count, np.float32)
+        rotations = _rows(rotations, 1, count, np.float32)
+
+        positions, texcoords = sprite_vertices(self.texture.width, self.texture.height, sources, dests, origins, rotations)
+        if self._stream.draw(self.texture.id, positions, texcoords, _vertex_colors(tints, count, 6)):
+            self.draw_calls += 1
+        else:
+            tints = _rows(tints, 4, count, np.uint8)
+            for source, dest, origin, rotation, tint in zip(sources.tolist(), dests.tolist(), origins.tolist(), rotations.tolist(), tints.tolist()):
+                _DrawTexturePro(self.texture, Rectangle(*source), Rectangle(*dest), Vector2(*origin), rotation, Color(*tint))
+            self.draw_calls += count
+        self.sprites_drawn += count
+
+    def reset_stats(self):
+        # type: () -> tuple[int, int]
+        """Returns (sprites drawn, draw calls) since the previous call and resets them"""
+        stats = self.sprites_drawn, self.draw_calls
+        self.sprites_drawn = self.draw_calls = 0
+        return stats
+
+    def unload(self):
+        # type: () -> None
+        """Unloads the vertex array and buffers (not the texture)"""
+        self._stream.unload()
@@ -0,0 +1,552 @@
+# streaming.py
+
+#   Helpers to stream frequently changing data to raylib: a GPU texture updated
+#   every frame from any buffer-protocol source (video, camera, procedural
+#   content), uploading only the dirty rectangles, an audio stream fed with
+#   Python-generated PCM from a ring buffer by a background thread, and a
+#   background thread decoding music streams.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   stream = StreamingTexture(320, 240)             # R8G8B8A8
+#   while not window_should_close():
+#       frame = decoder.next_frame()                # e.g. (240, 320, 4) uint8 array
+#       stream.update(frame)                        # or stream.invalidate(rect) + stream.flush(frame)
+#       begin_drawing()
+#       draw_texture(stream.texture, 0, 0, WHITE)
+#       end_drawing()
+#       stream.end_frame()                          # bytes uploaded this frame
+#
+#   source = StreamingAudioSource(44100, 16, 2)    # after init_audio_device()
+#   source.write(synth.render(4096))                # prefill, then from any thread:
+#   source.start()                                  # e.g. (frames, 2) int16 or float32 array, or bytes
+#   source.write(synth.render(1024), block=True)
+#   print(source.underruns, source.fill_level)
+#   source.unload()
+#
+#   streamer = MusicStreamer(prefetch_frames=16384) # after init_audio_device()
+#   music = streamer.load('theme.ogg')              # registered: no more music.update() calls
+#   music.play()
+#   streamer.start()
+#   ...
+#   with streamer.lock:                             # around seek/stop of registered music
+#       music.seek(30.0)
+#   print(streamer.underruns, streamer.max_latency)
+#   streamer.unload_music(music)
+#   streamer.stop()
+
+import ctypes
+import threading
+import time
+
+from . import (
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8A8,
+    PixelFormat,
+    Texture,
+    _GetPixelDataSize,
+    _IsAudioStreamProcessed,
+    _IsMusicStreamPlaying,
+    _LoadAudioStream,
+    _LoadMusicStream,
+    _PIXEL_LAYOUTS,
+    _PlayAudioStream,
+    _SAMPLE_DTYPES,
+    _SUBMODULE_EXPORTS,
+    _SetAudioStreamVolume,
+    _StopAudioStream,
+    _UnloadAudioStream,
+    _UnloadMusicStream,
+    _UpdateAudioStream,
+    _UpdateMusicStream,
+    _audio_stream_buffer_size_override,
+    _buffer_in,
+    _float_to_samples,
+    _numpy,
+    _rlLoadTexture,
+    _rlUnloadTexture,
+    _rlUpdateTexture,
+    _samples_to_float,
+    _str_in,
+    _symbol_namespaces,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['streaming'])
+
+_symbol_namespaces.append(globals())
+
+
+class StreamingTexture(object):
+    """Texture updated from buffer-protocol sources with dirty rectangles and a ring of staging buffers
+
+    Contiguous sources are uploaded straight from their memory. Sub-rectangles
+    of a full frame are not contiguous: their rows are packed into a packing
+    buffer first, reused by every upload (rlUpdateTexture copies synchronously)
+    and never handed out by acquire(), whose ring lets a producer fill a frame
+    while the previous one is being flushed.
+    """
+
+    def __init__(self, width, height, format_=PIXELFORMAT_UNCOMPRESSED_R8G8B8A8, staging_buffers=2):
+        # type: (int, int, int, int) -> None
+        if format_ not in _PIXEL_LAYOUTS:
+            raise ValueError("streaming textures need an uncompressed format, got {!r}".format(PixelFormat(format_)))
+        self.width = int(width)
+        self.height = int(height)
+        self.format = int(format_)
+        self.pixel_size = _GetPixelDataSize(1, 1, self.format)
+        self.frame_size = self.pixel_size * self.width * self.height
+        self.texture = Texture(_rlLoadTexture(None, self.width, self.height, self.format, 1), self.width, self.height, 1, self.format)
+        self._staging = [None] * max(1, int(staging_buffers))
+        self._next_staging = 0
+        self._packing = bytearray()     # rows of a rect, grown to the largest one
+        self._dirty = []
+
+        self.bytes_uploaded = 0         # since the last end_frame()
+        self.uploads = 0                # since the last end_frame()
+        self.last_frame_bytes = 0
+        self.total_bytes_uploaded = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unload()
+
+    def __repr__(self):
+        return "StreamingTexture({}x{}, {!r}, id={})".format(self.width, self.height, PixelFormat(self.format), self.texture.id)
+
+    def acquire(self):
+        # type: () -> Array[Char]
+        """Returns the next staging buffer of the ring, a writable frame-sized buffer
+
+        Fill it (e.g. through numpy.frombuffer) and pass it to update().
+        """
+        index = self._next_staging
+        self._next_staging = (index + 1) % len(self._staging)
+        buffer = self._staging[index]
+        if buffer is None:
+            buffer = self._staging[index] = (ctypes.c_char * self.frame_size)()
+        return buffer
+
+    def update(self, source, rect=None):
+        # type: (Buffer, tuple[int, int, int, int] | Rectangle | None) -> None
+        """Uploads `source` to the whole texture or to the (x, y, width, height) `rect`
+
+        `source` holds either the pixels of `rect` only or a whole frame, from
+        which the rows of `rect` are taken.
+        """
+        if rect is None:
+            x, y, width, height = 0, 0, self.width, self.height
+        else:
+            x, y, width, height = self._clip(rect)
+            if width <= 0 or height <= 0:
+                return
+        size = width * height * self.pixel_size
+        nbytes = memoryview(source).nbytes
+        if nbytes == size:
+            data = _buffer_in(source)
+        elif nbytes == self.frame_size:
+            data = self._pack_rect(source, x, y, width, height)
+        else:
+            raise ValueError("source has {} bytes, expected {} (rect) or {} (frame)".format(nbytes, size, self.frame_size))
+        _rlUpdateTexture(self.texture.id, x, y, width, height, self.format, data)
+        self.bytes_uploaded += size
+        self.total_bytes_uploaded += size
+        self.uploads += 1
+
+    def invalidate(self, rect=None):
+        # type: (tuple[int, int, int, int] | Rectangle | None) -> None
+        """Marks `rect` (or the whole texture) as changed, to be uploaded by the next flush()"""
+        if rect is None:
+            self._dirty = [(0, 0, self.width, self.height)]
+        elif not self._dirty or self._dirty[0] != (0, 0, self.width, self.height):
+            self._dirty.append(self._clip(rect))
+
+    def flush(self, frame):
+        # type: (Buffer) -> int
+        """Uploads the rectangles marked by invalidate() from the full `frame`, returns the bytes uploaded"""
+        before = self.bytes_uploaded
+        dirty, self._dirty = self._dirty, []
+        for rect in dirty:
+            self.update(frame, rect)
+        return self.bytes_uploaded - before
+
+    def end_frame(self):
+        # type: () -> int
+        """Closes the per-frame statistics, returns the bytes uploaded since the previous call"""
+        uploaded = self.last_frame_bytes = self.bytes_uploaded
+        self.bytes_uploaded = 0
+        self.uploads = 0
+        return uploaded
+
+    def unload(self):
+        # type: () -> None
+        """Unloads the texture from the GPU and frees the staging buffers"""
+        if self.texture.id:
+            _rlUnloadTexture(self.texture.id)
+            self.texture.id = 0
+        self._staging = [None] * len(self._staging)
+        self._packing = bytearray()
+
+    def _clip(self, rect):
+        x, y, width, height = (int(v) for v in rect)
+        x0, y0 = max(x, 0), max(y, 0)
+        return x0, y0, min(x + width, self.width) - x0, min(y + height, self.height) - y0
+
+    def _pack_rect(self, frame, x, y, width, height):
+        """Copies the rows of a rect of `frame` into the packing buffer, returns a pointer to them"""
+        view = memoryview(frame).cast('B')
+        row_size = width * self.pixel_size
+        if len(self._packing) < row_size * height:
+            self._packing = bytearray(row_size * height)
+        stride = self.width * self.pixel_size
+        start = y * stride + x * self.pixel_size
+        target = memoryview(self._packing)
+        for row in range(height):
+            source = start + row * stride
+            target[row * row_size:(row + 1) * row_size] = view[source:source + row_size]
+        return _buffer_in(self._packing)
+
+
+class StreamingAudioSource(object):
+    """AudioStream fed from a preallocated ring buffer of PCM frames by a producer thread
+
+    Writers, from any thread, copy interleaved frames into the ring. The producer
+    thread moves them into the stream whenever raylib has consumed one of its
+    buffers, and pads with silence (counting an underrun) when the ring runs dry.
+    Writers serialize on a short lock; the producer thread never takes it, it only
+    reads the write position published after each copy.
+
+    The stream buffers are `chunk_frames` long, which must be at least the audio
+    device period (otherwise raylib enlarges them and the chunks get silent gaps).
+    """
+
+    def __init__(self, sample_rate=44100, sample_size=16, channels=2, chunk_frames=2048, capacity_frames=None):
+        # type: (int, int, int, int, int | None) -> None
+        if sample_size not in _SAMPLE_DTYPES:
+            raise ValueError("sample_size must be 8, 16 or 32, got {}".format(sample_size))
+        self.sample_rate = int(sample_rate)
+        self.sample_size = int(sample_size)
+        self.channels = int(channels)
+        self.chunk_frames = int(chunk_frames)
+        self.frame_size = self.sample_size // 8 * self.channels
+        self.capacity_frames = int(capacity_frames or self.chunk_frames * 8)
+        self.dtype = _SAMPLE_DTYPES[self.sample_size]
+
+        with _audio_stream_buffer_size_override(self.chunk_frames):
+            self.stream = _LoadAudioStream(self.sample_rate, self.sample_size, self.channels)
+
+        self._capacity = self.capacity_frames * self.frame_size
+        self._ring = bytearray(self._capacity)
+        self._ring_view = memoryview(self._ring)
+        self._read = 0                  # bytes read since creation, only advanced by the producer thread
+        self._write = 0                 # bytes written since creation, only advanced under _write_lock
+        self._write_lock = threading.Lock()
+        self._clear = False
+        self._chunk = (ctypes.c_char * (self.chunk_frames * self.frame_size))()
+        self._chunk_view = memoryview(self._chunk).cast('B')
+        self._silence = (b'\x80' if self.sample_size == 8 else b'\x00') * len(self._chunk)
+        self._period = self.chunk_frames / float(self.sample_rate) / 4
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.underruns = 0              # chunks padded with silence because the ring ran dry
+        self.underrun_frames = 0
+        self.frames_written = 0
+        self.frames_played = 0          # frames handed to raylib, silence excluded
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unload()
+
+    def __repr__(self):
+        return "StreamingAudioSource({} Hz, {} bit, {} ch, fill={:.0%})".format(
+            self.sample_rate, self.sample_size, self.channels, self.fill_level)
+
+    @property
+    def available_frames(self):
+        # type: () -> int
+        """Frames written and not yet handed to raylib"""
+        return (self._write - self._read) // self.frame_size
+
+    @property
+    def free_frames(self):
+        # type: () -> int
+        """Frames that can be written without blocking"""
+        return self.capacity_frames - self.available_frames
+
+    @property
+    def fill_level(self):
+        # type: () -> float
+        """Fraction of the ring buffer in use, from 0.0 to 1.0"""
+        return (self._write - self._read) / float(self._capacity)
+
+    @property
+    def playing(self):
+        # type: () -> bool
+        """True while the producer thread is running"""
+        return self._thread is not None
+
+    def write(self, data, block=False, timeout=None):
+        # type: (Buffer, bool, float | None) -> int
+        """Copies interleaved frames into the ring buffer, returns the number of frames written
+
+        `data` is any buffer of samples in the stream format (bytes, array, ctypes
+        array...) or a NumPy array of float ([-1.0, 1.0]), uint8 or int16 samples,
+        rescaled to the stream format if needed. Without `block`, frames that do not fit are dropped; with it,
+        waits for room (at most `timeout` seconds).
+        """
+        view = self._as_bytes(data)
+        size = len(view) - len(view) % self.frame_size
+        deadline = None if timeout is None else time.monotonic() + timeout
+        written = 0
+        while True:
+            with self._write_lock:
+                count = min(self._capacity - (self._write - self._read), size - written)
+                count -= count % self.frame_size
+                if count:
+                    self._copy_in(view[written:written + count])
+                    written += count
+                    self.frames_written += count // self.frame_size
+            if written == size or not block or (deadline is not None and time.monotonic() >= deadline):
+                break
+            time.sleep(self._period)    # without the lock: other writers can fill what is freed meanwhile
+        return written // self.frame_size
+
+    def start(self):
+        # type: () -> None
+        """Starts playing the stream and the producer thread feeding it"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._produce, name='raylibpy-audio-source', daemon=True)
+        self._thread.start()
+        _PlayAudioStream(self.stream)
+
+    def stop(self):
+        # type: () -> None
+        """Stops the producer thread and the stream, the frames in the ring buffer are kept"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        _StopAudioStream(self.stream)
+
+    def clear(self):
+        # type: () -> None
+        """Drops the frames waiting in the ring buffer"""
+        if self._thread is None:
+            self._read = self._write
+        else:
+            self._clear = True  # applied by the producer thread, the only one moving the read position
+
+    def set_volume(self, volume):
+        # type: (float) -> None
+        """Sets the volume of the stream (1.0 is max level)"""
+        _SetAudioStreamVolume(self.stream, float(volume))
+
+    def unload(self):
+        # type: () -> None
+        """Stops the producer thread and unloads the audio stream"""
+        self.stop()
+        if self.stream is not None:
+            _UnloadAudioStream(self.stream)
+            self.stream = None
+
+    def _as_bytes(self, data):
+        """Returns `data` as a byte view of samples in the stream format"""
+        if hasattr(data, '__array_interface__'):
+            np = _numpy()
+            array = np.asarray(data)
+            if array.dtype != self.dtype:
+                # through [-1.0, 1.0] floats: integer samples of another width are rescaled, not wrapped
+                if array.dtype.kind != 'f':
+                    if array.dtype.name not in _SAMPLE_DTYPES.values():
+                        raise ValueError("can not convert {} samples, expected uint8, int16 or float".format(array.dtype))
+                    array = _samples_to_float(array)
+                converted = np.empty(array.shape, self.dtype)
+                _float_to_samples(array, converted)
+                array = converted
+            return memoryview(np.ascontiguousarray(array)).cast('B')
+        return memoryview(data).cast('B')
+
+    def _copy_in(self, view):
+        size = len(view)
+        start = self._write % self._capacity
+        first = min(size, self._capacity - start)
+        self._ring_view[start:start + first] = view[:first]
+        self._ring_view[:size - first] = view[first:]
+        self._write += size     # publishes the frames to the producer thread
+
+    def _feed(self):
+        """Moves the next chunk from the ring buffer into the stream"""
+        if self._clear:
+            self._clear = False
+            self._read = self._write
+        wanted = len(self._chunk)
+        size = min(self._write - self._read, wanted)
+        start = self._read % self._capacity
+        first = min(size, self._capacity - start)
+        self._chunk_view[:first] = self._ring_view[start:start + first]
+        self._chunk_view[first:size] = self._ring_view[:size - first]
+        self._read += size
+        if size < wanted:
+            self._chunk_view[size:] = self._silence[size:]
+            if self.frames_written:
+                self.underruns += 1
+                self.underrun_frames += (wanted - size) // self.frame_size
+        self.frames_played += size // self.frame_size
+        _UpdateAudioStream(self.stream, self._chunk, self.chunk_frames)
+
+    def _produce(self):
+        while not self._stop.is_set():
+            while _IsAudioStreamProcessed(self.stream):
+                self._feed()
+            self._stop.wait(self._period)
+
+
+class MusicStreamer(object):
+    """Background thread calling update_music_stream for the registered Music
+
+    Music loaded with load() gets stream buffers of `prefetch_frames` frames:
+    raylib plays one while the other is refilled, so the music keeps playing as
+    long as the thread runs at least once per buffer, whatever the main thread
+    is doing. The thread decodes with the GIL released; a pause of the whole
+    interpreter longer than a buffer (e.g. a long garbage collection) is counted
+    as an underrun.
+
+    The thread holds `lock` while updating; hold it too around the calls that
+    move the decoder of registered music (seek, stop), and unload them with
+    unload_music().
+    """
+
+    def __init__(self, prefetch_frames=8192, interval=None):
+        # type: (int, float | None) -> None
+        self.prefetch_frames = int(prefetch_frames)
+        self.interval = interval        # seconds between updates, an eighth of the shortest buffer by default
+        self.lock = threading.RLock()
+        self._music = []                # [music, buffer duration in seconds, time of its last update]
+        self._stop = threading.Event()
+        self._thread = None
+        self.reset_stats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __len__(self):
+        return len(self._music)
+
+    @property
+    def running(self):
+        # type: () -> bool
+        """True while the update thread is running"""
+        return self._thread is not None
+
+    def reset_stats(self):
+        # type: () -> None
+        self.updates = 0                # update_music_stream calls
+        self.underruns = 0              # updates later than the buffer duration: the stream may have run dry
+        self.latency = 0.0              # seconds between the last two updates of a stream, the longest of the streams
+        self.max_latency = 0.0
+        self.update_time = 0.0          # seconds spent decoding in the thread
+        self.max_update_time = 0.0
+
+    def load(self, file_name):
+        # type: (bytes | str | None) -> Music
+        """Loads a music stream with buffers of `prefetch_frames` frames and registers it"""
+        with _audio_stream_buffer_size_override(self.prefetch_frames):
+            music = _LoadMusicStream(_str_in(file_name))
+        self.register(music, self.prefetch_frames)
+        return music
+
+    def register(self, music, buffer_frames=None):
+        # type: (Music, int | None) -> None
+        """Updates `music` from the thread from now on
+
+        `buffer_frames` is the size of its stream buffers, used to detect the
+        underruns: raylib's default, 1/30 s, if not given.
+        """
+        sample_rate = music.stream.sample_rate or 44100
+        duration = (buffer_frames or sample_rate // 30) / float(sample_rate)
+        with self.lock:
+            self.unregister(music)
+            self._music.append([music, duration, time.perf_counter()])
+
+    def unregister(self, music):
+        # type: (Music) -> None
+        """Stops updating `music` from the thread"""
+        key = ctypes.cast(music.stream.buffer, ctypes.c_void_p).value
+        with self.lock:
+            self._music = [entry for entry in self._music
+                           if ctypes.cast(entry[0].stream.buffer, ctypes.c_void_p).value != key]
+
+    def unload_music(self, music):
+        # type: (Music) -> None
+        """Unregisters and unloads `music`"""
+        with self.lock:
+            self.unregister(music)
+            _UnloadMusicStream(music)
+
+    def start(self):
+        # type: () -> None
+        """Starts the update thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        now = time.perf_counter()
+        for entry in self._music:
+            entry[2] = now
+        self._thread = threading.Thread(target=self._run, name='raylibpy-music-streamer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        # type: () -> None
+        """Stops the update thread, the registered music is kept"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def update(self):
+        # type: () -> None
+        """Updates the registered music that is playing once, called by the thread"""
+        with self.lock:
+            latency = 0.0
+            for entry in self._music:
+                music, duration, last = entry
+                if not _IsMusicStreamPlaying(music):
+                    entry[2] = time.perf_counter()  # paused or stopped: no underrun when it resumes
+                    continue
+                start = time.perf_counter()
+                _UpdateMusicStream(music)
+                now = time.perf_counter()
+                entry[2] = now
+
+                elapsed = now - start
+                self.update_time += elapsed
+                if elapsed > self.max_update_time:
+                    self.max_update_time = elapsed
+                if start - last > duration:
+                    self.underruns += 1
+                latency = max(latency, start - last)
+                self.updates += 1
+            self.latency = latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.update()
+            interval = self.interval
+            if interval is None:
+                interval = min([entry[1] for entry in self._music] or [0.01]) / 8
+            self._stop.wait(interval)
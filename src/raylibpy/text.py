@@ -0,0 +1,368 @@
+# text.py
+
+#   Functions of raylib's text module (rtext): font loading, text drawing and
+#   measuring, codepoints and text strings management.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from ctypes import POINTER, byref, cast
+
+from . import (
+    GlyphInfo,
+    _CodepointToUTF8,
+    _DrawFPS,
+    _DrawText,
+    _DrawTextCodepoint,
+    _DrawTextCodepoints,
+    _DrawTextEx,
+    _DrawTextPro,
+    _ExportFontAsCode,
+    _GenImageFontAtlas,
+    _GetCodepoint,
+    _GetCodepointCount,
+    _GetCodepointNext,
+    _GetCodepointPrevious,
+    _GetFontDefault,
+    _GetGlyphAtlasRec,
+    _GetGlyphIndex,
+    _GetGlyphInfo,
+    _IsFontReady,
+    _LoadCodepoints,
+    _LoadFont,
+    _LoadFontData,
+    _LoadFontEx,
+    _LoadFontFromImage,
+    _LoadFontFromMemory,
+    _LoadUTF8,
+    _SUBMODULE_EXPORTS,
+    _TextAppend,
+    _TextCopy,
+    _TextFindIndex,
+    _TextFormat,
+    _TextInsert,
+    _TextIsEqual,
+    _TextJoin,
+    _TextLength,
+    _TextReplace,
+    _TextSplit,
+    _TextSubtext,
+    _TextToInteger,
+    _TextToLower,
+    _TextToPascal,
+    _TextToUpper,
+    _UnloadCodepoints,
+    _UnloadFontData,
+    _UnloadUTF8,
+    _clear_in_out,
+    _color,
+    _float,
+    _int,
+    _measure_text,
+    _measure_text_ex,
+    _push_in_out,
+    _set_text_line_spacing,
+    _str_in,
+    _str_out,
+    _symbol_namespaces,
+    _ubyte_buffer_in,
+    _unload_font,
+    _vec2,
+    int_array,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['text'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def get_font_default():
+    # type: () -> Font
+    """Get the default Font"""
+    return _GetFontDefault()
+
+
+def load_font(file_name):
+    # type: (bytes | str | None) -> Font
+    """Load font from file into GPU memory (VRAM)"""
+    return _LoadFont(_str_in(file_name))
+
+
+def load_font_ex(file_name, font_size, codepoints, codepoint_count):
+    # type: (bytes | str | None, int, list[int] | str, int) -> Font
+    """Load font from file with extended parameters, use NULL for codepoints and 0 for codepointCount to load the default character setFont"""
+    codepoints = int_array(codepoints)
+    result = _LoadFontEx(_str_in(file_name), _int(font_size), byref(codepoints), _int(codepoint_count))
+    result = result.contents[:codepoints]
+    return result
+
+
+def load_font_from_image(image, key, first_char):
+    # type: (Image, Color, int) -> Font
+    """Load font from Image (XNA style)"""
+    return _LoadFontFromImage(image, _color(key), _int(first_char))
+
+
+def load_font_from_memory(file_type, file_data, data_size, font_size, codepoints, codepoint_count):
+    # type: (bytes | str | None, Buffer, int, int, list[int] | str, int) -> Font
+    """Load font from memory buffer, fileType refers to extension: i.e. '.ttf'"""
+    codepoints = int_array(codepoints)
+    return _LoadFontFromMemory(_str_in(file_type), _ubyte_buffer_in(file_data), _int(data_size), _int(font_size), codepoints, _int(codepoint_count))
+
+
+def is_font_ready(font):
+    # type: (Font) -> bool
+    """Check if a font is ready"""
+    return _IsFontReady(font)
+
+
+def load_font_data(file_data, data_size, font_size, codepoints, codepoint_count, type_):
+    # type: (Buffer, int, int, list[int] | str, int, int) -> Array[GlyphInfo]
+    """Load font data for further use"""
+    codepoints = int_array(codepoints)
+    result = _LoadFontData(_ubyte_buffer_in(file_data), _int(data_size), _int(font_size), byref(codepoints), _int(codepoint_count), _int(type_))
+    result = cast(result, POINTER(GlyphInfo * codepoints.value))[0]
+    _clear_in_out()
+    _push_in_out(codepoints.value)
+    return result
+
+
+def gen_image_font_atlas(glyphs, glyph_recs, glyph_count, font_size, padding, pack_method):
+    # type: (GlyphInfoPtr, RectanglePtrPtr, int, int, int, int) -> Image
+    """Generate image font atlas using chars info"""
+    return _GenImageFontAtlas(glyphs, glyph_recs, _int(glyph_count), _int(font_size), _int(padding), _int(pack_method))
+
+
+def unload_font_data(glyphs, glyph_count):
+    # type: (GlyphInfoPtr, int) -> None
+    """Unload font chars info data (RAM)"""
+    _UnloadFontData(glyphs, _int(glyph_count))
+
+
+def unload_font(font):
+    # type: (Font) -> None
+    """Unload font from GPU memory (VRAM)"""
+    _unload_font(font)
+
+
+def export_font_as_code(font, file_name):
+    # type: (Font, bytes | str | None) -> bool
+    """Export font as code file, returns true on success"""
+    return _ExportFontAsCode(font, _str_in(file_name))
+
+
+def draw_fps(pos_x, pos_y):
+    # type: (int, int) -> None
+    """Draw current FPS"""
+    _DrawFPS(_int(pos_x), _int(pos_y))
+
+
+def draw_text(text, pos_x, pos_y, font_size, color):
+    # type: (bytes | str | None, int, int, int, Color) -> None
+    """Draw text (using default font)"""
+    _DrawText(_str_in(text), _int(pos_x), _int(pos_y), _int(font_size), _color(color))
+
+
+def draw_text_ex(font, text, position, font_size, spacing, tint):
+    # type: (Font, bytes | str | None, Vector2, float, float, Color) -> None
+    """Draw text using font and additional parameters"""
+    _DrawTextEx(font, _str_in(text), _vec2(position), _float(font_size), _float(spacing), _color(tint))
+
+
+def draw_text_pro(font, text, position, origin, rotation, font_size, spacing, tint):
+    # type: (Font, bytes | str | None, Vector2, Vector2, float, float, float, Color) -> None
+    """Draw text using Font and pro parameters (rotation)"""
+    _DrawTextPro(font, _str_in(text), _vec2(position), _vec2(origin), _float(rotation), _float(font_size), _float(spacing), _color(tint))
+
+
+def draw_text_codepoint(font, codepoint, position, font_size, tint):
+    # type: (Font, int, Vector2, float, Color) -> None
+    """Draw one character (codepoint)"""
+    _DrawTextCodepoint(font, _int(codepoint), _vec2(position), _float(font_size), _color(tint))
+
+
+def draw_text_codepoints(font, codepoints, codepoint_count, position, font_size, spacing, tint):
+    # type: (Font, IntPtr, int, Vector2, float, float, Color) -> None
+    """Draw multiple character (codepoint)"""
+    _DrawTextCodepoints(font, codepoints, _int(codepoint_count), _vec2(position), _float(font_size), _float(spacing), _color(tint))
+
+
+def set_text_line_spacing(spacing):
+    # type: (int) -> None
+    """Set vertical line spacing when drawing with line-breaks"""
+    _set_text_line_spacing(spacing)
+
+
+def measure_text(text, font_size):
+    # type: (bytes | str | None, int) -> int
+    """Measure string width for default font (cached, see set_text_measure_cache_size)"""
+    return _measure_text(text, font_size)
+
+
+def measure_text_ex(font, text, font_size, spacing):
+    # type: (Font, bytes | str | None, float, float) -> Vector2
+    """Measure string size for Font (cached, see set_text_measure_cache_size)"""
+    return _measure_text_ex(font, text, font_size, spacing)
+
+
+def get_glyph_index(font, codepoint):
+    # type: (Font, int) -> int
+    """Get glyph index position in font for a codepoint (unicode character), fallback to '?' if not found"""
+    return _GetGlyphIndex(font, _int(codepoint))
+
+
+def get_glyph_info(font, codepoint):
+    # type: (Font, int) -> GlyphInfo
+    """Get glyph font info data for a codepoint (unicode character), fallback to '?' if not found"""
+    return _GetGlyphInfo(font, _int(codepoint))
+
+
+def get_glyph_atlas_rec(font, codepoint):
+    # type: (Font, int) -> Rectangle
+    """Get glyph rectangle in font atlas for a codepoint (unicode character), fallback to '?' if not found"""
+    return _GetGlyphAtlasRec(font, _int(codepoint))
+
+
+def load_utf8(codepoints, length):
+    # type: (IntPtr, int) -> bytes | str | None
+    """Load UTF-8 text encoded from codepoints array"""
+    return _LoadUTF8(codepoints, _int(length))
+
+
+def unload_utf8(text):
+    # type: (bytes | str | None) -> None
+    """Unload UTF-8 text encoded from codepoints array"""
+    _UnloadUTF8(_str_in(text))
+
+
+def load_codepoints(text, count):
+    # type: (bytes | str | None, IntPtr) -> IntPtr
+    """Load all codepoints from a UTF-8 text string, codepoints count returned by parameter"""
+    return _LoadCodepoints(_str_in(text), count)
+
+
+def unload_codepoints(codepoints):
+    # type: (IntPtr) -> None
+    """Unload codepoints data from memory"""
+    _UnloadCodepoints(codepoints)
+
+
+def get_codepoint_count(text):
+    # type: (bytes | str | None) -> int
+    """Get total number of codepoints in a UTF-8 encoded string"""
+    return _GetCodepointCount(_str_in(text))
+
+
+def get_codepoint(text, codepoint_size):
+    # type: (bytes | str | None, IntPtr) -> int
+    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    return _GetCodepoint(_str_in(text), codepoint_size)
+
+
+def get_codepoint_next(text, codepoint_size):
+    # type: (bytes | str | None, IntPtr) -> int
+    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    return _GetCodepointNext(_str_in(text), codepoint_size)
+
+
+def get_codepoint_previous(text, codepoint_size):
+    # type: (bytes | str | None, IntPtr) -> int
+    """Get previous codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    return _GetCodepointPrevious(_str_in(text), codepoint_size)
+
+
+def codepoint_to_utf8(codepoint, utf8_size):
+    # type: (int, IntPtr) -> bytes | str | None
+    """Encode one codepoint into UTF-8 byte array (array length returned as parameter)"""
+    return _CodepointToUTF8(_int(codepoint), utf8_size)
+
+
+def text_copy(dst, src):
+    # type: (bytes | str | None, bytes | str | None) -> int
+    """Copy one string to another, returns bytes copied"""
+    return _TextCopy(_str_in(dst), _str_in(src))
+
+
+def text_is_equal(text1, text2):
+    # type: (bytes | str | None, bytes | str | None) -> bool
+    """Check if two text string are equal"""
+    return _TextIsEqual(_str_in(text1), _str_in(text2))
+
+
+def text_length(text):
+    # type: (bytes | str | None) -> int
+    """Get text length, checks for '\0' ending"""
+    return _TextLength(_str_in(text))
+
+
+def text_format(text, *args):
+    # type: (bytes | str | None, ...) -> bytes | str | None
+    """Text formatting with variables (sprintf() style)"""
+    return _str_out(_TextFormat(_str_in(text), *args))
+
+
+def text_subtext(text, position, length):
+    # type: (bytes | str | None, int, int) -> bytes | str | None
+    """Get a piece of a text string"""
+    return _str_out(_TextSubtext(_str_in(text), _int(position), _int(length)))
+
+
+def text_replace(text, replace, by):
+    # type: (bytes | str | None, bytes | str | None, bytes | str | None) -> bytes | str | None
+    """Replace text string (WARNING: memory must be freed!)"""
+    return _str_out(_TextReplace(_str_in(text), _str_in(replace), _str_in(by)))
+
+
+def text_insert(text, insert, position):
+    # type: (bytes | str | None, bytes | str | None, int) -> bytes | str | None
+    """Insert text in a position (WARNING: memory must be freed!)"""
+    return _str_out(_TextInsert(_str_in(text), _str_in(insert), _int(position)))
+
+
+def text_join(text_list, count, delimiter):
+    # type: (CharPtrPtr | list[CharPtr | str] | None, int, bytes | str | None) -> bytes | str | None
+    """Join text strings with delimiter"""
+    return _str_out(_TextJoin(text_list, _int(count), _str_in(delimiter)))
+
+
+def text_split(text, delimiter, count):
+    # type: (bytes | str | None, int | str, IntPtr) -> CharPtrPtr | list[CharPtr | str] | None
+    """Split text into multiple strings"""
+    return _TextSplit(_str_in(text), _int(delimiter, (-128, 127)), count)
+
+
+def text_append(text, append, position):
+    # type: (bytes | str | None, bytes | str | None, IntPtr) -> None
+    """Append text at specific position and move cursor!"""
+    _TextAppend(_str_in(text), _str_in(append), position)
+
+
+def text_find_index(text, find):
+    # type: (bytes | str | None, bytes | str | None) -> int
+    """Find first text occurrence within a string"""
+    return _TextFindIndex(_str_in(text), _str_in(find))
+
+
+def text_to_upper(text):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get upper case version of provided string"""
+    return _str_out(_TextToUpper(_str_in(text)))
+
+
+def text_to_lower(text):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get lower case version of provided string"""
+    return _str_out(_TextToLower(_str_in(text)))
+
+
+def text_to_pascal(text):
+    # type: (bytes | str | None) -> bytes | str | None
+    """Get Pascal case notation version of provided string"""
+    return _str_out(_TextToPascal(_str_in(text)))
+
+
+def text_to_integer(text):
+    # type: (bytes | str | None) -> int
+    """Get integer value from text (negative values not supported)"""
+    return _TextToInteger(_str_in(text))
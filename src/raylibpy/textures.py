@@ -0,0 +1,772 @@
+# textures.py
+
+#   Functions of raylib's textures module (rtextures): image loading, generation
+#   and manipulation, texture loading and drawing, color and pixel utilities.
+#
+#   This module is imported the first time one of its functions is accessed
+#   through the `raylibpy` package, which re-exports all of them.
+
+from ctypes import POINTER, byref, cast
+
+from . import (
+    Color,
+    Int,
+    _ColorAlpha,
+    _ColorAlphaBlend,
+    _ColorBrightness,
+    _ColorContrast,
+    _ColorFromHSV,
+    _ColorFromNormalized,
+    _ColorNormalize,
+    _ColorTint,
+    _ColorToHSV,
+    _ColorToInt,
+    _DrawTexture,
+    _DrawTextureEx,
+    _DrawTextureNPatch,
+    _DrawTexturePro,
+    _DrawTextureRec,
+    _DrawTextureV,
+    _ExportImage,
+    _ExportImageAsCode,
+    _ExportImageToMemory,
+    _Fade,
+    _GenImageCellular,
+    _GenImageChecked,
+    _GenImageColor,
+    _GenImageGradientLinear,
+    _GenImageGradientRadial,
+    _GenImageGradientSquare,
+    _GenImagePerlinNoise,
+    _GenImageText,
+    _GenImageWhiteNoise,
+    _GenTextureMipmaps,
+    _GetColor,
+    _GetImageAlphaBorder,
+    _GetImageColor,
+    _GetPixelColor,
+    _GetPixelDataSize,
+    _ImageAlphaClear,
+    _ImageAlphaCrop,
+    _ImageAlphaMask,
+    _ImageAlphaPremultiply,
+    _ImageBlurGaussian,
+    _ImageClearBackground,
+    _ImageColorBrightness,
+    _ImageColorContrast,
+    _ImageColorGrayscale,
+    _ImageColorInvert,
+    _ImageColorReplace,
+    _ImageColorTint,
+    _ImageCopy,
+    _ImageCrop,
+    _ImageDither,
+    _ImageDraw,
+    _ImageDrawCircle,
+    _ImageDrawCircleLines,
+    _ImageDrawCircleLinesV,
+    _ImageDrawCircleV,
+    _ImageDrawLine,
+    _ImageDrawLineV,
+    _ImageDrawPixel,
+    _ImageDrawPixelV,
+    _ImageDrawRectangle,
+    _ImageDrawRectangleLines,
+    _ImageDrawRectangleRec,
+    _ImageDrawRectangleV,
+    _ImageDrawText,
+    _ImageDrawTextEx,
+    _ImageFlipHorizontal,
+    _ImageFlipVertical,
+    _ImageFormat,
+    _ImageFromImage,
+    _ImageMipmaps,
+    _ImageResize,
+    _ImageResizeCanvas,
+    _ImageResizeNN,
+    _ImageRotate,
+    _ImageRotateCCW,
+    _ImageRotateCW,
+    _ImageText,
+    _ImageTextEx,
+    _ImageToPOT,
+    _IsImageReady,
+    _IsRenderTextureReady,
+    _IsTextureReady,
+    _LoadImage,
+    _LoadImageAnim,
+    _LoadImageColors,
+    _LoadImageFromMemory,
+    _LoadImageFromScreen,
+    _LoadImageFromTexture,
+    _LoadImagePalette,
+    _LoadImageRaw,
+    _LoadImageSvg,
+    _LoadRenderTexture,
+    _LoadTexture,
+    _LoadTextureCubemap,
+    _LoadTextureFromImage,
+    _SUBMODULE_EXPORTS,
+    _SetPixelColor,
+    _SetTextureFilter,
+    _SetTextureWrap,
+    _UnloadImage,
+    _UnloadImageColors,
+    _UnloadImagePalette,
+    _UnloadRenderTexture,
+    _UnloadTexture,
+    _UpdateTexture,
+    _UpdateTextureRec,
+    _buffer_in,
+    _clear_in_out,
+    _color,
+    _float,
+    _int,
+    _push_in_out,
+    _rect,
+    _str_in,
+    _symbol_namespaces,
+    _ubyte_buffer_in,
+    _vec2,
+    _vec4,
+)
+
+__all__ = list(_SUBMODULE_EXPORTS['textures'])
+
+# Lets lazily bound C functions replace their placeholders in this module too
+_symbol_namespaces.append(globals())
+
+
+def load_image(file_name):
+    # type: (bytes | str | None) -> Image
+    """Load image from file into CPU memory (RAM)"""
+    return _LoadImage(_str_in(file_name))
+
+
+def load_image_raw(file_name, width, height, format_, header_size):
+    # type: (bytes | str | None, int, int, int, int) -> Image
+    """Load image from RAW file data"""
+    return _LoadImageRaw(_str_in(file_name), _int(width), _int(height), _int(format_), _int(header_size))
+
+
+def load_image_svg(file_name_or_string, width, height):
+    # type: (bytes | str | None, int, int) -> Image
+    """Load image from SVG file data or string with specified size"""
+    return _LoadImageSvg(_str_in(file_name_or_string), _int(width), _int(height))
+
+
+def load_image_anim(file_name, frames):
+    # type: (bytes | str | None, IntPtr) -> Image
+    """Load image sequence from file (frames appended to image.data)"""
+    return _LoadImageAnim(_str_in(file_name), frames)
+
+
+def load_image_from_memory(file_type, file_data, data_size):
+    # type: (bytes | str | None, Buffer, int) -> Image
+    """Load image from memory buffer, fileType refers to extension: i.e. '.png'"""
+    return _LoadImageFromMemory(_str_in(file_type), _ubyte_buffer_in(file_data), _int(data_size))
+
+
+def load_image_from_texture(texture):
+    # type: (Texture2D) -> Image
+    """Load image from GPU texture data"""
+    return _LoadImageFromTexture(texture)
+
+
+def load_image_from_screen():
+    # type: () -> Image
+    """Load image from screen buffer and (screenshot)"""
+    return _LoadImageFromScreen()
+
+
+def is_image_ready(image):
+    # type: (Image) -> bool
+    """Check if an image is ready"""
+    return _IsImageReady(image)
+
+
+def unload_image(image):
+    # type: (Image) -> None
+    """Unload image from CPU memory (RAM)"""
+    _UnloadImage(image)
+
+
+def export_image(image, file_name):
+    # type: (Image, bytes | str | None) -> bool
+    """Export image data to file, returns true on success"""
+    return _ExportImage(image, _str_in(file_name))
+
+
+def export_image_to_memory(image, file_type, file_size):
+    # type: (Image, bytes | str | None, IntPtr) -> int
+    """Export image to memory buffer"""
+    return _ExportImageToMemory(image, _str_in(file_type), file_size)
+
+
+def export_image_as_code(image, file_name):
+    # type: (Image, bytes | str | None) -> bool
+    """Export image as code file defining an array of bytes, returns true on success"""
+    return _ExportImageAsCode(image, _str_in(file_name))
+
+
+def gen_image_color(width, height, color):
+    # type: (int, int, Color) -> Image
+    """Generate image: plain color"""
+    return _GenImageColor(_int(width), _int(height), _color(color))
+
+
+def gen_image_gradient_linear(width, height, direction, start, end):
+    # type: (int, int, int, Color, Color) -> Image
+    """Generate image: linear gradient, direction in degrees [0..360], 0=Vertical gradient"""
+    return _GenImageGradientLinear(_int(width), _int(height), _int(direction), _color(start), _color(end))
+
+
+def gen_image_gradient_radial(width, height, density, inner, outer):
+    # type: (int, int, float, Color, Color) -> Image
+    """Generate image: radial gradient"""
+    return _GenImageGradientRadial(_int(width), _int(height), _float(density), _color(inner), _color(outer))
+
+
+def gen_image_gradient_square(width, height, density, inner, outer):
+    # type: (int, int, float, Color, Color) -> Image
+    """Generate image: square gradient"""
+    return _GenImageGradientSquare(_int(width), _int(height), _float(density), _color(inner), _color(outer))
+
+
+def gen_image_checked(width, height, checks_x, checks_y, col1, col2):
+    # type: (int, int, int, int, Color, Color) -> Image
+    """Generate image: checked"""
+    return _GenImageChecked(_int(width), _int(height), _int(checks_x), _int(checks_y), _color(col1), _color(col2))
+
+
+def gen_image_white_noise(width, height, factor):
+    # type: (int, int, float) -> Image
+    """Generate image: white noise"""
+    return _GenImageWhiteNoise(_int(width), _int(height), _float(factor))
+
+
+def gen_image_perlin_noise(width, height, offset_x, offset_y, scale):
+    # type: (int, int, int, int, float) -> Image
+    """Generate image: perlin noise"""
+    return _GenImagePerlinNoise(_int(width), _int(height), _int(offset_x), _int(offset_y), _float(scale))
+
+
+def gen_image_cellular(width, height, tile_size):
+    # type: (int, int, int) -> Image
+    """Generate image: cellular algorithm, bigger tileSize means bigger cells"""
+    return _GenImageCellular(_int(width), _int(height), _int(tile_size))
+
+
+def gen_image_text(width, height, text):
+    # type: (int, int, bytes | str | None) -> Image
+    """Generate image: grayscale image from text data"""
+    return _GenImageText(_int(width), _int(height), _str_in(text))
+
+
+def image_copy(image):
+    # type: (Image) -> Image
+    """Create an image duplicate (useful for transformations)"""
+    return _ImageCopy(image)
+
+
+def image_from_image(image, rec):
+    # type: (Image, Rectangle) -> Image
+    """Create an image from another image piece"""
+    return _ImageFromImage(image, _rect(rec))
+
+
+def image_text(text, font_size, color):
+    # type: (bytes | str | None, int, Color) -> Image
+    """Create an image from text (default font)"""
+    return _ImageText(_str_in(text), _int(font_size), _color(color))
+
+
+def image_text_ex(font, text, font_size, spacing, tint):
+    # type: (Font, bytes | str | None, float, float, Color) -> Image
+    """Create an image from text (custom sprite font)"""
+    return _ImageTextEx(font, _str_in(text), _float(font_size), _float(spacing), _color(tint))
+
+
+def image_format(image, new_format):
+    # type: (ImagePtr, int) -> None
+    """Convert image data to desired format"""
+    _ImageFormat(image, _int(new_format))
+
+
+def image_to_pot(image, fill):
+    # type: (ImagePtr, Color) -> None
+    """Convert image to POT (power-of-two)"""
+    _ImageToPOT(image, _color(fill))
+
+
+def image_crop(image, crop):
+    # type: (ImagePtr, Rectangle) -> None
+    """Crop an image to a defined rectangle"""
+    _ImageCrop(image, _rect(crop))
+
+
+def image_alpha_crop(image, threshold):
+    # type: (ImagePtr, float) -> None
+    """Crop image depending on alpha value"""
+    _ImageAlphaCrop(image, _float(threshold))
+
+
+def image_alpha_clear(image, color, threshold):
+    # type: (ImagePtr, Color, float) -> None
+    """Clear alpha channel to desired color"""
+    _ImageAlphaClear(image, _color(color), _float(threshold))
+
+
+def image_alpha_mask(image, alpha_mask):
+    # type: (ImagePtr, Image) -> None
+    """Apply alpha mask to image"""
+    _ImageAlphaMask(image, alpha_mask)
+
+
+def image_alpha_premultiply(image):
+    # type: (ImagePtr) -> None
+    """Premultiply alpha channel"""
+    _ImageAlphaPremultiply(image)
+
+
+def image_blur_gaussian(image, blur_size):
+    # type: (ImagePtr, int) -> None
+    """Apply Gaussian blur using a box blur approximation"""
+    _ImageBlurGaussian(image, _int(blur_size))
+
+
+def image_resize(image, new_width, new_height):
+    # type: (ImagePtr, int, int) -> None
+    """Resize image (Bicubic scaling algorithm)"""
+    _ImageResize(image, _int(new_width), _int(new_height))
+
+
+def image_resize_nn(image, new_width, new_height):
+    # type: (ImagePtr, int, int) -> None
+    """Resize image (Nearest-Neighbor scaling algorithm)"""
+    _ImageResizeNN(image, _int(new_width), _int(new_height))
+
+
+def image_resize_canvas(image, new_width, new_height, offset_x, offset_y, fill):
+    # type: (ImagePtr, int, int, int, int, Color) -> None
+    """Resize canvas and fill with color"""
+    _ImageResizeCanvas(image, _int(new_width), _int(new_height), _int(offset_x), _int(offset_y), _color(fill))
+
+
+def image_mipmaps(image):
+    # type: (ImagePtr) -> None
+    """Compute all mipmap levels for a provided image"""
+    _ImageMipmaps(image)
+
+
+def image_dither(image, r_bpp, g_bpp, b_bpp, a_bpp):
+    # type: (ImagePtr, int, int, int, int) -> None
+    """Dither image data to 16bpp or lower (Floyd-Steinberg dithering)"""
+    _ImageDither(image, _int(r_bpp), _int(g_bpp), _int(b_bpp), _int(a_bpp))
+
+
+def image_flip_vertical(image):
+    # type: (ImagePtr) -> None
+    """Flip image vertically"""
+    _ImageFlipVertical(image)
+
+
+def image_flip_horizontal(image):
+    # type: (ImagePtr) -> None
+    """Flip image horizontally"""
+    _ImageFlipHorizontal(image)
+
+
+def image_rotate(image, degrees):
+    # type: (ImagePtr, int) -> None
+    """Rotate image by input angle in degrees (-359 to 359)"""
+    _ImageRotate(image, _int(degrees))
+
+
+def image_rotate_cw(image):
+    # type: (ImagePtr) -> None
+    """Rotate image clockwise 90deg"""
+    _ImageRotateCW(image)
+
+
+def image_rotate_ccw(image):
+    # type: (ImagePtr) -> None
+    """Rotate image counter-clockwise 90deg"""
+    _ImageRotateCCW(image)
+
+
+def image_color_tint(image, color):
+    # type: (ImagePtr, Color) -> None
+    """Modify image color: tint"""
+    _ImageColorTint(image, _color(color))
+
+
+def image_color_invert(image):
+    # type: (ImagePtr) -> None
+    """Modify image color: invert"""
+    _ImageColorInvert(image)
+
+
+def image_color_grayscale(image):
+    # type: (ImagePtr) -> None
+    """Modify image color: grayscale"""
+    _ImageColorGrayscale(image)
+
+
+def image_color_contrast(image, contrast):
+    # type: (ImagePtr, float) -> None
+    """Modify image color: contrast (-100 to 100)"""
+    _ImageColorContrast(image, _float(contrast))
+
+
+def image_color_brightness(image, brightness):
+    # type: (ImagePtr, int) -> None
+    """Modify image color: brightness (-255 to 255)"""
+    _ImageColorBrightness(image, _int(brightness))
+
+
+def image_color_replace(image, color, replace):
+    # type: (ImagePtr, Color, Color) -> None
+    """Modify image color: replace color"""
+    _ImageColorReplace(image, _color(color), _color(replace))
+
+
+def load_image_colors(image):
+    # type: (Image) -> ColorPtr
+    """Load color data from image as a Color array (RGBA - 32bit)"""
+    return _LoadImageColors(image)
+
+
+def load_image_palette(image, max_palette_size, color_count):
+    # type: (Image, int, int) -> Array[Color]
+    """Load colors palette from image as a Color array (RGBA - 32bit)"""
+    color_count = Int(color_count)
+    result = _LoadImagePalette(image, _int(max_palette_size), byref(color_count))
+    result = cast(result, POINTER(Color * color_count.value))[0]
+    _clear_in_out()
+    _push_in_out(color_count.value)
+    return result
+
+
+def unload_image_colors(colors):
+    # type: (ColorPtr) -> None
+    """Unload color data loaded with LoadImageColors()"""
+    _UnloadImageColors(colors)
+
+
+def unload_image_palette(colors):
+    # type: (ColorPtr) -> None
+    """Unload colors palette loaded with LoadImagePalette()"""
+    _UnloadImagePalette(colors)
+
+
+def get_image_alpha_border(image, threshold):
+    # type: (Image, float) -> Rectangle
+    """Get image alpha border rectangle"""
+    return _GetImageAlphaBorder(image, _float(threshold))
+
+
+def get_image_color(image, x, y):
+    # type: (Image, int, int) -> Color
+    """Get image pixel color at (x, y) position"""
+    return _GetImageColor(image, _int(x), _int(y))
+
+
+def image_clear_background(dst, color):
+    # type: (ImagePtr, Color) -> None
+    """Clear image background with given color"""
+    _ImageClearBackground(dst, _color(color))
+
+
+def image_draw_pixel(dst, pos_x, pos_y, color):
+    # type: (ImagePtr, int, int, Color) -> None
+    """Draw pixel within an image"""
+    _ImageDrawPixel(dst, _int(pos_x), _int(pos_y), _color(color))
+
+
+def image_draw_pixel_v(dst, position, color):
+    # type: (ImagePtr, Vector2, Color) -> None
+    """Draw pixel within an image (Vector version)"""
+    _ImageDrawPixelV(dst, _vec2(position), _color(color))
+
+
+def image_draw_line(dst, start_pos_x, start_pos_y, end_pos_x, end_pos_y, color):
+    # type: (ImagePtr, int, int, int, int, Color) -> None
+    """Draw line within an image"""
+    _ImageDrawLine(dst, _int(start_pos_x), _int(start_pos_y), _int(end_pos_x), _int(end_pos_y), _color(color))
+
+
+def image_draw_line_v(dst, start, end, color):
+    # type: (ImagePtr, Vector2, Vector2, Color) -> None
+    """Draw line within an image (Vector version)"""
+    _ImageDrawLineV(dst, _vec2(start), _vec2(end), _color(color))
+
+
+def image_draw_circle(dst, center_x, center_y, radius, color):
+    # type: (ImagePtr, int, int, int, Color) -> None
+    """Draw a filled circle within an image"""
+    _ImageDrawCircle(dst, _int(center_x), _int(center_y), _int(radius), _color(color))
+
+
+def image_draw_circle_v(dst, center, radius, color):
+    # type: (ImagePtr, Vector2, int, Color) -> None
+    """Draw a filled circle within an image (Vector version)"""
+    _ImageDrawCircleV(dst, _vec2(center), _int(radius), _color(color))
+
+
+def image_draw_circle_lines(dst, center_x, center_y, radius, color):
+    # type: (ImagePtr, int, int, int, Color) -> None
+    """Draw circle outline within an image"""
+    _ImageDrawCircleLines(dst, _int(center_x), _int(center_y), _int(radius), _color(color))
+
+
+def image_draw_circle_lines_v(dst, center, radius, color):
+    # type: (ImagePtr, Vector2, int, Color) -> None
+    """Draw circle outline within an image (Vector version)"""
+    _ImageDrawCircleLinesV(dst, _vec2(center), _int(radius), _color(color))
+
+
+def image_draw_rectangle(dst, pos_x, pos_y, width, height, color):
+    # type: (ImagePtr, int, int, int, int, Color) -> None
+    """Draw rectangle within an image"""
+    _ImageDrawRectangle(dst, _int(pos_x), _int(pos_y), _int(width), _int(height), _color(color))
+
+
+def image_draw_rectangle_v(dst, position, size, color):
+    # type: (ImagePtr, Vector2, Vector2, Color) -> None
+    """Draw rectangle within an image (Vector version)"""
+    _ImageDrawRectangleV(dst, _vec2(position), _vec2(size), _color(color))
+
+
+def image_draw_rectangle_rec(dst, rec, color):
+    # type: (ImagePtr, Rectangle, Color) -> None
+    """Draw rectangle within an image"""
+    _ImageDrawRectangleRec(dst, _rect(rec), _color(color))
+
+
+def image_draw_rectangle_lines(dst, rec, thick, color):
+    # type: (ImagePtr, Rectangle, int, Color) -> None
+    """Draw rectangle lines within an image"""
+    _ImageDrawRectangleLines(dst, _rect(rec), _int(thick), _color(color))
+
+
+def image_draw(dst, src, src_rec, dst_rec, tint):
+    # type: (ImagePtr, Image, Rectangle, Rectangle, Color) -> None
+    """Draw a source image within a destination image (tint applied to source)"""
+    _ImageDraw(dst, src, _rect(src_rec), _rect(dst_rec), _color(tint))
+
+
+def image_draw_text(dst, text, pos_x, pos_y, font_size, color):
+    # type: (ImagePtr, bytes | str | None, int, int, int, Color) -> None
+    """Draw text (using default font) within an image (destination)"""
+    _ImageDrawText(dst, _str_in(text), _int(pos_x), _int(pos_y), _int(font_size), _color(color))
+
+
+def image_draw_text_ex(dst, font, text, position, font_size, spacing, tint):
+    # type: (ImagePtr, Font, bytes | str | None, Vector2, float, float, Color) -> None
+    """Draw text (custom sprite font) within an image (destination)"""
+    _ImageDrawTextEx(dst, font, _str_in(text), _vec2(position), _float(font_size), _float(spacing), _color(tint))
+
+
+def load_texture(file_name):
+    # type: (bytes | str | None) -> Texture2D
+    """Load texture from file into GPU memory (VRAM)"""
+    return _LoadTexture(_str_in(file_name))
+
+
+def load_texture_from_image(image):
+    # type: (Image) -> Texture2D
+    """Load texture from image data"""
+    return _LoadTextureFromImage(image)
+
+
+def load_texture_cubemap(image, layout):
+    # type: (Image, int) -> TextureCubemap
+    """Load cubemap from image, multiple image cubemap layouts supported"""
+    return _LoadTextureCubemap(image, _int(layout))
+
+
+def load_render_texture(width, height):
+    # type: (int, int) -> RenderTexture2D
+    """Load texture for rendering (framebuffer)"""
+    return _LoadRenderTexture(_int(width), _int(height))
+
+
+def is_texture_ready(texture):
+    # type: (Texture2D) -> bool
+    """Check if a texture is ready"""
+    return _IsTextureReady(texture)
+
+
+def unload_texture(texture):
+    # type: (Texture2D) -> None
+    """Unload texture from GPU memory (VRAM)"""
+    _UnloadTexture(texture)
+
+
+def is_render_texture_ready(target):
+    # type: (RenderTexture2D) -> bool
+    """Check if a render texture is ready"""
+    return _IsRenderTextureReady(target)
+
+
+def unload_render_texture(target):
+    # type: (RenderTexture2D) -> None
+    """Unload render texture from GPU memory (VRAM)"""
+    _UnloadRenderTexture(target)
+
+
+def update_texture(texture, pixels):
+    # type: (Texture2D, bytes | Buffer | VoidPtr) -> None
+    """Update GPU texture with new data"""
+    _UpdateTexture(texture, _buffer_in(pixels))
+
+
+def update_texture_rec(texture, rec, pixels):
+    # type: (Texture2D, Rectangle, bytes | Buffer | VoidPtr) -> None
+    """Update GPU texture rectangle with new data"""
+    _UpdateTextureRec(texture, _rect(rec), _buffer_in(pixels))
+
+
+def gen_texture_mipmaps(texture):
+    # type: (Texture2DPtr) -> None
+    """Generate GPU mipmaps for a texture"""
+    _GenTextureMipmaps(texture)
+
+
+def set_texture_filter(texture, filter_):
+    # type: (Texture2D, int) -> None
+    """Set texture scaling filter mode"""
+    _SetTextureFilter(texture, _int(filter_))
+
+
+def set_texture_wrap(texture, wrap):
+    # type: (Texture2D, int) -> None
+    """Set texture wrapping mode"""
+    _SetTextureWrap(texture, _int(wrap))
+
+
+def draw_texture(texture, pos_x, pos_y, tint):
+    # type: (Texture2D, int, int, Color) -> None
+    """Draw a Texture2D"""
+    _DrawTexture(texture, _int(pos_x), _int(pos_y), _color(tint))
+
+
+def draw_texture_v(texture, position, tint):
+    # type: (Texture2D, Vector2, Color) -> None
+    """Draw a Texture2D with position defined as Vector2"""
+    _DrawTextureV(texture, _vec2(position), _color(tint))
+
+
+def draw_texture_ex(texture, position, rotation, scale, tint):
+    # type: (Texture2D, Vector2, float, float, Color) -> None
+    """Draw a Texture2D with extended parameters"""
+    _DrawTextureEx(texture, _vec2(position), _float(rotation), _float(scale), _color(tint))
+
+
+def draw_texture_rec(texture, source, position, tint):
+    # type: (Texture2D, Rectangle, Vector2, Color) -> None
+    """Draw a part of a texture defined by a rectangle"""
+    _DrawTextureRec(texture, _rect(source), _vec2(position), _color(tint))
+
+
+def draw_texture_pro(texture, source, dest, origin, rotation, tint):
+    # type: (Texture2D, Rectangle, Rectangle, Vector2, float, Color) -> None
+    """Draw a part of a texture defined by a rectangle with 'pro' parameters"""
+    _DrawTexturePro(texture, _rect(source), _rect(dest), _vec2(origin), _float(rotation), _color(tint))
+
+
+def draw_texture_npatch(texture, n_patch_info, dest, origin, rotation, tint):
+    # type: (Texture2D, NPatchInfo, Rectangle, Vector2, float, Color) -> None
+    """Draws a texture (or part of it) that stretches or shrinks nicely"""
+    _DrawTextureNPatch(texture, n_patch_info, _rect(dest), _vec2(origin), _float(rotation), _color(tint))
+
+
+def fade(color, alpha):
+    # type: (Color, float) -> Color
+    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+    return _Fade(_color(color), _float(alpha))
+
+
+def color_to_int(color):
+    # type: (Color) -> int
+    """Get hexadecimal value for a Color"""
+    return _ColorToInt(_color(color))
+
+
+def color_normalize(color):
+    # type: (Color) -> Vector4
+    """Get Color normalized as float [0..1]"""
+    return _ColorNormalize(_color(color))
+
+
+def color_from_normalized(normalized):
+    # type: (Vector4) -> Color
+    """Get Color from normalized values [0..1]"""
+    return _ColorFromNormalized(_vec4(normalized))
+
+
+def color_to_hsv(color):
+    # type: (Color) -> Vector3
+    """Get HSV values for a Color, hue [0..360], saturation/value [0..1]"""
+    return _ColorToHSV(_color(color))
+
+
+def color_from_hsv(hue, saturation, value):
+    # type: (float, float, float) -> Color
+    """Get a Color from HSV values, hue [0..360], saturation/value [0..1]"""
+    return _ColorFromHSV(_float(hue), _float(saturation), _float(value))
+
+
+def color_tint(color, tint):
+    # type: (Color, Color) -> Color
+    """Get color multiplied with another color"""
+    return _ColorTint(_color(color), _color(tint))
+
+
+def color_brightness(color, factor):
+    # type: (Color, float) -> Color
+    """Get color with brightness correction, brightness factor goes from -1.0f to 1.0f"""
+    return _ColorBrightness(_color(color), _float(factor))
+
+
+def color_contrast(color, contrast):
+    # type: (Color, float) -> Color
+    """Get color with contrast correction, contrast values between -1.0f and 1.0f"""
+    return _ColorContrast(_color(color), _float(contrast))
+
+
+def color_alpha(color, alpha):
+    # type: (Color, float) -> Color
+    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+    return _ColorAlpha(_color(color), _float(alpha))
+
+
+def color_alpha_blend(dst, src, tint):
+    # type: (Color, Color, Color) -> Color
+    """Get src alpha-blended into dst color with tint"""
+    return _ColorAlphaBlend(_color(dst), _color(src), _color(tint))
+
+
+def get_color(hex_value):
+    # type: (int) -> Color
+    """Get Color structure from hexadecimal value"""
+    return _GetColor(_int(hex_value))
+
+
+def get_pixel_color(src_ptr, format_):
+    # type: (bytes | str | None, int) -> Color
+    """Get Color from a source pixel pointer of certain format"""
+    return _GetPixelColor(src_ptr, _int(format_))
+
+
+def set_pixel_color(dst_ptr, color, format_):
+    # type: (bytes | str | None, Color, int) -> None
+    """Set color formatted into destination pixel pointer"""
+    _SetPixelColor(dst_ptr, _color(color), _int(format_))
+
+
+def get_pixel_data_size(width, height, format_):
+    # type: (int, int, int) -> int
+    """Get pixel data size in bytes for certain format"""
+    return _GetPixelDataSize(_int(width), _int(height), _int(format_))
@@ -0,0 +1,376 @@
+# tracker.py
+
+#   Opt-in tracking of the native resources (images, textures, render textures,
+#   meshes, models, waves, sounds, music, audio streams, fonts and shaders)
+#   allocated through raylib: every resource returned by a Load*, Gen*, *Copy
+#   or *FromImage function is recorded with an estimate of its size and the
+#   Python stack that created it, until the matching Unload* function is called.
+#   The resources still recorded are the live ones, and the ones leaking.
+#
+#   Like the profiler, enabling it interposes recording wrappers on the `_X`
+#   internals (the ctypes functions the wrappers call) in every namespace using
+#   them, and disabling it withdraws them; the records are kept. Both can be
+#   enabled and disabled in any order.
+#
+#   Resources are identified by their native handle (data pointer, OpenGL id or
+#   audio buffer). Functions reallocating an image, wave or mesh in place
+#   (image_resize, wave_format...) are followed, Python code reallocating them
+#   (Wave.resample) is not.
+#
+#   With finalizers, a resource whose Python object (the one returned by the
+#   load function) is garbage collected before being unloaded is unloaded by the
+#   next end_drawing() or release_finalized_resources() call, on that thread.
+#   Only use them if these objects are never copied into other structures
+#   (materials, arrays) that outlive them.
+#
+#   This module is imported the first time one of its names is accessed through
+#   the `raylibpy` package, which re-exports all of them.
+#
+#   How to use:
+#
+#   enable_resource_tracking(stack_depth=8)
+#   ... load and unload resources ...
+#   print(get_resource_report())                    # {'Texture': {'count': 3, 'bytes': 786432}, ...}
+#   print(format_resource_report())                 # live resources by creation site
+#   disable_resource_tracking()
+
+import collections
+import ctypes
+import os
+import threading
+import traceback
+import weakref
+from time import perf_counter
+
+from . import (
+    AudioStream,
+    Font,
+    Image,
+    Mesh,
+    Model,
+    Music,
+    RenderTexture,
+    Shader,
+    Sound,
+    Texture,
+    Wave,
+    _LazySymbol,
+    _SUBMODULE_EXPORTS,
+    _forget_text_measures,
+    _interpose,
+    _symbol_table,
+    _withdraw,
+)
+from .cache import _font_size, _mesh_size, _model_size, _sound_size, _texture_size
+
+__all__ = list(_SUBMODULE_EXPORTS['tracker'])
+
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def _address(pointer):
+    return ctypes.cast(pointer, ctypes.c_void_p).value
+
+
+def _wave_size(wave):
+    return wave.frame_count * wave.channels * wave.sample_size // 8
+
+
+def _render_texture_size(target):
+    return _texture_size(target.texture) + target.depth.width * target.depth.height * 4
+
+# resource type -> (handle of a resource, estimated bytes of a resource)
+_RESOURCES = {
+    Image: (lambda image: image.data, _texture_size),
+    Texture: (lambda texture: texture.id, _texture_size),
+    RenderTexture: (lambda target: target.id, _render_texture_size),
+    Mesh: (lambda mesh: _address(mesh.vertices), _mesh_size),
+    Model: (lambda model: _address(model.meshes), _model_size),
+    Wave: (lambda wave: wave.data, _wave_size),
+    Sound: (lambda sound: _address(sound.stream.buffer), _sound_size),
+    Music: (lambda music: _address(music.stream.buffer), lambda music: 0),
+    AudioStream: (lambda stream: _address(stream.buffer), lambda stream: 0),
+    Font: (lambda font: _address(font.glyphs), _font_size),
+    Shader: (lambda shader: shader.id, lambda shader: 0),
+}
+
+# functions returning a resource they do not allocate
+_NOT_ALLOCATING = {'GetFontDefault'}
+
+# functions taking ownership of a resource given as argument: its argument index
+_TAKING_OWNERSHIP = {'LoadModelFromMesh': 0}
+
+# resource type -> C function unloading it, for the finalizers
+_UNLOADERS = {
+    Image: 'UnloadImage',
+    Texture: 'UnloadTexture',
+    RenderTexture: 'UnloadRenderTexture',
+    Mesh: 'UnloadMesh',
+    Model: 'UnloadModel',
+    Wave: 'UnloadWave',
+    Sound: 'UnloadSound',
+    Music: 'UnloadMusicStream',
+    AudioStream: 'UnloadAudioStream',
+    Font: 'UnloadFont',
+    Shader: 'UnloadShader',
+}
+
+# allocating C function -> C function unloading its resources, when not the one of their type
+_ALIAS_UNLOADERS = {'LoadSoundAlias': 'UnloadSoundAlias'}
+
+_enabled = False
+_interposed = []                # C functions wrapped, to withdraw on disable
+_stack_depth = 8
+_finalizers = False
+_lock = threading.Lock()
+_live = {}                      # (type, handle) -> _Record
+_finalized = collections.deque()    # records of the resources whose Python object was collected
+
+
+class _Record(object):
+    __slots__ = ('type', 'handle', 'function', 'size', 'stack', 'time', 'copy', 'unload', 'finalizer')
+
+    def as_dict(self):
+        return {
+            'type': self.type.__name__,
+            'function': self.function,
+            'size': self.size,
+            'stack': ["{}:{} in {}".format(frame.filename, frame.lineno, frame.name) for frame in self.stack],
+            'time': self.time,
+        }
+
+
+# region RECORDING
+
+def _resource_type(value):
+    for resource_type in type(value).__mro__:
+        if resource_type in _RESOURCES:
+            return resource_type
+    return None
+
+
+def _record(resource, function):
+    resource_type = _resource_type(resource)
+    handle = _RESOURCES[resource_type][0](resource)
+    if not handle:
+        return  # failed load
+    record = _Record()
+    record.type = resource_type
+    record.handle = handle
+    record.function = function
+    try:
+        record.size = _RESOURCES[resource_type][1](resource)
+    except Exception:
+        record.size = 0
+    record.stack = traceback.extract_stack(limit=_stack_depth + 2)[:-2] if _stack_depth else []
+    record.time = perf_counter()
+    record.copy = record.unload = record.finalizer = None
+    key = (resource_type, handle)
+    if _finalizers:
+        record.copy = type(resource).from_buffer_copy(resource)
+        record.unload = _ALIAS_UNLOADERS.get(function, _UNLOADERS[resource_type])
+        record.finalizer = weakref.finalize(resource, _finalized.append, record)
+    with _lock:
+        _live[key] = record
+
+
+def _forget(resource):
+    resource_type = _resource_type(resource)
+    if resource_type is None:
+        return
+    with _lock:
+        record = _live.pop((resource_type, _RESOURCES[resource_type][0](resource)), None)
+    if record is not None and record.finalizer is not None:
+        record.finalizer.detach()
+
+
+def _rekey(resource, old_handle):
+    """Follows a resource reallocated in place by a C function"""
+    resource_type = _resource_type(resource)
+    handle = _RESOURCES[resource_type][0](resource)
+    if handle == old_handle:
+        return
+    with _lock:
+        record = _live.pop((resource_type, old_handle), None)
+        if record is not None and handle:
+            record.handle = handle
+            record.size = _RESOURCES[resource_type][1](resource)
+            if record.copy is not None:
+                ctypes.memmove(ctypes.addressof(record.copy), ctypes.addressof(resource), ctypes.sizeof(resource))
+            _live[(resource_type, handle)] = record
+
+
+def _allocating(name, function):
+    owned = _TAKING_OWNERSHIP.get(name)
+
+    def tracked(*args):
+        result = function(*args)
+        if owned is not None:
+            _forget(args[owned])
+        _record(result, name)
+        return result
+    return tracked
+
+
+def _unloading(name, function):
+    def tracked(resource, *args):
+        _forget(resource)
+        return function(resource, *args)
+    return tracked
+
+
+def _reallocating(name, function):
+    def tracked(pointer, *args):
+        if isinstance(pointer, ctypes.Structure):
+            resource = pointer                      # passed by reference by ctypes
+        elif isinstance(pointer, ctypes._Pointer):
+            resource = pointer.contents if pointer else None
+        else:
+            resource = getattr(pointer, '_obj', None)   # byref()
+        resource_type = _resource_type(resource)
+        if resource_type is None:
+            return function(pointer, *args)
+        handle = _RESOURCES[resource_type][0](resource)
+        result = function(pointer, *args)
+        _rekey(resource, handle)
+        return result
+    return tracked
+
+
+def _frame_end(name, function):
+    def tracked(*args):
+        result = function(*args)
+        release_finalized_resources()
+        return result
+    return tracked
+
+
+def _signature(function):
+    if isinstance(function, _LazySymbol):
+        return function.res_type, function.arg_types
+    return function.restype, function.argtypes or ()
+
+
+def _wrapper_factory(c_name, function):
+    """Returns the factory of the recording wrapper of the C function `c_name`, None if not recorded"""
+    res_type, arg_types = _signature(function)
+    first = arg_types[0] if arg_types else None
+    if res_type in _RESOURCES and c_name not in _NOT_ALLOCATING:
+        return _allocating
+    if c_name.startswith('Unload') and first in _RESOURCES:
+        return _unloading
+    if getattr(first, '_type_', None) in (Image, Wave, Mesh) and res_type is None:
+        return _reallocating
+    if c_name == 'EndDrawing':
+        return _frame_end
+    return None
+
+# endregion (recording)
+
+
+def enable_resource_tracking(stack_depth=8, finalizers=False):
+    # type: (int, bool) -> None
+    """Starts recording the native resources allocated and released through raylib
+
+    `stack_depth` frames of the Python stack are kept per resource (0 for none).
+    With `finalizers`, resources whose Python object is collected are unloaded.
+    """
+    global _enabled, _stack_depth, _finalizers
+
+    _stack_depth = int(stack_depth)
+    _finalizers = bool(finalizers)
+    if _enabled:
+        return
+    for c_name, function in list(_symbol_table.items()):
+        factory = _wrapper_factory(c_name, function)
+        if factory is not None:
+            _interpose(c_name, __name__, factory)
+            _interposed.append(c_name)
+    _enabled = True
+
+
+def disable_resource_tracking():
+    # type: () -> None
+    """Stops recording and restores the C functions, keeps the records"""
+    global _enabled
+
+    for c_name in _interposed:
+        _withdraw(c_name, __name__)
+    del _interposed[:]
+    _enabled = False
+
+
+def is_resource_tracking_enabled():
+    # type: () -> bool
+    """Returns True if the native resources are being recorded"""
+    return _enabled
+
+
+def get_live_resources():
+    # type: () -> list[dict]
+    """Returns the resources allocated and not released yet, oldest first
+
+    Each as {'type': str, 'function': C function, 'size': bytes, 'stack': [str], 'time': perf_counter()}
+    """
+    with _lock:
+        records = sorted(_live.values(), key=lambda record: record.time)
+    return [record.as_dict() for record in records]
+
+
+def get_resource_report():
+    # type: () -> dict[str, dict[str, int]]
+    """Returns {resource type: {'count': int, 'bytes': int}} of the live resources"""
+    report = {}
+    with _lock:
+        for record in _live.values():
+            entry = report.setdefault(record.type.__name__, {'count': 0, 'bytes': 0})
+            entry['count'] += 1
+            entry['bytes'] += record.size
+    return report
+
+
+def format_resource_report(limit=10):
+    # type: (int) -> str
+    """Returns a text report of the live resources by type and by creation site (the `limit` largest)"""
+    lines = ["{:<14} {:>7} {:>14}".format('type', 'count', 'bytes')]
+    for name, entry in sorted(get_resource_report().items(), key=lambda item: -item[1]['bytes']):
+        lines.append("{:<14} {:>7} {:>14}".format(name, entry['count'], entry['bytes']))
+
+    sites = {}
+    with _lock:
+        records = list(_live.values())
+    for record in records:
+        # the innermost frame outside of this package
+        frames = [frame for frame in record.stack if not frame.filename.startswith(_PACKAGE_DIRECTORY)]
+        site = "{}:{}".format(frames[-1].filename, frames[-1].lineno) if frames else '?'
+        entry = sites.setdefault((record.type.__name__, record.function, site), [0, 0])
+        entry[0] += 1
+        entry[1] += record.size
+    if sites:
+        lines.append('')
+        lines.append("{:>7} {:>14}  {}".format('count', 'bytes', 'created by'))
+        for (name, function, site), (count, size) in sorted(sites.items(), key=lambda item: -item[1][1])[:limit]:
+            lines.append("{:>7} {:>14}  {} {} at {}".format(count, size, name, function, site))
+    return '\n'.join(lines)
+
+
+def release_finalized_resources():
+    # type: () -> int
+    """Unloads the resources whose Python object was collected, returns how many (finalizers only)"""
+    count = 0
+    while _finalized:
+        record = _finalized.popleft()
+        key = (record.type, record.handle)
+        with _lock:
+            if _live.get(key) is not record:
+                continue    # unloaded meanwhile
+            del _live[key]
+        if record.copy is not None:
+            if record.type is Font:
+                _forget_text_measures(record.copy)
+            unload = _symbol_table[record.unload]
+            if isinstance(unload, _LazySymbol):
+                unload = unload.bind()
+            unload(record.copy)
+            count += 1
+    return count